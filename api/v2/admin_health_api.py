@@ -100,6 +100,22 @@ def get_system_metrics():
                 'miss_rate': 0
             }
         
+        # Database connection pool metrics
+        try:
+            from models.connection_pool import get_pool_stats
+            database_metrics = get_pool_stats()
+        except Exception as e:
+            current_app.logger.warning(f"Failed to get database pool stats: {e}")
+            database_metrics = {}
+        
+        # Application service construction metrics
+        try:
+            from services.service_registry import get_registry
+            service_metrics = get_registry().get_stats()
+        except Exception as e:
+            current_app.logger.warning(f"Failed to get service registry stats: {e}")
+            service_metrics = {}
+        
         # Health status determination
         health_status = "healthy"
         alerts = []
@@ -212,6 +228,8 @@ def get_system_metrics():
                 'monte_carlo': cache_metrics,
                 'parameters': param_cache_metrics
             },
+            'database': database_metrics,
+            'services': service_metrics,
             'health_status': health_status,
             'alerts': alerts
         }
@@ -6,9 +6,8 @@ as well as viewing parameter history, impact analysis, related parameters, and a
 """
 
 from flask import Blueprint, request, jsonify, current_app
-from datetime import datetime, timedelta
+from datetime import datetime
 import json
-import uuid
 
 # Import services
 from services.financial_parameter_service import get_financial_parameter_service
@@ -130,8 +129,8 @@ def get_admin_parameter(parameter_path):
         try:
             metadata = service.parameters.get_parameter_with_metadata(parameter_path)
             
-            # Get history entries
-            history = service.parameters.get_parameter_history(parameter_path)
+            # Get the most recent history entries
+            history = service.get_parameter_history(parameter_path, limit=5)
             
             # Usage info not directly available from service
             # Create basic usage info based on what we know
@@ -171,8 +170,8 @@ def get_admin_parameter(parameter_path):
                     'type': type(value).__name__,
                     'usage': usage_info
                 },
-                'history': history[:5] if history else [],
-                'history_count': len(history) if history else 0
+                'history': history['entries'],
+                'history_count': history['matched']
             })
         except Exception as e:
             # Return basic information if metadata not available
@@ -202,6 +201,7 @@ def get_admin_parameter_history(parameter_path):
     """
     service = get_financial_parameter_service()
     limit = request.args.get('limit', default=50, type=int)
+    offset = request.args.get('offset', default=0, type=int)
     start_date = request.args.get('start_date')
     end_date = request.args.get('end_date')
     
@@ -214,45 +214,15 @@ def get_admin_parameter_history(parameter_path):
                 'error': f"Parameter '{parameter_path}' not found"
             }), 404
             
-        # Get parameter history
-        history = service.parameters.get_parameter_history(parameter_path)
-        
-        if not history:
-            return jsonify({
-                'success': True,
-                'history': [],
-                'parameter': {
-                    'path': parameter_path,
-                    'current_value': value
-                }
-            })
-            
-        # Filter by dates if provided
-        filtered_history = history
-        if start_date:
-            try:
-                start_datetime = datetime.fromisoformat(start_date)
-                filtered_history = [
-                    entry for entry in filtered_history 
-                    if 'timestamp' in entry and datetime.fromisoformat(entry['timestamp']) >= start_datetime
-                ]
-            except ValueError:
-                # If date parsing fails, ignore filter
-                pass
-                
-        if end_date:
-            try:
-                end_datetime = datetime.fromisoformat(end_date)
-                filtered_history = [
-                    entry for entry in filtered_history 
-                    if 'timestamp' in entry and datetime.fromisoformat(entry['timestamp']) <= end_datetime
-                ]
-            except ValueError:
-                # If date parsing fails, ignore filter
-                pass
-            
-        # Limit the number of entries
-        limited_history = filtered_history[:limit]
+        # Get a page of the parameter's history from the audit index
+        history = service.get_parameter_history(
+            parameter_path,
+            start_date=_parse_date_filter(start_date),
+            end_date=_parse_date_filter(end_date),
+            limit=limit,
+            offset=offset
+        )
+        limited_history = history['entries']
         
         # Add additional metadata
         parameter_metadata = {}
@@ -269,9 +239,10 @@ def get_admin_parameter_history(parameter_path):
                 'current_value': value,
                 'metadata': parameter_metadata
             },
-            'total_history_entries': len(history),
-            'filtered_entries': len(filtered_history),
-            'returned_entries': len(limited_history)
+            'total_history_entries': history['matched'],
+            'filtered_entries': history['matched'],
+            'returned_entries': len(limited_history),
+            'offset': offset
         })
             
     except Exception as e:
@@ -397,60 +368,34 @@ def get_related_parameters(parameter_path):
         parts = parameter_path.split('.')
         prefix = '.'.join(parts[:-1]) if len(parts) > 1 else parts[0]
         
-        # Get all parameters
-        all_params = service.get_all_parameters()
+        def related_entry(path, val, relation_type, relation_strength):
+            entry = {'path': path, 'value': val}
+            try:
+                metadata = service.parameters.get_parameter_with_metadata(path) or {}
+                entry['description'] = metadata.get('description')
+                entry['source'] = metadata.get('source')
+            except:
+                pass
+            entry['relation_type'] = relation_type
+            entry['relation_strength'] = relation_strength
+            return entry
         
-        # Find related parameters
-        related_parameters = []
+        # Parameters with the same prefix come straight from the path index
+        same_group = service.get_parameters_under(prefix)
+        same_group.pop(parameter_path, None)
+        related_parameters = [related_entry(path, val, 'same_group', 0.8)
+                              for path, val in same_group.items()]
         
-        for path, val in all_params.items():
-            # Skip the parameter itself
-            if path == parameter_path:
+        # Add parameters that are functionally related (this would be based on a real dependency graph)
+        # For now, we just use some heuristics based on parameter name
+        for path, val in service.get_all_parameters().items():
+            if path == parameter_path or path in same_group:
                 continue
-                
-            # Add parameters with the same prefix
-            if path.startswith(prefix + '.') or (len(parts) == 1 and path.startswith(prefix)):
-                try:
-                    metadata = service.parameters.get_parameter_with_metadata(path) or {}
-                    related_parameters.append({
-                        'path': path,
-                        'value': val,
-                        'description': metadata.get('description'),
-                        'source': metadata.get('source'),
-                        'relation_type': 'same_group',
-                        'relation_strength': 0.8
-                    })
-                except:
-                    related_parameters.append({
-                        'path': path,
-                        'value': val,
-                        'relation_type': 'same_group',
-                        'relation_strength': 0.8
-                    })
-            
-            # Add parameters that are functionally related (this would be based on a real dependency graph)
-            # For now, we just use some heuristics based on parameter name
-            elif (parts[-1] in path.split('.') or 
+            if (parts[-1] in path.split('.') or 
                  ('rate' in parts[-1] and 'rate' in path) or
                  ('tax' in parts[-1] and 'tax' in path) or
                  ('market' in parts[-1] and 'market' in path)):
-                try:
-                    metadata = service.parameters.get_parameter_with_metadata(path) or {}
-                    related_parameters.append({
-                        'path': path,
-                        'value': val,
-                        'description': metadata.get('description'),
-                        'source': metadata.get('source'),
-                        'relation_type': 'functional',
-                        'relation_strength': 0.5
-                    })
-                except:
-                    related_parameters.append({
-                        'path': path,
-                        'value': val,
-                        'relation_type': 'functional',
-                        'relation_strength': 0.5
-                    })
+                related_parameters.append(related_entry(path, val, 'functional', 0.5))
         
         return jsonify({
             'success': True,
@@ -479,6 +424,7 @@ def get_parameter_audit_log():
     
     # Get filter parameters
     limit = request.args.get('limit', default=50, type=int)
+    offset = request.args.get('offset', default=0, type=int)
     path_filter = request.args.get('path')
     action_filter = request.args.get('action')
     start_date = request.args.get('start_date')
@@ -486,70 +432,24 @@ def get_parameter_audit_log():
     search = request.args.get('search')
     
     try:
-        # Get audit log
-        try:
-            audit_log = service.parameters.get_audit_log() or []
-        except:
-            # Create mock audit log if method doesn't exist
-            audit_log = generate_mock_audit_log()
-        
-        # Apply filters
-        filtered_log = audit_log
-        
-        if path_filter:
-            filtered_log = [
-                entry for entry in filtered_log 
-                if entry.get('parameter_path') and path_filter in entry['parameter_path']
-            ]
-            
-        if action_filter:
-            filtered_log = [
-                entry for entry in filtered_log 
-                if entry.get('action') and entry['action'] == action_filter
-            ]
-            
-        if start_date:
-            try:
-                start_datetime = datetime.fromisoformat(start_date)
-                filtered_log = [
-                    entry for entry in filtered_log 
-                    if 'timestamp' in entry and datetime.fromisoformat(entry['timestamp']) >= start_datetime
-                ]
-            except ValueError:
-                # If date parsing fails, ignore filter
-                pass
-                
-        if end_date:
-            try:
-                end_datetime = datetime.fromisoformat(end_date)
-                filtered_log = [
-                    entry for entry in filtered_log 
-                    if 'timestamp' in entry and datetime.fromisoformat(entry['timestamp']) <= end_datetime
-                ]
-            except ValueError:
-                # If date parsing fails, ignore filter
-                pass
-                
-        if search:
-            search_term = search.lower()
-            filtered_log = [
-                entry for entry in filtered_log 
-                if (entry.get('parameter_path') and search_term in entry['parameter_path'].lower()) or
-                   (entry.get('reason') and search_term in entry['reason'].lower())
-            ]
-        
-        # Sort by timestamp in descending order
-        filtered_log.sort(key=lambda x: x.get('timestamp', ''), reverse=True)
-        
-        # Limit the number of entries
-        limited_log = filtered_log[:limit]
+        # Query a page of the audit log from its index
+        page = service.query_audit_log(
+            path_contains=path_filter,
+            action=action_filter,
+            start_date=_parse_date_filter(start_date),
+            end_date=_parse_date_filter(end_date),
+            search=search,
+            limit=limit,
+            offset=offset
+        )
         
         return jsonify({
             'success': True,
-            'audit_log': limited_log,
-            'total_entries': len(audit_log),
-            'filtered_entries': len(filtered_log),
-            'returned_entries': len(limited_log)
+            'audit_log': page['entries'],
+            'total_entries': page['total'],
+            'filtered_entries': page['matched'],
+            'returned_entries': len(page['entries']),
+            'offset': offset
         })
             
     except Exception as e:
@@ -846,56 +746,15 @@ def calculate_difference_percent(value1, value2):
     except:
         return None
         
-def generate_mock_audit_log():
-    """Generate mock audit log entries for testing"""
-    current_time = datetime.now().isoformat()
-    # Handle yesterday safely - subtract 24 hours using timedelta
-    yesterday = (datetime.now() - timedelta(hours=24)).isoformat()
-    # Handle last week safely - subtract 7 days using timedelta
-    last_week = (datetime.now() - timedelta(days=7)).isoformat()
-    
-    return [
-        {
-            'id': str(uuid.uuid4()),
-            'parameter_path': 'market.equity.expected_return',
-            'action': 'update',
-            'timestamp': current_time,
-            'user': 'admin',
-            'reason': 'Updated expected return based on latest projections',
-            'previous_value': 8.5,
-            'new_value': 9.2
-        },
-        {
-            'id': str(uuid.uuid4()),
-            'parameter_path': 'market.bond.expected_return',
-            'action': 'update',
-            'timestamp': yesterday,
-            'user': 'admin',
-            'reason': 'Adjusted bond returns to reflect current market conditions',
-            'previous_value': 4.0,
-            'new_value': 3.5
-        },
-        {
-            'id': str(uuid.uuid4()),
-            'parameter_path': 'inflation.long_term',
-            'action': 'update',
-            'timestamp': last_week,
-            'user': 'system',
-            'reason': 'Scheduled quarterly update from economic data feed',
-            'previous_value': 2.5,
-            'new_value': 2.7
-        },
-        {
-            'id': str(uuid.uuid4()),
-            'parameter_path': 'custom.test.parameter',
-            'action': 'create',
-            'timestamp': last_week,
-            'user': 'admin',
-            'reason': 'Created new test parameter',
-            'previous_value': None,
-            'new_value': 100
-        }
-    ]
+def _parse_date_filter(value):
+    """Normalize an ISO date query argument for timestamp comparison (None if invalid)"""
+    if not value:
+        return None
+    try:
+        return datetime.fromisoformat(value).isoformat()
+    except ValueError:
+        # If date parsing fails, ignore filter
+        return None
 
 @admin_parameters_api.route('/admin/parameters', methods=['POST'])
 @auth.login_required
@@ -1136,6 +995,10 @@ def delete_parameter(parameter_path):
             success = True
         
         if success:
+            # Deleted from the store directly; drop it from the service's parameter snapshot
+            if hasattr(service, 'discard'):
+                service.discard(parameter_path)
+            
             # Log action for audit purposes
             try:
                 # Use _add_audit_entry if available, otherwise log the change
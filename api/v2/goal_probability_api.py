@@ -21,10 +21,13 @@ from models.goal_adjustment import GoalAdjustmentRecommender, AdjustmentType
 from models.gap_analysis.scenarios import GoalScenarioComparison
 from services.goal_service import GoalService
 from services.goal_adjustment_service import GoalAdjustmentService
+from services.service_registry import get_service
 from models.monte_carlo.cache import (
-    cached_simulation, get_cache_stats, invalidate_cache,
-    save_cache, load_cache, configure_cache
+    cached_simulation, get_cache_stats, invalidate_cache, invalidate_tags,
+    goal_tag, save_cache, load_cache, configure_cache
 )
+from models.monte_carlo.coalesce import get_coalescing_stats
+from models.connection_pool import get_pool_stats
 
 # Import common API utilities
 from api.v2.utils import (
@@ -89,8 +92,8 @@ def get_goal_probability(goal_id: str):
         g.cache_status = "MISS"
             
         # Access services
-        goal_service = current_app.config.get('goal_service', GoalService())
-        goal_probability_analyzer = current_app.config.get('goal_probability_analyzer', GoalProbabilityAnalyzer())
+        goal_service = get_service('goal_service')
+        goal_probability_analyzer = get_service('goal_probability_analyzer')
         
         # Get goal data
         goal = goal_service.get_goal(goal_id)
@@ -219,8 +222,8 @@ def calculate_goal_probability(goal_id: str):
             g.cache_status = "MISS"
             
         # Access services
-        goal_service = current_app.config.get('goal_service', GoalService())
-        goal_probability_analyzer = current_app.config.get('goal_probability_analyzer', GoalProbabilityAnalyzer())
+        goal_service = get_service('goal_service')
+        goal_probability_analyzer = get_service('goal_probability_analyzer')
         
         # Get goal data
         goal = goal_service.get_goal(goal_id)
@@ -258,7 +261,7 @@ def calculate_goal_probability(goal_id: str):
                     }), 500
                 
                 # Invalidate cached data for this goal
-                invalidate_cache(f"goal:{goal_id}")
+                invalidate_tags(goal_tag(goal_id))
             
             # Prepare response with safer attribute access using the attribute_fix functions
             response = {
@@ -374,8 +377,8 @@ def get_goal_adjustments(goal_id: str):
         g.cache_status = "MISS"
             
         # Access services
-        goal_service = current_app.config.get('goal_service', GoalService())
-        goal_adjustment_service = current_app.config.get('goal_adjustment_service', GoalAdjustmentService())
+        goal_service = get_service('goal_service')
+        goal_adjustment_service = get_service('goal_adjustment_service')
         
         # Get goal data
         goal = goal_service.get_goal(goal_id)
@@ -536,7 +539,7 @@ def get_goal_scenarios(goal_id: str):
         g.cache_status = "MISS"
             
         # Access services
-        goal_service = current_app.config.get('goal_service', GoalService())
+        goal_service = get_service('goal_service')
         
         # Get goal data
         goal = goal_service.get_goal(goal_id)
@@ -765,8 +768,8 @@ def create_goal_scenario(goal_id: str):
                     }), 400
             
         # Access services
-        goal_service = current_app.config.get('goal_service', GoalService())
-        goal_probability_analyzer = current_app.config.get('goal_probability_analyzer', GoalProbabilityAnalyzer())
+        goal_service = get_service('goal_service')
+        goal_probability_analyzer = get_service('goal_probability_analyzer')
         
         # Get goal data
         goal = goal_service.get_goal(goal_id)
@@ -899,7 +902,7 @@ def get_goal_scenario(goal_id: str, scenario_id: str):
         g.cache_status = "MISS"
             
         # Access services
-        goal_service = current_app.config.get('goal_service', GoalService())
+        goal_service = get_service('goal_service')
         
         # Get goal data
         goal = goal_service.get_goal(goal_id)
@@ -1022,7 +1025,7 @@ def delete_goal_scenario(goal_id: str, scenario_id: str):
             }), 400
             
         # Access services
-        goal_service = current_app.config.get('goal_service', GoalService())
+        goal_service = get_service('goal_service')
         
         # Get goal data
         goal = goal_service.get_goal(goal_id)
@@ -1153,7 +1156,11 @@ def get_cache_stats_api():
             'hit_rate': stats.get('hit_rate', 0),
             'cache_type': 'in_memory',
             'uptime': stats.get('uptime', 0),
-            'memory_usage_estimate': stats.get('memory_usage', 0),
+            'memory_usage_estimate': stats.get('memory_usage_estimate', 0),
+            'max_bytes': stats.get('max_bytes'),
+            'evictions': stats.get('evictions', 0),
+            'expirations': stats.get('expirations', 0),
+            'prefixes': stats.get('prefixes', {}),
             'hit_rate_percentage': round(stats.get('hit_rate', 0) * 100, 2),
             'enabled': current_app.config.get('API_CACHE_ENABLED', True),
             'default_ttl': current_app.config.get('API_CACHE_TTL', 3600),
@@ -1365,6 +1372,7 @@ def configure_cache_endpoint():
     
     Request Body (optional):
         - max_size: Maximum number of entries in the cache
+        - max_bytes: Maximum estimated size of all cache entries in bytes
         - ttl: Time-to-live for cache entries in seconds
         - save_interval: Interval between auto-saves in seconds
         - cache_dir: Directory to store cache files
@@ -1391,6 +1399,7 @@ def configure_cache_endpoint():
         # Get request data
         data = request.get_json() or {}
         max_size = data.get('max_size')
+        max_bytes = data.get('max_bytes')
         ttl = data.get('ttl')
         save_interval = data.get('save_interval')
         cache_dir = data.get('cache_dir')
@@ -1407,6 +1416,7 @@ def configure_cache_endpoint():
             configure_cache(
                 max_size=max_size,
                 ttl=ttl,
+                max_bytes=max_bytes,
                 save_interval=save_interval,
                 cache_dir=cache_dir,
                 cache_file=cache_file
@@ -1428,6 +1438,7 @@ def configure_cache_endpoint():
             'ip_address': request.remote_addr,
             'config': {
                 'max_size': max_size,
+                'max_bytes': max_bytes,
                 'ttl': ttl,
                 'save_interval': save_interval,
                 'cache_dir': cache_dir,
@@ -1443,6 +1454,7 @@ def configure_cache_endpoint():
             'message': "Cache configuration updated successfully",
             'config': {
                 'max_size': stats['max_size'],
+                'max_bytes': stats.get('max_bytes'),
                 'ttl': stats['ttl'],
                 'memory_usage_estimate': stats.get('memory_usage_estimate', 0)
             },
@@ -1592,9 +1604,18 @@ def get_monte_carlo_performance():
                 'hit_rate': 0
             }
         
+        # Identical simulations requested concurrently and served by one calculation
+        try:
+            coalescing_stats = get_coalescing_stats()
+        except Exception as coalescing_error:
+            logger.warning(f"Error getting coalescing stats: {str(coalescing_error)}")
+            coalescing_stats = {}
+        
         # Collect all performance data
         performance_data = {
             'cache': cache_stats,
+            'coalescing': coalescing_stats,
+            'database_pools': get_pool_stats(),
             'simulation_times': _get_simulation_times(),
             'resource_usage': {
                 'cpu_utilization': _get_cpu_utilization(),
@@ -1633,6 +1654,10 @@ def get_monte_carlo_performance():
                     if isinstance(value, (int, float)):
                         csv_data += f"cache,{key},{value}\n"
                         
+                # Add coalescing metrics
+                for key, value in performance_data['coalescing'].items():
+                    csv_data += f"coalescing,{key},{value}\n"
+                        
                 # Add API metrics
                 for key, value in performance_data['api_metrics'].items():
                     if isinstance(value, (int, float)):
@@ -1833,7 +1858,7 @@ def get_goal_simulation(goal_id: str):
         return_type = request.args.get('return_type', 'data')
         
         # Access services
-        goal_service = current_app.config.get('goal_service', GoalService())
+        goal_service = get_service('goal_service')
             
         # Get goal data
         goal = goal_service.get_goal(goal_id)
@@ -2118,8 +2143,8 @@ def calculate_probability_frontend_compatible():
         start_time = time.time()
         
         # Access services
-        goal_service = current_app.config.get('goal_service', GoalService())
-        goal_probability_analyzer = current_app.config.get('goal_probability_analyzer', GoalProbabilityAnalyzer())
+        goal_service = get_service('goal_service')
+        goal_probability_analyzer = get_service('goal_probability_analyzer')
         
         # For new goals, create a temp goal
         temp_goal = {
@@ -142,8 +142,8 @@ def get_parameter(parameter_path):
         try:
             metadata = service.parameters.get_parameter_with_metadata(parameter_path)
             
-            # Get history
-            history = service.parameters.get_parameter_history(parameter_path)
+            # Get the most recent history entries
+            history = service.get_parameter_history(parameter_path, limit=10)
             
             return jsonify({
                 'success': True,
@@ -159,7 +159,7 @@ def get_parameter(parameter_path):
                     'last_updated': metadata.get('last_updated'),
                     'has_overrides': metadata.get('has_overrides', False)
                 },
-                'history': history[:10] if history else []
+                'history': history['entries']
             })
         except Exception as e:
             # Return basic information if metadata not available
@@ -372,6 +372,7 @@ def delete_parameter(parameter_path):
         success = service.parameters.delete_parameter(parameter_path)
         
         if success:
+            service.discard(parameter_path)
             return jsonify({
                 'success': True,
                 'message': f"Parameter '{parameter_path}' deleted successfully"
@@ -424,10 +425,17 @@ def bulk_update_parameters():
         }), 400
     
     try:
-        # Process each parameter
+        # Publish every complete entry as one parameter snapshot
         results = []
         source = data.get('source', 'api_bulk')
-        reason = data.get('reason')
+        updates = {param['path']: param['value'] for param in data['parameters']
+                   if 'path' in param and 'value' in param}
+        
+        try:
+            outcomes = service.set_many(updates, source=source)
+        except Exception as e:
+            current_app.logger.error(f"Bulk parameter update failed: {str(e)}")
+            outcomes = {}
         
         for param in data['parameters']:
             if 'path' not in param or 'value' not in param:
@@ -437,26 +445,13 @@ def bulk_update_parameters():
                     'error': 'path and value are required'
                 })
                 continue
-                
-            try:
-                success = service.set(
-                    param['path'], 
-                    param['value'],
-                    source=source,
-                    reason=reason
-                )
-                
-                results.append({
-                    'path': param['path'],
-                    'success': success,
-                    'error': None if success else 'Failed to update parameter'
-                })
-            except Exception as e:
-                results.append({
-                    'path': param['path'],
-                    'success': False,
-                    'error': str(e)
-                })
+            
+            success = outcomes.get(param['path'], False)
+            results.append({
+                'path': param['path'],
+                'success': success,
+                'error': None if success else 'Failed to update parameter'
+            })
         
         # Calculate summary
         success_count = sum(1 for r in results if r['success'])
@@ -490,12 +485,14 @@ def get_parameter_history(parameter_path):
         
     Query parameters:
     - limit: Maximum number of history entries to return
+    - offset: Number of history entries to skip
         
     Returns:
         JSON response with parameter history
     """
     service = get_financial_parameter_service()
     limit = request.args.get('limit', default=10, type=int)
+    offset = request.args.get('offset', default=0, type=int)
     
     try:
         # Check if parameter exists
@@ -506,21 +503,13 @@ def get_parameter_history(parameter_path):
                 'error': f"Parameter '{parameter_path}' not found"
             }), 404
             
-        # Get parameter history
-        history = service.parameters.get_parameter_history(parameter_path)
-        
-        if not history:
-            return jsonify({
-                'success': True,
-                'history': []
-            })
-            
-        # Limit the number of entries
-        limited_history = history[:limit]
+        # Get a page of the parameter's history from the audit index
+        history = service.get_parameter_history(parameter_path, limit=limit, offset=offset)
         
         return jsonify({
             'success': True,
-            'history': limited_history
+            'history': history['entries'],
+            'total': history['matched']
         })
             
     except Exception as e:
@@ -19,6 +19,7 @@ from flask import Blueprint, jsonify, request, current_app, g
 
 # Import relevant models and services
 from services.question_service import QuestionService, QuestionLogger
+from services.service_registry import get_service
 from models.profile_understanding import ProfileUnderstandingCalculator
 from models.question_generator import QuestionGenerator
 
@@ -302,23 +303,8 @@ def get_dynamic_question_data():
         }), 500
 
 def _get_question_service():
-    """Get the question service from current app config or create a new one."""
-    question_service = current_app.config.get('question_service')
-    
-    if not question_service:
-        # Try to create a new question service
-        question_repository = current_app.config.get('question_repository')
-        profile_manager = current_app.config.get('profile_manager')
-        llm_service = current_app.config.get('llm_service')
-        
-        if question_repository and profile_manager:
-            question_service = QuestionService(
-                question_repository, 
-                profile_manager,
-                llm_service
-            )
-    
-    return question_service
+    """Get the question service from current app config or the shared service registry."""
+    return get_service('question_service')
 
 def _get_dynamic_question_data(question_id, profile, question_service):
     """
@@ -17,7 +17,7 @@ import functools
 import json
 import uuid
 from typing import Dict, Any, Optional, Tuple, Callable
-from flask import jsonify, request, current_app, g
+from flask import jsonify, request, current_app, g, after_this_request
 
 # Import the consolidated cache implementation
 from models.monte_carlo.simulation import cache_response as simulation_cache_response
@@ -335,10 +335,20 @@ def rate_limit_middleware():
     return None
 
 
+# Max seconds a request waits for another worker computing the same response
+API_FILL_WAIT_TIMEOUT = 10
+
+
 def check_cache(key):
     """
     Check if a response is in the cache and return it if found.
     
+    The cache is shared by all worker processes. On a miss the caller
+    becomes the single filler of the key: concurrent requests for the same
+    key, in any worker, wait for its cache_response() instead of computing
+    the response again. The fill is released when the request finishes,
+    even if no response is cached.
+    
     Args:
         key: Cache key to check
         
@@ -347,9 +357,15 @@ def check_cache(key):
     """
     # Use the global cache object directly
     from models.monte_carlo.cache import _cache
-    cached_data = _cache.get(key)
+    cached_data = _cache.acquire_fill(key, wait_timeout=API_FILL_WAIT_TIMEOUT)
     if cached_data is not None:
         return jsonify(cached_data), 200
+    
+    @after_this_request
+    def release_fill(response):
+        _cache.release_fill(key)
+        return response
+    
     return None
 
 
@@ -362,16 +378,22 @@ def cache_response(key, data, ttl=3600):
         data: Data to cache
         ttl: Time-to-live in seconds (default: 1 hour)
     """
-    # Skip caching if disabled in config
-    if not current_app.config.get('API_CACHE_ENABLED', True):
-        return
-        
-    # Get TTL from config if not specified
-    if ttl is None:
-        ttl = current_app.config.get('API_CACHE_TTL', 3600)
-        
-    # Use the consolidated implementation
-    simulation_cache_response(key, data, ttl)
+    from models.monte_carlo.cache import _cache
+    
+    try:
+        # Skip caching if disabled in config
+        if not current_app.config.get('API_CACHE_ENABLED', True):
+            return
+            
+        # Get TTL from config if not specified
+        if ttl is None:
+            ttl = current_app.config.get('API_CACHE_TTL', 3600)
+            
+        # Use the consolidated implementation
+        simulation_cache_response(key, data, ttl)
+    finally:
+        # Wake up requests waiting for this response (see check_cache)
+        _cache.release_fill(key)
 
 
 def monitor_performance(f):
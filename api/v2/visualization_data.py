@@ -30,6 +30,7 @@ from models.goal_adjustment import GoalAdjustmentRecommender, AdjustmentType
 from models.gap_analysis.scenarios import GoalScenarioComparison
 from services.goal_service import GoalService
 from services.goal_adjustment_service import GoalAdjustmentService
+from services.service_registry import get_service
 from models.monte_carlo.cache import cached_simulation, get_cache_stats, invalidate_cache
 
 # Import common API utilities
@@ -92,9 +93,9 @@ def get_visualization_data(goal_id: str):
         g.cache_status = "MISS"
             
         # Access services
-        goal_service = current_app.config.get('goal_service', GoalService())
-        goal_manager = current_app.config.get('goal_manager', GoalManager())
-        profile_manager = current_app.config.get('profile_manager')
+        goal_service = get_service('goal_service')
+        goal_manager = get_service('goal_manager')
+        profile_manager = get_service('profile_manager')
         
         # Get goal data
         goal = goal_service.get_goal(goal_id)
@@ -220,7 +221,7 @@ def get_goal_projection_data(goal_id: str):
         g.cache_status = "MISS"
             
         # Access services
-        goal_service = current_app.config.get('goal_service', GoalService())
+        goal_service = get_service('goal_service')
         
         # Get goal data
         goal = goal_service.get_goal(goal_id)
@@ -322,7 +323,7 @@ def get_portfolio_data():
         g.cache_status = "MISS"
             
         # Access services
-        goal_service = current_app.config.get('goal_service', GoalService())
+        goal_service = get_service('goal_service')
         
         # Get all goals for the user
         goals = goal_service.get_goals_for_user(user_id)
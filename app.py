@@ -23,6 +23,7 @@ from services.llm_service import LLMService
 from services.profile_analytics_service import ProfileAnalyticsService
 from services.goal_service import GoalService
 from services.financial_parameter_service import FinancialParameterService, get_financial_parameter_service
+from services.service_registry import get_service, init_app as init_services
 from config import Config
 
 # Initialize Flask app
@@ -36,6 +37,11 @@ CORS(app)
 # Initialize configuration for the app
 Config.init_app(app)
 
+# Shared services, constructed on first use (or at startup with SERVICE_WARMUP)
+services = init_services(app)
+if getattr(Config, 'SERVICE_WARMUP', False):
+    app.logger.info(f"Services warmed up in {services.warmup():.3f}s")
+
 @app.route('/api/v2/check_server')
 def check_server():
     """Simple endpoint to verify the server is running without auth"""
@@ -51,7 +57,7 @@ def debug_goal_probability(goal_id):
     """Debug endpoint to view raw goal probability data"""
     try:
         # Get goal service
-        goal_service = app.config.get('goal_service', GoalService())
+        goal_service = get_service('goal_service')
         
         # Get the goal with all probability details
         goal = goal_service.get_goal(goal_id, legacy_mode=False, include_probability_details=True)
@@ -456,6 +462,11 @@ try:
     else:
         cache_ttl = 3600  # 1 hour
 
+    if hasattr(Config, 'MONTE_CARLO_CACHE_MAX_BYTES'):
+        cache_max_bytes = Config.MONTE_CARLO_CACHE_MAX_BYTES
+    else:
+        cache_max_bytes = None  # Use default
+
     if hasattr(Config, 'MONTE_CARLO_CACHE_SAVE_INTERVAL'):
         save_interval = Config.MONTE_CARLO_CACHE_SAVE_INTERVAL
     else:
@@ -466,14 +477,19 @@ try:
     else:
         cache_dir = None  # Use default
 
+    # Simulation store shared by all worker processes
+    store_dir = getattr(Config, 'MONTE_CARLO_CACHE_STORE_DIR', None)
+
     # Configure and initialize the cache
     configure_cache(
         max_size=max_cache_size,
         ttl=cache_ttl,
+        max_bytes=cache_max_bytes,
         save_interval=save_interval,
-        cache_dir=cache_dir
+        cache_dir=cache_dir,
+        store_dir=store_dir
     )
-    initialize_cache()
+    initialize_cache(background=getattr(Config, 'MONTE_CARLO_CACHE_BACKGROUND_INIT', False))
 
     app.logger.info("Monte Carlo cache system initialized")
 
@@ -481,6 +497,20 @@ except Exception as e:
     app.logger.warning(f"Failed to initialize Monte Carlo cache: {e}")
     app.logger.warning("Monte Carlo simulations will still work but without persistence")
 
+# Persist the parameter audit log so every worker sees the same history
+try:
+    from models.parameter_audit import configure_audit_store
+
+    if getattr(Config, 'PARAMETER_AUDIT_DB_PATH', None):
+        configure_audit_store(Config.PARAMETER_AUDIT_DB_PATH,
+                              max_rows=Config.PARAMETER_AUDIT_MAX_ROWS,
+                              max_age_days=Config.PARAMETER_AUDIT_MAX_AGE_DAYS)
+        app.logger.info("Parameter audit log persisted to SQLite")
+
+except Exception as e:
+    app.logger.warning(f"Failed to initialize parameter audit store: {e}")
+    app.logger.warning("Parameter audit entries will only be kept in memory")
+
 # Import and register API blueprints
 from api.v2.visualization_data import visualization_api
 from api.v2.goal_probability_api import goal_probability_api
@@ -649,7 +679,7 @@ def direct_auth_test():
 def test_simulation_endpoint(goal_id):
     """Test endpoint using the consolidated simulation module."""
     # Get goal service from app config
-    goal_service_instance = app.config.get('goal_service', GoalService())
+    goal_service_instance = get_service('goal_service')
 
     # Parse request parameters
     params = request.args.to_dict()
@@ -777,7 +807,7 @@ def create_profile():
             }), 400
             
         # Create the profile using DatabaseProfileManager
-        profile_manager = DatabaseProfileManager()
+        profile_manager = get_service('profile_manager')
         profile = profile_manager.create_profile(
             name=profile_data['name'],
             email=profile_data['email']
@@ -821,14 +851,10 @@ def questions():
     if not profile_id:
         return redirect(url_for('create_profile'))
     
-    # Initialize dependencies for the QuestionService
-    from models.question_repository import QuestionRepository
-    from models.database_profile_manager import DatabaseProfileManager
-    
-    # Initialize needed services with required dependencies
-    question_repository = QuestionRepository()
-    profile_manager = DatabaseProfileManager()
-    question_service = QuestionService(question_repository, profile_manager)
+    # Shared services (constructed once per process)
+    question_repository = get_service('question_repository')
+    profile_manager = get_service('profile_manager')
+    question_service = get_service('question_service')
     
     # Get next question and profile completion
     try:
@@ -937,14 +963,10 @@ def submit_answer():
     else:
         answer = request.form.get('answer')
     
-    # Initialize dependencies for the QuestionService
-    from models.question_repository import QuestionRepository
-    from models.database_profile_manager import DatabaseProfileManager
-    
-    # Initialize the service with required dependencies
-    question_repository = QuestionRepository()
-    profile_manager = DatabaseProfileManager()
-    question_service = QuestionService(question_repository, profile_manager)
+    # Shared services (constructed once per process)
+    question_repository = get_service('question_repository')
+    profile_manager = get_service('profile_manager')
+    question_service = get_service('question_service')
     
     # Debug information
     app.logger.info(f"Submitting answer for question ID: {question_id}, input type: {input_type}")
@@ -987,7 +1009,7 @@ def switch_profile():
         session.pop('profile_id')
     
     # Get profile manager
-    profile_manager = DatabaseProfileManager()
+    profile_manager = get_service('profile_manager')
     
     # Get all profiles
     profiles = profile_manager.get_all_profiles()
@@ -1003,7 +1025,7 @@ def list_goals():
         return redirect(url_for('create_profile'))
     
     # Get goals for this profile
-    goal_service = app.config.get('goal_service', GoalService())
+    goal_service = get_service('goal_service')
     try:
         goals = goal_service.get_goals_for_profile(profile_id)
     except AttributeError as e:
@@ -1014,8 +1036,9 @@ def list_goals():
                 goals = goal_service.get_profile_goals(profile_id)
             else:
                 # Final fallback - use direct database access
-                goal_manager = GoalManager()
+                goal_manager = get_service('goal_manager')
                 goal_objects = goal_manager.get_profile_goals(profile_id)
+                goal_manager.load_goal_blobs(goal_objects or [])
                 goals = [goal.to_dict() for goal in goal_objects] if goal_objects else []
                 app.logger.info(f"Used GoalManager fallback to get {len(goals)} goals")
         except Exception as inner_e:
@@ -1035,7 +1058,7 @@ def profile_complete():
         return redirect(url_for('create_profile'))
     
     # Get profile manager
-    profile_manager = DatabaseProfileManager()
+    profile_manager = get_service('profile_manager')
     
     # Get profile
     profile = profile_manager.get_profile(profile_id)
@@ -1044,12 +1067,8 @@ def profile_complete():
         return redirect(url_for('create_profile'))
     
     # Get question service to calculate completion metrics
-    # Initialize dependencies for the QuestionService
-    from models.question_repository import QuestionRepository
-    from services.question_service import QuestionService
-    
-    question_repository = QuestionRepository()
-    question_service = QuestionService(question_repository, profile_manager)
+    question_repository = get_service('question_repository')
+    question_service = get_service('question_service')
     
     # Calculate completion metrics
     completion = question_service.get_profile_completion(profile)
@@ -1099,7 +1118,7 @@ def create_goal(goal_type=None):
     if not profile_id:
         return redirect(url_for('create_profile'))
     
-    goal_service = app.config.get('goal_service', GoalService())
+    goal_service = get_service('goal_service')
     
     if request.method == 'POST':
         # Process the form data
@@ -1199,7 +1218,7 @@ def debug_goals_list():
             }), 400
             
         # Get goal service
-        goal_service = app.config.get('goal_service', GoalService())
+        goal_service = get_service('goal_service')
         
         # Get all goals for the profile
         goals = goal_service.get_profile_goals(profile_id, legacy_mode=False, include_probability_details=True)
@@ -1230,8 +1249,8 @@ def debug_recalculate_probability(goal_id):
     """Debug endpoint to force recalculation of a goal's probability"""
     try:
         # Get services
-        goal_service = app.config.get('goal_service', GoalService())
-        goal_probability_analyzer = app.config.get('goal_probability_analyzer', GoalProbabilityAnalyzer())
+        goal_service = get_service('goal_service')
+        goal_probability_analyzer = get_service('goal_probability_analyzer')
         
         # Get the goal
         goal = goal_service.get_goal(goal_id, legacy_mode=False, include_probability_details=True)
@@ -1290,7 +1309,7 @@ def debug_recalculate_probability(goal_id):
 @app.route('/check_probability/<goal_id>')
 def check_probability(goal_id):
     """Debug route to check probability display for a specific goal"""
-    goal_service = app.config.get('goal_service', GoalService())
+    goal_service = get_service('goal_service')
     goal = goal_service.get_goal(goal_id)
     if not goal:
         return "Goal not found", 404
@@ -1306,7 +1325,7 @@ def check_probability(goal_id):
 def update_probability(goal_id):
     """Update a goal's probability for testing display"""
     try:
-        goal_service = app.config.get('goal_service', GoalService())
+        goal_service = get_service('goal_service')
         new_prob = request.form.get('new_prob')
         
         # Convert to float and validate
@@ -1328,7 +1347,7 @@ def update_probability(goal_id):
         # Update the probability directly in the goal object using manager
         # This is a more direct approach for testing
         try:
-            goal_manager = app.config.get('goal_manager', GoalManager())
+            goal_manager = get_service('goal_manager')
             db_goal = goal_manager.get_goal(goal_id)
             
             if db_goal:
@@ -1360,7 +1379,7 @@ def edit_goal(goal_id):
     if not profile_id:
         return redirect(url_for('create_profile'))
     
-    goal_service = app.config.get('goal_service', GoalService())
+    goal_service = get_service('goal_service')
     
     # Get the goal
     try:
@@ -1463,7 +1482,7 @@ def test_profile_question_flow():
     
     try:
         # Step 1: Test profile creation
-        profile_manager = DatabaseProfileManager()
+        profile_manager = get_service('profile_manager')
         
         # Create a test profile
         test_name = f"Test User {datetime.now().strftime('%Y%m%d_%H%M%S')}"
@@ -1494,8 +1513,8 @@ def test_profile_question_flow():
         # Step 2: Test question flow
         try:
             # Initialize QuestionService with proper dependencies
-            question_repository = QuestionRepository()
-            question_service = QuestionService(question_repository, profile_manager)
+            question_repository = get_service('question_repository')
+            question_service = get_service('question_service')
             
             # Get the next question for the profile
             next_question, profile = question_service.get_next_question(profile_id)
@@ -1635,7 +1654,7 @@ def test_goal_management_flow():
     
     try:
         # Step 1: Create a test profile for goal management testing
-        profile_manager = DatabaseProfileManager()
+        profile_manager = get_service('profile_manager')
         
         # Create a test profile
         test_name = f"Goal Test User {datetime.now().strftime('%Y%m%d_%H%M%S')}"
@@ -1658,7 +1677,7 @@ def test_goal_management_flow():
         }
         
         # Step 2: Test goal creation
-        goal_service = app.config.get('goal_service', GoalService())
+        goal_service = get_service('goal_service')
         
         try:
             # Create test goal data
@@ -1786,8 +1805,9 @@ def test_goal_management_flow():
                         app.logger.error(f"Error in fallback method: {str(inner_e)}")
                         # Try direct database access
                         from models.goal_models import GoalManager
-                        goal_manager = GoalManager()
+                        goal_manager = get_service('goal_manager')
                         goal_objects = goal_manager.get_profile_goals(profile_id)
+                        goal_manager.load_goal_blobs(goal_objects or [])
                         goals = [goal.to_dict() for goal in goal_objects] if goal_objects else []
                 
                 if goals is not None:
@@ -1902,7 +1922,7 @@ def delete_goal(goal_id):
     if not profile_id:
         return jsonify({'success': False, 'error': 'No active profile'}), 401
     
-    goal_service = app.config.get('goal_service', GoalService())
+    goal_service = get_service('goal_service')
     
     try:
         # Delete the goal
@@ -1934,7 +1954,7 @@ def admin_dashboard():
 @admin_required
 def admin_profiles():
     """Admin profiles page"""
-    profile_manager = DatabaseProfileManager()
+    profile_manager = get_service('profile_manager')
     profiles = profile_manager.get_all_profiles()
     return render_template('admin/profiles.html', profiles=profiles)
 
@@ -1942,7 +1962,7 @@ def admin_profiles():
 @admin_required
 def admin_profile_detail(profile_id):
     """Admin profile detail page"""
-    profile_manager = DatabaseProfileManager()
+    profile_manager = get_service('profile_manager')
     try:
         profile = profile_manager.get_profile(profile_id)
     except Exception as e:
@@ -1954,7 +1974,7 @@ def admin_profile_detail(profile_id):
         flash('Profile not found!', 'error')
         return redirect(url_for('admin_profiles'))
     
-    goal_service = app.config.get('goal_service', GoalService())
+    goal_service = get_service('goal_service')
     try:
         goals = goal_service.get_goals_for_profile(profile_id)
     except AttributeError as e:
@@ -1965,8 +1985,9 @@ def admin_profile_detail(profile_id):
                 goals = goal_service.get_profile_goals(profile_id)
             else:
                 # Final fallback - use direct database access
-                goal_manager = GoalManager()
+                goal_manager = get_service('goal_manager')
                 goal_objects = goal_manager.get_profile_goals(profile_id)
+                goal_manager.load_goal_blobs(goal_objects or [])
                 goals = [goal.to_dict() for goal in goal_objects] if goal_objects else []
                 app.logger.info(f"Used GoalManager fallback to get {len(goals)} goals")
         except Exception as inner_e:
@@ -2028,7 +2049,7 @@ def view_profile_analytics(profile_id):
         return redirect(url_for('index'))
 
     # Get the profile
-    profile_manager = DatabaseProfileManager()
+    profile_manager = get_service('profile_manager')
     profile = profile_manager.get_profile(profile_id)
     
     if not profile:
@@ -2040,7 +2061,7 @@ def view_profile_analytics(profile_id):
     
     try:
         # Get the analytics service, passing the required profile_manager
-        analytics_service = ProfileAnalyticsService(profile_manager)
+        analytics_service = get_service('profile_analytics_service')
         
         # Get analytics data
         analytics_data = analytics_service.generate_profile_analytics(profile_id)
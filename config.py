@@ -43,15 +43,32 @@ class Config:
     # Monte Carlo cache settings
     MONTE_CARLO_CACHE_SIZE = int(os.environ.get('MONTE_CARLO_CACHE_SIZE', '100'))
     MONTE_CARLO_CACHE_TTL = int(os.environ.get('MONTE_CARLO_CACHE_TTL', '3600'))  # 1 hour
+    MONTE_CARLO_CACHE_MAX_BYTES = int(os.environ.get('MONTE_CARLO_CACHE_MAX_BYTES', str(256 * 1024 * 1024)))  # 256 MB
     MONTE_CARLO_CACHE_SAVE_INTERVAL = int(os.environ.get('MONTE_CARLO_CACHE_SAVE_INTERVAL', '300'))  # 5 minutes
     MONTE_CARLO_CACHE_DIR = os.environ.get('MONTE_CARLO_CACHE_DIR') or os.path.join(DATA_DIRECTORY, 'cache')
     MONTE_CARLO_CACHE_FILE = os.environ.get('MONTE_CARLO_CACHE_FILE', 'monte_carlo_cache.pickle')
+    # Simulation store shared by all worker processes (e.g. /dev/shm/monte_carlo); defaults to MONTE_CARLO_CACHE_DIR
+    MONTE_CARLO_CACHE_STORE_DIR = os.environ.get('MONTE_CARLO_CACHE_STORE_DIR')
+    # Load persisted cache entries in a background thread so workers boot without waiting on it
+    MONTE_CARLO_CACHE_BACKGROUND_INIT = os.environ.get('MONTE_CARLO_CACHE_BACKGROUND_INIT', 'True').lower() in ('true', '1', 't')
+    
+    # Parameter audit log shared by all worker processes (empty keeps only the in-memory ring buffer)
+    PARAMETER_AUDIT_DB_PATH = os.environ.get('PARAMETER_AUDIT_DB_PATH', os.path.join(DATA_DIRECTORY, 'parameter_audit.db'))
+    PARAMETER_AUDIT_MAX_ROWS = int(os.environ.get('PARAMETER_AUDIT_MAX_ROWS', '100000'))
+    PARAMETER_AUDIT_MAX_AGE_DAYS = int(os.environ.get('PARAMETER_AUDIT_MAX_AGE_DAYS', '90'))
+    
+    # Simulation executor: processes forked per gunicorn worker (0 = min(2, CPU count))
+    MONTE_CARLO_EXECUTOR_WORKERS = int(os.environ.get('MONTE_CARLO_EXECUTOR_WORKERS', '0'))
+    
+    # Construct shared services at startup instead of on the first request
+    SERVICE_WARMUP = os.environ.get('SERVICE_WARMUP', 'False').lower() in ('true', '1', 't')
     
     # Feature flags
     FEATURE_GOAL_PROBABILITY_API = os.environ.get('FEATURE_GOAL_PROBABILITY_API', 'True').lower() in ('true', '1', 't')
     FEATURE_VISUALIZATION_API = os.environ.get('FEATURE_VISUALIZATION_API', 'True').lower() in ('true', '1', 't')
     FEATURE_ADMIN_CACHE_API = os.environ.get('FEATURE_ADMIN_CACHE_API', 'True').lower() in ('true', '1', 't')
     FEATURE_MONTE_CARLO_CACHE = os.environ.get('FEATURE_MONTE_CARLO_CACHE', 'True').lower() in ('true', '1', 't')
+    FEATURE_SIMULATION_EXECUTOR = os.environ.get('FEATURE_SIMULATION_EXECUTOR', 'False').lower() in ('true', '1', 't')
     
     # Authentication and environment settings
     DEV_MODE = os.environ.get('DEV_MODE', 'True').lower() in ('true', '1', 't')  # True for development, False for production
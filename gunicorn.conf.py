@@ -0,0 +1,26 @@
+"""
+Gunicorn settings for the Financial Profiler app (read automatically by the
+`gunicorn app:app` command in the Procfile).
+
+Keep preload_app off: the simulation executor below is forked in each worker
+before app.py is imported, i.e. before the Monte Carlo cache warm-up thread or
+any SQLite connection exists in that worker.
+"""
+
+from config import Config
+
+
+def post_fork(server, worker):
+    """Start this worker's simulation executor if FEATURE_SIMULATION_EXECUTOR is set."""
+    if not Config.FEATURE_SIMULATION_EXECUTOR:
+        return
+
+    try:
+        from models.monte_carlo.executor import start_simulation_executor
+
+        executor = start_simulation_executor(Config.MONTE_CARLO_EXECUTOR_WORKERS or None)
+        server.log.info(f"Worker {worker.pid}: simulation executor started with {executor.workers} workers")
+
+    except Exception as e:
+        server.log.warning(f"Worker {worker.pid}: failed to start simulation executor: {e}")
+        server.log.warning("Parallel simulations will run sequentially in this worker")
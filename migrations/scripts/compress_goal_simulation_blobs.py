@@ -0,0 +1,203 @@
+#!/usr/bin/env python3
+"""
+Migration script to convert goal simulation payloads to the compact binary format.
+
+goals.simulation_data and goals.simulation_path_data used to hold JSON text.
+This script re-encodes every JSON value with models/goal_blob_codec.py
+(array buffers plus zlib, behind a versioned header). Rows that are already
+encoded are skipped, so the script can be re-run safely; --revert converts
+encoded rows back to JSON text.
+
+Paths and percentile bands are stored as float32, so the conversion is not
+exactly reversible. The database is therefore copied to a timestamped backup
+(in a backups directory next to it, unless --backup-dir is given) before
+any row is written.
+
+Usage:
+    python compress_goal_simulation_blobs.py [--db PATH] [--dry-run] [--revert] [--batch-size N]
+                                             [--backup-dir DIR] [--no-backup]
+"""
+
+import argparse
+import json
+import logging
+import os
+import sqlite3
+import sys
+from datetime import datetime
+
+# Add parent directory to path to allow imports
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+
+from config import Config
+from models.goal_blob_codec import decode_payload, encode_payload, is_encoded
+
+# Set up logging
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+BLOB_COLUMNS = ('simulation_data', 'simulation_path_data')
+
+
+def get_existing_columns(cursor, table_name):
+    """Get existing columns in the table."""
+    cursor.execute(f"PRAGMA table_info({table_name})")
+    return [row[1] for row in cursor.fetchall()]
+
+
+def create_backup(db_path, backup_dir=None):
+    """
+    Copy the database before converting any payloads.
+
+    Args:
+        db_path: Path to the SQLite database
+        backup_dir: Directory for the copy (defaults to a backups directory
+            next to the database)
+
+    Returns:
+        str: Path of the backup file
+    """
+    if backup_dir is None:
+        backup_dir = os.path.join(os.path.dirname(os.path.abspath(db_path)), 'backups')
+    os.makedirs(backup_dir, exist_ok=True)
+
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    name = os.path.splitext(os.path.basename(db_path))[0]
+    backup_file = os.path.join(backup_dir, f"{name}_backup_{timestamp}.db")
+
+    # SQLite's online backup also copies changes still in the WAL file
+    source = sqlite3.connect(db_path)
+    target = sqlite3.connect(backup_file)
+    try:
+        source.backup(target)
+    finally:
+        target.close()
+        source.close()
+
+    logger.info(f"Created database backup at {backup_file}")
+    return backup_file
+
+
+def convert_value(value, revert=False, paths=False):
+    """
+    Convert one column value.
+
+    Args:
+        value: Stored column value
+        revert: Convert encoded values back to JSON text
+        paths: The value is path data (simulation_path_data)
+
+    Returns:
+        tuple: (new value, whether it changed)
+    """
+    if value is None or value == '':
+        return value, False
+
+    if revert:
+        if not is_encoded(value):
+            return value, False
+        decoded = decode_payload(value)
+        return (json.dumps(decoded) if decoded is not None else None), True
+
+    if is_encoded(value):
+        return value, False
+    try:
+        decoded = json.loads(value)
+    except (ValueError, TypeError):
+        logger.warning("Skipping value that is not valid JSON")
+        return value, False
+    return encode_payload(decoded, paths=paths), True
+
+
+def compress_goal_blobs(db_path, dry_run=False, revert=False, batch_size=200, backup=True, backup_dir=None):
+    """
+    Convert simulation payloads of all goals.
+
+    Args:
+        db_path: Path to the SQLite database
+        dry_run: Report sizes without writing
+        revert: Convert back to JSON text
+        batch_size: Number of goals converted per transaction
+        backup: Copy the database before writing (see create_backup)
+        backup_dir: Directory for the backup
+
+    Returns:
+        dict: Counts of converted goals, total bytes before and after and
+            the backup path (None if no backup was made)
+    """
+    stats = {'goals': 0, 'converted': 0, 'bytes_before': 0, 'bytes_after': 0, 'backup': None}
+    conn = None
+    try:
+        conn = sqlite3.connect(db_path)
+        cursor = conn.cursor()
+
+        columns = [column for column in BLOB_COLUMNS if column in get_existing_columns(cursor, 'goals')]
+        if not columns:
+            logger.info("Goals table has no simulation payload columns, nothing to convert")
+            return stats
+
+        if backup and not dry_run:
+            stats['backup'] = create_backup(db_path, backup_dir)
+
+        cursor.execute("SELECT id FROM goals ORDER BY id")
+        goal_ids = [row[0] for row in cursor.fetchall()]
+        stats['goals'] = len(goal_ids)
+
+        for start in range(0, len(goal_ids), batch_size):
+            batch = goal_ids[start:start + batch_size]
+            cursor.execute(f"""
+                SELECT id, {', '.join(columns)} FROM goals
+                WHERE id IN ({', '.join('?' * len(batch))})
+            """, batch)
+
+            for row in cursor.fetchall():
+                updates = {}
+                for column, value in zip(columns, row[1:]):
+                    new_value, changed = convert_value(value, revert, paths=column == 'simulation_path_data')
+                    if changed:
+                        updates[column] = new_value
+                        stats['bytes_before'] += len(value)
+                        stats['bytes_after'] += len(new_value) if new_value else 0
+
+                if updates:
+                    stats['converted'] += 1
+                    if not dry_run:
+                        assignments = ', '.join(f"{column} = ?" for column in updates)
+                        conn.execute(f"UPDATE goals SET {assignments} WHERE id = ?",
+                                     list(updates.values()) + [row[0]])
+
+            if not dry_run:
+                conn.commit()
+
+        action = "Would convert" if dry_run else "Converted"
+        logger.info(f"{action} {stats['converted']} of {stats['goals']} goals "
+                    f"({stats['bytes_before']} -> {stats['bytes_after']} bytes)")
+        return stats
+
+    except sqlite3.Error as e:
+        logger.error(f"Database error: {str(e)}")
+        if conn:
+            conn.rollback()
+        raise
+    finally:
+        if conn:
+            conn.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Convert goal simulation payloads to the compact binary format")
+    parser.add_argument('--db', default=Config.DB_PATH, help="Path to SQLite database")
+    parser.add_argument('--dry-run', action='store_true', help="Report what would change without writing")
+    parser.add_argument('--revert', action='store_true', help="Convert encoded payloads back to JSON text")
+    parser.add_argument('--batch-size', type=int, default=200, help="Goals converted per transaction")
+    parser.add_argument('--backup-dir', help="Directory for the database backup (default: backups next to the database)")
+    parser.add_argument('--no-backup', action='store_true', help="Skip the database backup")
+    args = parser.parse_args()
+
+    logger.info(f"Starting goal simulation payload migration on {args.db}")
+    compress_goal_blobs(args.db, dry_run=args.dry_run, revert=args.revert, batch_size=args.batch_size,
+                        backup=not args.no_backup, backup_dir=args.backup_dir)
+
+
+if __name__ == "__main__":
+    main()
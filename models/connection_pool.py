@@ -0,0 +1,231 @@
+"""
+Shared SQLite connection pool.
+
+Opening a SQLite connection and configuring it costs far more than most of
+the queries run on it, and DatabaseProfileManager and GoalManager used to
+do it for every operation. This module keeps configured connections open
+and hands them out again:
+
+- Connections are reused per thread (sqlite3 connections must not be shared
+  between threads while in use); nested checkouts get their own connection
+- Databases are switched to WAL journal mode so readers never block the
+  writer, with synchronous=NORMAL, a larger page cache and memory-mapped I/O
+- Reused connections keep their compiled statement cache
+- Uncommitted work is rolled back when a connection is returned, exactly
+  as closing a connection did
+- A connection is discarded if its database file was replaced or removed
+- Checkout/reuse/wait metrics are available from get_pool_stats()
+"""
+
+import os
+import time
+import sqlite3
+import logging
+import threading
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Constants
+BUSY_TIMEOUT = 30  # Seconds to wait for a database lock
+JOURNAL_MODE = 'WAL'
+SYNCHRONOUS = 'NORMAL'
+CACHE_SIZE_KB = 16 * 1024  # 16 MB page cache per connection
+MMAP_SIZE = 256 * 1024 * 1024  # 256 MB of memory-mapped I/O
+STATEMENT_CACHE_SIZE = 256  # Compiled statements kept per connection
+MAX_IDLE_PER_THREAD = 4
+
+# Paths that name a private in-memory database on every connect
+_MEMORY_PATHS = ('', ':memory:')
+
+
+def _file_identity(db_path: str) -> Optional[Tuple[int, int]]:
+    """(device, inode) of a database file, or None if it does not exist."""
+    try:
+        stat = os.stat(db_path)
+    except OSError:
+        return None
+    return stat.st_dev, stat.st_ino
+
+
+class SQLiteConnectionPool:
+    """Per-thread pool of configured connections to one SQLite database."""
+
+    def __init__(self, db_path: str, journal_mode: Optional[str] = JOURNAL_MODE,
+                 synchronous: str = SYNCHRONOUS, cache_size_kb: int = CACHE_SIZE_KB,
+                 mmap_size: int = MMAP_SIZE, max_idle: int = MAX_IDLE_PER_THREAD):
+        """
+        Initialize the pool.
+
+        Args:
+            db_path: Path to the SQLite database file
+            journal_mode: Journal mode to set on the database (None to keep it)
+            synchronous: Value of PRAGMA synchronous
+            cache_size_kb: Page cache size per connection in KiB
+            mmap_size: Maximum number of bytes of the database to memory-map
+            max_idle: Maximum number of idle connections kept per thread
+        """
+        self.db_path = db_path
+        self.journal_mode = journal_mode
+        self.synchronous = synchronous
+        self.cache_size_kb = cache_size_kb
+        self.mmap_size = mmap_size
+        self.max_idle = max_idle
+        self.pooled = db_path not in _MEMORY_PATHS
+
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self.checkouts = 0
+        self.reuses = 0
+        self.connects = 0
+        self.discards = 0
+        self.in_use = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+
+    def _idle(self) -> List[Tuple[sqlite3.Connection, Optional[Tuple[int, int]]]]:
+        """Idle connections of the calling thread, with their file identity."""
+        idle = getattr(self._local, 'idle', None)
+        if idle is None:
+            idle = self._local.idle = []
+        return idle
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open and configure a new connection."""
+        conn = sqlite3.connect(self.db_path, timeout=BUSY_TIMEOUT,
+                               cached_statements=STATEMENT_CACHE_SIZE)
+        conn.execute("PRAGMA foreign_keys = ON")
+        if self.journal_mode and self.pooled:
+            try:
+                conn.execute(f"PRAGMA journal_mode = {self.journal_mode}")
+            except sqlite3.Error as e:
+                logger.warning(f"Could not set journal mode {self.journal_mode} on {self.db_path}: {e}")
+        conn.execute(f"PRAGMA synchronous = {self.synchronous}")
+        conn.execute(f"PRAGMA cache_size = -{int(self.cache_size_kb)}")
+        conn.execute(f"PRAGMA mmap_size = {int(self.mmap_size)}")
+        return conn
+
+    def _discard(self, conn: sqlite3.Connection) -> None:
+        """Close a connection that will not be reused."""
+        with self._lock:
+            self.discards += 1
+        try:
+            conn.close()
+        except sqlite3.Error:
+            pass
+
+    @contextmanager
+    def connection(self) -> Iterator[sqlite3.Connection]:
+        """
+        Check out a connection for the duration of a with block.
+
+        Yields:
+            sqlite3.Connection: Connection with foreign keys enabled and
+            sqlite3.Row as row factory
+        """
+        start = time.perf_counter()
+        identity = _file_identity(self.db_path) if self.pooled else None
+        idle = self._idle()
+        conn = None
+        while idle:
+            candidate, candidate_identity = idle.pop()
+            if identity is not None and candidate_identity == identity:
+                conn = candidate
+                break
+            # The database file was replaced or removed since this connection was opened
+            self._discard(candidate)
+
+        reused = conn is not None
+        if conn is None:
+            conn = self._connect()
+            identity = _file_identity(self.db_path) if self.pooled else None
+        conn.row_factory = sqlite3.Row
+
+        wait = time.perf_counter() - start
+        with self._lock:
+            self.checkouts += 1
+            self.in_use += 1
+            if reused:
+                self.reuses += 1
+            else:
+                self.connects += 1
+            self.total_wait += wait
+            self.max_wait = max(self.max_wait, wait)
+
+        try:
+            yield conn
+        finally:
+            with self._lock:
+                self.in_use -= 1
+            self._release(conn, identity)
+
+    def _release(self, conn: sqlite3.Connection, identity: Optional[Tuple[int, int]]) -> None:
+        """Return a connection to the calling thread's idle list."""
+        try:
+            if conn.in_transaction:
+                # Uncommitted work is discarded, as it was when connections were closed
+                conn.rollback()
+        except sqlite3.Error:
+            # Closed by the caller or unusable
+            self._discard(conn)
+            return
+
+        idle = self._idle()
+        if self.pooled and identity is not None and len(idle) < self.max_idle:
+            idle.append((conn, identity))
+        else:
+            self._discard(conn)
+
+    def close_idle(self) -> None:
+        """Close the calling thread's idle connections."""
+        idle = self._idle()
+        while idle:
+            self._discard(idle.pop()[0])
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Return pool statistics."""
+        with self._lock:
+            return {
+                'db_path': self.db_path,
+                'journal_mode': self.journal_mode,
+                'checkouts': self.checkouts,
+                'reuses': self.reuses,
+                'connects': self.connects,
+                'discards': self.discards,
+                'in_use': self.in_use,
+                'hit_rate': self.reuses / self.checkouts if self.checkouts > 0 else 0,
+                'avg_wait_ms': self.total_wait / self.checkouts * 1000 if self.checkouts > 0 else 0,
+                'max_wait_ms': self.max_wait * 1000
+            }
+
+
+_pools: Dict[str, SQLiteConnectionPool] = {}
+_pools_lock = threading.Lock()
+
+
+def get_pool(db_path: str) -> SQLiteConnectionPool:
+    """
+    Get the shared pool for a database, creating it on first use.
+
+    Args:
+        db_path: Path to the SQLite database file
+
+    Returns:
+        SQLiteConnectionPool shared by all users of the database
+    """
+    key = db_path if db_path in _MEMORY_PATHS else os.path.abspath(db_path)
+    pool = _pools.get(key)
+    if pool is None:
+        with _pools_lock:
+            pool = _pools.get(key)
+            if pool is None:
+                pool = _pools[key] = SQLiteConnectionPool(db_path)
+    return pool
+
+
+def get_pool_stats() -> Dict[str, Dict[str, Any]]:
+    """Get statistics of all connection pools, keyed by database path."""
+    with _pools_lock:
+        pools = list(_pools.items())
+    return {path: pool.get_stats() for path, pool in pools}
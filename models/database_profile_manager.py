@@ -4,15 +4,40 @@ import uuid
 import logging
 import copy
 import sqlite3
+import threading
+from collections import OrderedDict
 from datetime import datetime
 from contextlib import contextmanager
 
+from models.connection_pool import get_pool
+
 class DatabaseProfileManager:
     """
     Database-backed Profile Management System for creating, loading, updating, and versioning user profiles.
     Uses SQLite for persistent storage with JSON serialization of profile data.
+    
+    Answers are stored one row per question in profile_answers and written
+    individually, so submitting an answer does not rewrite the whole profile
+    document. Versions are stored as diffs against the latest full snapshot,
+    with a new full snapshot every VERSION_SNAPSHOT_INTERVAL versions. The
+    version history itself is not stored in each version; it is rebuilt from
+    the profile_versions rows when a version is read.
+    
+    One manager is shared by every request in a worker process, so cached
+    profiles are checked against profiles.updated_at on each read (another
+    worker may have changed them) and at most PROFILE_CACHE_SIZE profiles
+    are kept, least recently used first out.
     """
     
+    # Maximum number of profiles kept in the memory cache
+    PROFILE_CACHE_SIZE = 256
+    
+    # A full version snapshot is stored at least this often
+    VERSION_SNAPSHOT_INTERVAL = 10
+    
+    # Profile fields that are not persisted in the profile document
+    TRANSIENT_FIELDS = ('answers', '_object_id')
+    
     def __init__(self, db_path="/Users/coddiwomplers/Desktop/Python/Profiler4/data/profiles.db"):
         """
         Initialize the DatabaseProfileManager with SQLite database.
@@ -25,8 +50,15 @@ class DatabaseProfileManager:
         # Ensure the parent directory exists
         os.makedirs(os.path.dirname(db_path), exist_ok=True)
         
-        # Memory cache for profiles to ensure single instance
-        self.cache = {}
+        # Memory cache for profiles to ensure single instance (LRU order)
+        self.cache = OrderedDict()
+        self._cache_lock = threading.RLock()
+        
+        # Persisted (answer id, timestamp) per question, to write only changed answers
+        self._answer_state = {}
+        
+        # Latest full version snapshot per profile: (version, document)
+        self._version_bases = {}
         
         # Set up logging
         logging.basicConfig(level=logging.INFO)
@@ -38,27 +70,19 @@ class DatabaseProfileManager:
     def _get_connection(self):
         """
         Context manager for getting a database connection.
-        Handles transaction management and connection closing.
+        Handles transaction management and connection reuse.
+        Connections come from the shared pool (models/connection_pool.py) and
+        are reused; uncommitted changes are rolled back when the block exits.
         
         Yields:
             sqlite3.Connection: Database connection
         """
-        conn = None
         try:
-            conn = sqlite3.connect(self.db_path)
-            # Enable foreign keys
-            conn.execute("PRAGMA foreign_keys = ON")
-            # Enables returning rows as dictionaries
-            conn.row_factory = sqlite3.Row
-            yield conn
+            with get_pool(self.db_path).connection() as conn:
+                yield conn
         except sqlite3.Error as e:
             logging.error(f"Database connection error: {str(e)}")
-            if conn:
-                conn.rollback()
             raise
-        finally:
-            if conn:
-                conn.close()
     
     def _initialize_database(self):
         """
@@ -91,6 +115,24 @@ class DatabaseProfileManager:
                 )
                 ''')
                 
+                # Create profile_answers table (one row per answered question)
+                cursor.execute('''
+                CREATE TABLE IF NOT EXISTS profile_answers (
+                    profile_id TEXT NOT NULL,
+                    question_id TEXT NOT NULL,
+                    data TEXT NOT NULL,
+                    seq INTEGER NOT NULL,
+                    updated_at TEXT NOT NULL,
+                    PRIMARY KEY (profile_id, question_id),
+                    FOREIGN KEY (profile_id) REFERENCES profiles (id) ON DELETE CASCADE
+                )
+                ''')
+                
+                # Versions may be stored as a diff against an earlier full snapshot
+                cursor.execute("PRAGMA table_info(profile_versions)")
+                if 'base_version' not in [column['name'] for column in cursor.fetchall()]:
+                    cursor.execute("ALTER TABLE profile_versions ADD COLUMN base_version INTEGER")
+                
                 # Create goal categories table
                 cursor.execute('''
                 CREATE TABLE IF NOT EXISTS goal_categories (
@@ -220,19 +262,21 @@ class DatabaseProfileManager:
                 # Insert profile into database
                 cursor.execute(
                     "INSERT INTO profiles (id, data, created_at, updated_at) VALUES (?, ?, ?, ?)",
-                    (profile_id, json.dumps(profile), current_time, current_time)
+                    (profile_id, self._serialize_document(profile), current_time, current_time)
                 )
                 
                 # Insert initial version
                 cursor.execute(
                     "INSERT INTO profile_versions (profile_id, data, version, reason, created_at) VALUES (?, ?, ?, ?, ?)",
-                    (profile_id, json.dumps(profile), 1, "initial_creation", current_time)
+                    (profile_id, json.dumps(self._version_document(profile)), 1, "initial_creation", current_time)
                 )
                 
                 conn.commit()
                 
                 # Store in cache
-                self.cache[profile_id] = profile
+                self._cache_profile(profile)
+                self._answer_state[profile_id] = {}
+                self._version_bases[profile_id] = (1, json.loads(json.dumps(self._version_document(profile))))
                 
                 logging.info(f"Created new profile with ID: {profile_id}")
                 return profile
@@ -251,28 +295,39 @@ class DatabaseProfileManager:
         Returns:
             dict: Profile object or None if not found
         """
-        # First check the cache for existing reference
-        if profile_id in self.cache:
-            logging.info(f"Retrieved profile {profile_id} from cache (id: {id(self.cache[profile_id])})")
-            return self.cache[profile_id]
-        
-        # Otherwise load from database
         try:
             with self._get_connection() as conn:
                 cursor = conn.cursor()
                 
-                cursor.execute("SELECT data FROM profiles WHERE id = ?", (profile_id,))
+                # Use the cached reference while the stored profile is unchanged
+                cached = self.cache.get(profile_id)
+                if cached is not None:
+                    cursor.execute("SELECT updated_at FROM profiles WHERE id = ?", (profile_id,))
+                    result = cursor.fetchone()
+                    if result and result['updated_at'] == cached.get('updated_at'):
+                        self._cache_profile(cached)
+                        logging.info(f"Retrieved profile {profile_id} from cache (id: {id(cached)})")
+                        return cached
+                    self._evict_profile(profile_id)
+                
+                cursor.execute("SELECT data, updated_at FROM profiles WHERE id = ?", (profile_id,))
                 result = cursor.fetchone()
                 
                 if not result:
                     logging.error(f"Profile {profile_id} not found in database")
                     return None
                 
-                # Parse JSON data
+                # Parse JSON data; answers live in profile_answers unless the
+                # row predates that table and still embeds them
                 profile = json.loads(result['data'])
+                profile['updated_at'] = result['updated_at']
+                if 'answers' not in profile:
+                    profile['answers'] = self._load_answers(cursor, profile_id)
+                else:
+                    self._answer_state.pop(profile_id, None)
                 
                 # Store in cache for future reference consistency
-                self.cache[profile_id] = profile
+                self._cache_profile(profile)
                 
                 logging.info(f"Loaded profile {profile_id} from database (id: {id(profile)})")
                 return profile
@@ -302,7 +357,7 @@ class DatabaseProfileManager:
         if profile_id in self.cache and id(profile) != id(self.cache[profile_id]):
             logging.warning(f"Profile reference mismatch: {id(profile)} vs {id(self.cache[profile_id])}")
             # Update our cache to use this reference, to maintain consistency
-            self.cache[profile_id] = profile
+            self._cache_profile(profile)
         
         # Update timestamp
         profile['updated_at'] = datetime.now().isoformat()
@@ -322,44 +377,26 @@ class DatabaseProfileManager:
                         logging.error(f"Required field {field} missing from profile")
                         raise ValueError(f"Required field {field} missing from profile")
             
-            # Check answers count before serialization
-            answers_count = len(profile.get('answers', []))
-            logging.info(f"Before save: Profile has {answers_count} answers")
-            
-            # Create a copy for serialization to avoid reference issues
-            profile_copy = copy.deepcopy(profile)
-            
-            # Remove debug fields for serialization
-            if '_object_id' in profile_copy:
-                del profile_copy['_object_id']
-            
-            # Serialize profile
-            json_string = json.dumps(profile_copy)
+            # Serialize the profile document without its answers
+            json_string = self._serialize_document(profile)
             
             with self._get_connection() as conn:
                 cursor = conn.cursor()
                 
-                # Check if profile exists
-                cursor.execute("SELECT id FROM profiles WHERE id = ?", (profile_id,))
-                exists = cursor.fetchone() is not None
+                cursor.execute(
+                    """INSERT INTO profiles (id, data, created_at, updated_at) VALUES (?, ?, ?, ?)
+                       ON CONFLICT(id) DO UPDATE SET data = excluded.data, updated_at = excluded.updated_at""",
+                    (profile_id, json_string, profile['created_at'], profile['updated_at'])
+                )
                 
-                if exists:
-                    # Update existing profile
-                    cursor.execute(
-                        "UPDATE profiles SET data = ?, updated_at = ? WHERE id = ?",
-                        (json_string, profile['updated_at'], profile_id)
-                    )
-                else:
-                    # Insert new profile (shouldn't normally happen through this method)
-                    cursor.execute(
-                        "INSERT INTO profiles (id, data, created_at, updated_at) VALUES (?, ?, ?, ?)",
-                        (profile_id, json_string, profile['created_at'], profile['updated_at'])
-                    )
+                # Write only the answers that changed since the last save
+                answer_state = self._sync_answers(cursor, profile_id, profile['answers'])
                 
                 conn.commit()
+                self._answer_state[profile_id] = answer_state
             
             # Ensure it's in our cache
-            self.cache[profile_id] = profile
+            self._cache_profile(profile)
             
             logging.info(f"Saved profile {profile_id} (answers: {len(profile.get('answers', []))})")
             return profile
@@ -410,34 +447,37 @@ class DatabaseProfileManager:
             else:
                 logging.info(f"[{op_id}] Profile has {len(profile['answers'])} existing answers")
                 
-            # First remove any existing answer with the same question_id
-            original_answer_count = len(profile['answers'])
-            profile['answers'] = [a for a in profile['answers'] if a.get('question_id') != question_id]
-            new_answer_count = len(profile['answers'])
-            
-            if original_answer_count != new_answer_count:
-                logging.info(f"[{op_id}] Removed existing answer for question {question_id}")
+            # Remove any existing answer with the same question_id; the new
+            # answer is appended, so updated answers move to the end
+            answers = profile['answers']
+            for index, existing in enumerate(answers):
+                if existing.get('question_id') == question_id:
+                    del answers[index]
+                    logging.info(f"[{op_id}] Removed existing answer for question {question_id}")
+                    break
             
             # Create new answer record
             answer_id = str(uuid.uuid4())
+            current_time = datetime.now().isoformat()
             new_answer = {
                 "id": answer_id,
                 "question_id": question_id,
                 "answer": answer_value,
-                "timestamp": datetime.now().isoformat()
+                "timestamp": current_time
             }
             
             # Add the new answer
-            profile['answers'].append(new_answer)
+            answers.append(new_answer)
+            profile['updated_at'] = current_time
             logging.info(f"[{op_id}] Added new answer with ID {answer_id}")
             
             # Save changes
-            logging.info(f"[{op_id}] Saving profile with {len(profile['answers'])} answers")
+            logging.info(f"[{op_id}] Saving answer ({len(answers)} answers in profile)")
             try:
-                self.save_profile(profile)
-                logging.info(f"[{op_id}] Profile saved successfully")
+                self._save_answer(profile, new_answer)
+                logging.info(f"[{op_id}] Answer saved successfully")
             except Exception as save_error:
-                logging.error(f"[{op_id}] Error saving profile: {str(save_error)}")
+                logging.error(f"[{op_id}] Error saving answer: {str(save_error)}")
                 return False
             
             # Verify answers are still there
@@ -507,28 +547,34 @@ class DatabaseProfileManager:
         profile['versions'].append(new_version)
         
         try:
-            # Create a deep copy for the version snapshot
-            version_snapshot = copy.deepcopy(profile)
-            
-            # Remove any debug fields
-            if '_object_id' in version_snapshot:
-                del version_snapshot['_object_id']
-            
-            # Serialize version
-            version_json = json.dumps(version_snapshot)
+            version_number = new_version['version_id']
+            document = self._version_document(profile)
             
             with self._get_connection() as conn:
                 cursor = conn.cursor()
                 
+                # Store a diff against the latest full snapshot, or a new
+                # full snapshot when there is none or it is too old
+                base = self._get_version_base(cursor, profile_id)
+                if base is None or version_number - base[0] >= self.VERSION_SNAPSHOT_INTERVAL:
+                    version_json, base_version = json.dumps(document), None
+                else:
+                    version_json = json.dumps(self._diff_documents(base[1], document))
+                    base_version = base[0]
+                
                 # Insert into profile_versions table
                 cursor.execute(
-                    "INSERT INTO profile_versions (profile_id, data, version, reason, created_at) VALUES (?, ?, ?, ?, ?)",
-                    (profile_id, version_json, new_version['version_id'], reason, current_time)
+                    "INSERT INTO profile_versions (profile_id, data, version, reason, created_at, base_version) "
+                    "VALUES (?, ?, ?, ?, ?, ?)",
+                    (profile_id, version_json, version_number, reason, current_time, base_version)
                 )
                 
                 conn.commit()
+            
+            if base_version is None:
+                self._version_bases[profile_id] = (version_number, json.loads(version_json))
                 
-            logging.info(f"Created version {new_version['version_id']} for profile {profile_id}")
+            logging.info(f"Created version {version_number} for profile {profile_id}")
             
         except Exception as e:
             logging.error(f"Failed to save version snapshot: {str(e)}")
@@ -554,15 +600,20 @@ class DatabaseProfileManager:
                 cursor = conn.cursor()
                 
                 cursor.execute(
-                    "SELECT data, version, reason, created_at FROM profile_versions WHERE profile_id = ? ORDER BY version",
+                    "SELECT data, version, reason, created_at, base_version FROM profile_versions "
+                    "WHERE profile_id = ? ORDER BY version",
                     (profile_id,)
                 )
                 
                 results = cursor.fetchall()
                 versions = []
+                snapshots = {}
+                history = []
                 
                 for result in results:
-                    version_data = json.loads(result['data'])
+                    history.append(self._version_entry(result))
+                    version_data = dict(self._materialize_version(cursor, profile_id, result, snapshots),
+                                        versions=list(history))
                     versions.append({
                         'version': result['version'],
                         'reason': result['reason'],
@@ -592,7 +643,7 @@ class DatabaseProfileManager:
                 cursor = conn.cursor()
                 
                 cursor.execute(
-                    "SELECT data FROM profile_versions WHERE profile_id = ? AND version = ?",
+                    "SELECT data, version, base_version FROM profile_versions WHERE profile_id = ? AND version = ?",
                     (profile_id, version_number)
                 )
                 
@@ -602,7 +653,13 @@ class DatabaseProfileManager:
                     logging.error(f"Version {version_number} for profile {profile_id} not found")
                     return None
                 
-                return json.loads(result['data'])
+                document = self._materialize_version(cursor, profile_id, result)
+                cursor.execute(
+                    "SELECT version, reason, created_at FROM profile_versions "
+                    "WHERE profile_id = ? AND version <= ? ORDER BY version",
+                    (profile_id, version_number)
+                )
+                return dict(document, versions=[self._version_entry(row) for row in cursor.fetchall()])
                 
         except Exception as e:
             logging.error(f"Failed to get profile version {version_number} for {profile_id}: {str(e)}")
@@ -622,14 +679,13 @@ class DatabaseProfileManager:
             with self._get_connection() as conn:
                 cursor = conn.cursor()
                 
-                # Foreign key constraint will delete related versions
+                # Foreign key constraint will delete related versions and answers
                 cursor.execute("DELETE FROM profiles WHERE id = ?", (profile_id,))
                 
                 conn.commit()
                 
                 # Remove from cache
-                if profile_id in self.cache:
-                    del self.cache[profile_id]
+                self._evict_profile(profile_id)
                 
                 logging.info(f"Deleted profile {profile_id}")
                 return True
@@ -649,20 +705,27 @@ class DatabaseProfileManager:
             with self._get_connection() as conn:
                 cursor = conn.cursor()
                 
-                cursor.execute("SELECT id, data, created_at, updated_at FROM profiles")
+                # Read only the summary fields instead of parsing every document
+                cursor.execute("""
+                    SELECT p.id, p.created_at, p.updated_at,
+                           json_extract(p.data, '$.name') AS name,
+                           json_extract(p.data, '$.email') AS email,
+                           COALESCE(json_array_length(p.data, '$.answers'),
+                                    (SELECT COUNT(*) FROM profile_answers a WHERE a.profile_id = p.id)) AS answers_count
+                    FROM profiles p
+                """)
                 
                 results = cursor.fetchall()
                 profiles = []
                 
                 for result in results:
-                    profile_data = json.loads(result['data'])
                     profiles.append({
                         'id': result['id'],
-                        'name': profile_data.get('name', 'Unknown'),
-                        'email': profile_data.get('email', 'Unknown'),
+                        'name': result['name'] if result['name'] is not None else 'Unknown',
+                        'email': result['email'] if result['email'] is not None else 'Unknown',
                         'created_at': result['created_at'],
                         'updated_at': result['updated_at'],
-                        'answers_count': len(profile_data.get('answers', []))
+                        'answers_count': result['answers_count']
                     })
                 
                 return profiles
@@ -671,6 +734,296 @@ class DatabaseProfileManager:
             logging.error(f"Failed to get all profiles: {str(e)}")
             return []
             
+    def _cache_profile(self, profile):
+        """
+        Store a profile as the most recently used cache entry, evicting the
+        least recently used ones beyond PROFILE_CACHE_SIZE.
+        
+        Args:
+            profile (dict): Profile to cache
+        """
+        with self._cache_lock:
+            self.cache[profile['id']] = profile
+            self.cache.move_to_end(profile['id'])
+            while len(self.cache) > self.PROFILE_CACHE_SIZE:
+                self._evict_profile(next(iter(self.cache)))
+    
+    def _evict_profile(self, profile_id):
+        """
+        Drop a profile and its persisted answer and version state from memory.
+        
+        Args:
+            profile_id (str): ID of the profile
+        """
+        with self._cache_lock:
+            self.cache.pop(profile_id, None)
+            self._answer_state.pop(profile_id, None)
+            self._version_bases.pop(profile_id, None)
+    
+    def _serialize_document(self, profile):
+        """
+        Serialize the profile document stored in profiles.data.
+        
+        Answers are stored in profile_answers and debug fields are dropped.
+        
+        Args:
+            profile (dict): Profile to serialize
+            
+        Returns:
+            str: JSON document
+        """
+        return json.dumps({key: value for key, value in profile.items() if key not in self.TRANSIENT_FIELDS})
+    
+    def _version_document(self, profile):
+        """
+        Build the document stored for a profile version, answers included.
+        
+        The version history is left out: it grows with every version, so
+        storing it in each one would make version storage quadratic. Reads
+        rebuild it from the profile_versions rows (see _version_entry).
+        
+        Args:
+            profile (dict): Profile to version
+            
+        Returns:
+            dict: Shallow copy of the profile without debug fields or versions
+        """
+        return {key: value for key, value in profile.items() if key not in ('_object_id', 'versions')}
+    
+    @staticmethod
+    def _version_entry(row):
+        """
+        Build a profile 'versions' entry from a profile_versions row.
+        
+        Args:
+            row: profile_versions row with version, reason and created_at
+            
+        Returns:
+            dict: Entry as recorded by create_version
+        """
+        return {"version_id": row['version'], "timestamp": row['created_at'], "reason": row['reason']}
+    
+    def _load_answers(self, cursor, profile_id):
+        """
+        Load a profile's answers in submission order.
+        
+        Args:
+            cursor: Database cursor
+            profile_id (str): ID of the profile
+            
+        Returns:
+            list: Answer records
+        """
+        cursor.execute(
+            "SELECT question_id, data FROM profile_answers WHERE profile_id = ? ORDER BY seq",
+            (profile_id,)
+        )
+        answers = [json.loads(row['data']) for row in cursor.fetchall()]
+        self._answer_state[profile_id] = {
+            answer.get('question_id'): (answer.get('id'), answer.get('timestamp')) for answer in answers
+        }
+        return answers
+    
+    def _sync_answers(self, cursor, profile_id, answers):
+        """
+        Write the answers that changed since they were last persisted.
+        
+        An answer counts as changed when its id or timestamp differs from the
+        persisted one; add_answer always assigns both. When the persisted
+        state is unknown (a new or legacy profile), all answers are replaced.
+        
+        Args:
+            cursor: Database cursor
+            profile_id (str): ID of the profile
+            answers (list): Current answer records
+            
+        Returns:
+            dict: Persisted (answer id, timestamp) per question once committed
+        """
+        state = self._answer_state.get(profile_id)
+        if state is None:
+            cursor.execute("DELETE FROM profile_answers WHERE profile_id = ?", (profile_id,))
+            state = {}
+        
+        new_state = {}
+        changed = []
+        for answer in answers:
+            question_id = answer.get('question_id')
+            if not question_id:
+                logging.warning(f"Skipping answer without question_id in profile {profile_id}")
+                continue
+            fingerprint = (answer.get('id'), answer.get('timestamp'))
+            new_state[question_id] = fingerprint
+            if state.get(question_id) != fingerprint:
+                changed.append(answer)
+        
+        removed = [(profile_id, question_id) for question_id in state if question_id not in new_state]
+        if removed:
+            cursor.executemany("DELETE FROM profile_answers WHERE profile_id = ? AND question_id = ?", removed)
+        if changed:
+            cursor.execute("SELECT COALESCE(MAX(seq), 0) FROM profile_answers WHERE profile_id = ?", (profile_id,))
+            next_seq = cursor.fetchone()[0] + 1
+            cursor.executemany(
+                """INSERT INTO profile_answers (profile_id, question_id, data, seq, updated_at) VALUES (?, ?, ?, ?, ?)
+                   ON CONFLICT(profile_id, question_id) DO UPDATE SET
+                       data = excluded.data, seq = excluded.seq, updated_at = excluded.updated_at""",
+                [(profile_id, answer['question_id'], json.dumps(answer), next_seq + offset,
+                  answer.get('timestamp') or datetime.now().isoformat())
+                 for offset, answer in enumerate(changed)]
+            )
+        
+        return new_state
+    
+    def _save_answer(self, profile, answer):
+        """
+        Persist a single answer and the profile's updated_at.
+        
+        Falls back to a full save_profile when the profile row does not exist
+        yet or still embeds its answers.
+        
+        Args:
+            profile (dict): Profile the answer belongs to
+            answer (dict): Answer record
+        """
+        profile_id = profile['id']
+        state = self._answer_state.get(profile_id)
+        if state is not None:
+            with self._get_connection() as conn:
+                cursor = conn.cursor()
+                cursor.execute("UPDATE profiles SET updated_at = ? WHERE id = ?", (profile['updated_at'], profile_id))
+                if cursor.rowcount:
+                    cursor.execute(
+                        """INSERT INTO profile_answers (profile_id, question_id, data, seq, updated_at)
+                           VALUES (?, ?, ?, (SELECT COALESCE(MAX(seq), 0) + 1 FROM profile_answers WHERE profile_id = ?), ?)
+                           ON CONFLICT(profile_id, question_id) DO UPDATE SET
+                               data = excluded.data, seq = excluded.seq, updated_at = excluded.updated_at""",
+                        (profile_id, answer['question_id'], json.dumps(answer), profile_id, answer['timestamp'])
+                    )
+                    conn.commit()
+                    state[answer['question_id']] = (answer['id'], answer['timestamp'])
+                    self._cache_profile(profile)
+                    return
+        
+        self.save_profile(profile)
+    
+    def _get_version_base(self, cursor, profile_id):
+        """
+        Get the latest full version snapshot of a profile.
+        
+        Args:
+            cursor: Database cursor
+            profile_id (str): ID of the profile
+            
+        Returns:
+            tuple: (version, document), or None if the profile has no snapshot
+        """
+        if profile_id in self._version_bases:
+            return self._version_bases[profile_id]
+        
+        cursor.execute(
+            "SELECT version, data FROM profile_versions WHERE profile_id = ? AND base_version IS NULL "
+            "ORDER BY version DESC LIMIT 1",
+            (profile_id,)
+        )
+        result = cursor.fetchone()
+        if not result:
+            return None
+        
+        base = (result['version'], json.loads(result['data']))
+        self._version_bases[profile_id] = base
+        return base
+    
+    def _materialize_version(self, cursor, profile_id, row, snapshots=None):
+        """
+        Build the full profile document of a stored version.
+        
+        Args:
+            cursor: Database cursor
+            profile_id (str): ID of the profile
+            row: profile_versions row with data, version and base_version
+            snapshots (dict): Optional full snapshots already loaded, by version
+            
+        Returns:
+            dict: Profile document of the version
+        """
+        data = json.loads(row['data'])
+        base_version = row['base_version']
+        if base_version is None:
+            if snapshots is not None:
+                snapshots[row['version']] = data
+            return data
+        
+        base = snapshots.get(base_version) if snapshots is not None else None
+        if base is None:
+            cursor.execute(
+                "SELECT data FROM profile_versions WHERE profile_id = ? AND version = ?",
+                (profile_id, base_version)
+            )
+            base = json.loads(cursor.fetchone()['data'])
+            if snapshots is not None:
+                snapshots[base_version] = base
+        
+        return self._apply_diff(base, data)
+    
+    @staticmethod
+    def _diff_documents(base, document):
+        """
+        Compute the changes from a base version document to a newer one.
+        
+        Top-level fields are compared by value; answers are compared per
+        question_id.
+        
+        Args:
+            base (dict): Base version document
+            document (dict): Newer version document
+            
+        Returns:
+            dict: Diff with set/unset fields and set/unset answers
+        """
+        fields = {key: value for key, value in document.items() if key != 'answers'}
+        base_answers = {answer.get('question_id'): answer for answer in base.get('answers', [])}
+        
+        answers_set = []
+        current_ids = set()
+        for answer in document.get('answers', []):
+            question_id = answer.get('question_id')
+            current_ids.add(question_id)
+            if base_answers.get(question_id) != answer:
+                answers_set.append(answer)
+        
+        return {
+            'set': {key: value for key, value in fields.items() if base.get(key, object()) != value},
+            'unset': [key for key in base if key != 'answers' and key not in fields],
+            'answers_set': answers_set,
+            'answers_unset': [question_id for question_id in base_answers if question_id not in current_ids]
+        }
+    
+    @staticmethod
+    def _apply_diff(base, diff):
+        """
+        Rebuild a version document from its base snapshot and diff.
+        
+        Unchanged answers keep their base order; changed answers follow them.
+        
+        Args:
+            base (dict): Base version document
+            diff (dict): Diff produced by _diff_documents
+            
+        Returns:
+            dict: Version document
+        """
+        document = copy.deepcopy(base)
+        for key in diff.get('unset', []):
+            document.pop(key, None)
+        document.update(diff.get('set', {}))
+        
+        replaced = {answer.get('question_id') for answer in diff.get('answers_set', [])}
+        replaced.update(diff.get('answers_unset', []))
+        document['answers'] = [
+            answer for answer in document.get('answers', []) if answer.get('question_id') not in replaced
+        ] + diff.get('answers_set', [])
+        return document
+    
     def _export_profile_to_json(self, profile_id, output_path):
         """
         Export a profile to a JSON file (utility method for migration).
@@ -722,7 +1075,7 @@ class DatabaseProfileManager:
                 profile['updated_at'] = datetime.now().isoformat()
                 
             # Save to database
-            self.cache[profile_id] = profile
+            self._cache_profile(profile)
             self.save_profile(profile)
             
             return profile_id
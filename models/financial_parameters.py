@@ -30,7 +30,6 @@ import os
 import json
 import logging
 import sqlite3
-import random
 import math
 import uuid
 import re
@@ -39,6 +38,10 @@ from typing import Dict, Any, Optional, Union, List, Tuple, Callable, Set
 from contextlib import contextmanager
 from functools import lru_cache
 
+import numpy as np
+
+from models.parameter_index import IndexedParameters
+
 # Configure logging
 logging.basicConfig(level=logging.INFO, 
                    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
@@ -1273,8 +1276,8 @@ class FinancialParameters:
             custom_params_path: Path to JSON file with custom parameters
             db_path: Path to SQLite database containing parameters
         """
-        # Initialize parameters and metadata store
-        self.parameters = {}
+        # Initialize parameters and metadata store; the store keeps a path trie of its keys
+        self.parameters = IndexedParameters()
         self.metadata = {}
         
         # Store instance variables
@@ -1296,38 +1299,65 @@ class FinancialParameters:
         """
         Load base parameters with default metadata.
         """
-        # Flatten base parameters and create metadata
-        self._process_parameters_recursive(self.BASE_PARAMETERS, path_prefix="")
+        # BASE_PARAMETERS is flattened once per process; every instance
+        # (one per request in the web app) reuses the flattened paths
+        cls = type(self)
+        if cls.__dict__.get('_base_parameter_paths') is None:
+            cls._base_parameter_paths = self._flatten_parameters(self.BASE_PARAMETERS)
+        
+        for full_path, value in cls._base_parameter_paths:
+            self._store_parameter(full_path, value, ParameterSource.DEFAULT)
     
-    def _process_parameters_recursive(self, params: Dict, path_prefix: str, 
-                                     source: int = ParameterSource.DEFAULT) -> None:
+    @staticmethod
+    def _flatten_parameters(params: Dict, path_prefix: str = "") -> List[Tuple[str, Any]]:
         """
-        Process parameters recursively, creating flattened parameters with metadata.
+        Flatten nested parameters into (path, value) pairs.
+        
+        Dictionaries with keys starting with '_' are treated as values.
         
         Args:
             params: Parameters dictionary
             path_prefix: Current path prefix for flattened keys
-            source: Source priority for these parameters
+            
+        Returns:
+            List of (full path, value) pairs
         """
+        flattened = []
         for key, value in params.items():
             full_path = f"{path_prefix}.{key}" if path_prefix else key
             
             if isinstance(value, dict) and not any(k.startswith('_') for k in value.keys()):
                 # Recursively process nested dictionaries
-                self._process_parameters_recursive(value, full_path, source)
+                flattened.extend(FinancialParameters._flatten_parameters(value, full_path))
             else:
-                # Create parameter value with metadata
-                metadata = ParameterMetadata(
-                    name=full_path, 
-                    description=f"Parameter: {full_path}",
-                    source=source,
-                    user_overridable=True,
-                    volatility=0.1 if "return" in full_path.lower() else 0.0
-                )
-                
-                # Store parameter
-                self.parameters[full_path] = ParameterValue(value, metadata)
-                self.metadata[full_path] = metadata
+                flattened.append((full_path, value))
+        return flattened
+    
+    def _store_parameter(self, full_path: str, value: Any, source: int) -> None:
+        """Store a parameter value with default metadata."""
+        metadata = ParameterMetadata(
+            name=full_path, 
+            description=f"Parameter: {full_path}",
+            source=source,
+            user_overridable=True,
+            volatility=0.1 if "return" in full_path.lower() else 0.0
+        )
+        
+        self.parameters[full_path] = ParameterValue(value, metadata)
+        self.metadata[full_path] = metadata
+    
+    def _process_parameters_recursive(self, params: Dict, path_prefix: str, 
+                                     source: int = ParameterSource.DEFAULT) -> None:
+        """
+        Process parameters recursively, creating flattened parameters with metadata.
+        
+        Args:
+            params: Parameters dictionary
+            path_prefix: Current path prefix for flattened keys
+            source: Source priority for these parameters
+        """
+        for full_path, value in self._flatten_parameters(params, path_prefix):
+            self._store_parameter(full_path, value, source)
     
     def load_from_json(self, file_path: str) -> bool:
         """
@@ -1662,16 +1692,25 @@ class FinancialParameters:
                 return curr
         
         # Try to find a more specific match
-        if not path.endswith('.'):
-            path = path + '.'
-            
-        for param_path, param in self.parameters.items():
-            if param_path.startswith(path):
-                # Found a more specific match
-                return param.get_value()
+        param_path = self.parameters.index.first(path)
+        if param_path is not None:
+            return self.parameters[param_path].get_value()
         
         return default
     
+    def get_parameters_under(self, prefix: str) -> Dict[str, Any]:
+        """
+        Get all parameters below a path prefix.
+        
+        Args:
+            prefix: Path prefix (e.g., "asset_returns.equity")
+            
+        Returns:
+            Dict of parameter paths to values, in insertion order
+        """
+        return {path: self.parameters[path].get_value()
+                for path in self.parameters.index.subtree(prefix)}
+    
     def get_metadata(self, path: str) -> Optional[ParameterMetadata]:
         """
         Get metadata for a parameter.
@@ -1729,6 +1768,108 @@ class FinancialParameters:
             logger.error(f"Failed to set parameter {path}: {str(e)}")
             return False
     
+    def set_many(self, updates: Dict[str, Any], source: int = ParameterSource.USER_SPECIFIC,
+                 reason: str = "") -> Dict[str, bool]:
+        """
+        Set several parameters as one transaction.
+        
+        Every update is validated against the current sources first. The
+        accepted values are written to the database (if configured) in a
+        single transaction and only then applied in memory, so a failed
+        write leaves both unchanged.
+        
+        Args:
+            updates: Parameter paths and their new values
+            source: Source priority (lower = higher priority)
+            reason: Reason for update
+            
+        Returns:
+            Dict[str, bool]: Result for each path, as set() would return it
+        """
+        results = {}
+        accepted = {}
+        for path, value in updates.items():
+            param = self.parameters.get(path)
+            try:
+                if param is not None and not source <= param.metadata.source:
+                    logger.info(f"Not updating {path} - source {source} has lower priority than current source {param.metadata.source}")
+                    results[path] = False
+                    continue
+            except Exception as e:
+                logger.error(f"Failed to set parameter {path}: {str(e)}")
+                results[path] = False
+                continue
+            
+            metadata = param.metadata if param is not None else ParameterMetadata(
+                name=path,
+                description=f"Parameter: {path}",
+                source=source,
+                user_overridable=True
+            )
+            accepted[path] = (value, metadata)
+            results[path] = True
+        
+        if accepted and self.db_path and not self._save_updates_to_database(accepted, source):
+            return {path: False for path in updates}
+        
+        for path, (value, metadata) in accepted.items():
+            param = self.parameters.get(path)
+            if param is not None:
+                param.update(value, source, reason)
+            else:
+                self.parameters[path] = ParameterValue(value, metadata)
+                self.metadata[path] = metadata
+        
+        return results
+    
+    def _save_updates_to_database(self, updates: Dict[str, Tuple[Any, ParameterMetadata]],
+                                  source: int) -> bool:
+        """
+        Write updated parameter values to the database in one transaction.
+        
+        Args:
+            updates: Parameter paths and their (value, metadata)
+            source: Source priority of the update
+            
+        Returns:
+            bool: True if successful, False otherwise
+        """
+        try:
+            current_time = datetime.now().isoformat()
+            rows = [(path, json.dumps(value), source, metadata.description,
+                     int(metadata.user_overridable), metadata.volatility, current_time)
+                    for path, (value, metadata) in updates.items()]
+            
+            with self._get_connection() as conn:
+                cursor = conn.cursor()
+                
+                # Check if parameters table exists
+                cursor.execute("SELECT name FROM sqlite_master WHERE type='table' AND name='financial_parameters'")
+                if cursor.fetchone() is None:
+                    self._initialize_parameters_table(conn)
+                
+                # Use executemany for better performance
+                cursor.executemany(
+                    """
+                    INSERT INTO financial_parameters 
+                    (parameter_path, parameter_value, source, description, user_overridable, volatility, last_updated)
+                    VALUES (?, ?, ?, ?, ?, ?, ?)
+                    ON CONFLICT(parameter_path) DO UPDATE SET
+                        parameter_value = excluded.parameter_value,
+                        source = excluded.source,
+                        last_updated = excluded.last_updated
+                    """, 
+                    rows
+                )
+                
+                conn.commit()
+                logger.info(f"Saved {len(rows)} parameter updates to database")
+                return True
+                
+        except Exception as e:
+            logger.error(f"Failed to save parameter updates to database: {str(e)}")
+            return False
+    
     def process_user_profile(self, profile: Dict[str, Any]) -> None:
         """
         Process user profile to extract parameters and override defaults.
@@ -3227,10 +3368,7 @@ class FinancialParameters:
             return value
         
         # Try to find nested rule structures
-        nested_paths = []
-        for path, param in self.parameters.items():
-            if path.startswith(f"rules_of_thumb.{rule_name}."):
-                nested_paths.append(path)
+        nested_paths = self.parameters.index.subtree(f"rules_of_thumb.{rule_name}")
         
         if nested_paths:
             # We have a nested rule structure, return the "general" or first one
@@ -3250,10 +3388,14 @@ class FinancialParameters:
                                  withdrawal_phase: bool = False, withdrawal_amount: float = 0,
                                  num_runs: int = 1000, inflation_adjust: bool = True,
                                  stress_test: bool = False, confidence_threshold: float = 0.8,
-                                 correlation_matrix: Dict[str, Dict[str, float]] = None) -> Dict[str, Any]:
+                                 correlation_matrix: Dict[str, Dict[str, float]] = None,
+                                 rng: Optional[np.random.Generator] = None) -> Dict[str, Any]:
         """
         Run Monte Carlo simulation for investment growth or retirement planning.
         
+        All runs are simulated together as a (runs, months) matrix of returns
+        and balances; risk metrics are array reductions over that matrix.
+        
         Args:
             initial_amount: Initial investment amount
             monthly_contribution: Monthly contribution amount
@@ -3266,10 +3408,15 @@ class FinancialParameters:
             stress_test: Whether to run stress test scenarios
             confidence_threshold: Threshold for success probability
             correlation_matrix: Asset class correlation matrix
+            rng: Optional random number generator (defaults to a seeded stream)
             
         Returns:
             Dict: Simulation results with confidence levels and risk metrics
         """
+        # Import here to avoid circular imports
+        from models.monte_carlo.engine import simulate_wealth_paths
+        from models.monte_carlo.rng import DEFAULT_SEED, resolve_generator
+        
         # Get market volatility parameters
         volatility_params = self.get("risk_modeling.monte_carlo.market_volatility")
         confidence_levels = self.get("risk_modeling.monte_carlo.confidence_levels", 
@@ -3297,8 +3444,8 @@ class FinancialParameters:
             "confidence_analysis": {}
         }
         
-        # Set up random number generator
-        rng = random.Random(42)  # Seed for reproducibility
+        # Set up random number generator (reproducible unless a generator is supplied)
+        rng = resolve_generator(rng, DEFAULT_SEED)
         
         # Calculate expected return and volatility based on allocation
         expected_return = self.calculate_portfolio_return(allocation)
@@ -3352,14 +3499,6 @@ class FinancialParameters:
         if stress_test:
             stress_scenarios = self.get("risk_modeling.stress_testing.scenarios", {})
         
-        # Run standard simulations
-        all_paths = []
-        success_count = 0
-        max_drawdowns = []
-        path_volatilities = []
-        shortfall_count = 0
-        total_shortfall = 0.0
-        
         # Target amount calculation based on assumed growth rate
         target_amount = initial_amount * (1 + expected_return) ** time_horizon
         if monthly_contribution > 0:
@@ -3367,112 +3506,86 @@ class FinancialParameters:
             fv_factor = ((1 + expected_return) ** time_horizon - 1) / expected_return
             target_amount += monthly_contribution * 12 * fv_factor
         
-        # Run simulations
-        for run in range(num_runs):
-            # Initialize this simulation run
-            balance = initial_amount
-            monthly_return = (1 + expected_return) ** (1/12) - 1
-            monthly_volatility = portfolio_volatility / math.sqrt(12)
-            
-            path = [balance]
-            success = True  # For withdrawal phase
-            max_balance = balance
-            max_drawdown = 0.0
-            returns = []
-            
-            # Apply sequence risk adjustment for withdrawal phase (early negative returns matter more)
-            if withdrawal_phase and run < int(num_runs * 0.2):  # Bottom 20% of scenarios
-                # Simulate more adverse early sequence for these runs
-                early_adjustment = sequence_risk_adjustment * (1 - run / (num_runs * 0.2))
-                monthly_return = monthly_return * (1 - early_adjustment)
-            
-            # Run simulation for each month
-            for month in range(1, time_horizon * 12 + 1):
-                # Generate correlated random returns for each asset class
-                if correlation_matrix:
-                    # Calculate overall portfolio return from correlated asset returns
-                    portfolio_return = self._generate_correlated_returns(
-                        allocation, asset_volatilities, correlation_matrix, monthly_return, rng)
-                else:
-                    # Generate random return using log-normal distribution for entire portfolio
-                    random_factor = rng.normalvariate(0, 1)
-                    log_return = (math.log(1 + monthly_return) - 0.5 * monthly_volatility**2)
-                    portfolio_return = math.exp(log_return + monthly_volatility * random_factor) - 1
-                
-                # Apply return to current balance
-                investment_growth = balance * portfolio_return
-                
-                # Adjust for inflation if enabled
-                inflation_adjustment = 1.0
-                if inflation_adjust:
-                    inflation_adjustment = 1.0 / (1.0 + monthly_inflation)
-                
-                # Add contribution or withdrawal
-                if withdrawal_phase:
-                    # Adjust withdrawal for inflation if needed
-                    adjusted_withdrawal = withdrawal_amount
-                    if inflation_adjust:
-                        adjusted_withdrawal = withdrawal_amount * ((1 + monthly_inflation) ** month)
-                    
-                    balance = (balance + investment_growth - adjusted_withdrawal) * inflation_adjustment
-                    
-                    # Check if balance went to zero
-                    if balance <= 0:
-                        balance = 0
-                        success = False
-                        break
-                else:
-                    # For accumulation phase, adjust contribution for inflation if needed
-                    adjusted_contribution = monthly_contribution
-                    if inflation_adjust:
-                        # Future contributions increase with inflation
-                        adjusted_contribution = monthly_contribution * ((1 + monthly_inflation) ** month)
-                    
-                    balance = (balance + investment_growth + adjusted_contribution) * inflation_adjustment
-                
-                # Record balance for this month
-                path.append(balance)
-                
-                # Track return for volatility calculation
-                if balance > 0 and len(path) > 1:
-                    monthly_actual_return = (balance - path[-2]) / path[-2]
-                    returns.append(monthly_actual_return)
-                
-                # Update max balance and calculate drawdown
-                if balance > max_balance:
-                    max_balance = balance
-                else:
-                    current_drawdown = (max_balance - balance) / max_balance if max_balance > 0 else 0
-                    max_drawdown = max(max_drawdown, current_drawdown)
-            
-            # Calculate path volatility from returns
-            path_volatility = (
-                math.sqrt(sum((r - sum(returns) / len(returns)) ** 2 for r in returns) / len(returns))
-                if returns else 0
-            )
-            
-            # Record metrics
-            final_balance = balance
-            results["final_amounts"].append(final_balance)
-            all_paths.append(path)
-            max_drawdowns.append(max_drawdown)
-            path_volatilities.append(path_volatility)
-            
-            # Track success for withdrawal phase
-            if withdrawal_phase and success:
-                success_count += 1
-            
-            # Check for shortfall against target
-            if final_balance < target_amount:
-                shortfall_count += 1
-                shortfall_amount = target_amount - final_balance
-                total_shortfall += shortfall_amount
+        months = time_horizon * 12
+        monthly_volatility = portfolio_volatility / math.sqrt(12)
+        
+        # Expected monthly return per run; sequence risk adjustment for the first
+        # 20% of runs in the withdrawal phase (early negative returns matter more)
+        monthly_returns = np.full(num_runs, (1 + expected_return) ** (1/12) - 1)
+        if withdrawal_phase:
+            adverse_runs = int(num_runs * 0.2)
+            run_index = np.arange(adverse_runs)
+            early_adjustment = sequence_risk_adjustment * (1 - run_index / (num_runs * 0.2))
+            monthly_returns[:adverse_runs] *= (1 - early_adjustment)
+        
+        # Draw every monthly portfolio return for all runs at once: (runs, months)
+        if correlation_matrix:
+            portfolio_returns = self._simulate_correlated_portfolio_returns(
+                allocation, asset_volatilities, correlation_matrix, monthly_returns, months, rng)
+        else:
+            # Log-normal returns for the entire portfolio
+            shocks = rng.standard_normal((num_runs, months))
+            log_returns = (np.log1p(monthly_returns) - 0.5 * monthly_volatility**2)[:, np.newaxis]
+            portfolio_returns = np.expm1(log_returns + monthly_volatility * shocks)
+        
+        # Monthly cash flows (future contributions and withdrawals increase with inflation)
+        month_index = np.arange(1, months + 1)
+        flow_amount = -withdrawal_amount if withdrawal_phase else monthly_contribution
+        cash_flows = np.full(months, float(flow_amount))
+        inflation_adjustment = 1.0
+        if inflation_adjust:
+            cash_flows = cash_flows * (1 + monthly_inflation) ** month_index
+            inflation_adjustment = 1.0 / (1.0 + monthly_inflation)
+        
+        # balance = (balance * (1 + r) + flow) * inflation_adjustment, for every run at once.
+        # In the withdrawal phase a depleted portfolio stays at zero.
+        paths = simulate_wealth_paths(
+            initial_amount,
+            (1 + portfolio_returns) * inflation_adjustment - 1,
+            cash_flows * inflation_adjustment,
+            floor=0.0 if withdrawal_phase else None
+        )
+        balances = paths[:, 1:]
+        final_amounts = paths[:, -1]
+        
+        # Months recorded for each run; a run stops at the month its balance hits zero
+        if withdrawal_phase:
+            depleted = balances <= 0
+            failed = depleted.any(axis=1)
+            recorded_months = np.where(failed, np.argmax(depleted, axis=1), months)
+        else:
+            failed = np.zeros(num_runs, dtype=bool)
+            recorded_months = np.full(num_runs, months)
+        recorded = month_index[np.newaxis, :] <= recorded_months[:, np.newaxis]
+        
+        # Path volatility: population standard deviation of monthly balance changes
+        previous = paths[:, :-1]
+        return_mask = recorded & (balances > 0) & (previous > 0)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            balance_changes = np.where(return_mask, (balances - previous) / previous, 0.0)
+        return_counts = return_mask.sum(axis=1)
+        safe_counts = np.maximum(return_counts, 1)
+        mean_changes = balance_changes.sum(axis=1) / safe_counts
+        deviations = np.where(return_mask, balance_changes - mean_changes[:, np.newaxis], 0.0)
+        path_volatilities = np.where(
+            return_counts > 0, np.sqrt((deviations ** 2).sum(axis=1) / safe_counts), 0.0)
+        
+        # Maximum drawdown from the running peak (including the initial balance)
+        running_max = np.maximum.accumulate(paths, axis=1)[:, 1:]
+        with np.errstate(divide='ignore', invalid='ignore'):
+            drawdowns = np.where(running_max > 0, (running_max - balances) / running_max, 0.0)
+        max_drawdowns = np.where(recorded, drawdowns, 0.0).max(axis=1, initial=0.0)
+        
+        # Shortfall against target
+        shortfalls = target_amount - final_amounts[final_amounts < target_amount]
+        
+        results["final_amounts"] = final_amounts.tolist()
         
         # Calculate percentiles for final amounts
-        sorted_final_amounts = sorted(results["final_amounts"])
+        sorted_final_amounts = np.sort(final_amounts)
         for confidence in confidence_levels:
             percentile = 100 * (1 - confidence)
-            results["percentiles"][confidence] = sorted_final_amounts[int(percentile * num_runs / 100)]
+            results["percentiles"][confidence] = float(sorted_final_amounts[int(percentile * num_runs / 100)])
         
         # Calculate detailed confidence analysis
         step = 0.05  # 5% steps
@@ -3480,42 +3593,40 @@ class FinancialParameters:
             percentile = 100 * (1 - conf_level)
             percentile_idx = int(percentile * num_runs / 100)
             if 0 <= percentile_idx < len(sorted_final_amounts):
-                results["confidence_analysis"][conf_level] = sorted_final_amounts[percentile_idx]
+                results["confidence_analysis"][conf_level] = float(sorted_final_amounts[percentile_idx])
         
         # Calculate risk metrics
-        results["risk_metrics"]["max_drawdown"] = sum(max_drawdowns) / len(max_drawdowns)
-        results["risk_metrics"]["volatility"] = sum(path_volatilities) / len(path_volatilities)
-        results["risk_metrics"]["shortfall_probability"] = shortfall_count / num_runs
+        results["risk_metrics"]["max_drawdown"] = float(max_drawdowns.mean())
+        results["risk_metrics"]["volatility"] = float(path_volatilities.mean())
+        results["risk_metrics"]["shortfall_probability"] = len(shortfalls) / num_runs
         results["risk_metrics"]["expected_shortfall"] = (
-            total_shortfall / shortfall_count if shortfall_count > 0 else 0
+            float(shortfalls.mean()) if len(shortfalls) > 0 else 0
         )
         
         # Calculate Value at Risk (VaR) at different confidence levels
         for var_level in [0.95, 0.99]:
             var_idx = int(num_runs * (1 - var_level))
             results["risk_metrics"]["value_at_risk"][var_level] = (
-                initial_amount - sorted_final_amounts[var_idx]
+                initial_amount - float(sorted_final_amounts[var_idx])
                 if var_idx < len(sorted_final_amounts) else initial_amount
             )
         
-        # Calculate median path
-        if all_paths:
-            median_path_index = sorted(range(num_runs), key=lambda i: results["final_amounts"][i])[num_runs // 2]
-            results["median_path"] = all_paths[median_path_index]
+        # Calculate median path (stable ordering matches sorted() on the final amounts)
+        if num_runs > 0:
+            median_path_index = np.argsort(final_amounts, kind='stable')[num_runs // 2]
+            results["median_path"] = paths[median_path_index, :recorded_months[median_path_index] + 1].tolist()
         
         # Calculate success rate for withdrawal phase
         if withdrawal_phase:
-            results["success_rate"] = success_count / num_runs
+            results["success_rate"] = float(np.count_nonzero(~failed)) / num_runs
         
         # Run stress test simulations if enabled
         if stress_test and stress_scenarios:
-            for scenario_name, impacts in stress_scenarios.items():
-                # Run a separate simulation with modified returns for this scenario
-                scenario_result = self._run_stress_scenario(
-                    initial_amount, monthly_contribution, time_horizon, allocation,
-                    withdrawal_phase, withdrawal_amount, impacts, inflation_rate
-                )
-                results["stress_test_results"][scenario_name] = scenario_result
+            # All scenarios are evaluated together with modified returns
+            results["stress_test_results"] = self._run_stress_scenarios(
+                initial_amount, monthly_contribution, time_horizon, allocation,
+                withdrawal_phase, withdrawal_amount, stress_scenarios, inflation_rate
+            )
         
         return results
         
@@ -3570,48 +3681,69 @@ class FinancialParameters:
         
         return 0.0  # Default: no correlation
             
-    def _generate_correlated_returns(self, allocation: Dict[str, float], 
-                                    volatilities: Dict[str, float],
-                                    correlation_matrix: Dict[str, Dict[str, float]],
-                                    base_return: float, rng: random.Random) -> float:
-        """Generate correlated random returns for all assets in allocation."""
-        # Generate uncorrelated random variables
-        uncorrelated_returns = {
-            asset: rng.normalvariate(0, 1) for asset in allocation
-        }
+    def _build_correlation_array(self, assets: List[str],
+                                 correlation_matrix: Dict[str, Dict[str, float]]) -> np.ndarray:
+        """Build a correlation matrix array for the given assets (unit diagonal)."""
+        size = len(assets)
+        matrix = np.eye(size)
+        for i in range(size):
+            for j in range(i + 1, size):
+                correlation = self._get_correlation(assets[i], assets[j], correlation_matrix)
+                matrix[i, j] = matrix[j, i] = correlation
+        return matrix
+    
+    def _simulate_correlated_portfolio_returns(self, allocation: Dict[str, float],
+                                               volatilities: Dict[str, float],
+                                               correlation_matrix: Dict[str, Dict[str, float]],
+                                               base_returns: np.ndarray, months: int,
+                                               rng: np.random.Generator) -> np.ndarray:
+        """
+        Generate monthly portfolio returns from correlated asset returns.
         
-        # Apply Cholesky decomposition or a simplified approach for correlation
-        # This is a simplified approach - for a full implementation, we would use linear algebra
-        correlated_returns = {}
-        portfolio_return = 0.0
+        The correlation matrix is factorized once and a single
+        (runs, months, assets) tensor of correlated shocks is drawn.
         
-        for asset, alloc_percent in allocation.items():
-            # For each asset, calculate a return that's correlated with other assets
-            asset_return = base_return
-            asset_volatility = volatilities.get(asset, 0.05)
-            
-            # Apply random component with correlation
-            random_component = uncorrelated_returns[asset]
-            for other_asset, other_random in uncorrelated_returns.items():
-                if asset != other_asset:
-                    correlation = self._get_correlation(asset, other_asset, correlation_matrix)
-                    # Mix in some of the other asset's random component based on correlation
-                    random_component = random_component * (1 - abs(correlation)) + other_random * correlation
-            
-            # Calculate log-normal return
-            log_return = (math.log(1 + asset_return) - 0.5 * asset_volatility**2)
-            actual_return = math.exp(log_return + asset_volatility * random_component) - 1
-            
-            # Add to portfolio return
-            portfolio_return += actual_return * alloc_percent
+        Args:
+            allocation: Asset allocation dictionary
+            volatilities: Annual volatility per asset
+            correlation_matrix: Asset class correlation matrix
+            base_returns: Expected monthly return for each run
+            months: Number of simulated months
+            rng: Random number generator
             
-        return portfolio_return
-        
+        Returns:
+            Array of shape (runs, months) with portfolio returns
+        """
+        # Import here to avoid circular imports
+        from models.monte_carlo.correlation import cholesky_factor, correlated_normals
+        
+        assets = list(allocation)
+        weights = np.array([allocation[asset] for asset in assets], dtype=np.float64)
+        monthly_volatilities = np.array(
+            [volatilities.get(asset, 0.05) for asset in assets], dtype=np.float64) / math.sqrt(12)
+        
+        chol = cholesky_factor(self._build_correlation_array(assets, correlation_matrix))
+        shocks = correlated_normals(chol, (len(base_returns), months), rng)
+        
+        # Log-normal return for each asset, then weighted into the portfolio return
+        log_returns = (np.log1p(base_returns)[:, np.newaxis, np.newaxis]
+                       - 0.5 * monthly_volatilities**2)
+        asset_returns = np.expm1(log_returns + monthly_volatilities * shocks)
+        return asset_returns @ weights
+    
     def _run_stress_scenario(self, initial_amount: float, monthly_contribution: float,
                            time_horizon: int, allocation: Dict[str, float],
                            withdrawal_phase: bool, withdrawal_amount: float,
                            scenario_impacts: Dict[str, float], inflation_rate: float) -> Dict[str, Any]:
         """Run a simulation with modified returns for stress testing."""
+        return self._run_stress_scenarios(
+            initial_amount, monthly_contribution, time_horizon, allocation,
+            withdrawal_phase, withdrawal_amount, {"scenario": scenario_impacts}, inflation_rate
+        )["scenario"]
+    
+    def _stress_portfolio_return(self, allocation: Dict[str, float],
+                                 scenario_impacts: Dict[str, float]) -> float:
+        """Monthly portfolio return during the stress period of a scenario."""
         # Simplify impacts to main asset classes
         main_impacts = {}
         for asset, impact in scenario_impacts.items():
@@ -3619,106 +3751,103 @@ class FinancialParameters:
                 if asset in alloc_asset.lower():
                     main_impacts[alloc_asset] = impact
         
-        results = {
-            "final_balance": 0.0,
-            "success_probability": 0.0,
-            "recovery_time": 0,
-            "max_drawdown": 0.0
-        }
+        portfolio_return = 0.0
+        for asset, alloc_percent in allocation.items():
+            # Find applicable impact
+            impact = 0.0
+            for impact_asset, impact_value in main_impacts.items():
+                if impact_asset in asset:
+                    impact = impact_value
+                    break
+            
+            # Calculate monthly impact
+            monthly_impact = (1 + impact) ** (1/12) - 1
+            portfolio_return += monthly_impact * alloc_percent
         
-        # Set up simulation
-        balance = initial_amount
-        max_balance = balance
-        max_drawdown = 0.0
+        return portfolio_return
+    
+    def _run_stress_scenarios(self, initial_amount: float, monthly_contribution: float,
+                              time_horizon: int, allocation: Dict[str, float],
+                              withdrawal_phase: bool, withdrawal_amount: float,
+                              scenarios: Dict[str, Dict[str, float]],
+                              inflation_rate: float) -> Dict[str, Dict[str, Any]]:
+        """
+        Run stress test simulations for several scenarios at once.
         
-        # First year: apply stress impacts
-        stress_period_months = 12  # One year of stress
+        Each scenario applies its asset impacts for one year followed by normal
+        returns; all scenarios are computed as one (scenarios, months) matrix.
         
-        for month in range(1, stress_period_months + 1):
-            # Apply stress scenario impacts
-            portfolio_return = 0.0
-            for asset, alloc_percent in allocation.items():
-                # Find applicable impact
-                impact = 0.0
-                for impact_asset, impact_value in main_impacts.items():
-                    if impact_asset in asset:
-                        impact = impact_value
-                        break
-                
-                # Calculate monthly impact
-                monthly_impact = (1 + impact) ** (1/12) - 1
-                portfolio_return += monthly_impact * alloc_percent
-            
-            # Apply return
-            investment_growth = balance * portfolio_return
-            
-            # Apply inflation
-            inflation_adjustment = 1.0 / (1.0 + inflation_rate/12)
-            
-            # Add contribution or withdrawal
-            if withdrawal_phase:
-                balance = (balance + investment_growth - withdrawal_amount) * inflation_adjustment
-            else:
-                balance = (balance + investment_growth + monthly_contribution) * inflation_adjustment
-            
-            # Track max balance and drawdown
-            if balance > max_balance:
-                max_balance = balance
-            else:
-                current_drawdown = (max_balance - balance) / max_balance if max_balance > 0 else 0
-                max_drawdown = max(max_drawdown, current_drawdown)
-                
-            # Check if balance went to zero
-            if balance <= 0:
-                balance = 0
-                results["success_probability"] = 0.0
-                results["final_balance"] = 0.0
-                results["max_drawdown"] = 1.0
-                return results
-        
-        # After stress period: normal returns (simplified)
-        expected_return = self.calculate_portfolio_return(allocation)
-        monthly_return = (1 + expected_return) ** (1/12) - 1
+        Returns:
+            Dict: Results per scenario name
+        """
+        # Import here to avoid circular imports
+        from models.monte_carlo.engine import simulate_wealth_paths
         
-        recovery_month = 0
-        has_recovered = False
+        names = list(scenarios)
+        if not names:
+            return {}
         
-        for month in range(stress_period_months + 1, time_horizon * 12 + 1):
-            # Apply normal return
-            investment_growth = balance * monthly_return
-            
-            # Apply inflation
-            inflation_adjustment = 1.0 / (1.0 + inflation_rate/12)
-            
-            # Add contribution or withdrawal
-            if withdrawal_phase:
-                balance = (balance + investment_growth - withdrawal_amount) * inflation_adjustment
-            else:
-                balance = (balance + investment_growth + monthly_contribution) * inflation_adjustment
-            
-            # Track max balance and drawdown
-            if balance > max_balance:
-                max_balance = balance
-                if not has_recovered and balance >= initial_amount:
-                    has_recovered = True
-                    recovery_month = month
-            else:
-                current_drawdown = (max_balance - balance) / max_balance if max_balance > 0 else 0
-                max_drawdown = max(max_drawdown, current_drawdown)
-            
-            # Check if balance went to zero
-            if balance <= 0:
-                balance = 0
-                break
+        stress_period_months = 12  # One year of stress
+        months = max(stress_period_months, time_horizon * 12)
         
-        # Calculate final results
-        results["final_balance"] = balance
-        results["success_probability"] = 1.0 if (withdrawal_phase and balance > 0) or (not withdrawal_phase) else 0.0
-        results["recovery_time"] = recovery_month / 12 if recovery_month > 0 else 0
-        results["max_drawdown"] = max_drawdown
+        # Monthly returns: stress impacts first, then normal returns (simplified)
+        expected_return = self.calculate_portfolio_return(allocation)
+        monthly_returns = np.full((len(names), months), (1 + expected_return) ** (1/12) - 1)
+        monthly_returns[:, :stress_period_months] = np.array(
+            [self._stress_portfolio_return(allocation, scenarios[name]) for name in names]
+        )[:, np.newaxis]
+        
+        inflation_adjustment = 1.0 / (1.0 + inflation_rate/12)
+        flow = -withdrawal_amount if withdrawal_phase else monthly_contribution
+        
+        paths = simulate_wealth_paths(
+            initial_amount,
+            (1 + monthly_returns) * inflation_adjustment - 1,
+            np.full(months, flow * inflation_adjustment),
+            floor=None
+        )
+        balances = paths[:, 1:]
+        month_index = np.arange(1, months + 1)
+        
+        # Scenarios stop at the first month the balance reaches zero
+        depleted = balances <= 0
+        failed = depleted.any(axis=1)
+        stop_month = np.where(failed, np.argmax(depleted, axis=1) + 1, months)
+        recorded = month_index[np.newaxis, :] <= stop_month[:, np.newaxis]
+        
+        # Drawdown from the running peak and recovery to a new high above the start
+        running_max = np.maximum.accumulate(paths, axis=1)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            drawdowns = np.where(running_max[:, 1:] > 0,
+                                 (running_max[:, 1:] - balances) / running_max[:, 1:], 0.0)
+        max_drawdowns = np.where(recorded, drawdowns, 0.0).max(axis=1, initial=0.0)
+        recovered = (recorded & (month_index > stress_period_months)
+                     & (balances > running_max[:, :-1]) & (balances >= initial_amount))
+        recovery_month = np.where(recovered.any(axis=1), np.argmax(recovered, axis=1) + 1, 0)
+        
+        results = {}
+        for i, name in enumerate(names):
+            if failed[i] and stop_month[i] <= stress_period_months:
+                # Depleted during the stress period
+                results[name] = {
+                    "final_balance": 0.0,
+                    "success_probability": 0.0,
+                    "recovery_time": 0,
+                    "max_drawdown": 1.0
+                }
+                continue
+            
+            balance = 0.0 if failed[i] else float(balances[i, -1])
+            results[name] = {
+                "final_balance": balance,
+                "success_probability": 1.0 if (withdrawal_phase and balance > 0) or (not withdrawal_phase) else 0.0,
+                "recovery_time": float(recovery_month[i]) / 12 if recovery_month[i] > 0 else 0,
+                "max_drawdown": float(max_drawdowns[i])
+            }
         
         return results
     
+    
     def analyze_user_behavior(self, behavior_data: Dict[str, Any]) -> Dict[str, Any]:
         """
         Analyze user behavioral factors and provide nudges or adjustments.
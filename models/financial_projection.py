@@ -7,14 +7,18 @@ allocation changes, and risk modeling capabilities.
 """
 
 import numpy as np
-import pandas as pd
 import math
 import time
-from typing import Dict, List, Tuple, Union, Optional
+import hashlib
+from typing import TYPE_CHECKING, Dict, List, Tuple, Union, Optional
 from dataclasses import dataclass, field
 from enum import Enum
 import logging
 
+if TYPE_CHECKING:
+    # pandas is only needed for to_dataframe(); importing it lazily keeps it off the app boot path
+    import pandas as pd
+
 logger = logging.getLogger(__name__)
 
 class AssetClass(Enum):
@@ -81,8 +85,10 @@ class ProjectionResult:
             else:
                 self.growth = self.growth[:len(self.years)]
     
-    def to_dataframe(self) -> pd.DataFrame:
+    def to_dataframe(self) -> 'pd.DataFrame':
         """Convert projection result to pandas DataFrame for analysis/visualization"""
+        import pandas as pd
+        
         df = pd.DataFrame({
             'Year': self.years,
             'Projected_Value': self.projected_values,
@@ -226,6 +232,7 @@ class AssetProjection:
         self.cache_simulations = cache_simulations
         
         # Cache for Monte Carlo simulations to avoid expensive recalculations
+        # (backed by the shared simulation cache, see _get_shared_cache_key)
         self._simulation_cache = {}
         self._cache_hits = 0
         self._cache_misses = 0
@@ -237,9 +244,8 @@ class AssetProjection:
         except ImportError:
             self._time_module_available = False
         
-        # Set random seed if provided
-        if seed is not None:
-            np.random.seed(seed)
+        # Seed for this engine's random streams; global NumPy state is never touched
+        self.seed = seed
             
     def _get_cache_key(self, 
                        initial_amount: float, 
@@ -251,6 +257,31 @@ class AssetProjection:
         """Generate a unique cache key for a simulation configuration"""
         return f"{initial_amount}_{years}_{simulations}_{seed}_{contribution_pattern_hash}_{allocation_strategy_hash}"
     
+    def _get_shared_cache_key(self,
+                              initial_amount: float,
+                              years: int,
+                              simulations: int,
+                              seed: Optional[int],
+                              use_vectorized: bool,
+                              contribution_pattern: ContributionPattern,
+                              allocation_strategy: AllocationStrategy) -> Optional[str]:
+        """
+        Generate a key for sharing a simulation with other instances and worker processes
+        
+        Unlike the per-instance key this covers the return assumptions of the
+        instance and the full contribution and allocation definitions. Returns
+        None when the result cannot be reproduced elsewhere (unseeded runs or
+        custom pattern/strategy subclasses).
+        """
+        if seed is None or type(contribution_pattern) is not ContributionPattern \
+                or type(allocation_strategy) is not AllocationStrategy:
+            return None
+        returns = sorted((asset_class.name, tuple(params)) for asset_class, params in self.returns.items())
+        config = repr((initial_amount, years, simulations, seed, use_vectorized, returns,
+                       self.inflation_rate, self.rebalancing_frequency,
+                       contribution_pattern, allocation_strategy))
+        return "asset_projection:" + hashlib.md5(config.encode()).hexdigest()
+    
     def _get_contribution_pattern_hash(self, pattern: ContributionPattern) -> str:
         """Generate a hash for a contribution pattern"""
         if hasattr(pattern, 'annual_amount') and hasattr(pattern, 'growth_rate'):
@@ -346,7 +377,8 @@ class AssetProjection:
                                 confidence_levels: List[float] = [0.10, 0.25, 0.50, 0.75, 0.90],
                                 seed: int = 42,
                                 use_vectorized: bool = True,
-                                use_cache: bool = None) -> ProjectionResult:
+                                use_cache: bool = None,
+                                rng: Optional[np.random.Generator] = None) -> ProjectionResult:
         """
         Project asset growth using Monte Carlo simulation
         
@@ -370,12 +402,19 @@ class AssetProjection:
             Whether to use vectorized operations for improved performance
         use_cache : bool, optional
             Whether to use caching (defaults to self.cache_simulations)
+        rng : np.random.Generator, optional
+            Random stream to draw from; when omitted a private stream is created
+            from ``seed`` so concurrent simulations never share random state
             
         Returns:
         --------
         ProjectionResult
             Object containing projection results with confidence intervals
         """
+        # Import here to avoid circular imports (models.monte_carlo imports this module)
+        from models.monte_carlo.rng import resolve_generator
+        from models.monte_carlo.cache import _cache as shared_cache
+        
         # Performance metrics for diagnostics
         start_time = time.time() if hasattr(self, '_time_module_available') and self._time_module_available else None
         
@@ -392,6 +431,7 @@ class AssetProjection:
             use_cache = self.cache_simulations
             
         # If using cache, check if we have a cached result
+        shared_key = None
         if use_cache:
             # Generate cache keys
             contribution_hash = self._get_contribution_pattern_hash(contribution_pattern)
@@ -405,11 +445,23 @@ class AssetProjection:
                 allocation_strategy_hash=allocation_hash
             )
             
-            # Check cache
-            if cache_key in self._simulation_cache:
+            # Results drawn from a caller's generator depend on its state and are not shared
+            if rng is None:
+                shared_key = self._get_shared_cache_key(
+                    initial_amount, years, simulations, seed, use_vectorized,
+                    contribution_pattern, allocation_strategy
+                )
+            
+            # Check this instance's cache, then the cache shared with other workers
+            cached_result = self._simulation_cache.get(cache_key)
+            if cached_result is None and shared_key is not None:
+                cached_result = shared_cache.get(shared_key)
+                if cached_result is not None:
+                    self._simulation_cache[cache_key] = cached_result
+            
+            if cached_result is not None:
                 self._cache_hits += 1
                 logger.debug(f"Monte Carlo simulation cache hit (key={cache_key})")
-                cached_result = self._simulation_cache[cache_key]
                 
                 # If confidence levels match, return cached result directly
                 cached_levels = set(level for level in cached_result.confidence_intervals.keys() 
@@ -461,10 +513,8 @@ class AssetProjection:
                 self._cache_misses += 1
                 logger.debug(f"Monte Carlo simulation cache miss (key={cache_key})")
             
-        # Set random seed for deterministic testing
-        if seed is not None:
-            logger.info(f"Setting random seed to {seed} for deterministic Monte Carlo simulation")
-            np.random.seed(seed)
+        # Use a private random stream (seeded for deterministic results)
+        rng = resolve_generator(rng, seed)
         
         # Store all simulation results
         all_projections = np.zeros((simulations, years + 1))
@@ -495,7 +545,7 @@ class AssetProjection:
                 
                 # Generate random returns for all simulations at once
                 simulated_returns = self._simulate_portfolio_returns_vectorized(
-                    current_allocation, simulations
+                    current_allocation, simulations, rng
                 )
                 
                 # Update all values at once
@@ -512,7 +562,7 @@ class AssetProjection:
                     current_allocation = yearly_allocations[year-1]
                     
                     # Generate random returns for each asset class
-                    simulated_return = self._simulate_portfolio_return(current_allocation)
+                    simulated_return = self._simulate_portfolio_return(current_allocation, rng)
                     
                     # Update current value
                     current_value = current_value * (1 + simulated_return) + contribution
@@ -550,10 +600,12 @@ class AssetProjection:
             volatility=np.std(all_projections[:, -1]) / np.mean(all_projections[:, -1])
         )
         
+        # Keep the raw paths for path-based metrics such as time-to-goal
+        result.all_projections = all_projections
+        
         # Store additional data for caching
         if use_cache:
-            # Add the raw projections data and contributions to the result for caching
-            result.all_projections = all_projections
+            # Add the contributions to the result for caching
             result.yearly_contributions = yearly_contributions
             
             # Generate cache key and store in cache
@@ -570,6 +622,8 @@ class AssetProjection:
                 )
                 
             self._simulation_cache[cache_key] = result
+            if shared_key is not None:
+                shared_cache.set(shared_key, result)
             logger.debug(f"Stored Monte Carlo simulation in cache (key={cache_key})")
             
             # Limit cache size to prevent memory issues
@@ -798,7 +852,8 @@ class AssetProjection:
             
         return max_vol - min_vol
     
-    def _simulate_portfolio_return(self, allocation: Dict[AssetClass, float]) -> float:
+    def _simulate_portfolio_return(self, allocation: Dict[AssetClass, float],
+                                   rng: Optional[np.random.Generator] = None) -> float:
         """
         Simulate a single year's portfolio return using random sampling
         
@@ -806,12 +861,15 @@ class AssetProjection:
         -----------
         allocation : Dict[AssetClass, float]
             Current asset allocation
+        rng : np.random.Generator, optional
+            Random stream to draw from (defaults to the numpy.random module)
             
         Returns:
         --------
         float
             Simulated portfolio return for one year
         """
+        source = rng if rng is not None else np.random
         portfolio_return = 0
         
         # Using a more efficient implementation
@@ -819,12 +877,13 @@ class AssetProjection:
             if asset_class in self.returns and weight > 0.001:  # Skip negligible allocations
                 mean_return, volatility = self.returns[asset_class]
                 # Generate random return from normal distribution
-                asset_return = np.random.normal(mean_return, volatility)
+                asset_return = source.normal(mean_return, volatility)
                 portfolio_return += weight * asset_return
         
         return portfolio_return
         
-    def _simulate_portfolio_returns_vectorized(self, allocation: Dict[AssetClass, float], simulations: int = 1) -> np.ndarray:
+    def _simulate_portfolio_returns_vectorized(self, allocation: Dict[AssetClass, float], simulations: int = 1,
+                                               rng: Optional[np.random.Generator] = None) -> np.ndarray:
         """
         Simulate multiple portfolio returns at once using vectorized operations
         
@@ -834,12 +893,16 @@ class AssetProjection:
             Current asset allocation
         simulations : int
             Number of simulations to generate
+        rng : np.random.Generator, optional
+            Random stream to draw from (defaults to the numpy.random module)
             
         Returns:
         --------
         np.ndarray
             Array of simulated returns (shape: simulations)
         """
+        source = rng if rng is not None else np.random
+        
         # Initialize with zeros
         portfolio_returns = np.zeros(simulations)
         
@@ -848,7 +911,7 @@ class AssetProjection:
             if asset_class in self.returns and weight > 0.001:  # Skip negligible allocations
                 mean_return, volatility = self.returns[asset_class]
                 # Generate random returns for all simulations at once
-                asset_returns = np.random.normal(mean_return, volatility, simulations)
+                asset_returns = source.normal(mean_return, volatility, simulations)
                 # Add weighted contribution to portfolio returns
                 portfolio_returns += weight * asset_returns
         
@@ -1024,8 +1087,10 @@ class IncomeResult:
     total_income: List[float]
     after_tax_income: List[float]
     
-    def to_dataframe(self) -> pd.DataFrame:
+    def to_dataframe(self) -> 'pd.DataFrame':
         """Convert income result to pandas DataFrame for analysis/visualization"""
+        import pandas as pd
+        
         df = pd.DataFrame({
             'Year': self.years,
             'Total_Income': self.total_income,
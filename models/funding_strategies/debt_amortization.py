@@ -0,0 +1,135 @@
+"""
+Array-based amortization kernel for debt repayment strategies.
+
+DebtRepaymentStrategy used to simulate each repayment plan month by month
+over lists of debt dicts, re-filtering the list every month, and repeated
+the whole simulation for every method (avalanche, snowball, hybrid) and
+every allocation level it wanted to compare.
+
+simulate_repayment() instead advances a (strategies, allocations, debts)
+state tensor one month at a time, so every repayment order and every
+monthly allocation is simulated in the same pass. The monthly rules match
+the original loop:
+
+    1. Every active debt accrues a month of interest and receives its
+       minimum payment (or whatever clears it, if that is smaller).
+    2. What is left of the allocation goes to the first active debt in
+       the repayment order.
+    3. Debts with a balance of 1 or less are treated as paid off.
+"""
+
+from typing import Sequence
+
+import numpy as np
+
+# Cap at 30 years
+MAX_REPAYMENT_MONTHS = 360
+
+# Balances at or below this are treated as rounding residue
+PAID_OFF_THRESHOLD = 1
+
+
+class AmortizationResult:
+    """
+    Outputs of simulate_repayment().
+
+    Attributes:
+        total_interest: (strategies, allocations) interest paid
+        months_to_freedom: (strategies, allocations) months until every
+            debt is paid off, capped at max_months
+        payoff_month: (strategies, allocations, debts) month each debt
+            was paid off, 0 if it was not paid off within max_months.
+            Debts are indexed in their original order.
+        first_payoff_month: (strategies, allocations) month of the first
+            payoff, max_months if none
+        history: Per-month totals when requested, each of shape
+            (months, strategies, allocations): 'remaining_balance',
+            'interest_paid' (cumulative) and 'debts_remaining'
+    """
+
+    def __init__(self, total_interest, months_to_freedom, payoff_month, first_payoff_month, history=None):
+        self.total_interest = total_interest
+        self.months_to_freedom = months_to_freedom
+        self.payoff_month = payoff_month
+        self.first_payoff_month = first_payoff_month
+        self.history = history
+
+
+def simulate_repayment(balances: Sequence[float], interest_rates: Sequence[float],
+                       minimum_payments: Sequence[float], orders: Sequence[Sequence[int]],
+                       allocations: Sequence[float], max_months: int = MAX_REPAYMENT_MONTHS,
+                       record_history: bool = False) -> AmortizationResult:
+    """
+    Simulate several repayment orders at several allocation levels at once.
+
+    Args:
+        balances: Outstanding balance per debt
+        interest_rates: Annual interest rate per debt (0.12 for 12%)
+        minimum_payments: Minimum monthly payment per debt
+        orders: One permutation of debt indices per strategy, highest
+            priority first
+        allocations: Monthly amounts allocated to debt repayment
+        max_months: Simulation horizon
+        record_history: Keep per-month totals for timelines
+
+    Returns:
+        AmortizationResult: Interest, payoff months and optional history
+    """
+    order = np.asarray(orders, dtype=int).reshape(len(orders), -1)
+    allocation = np.asarray(allocations, dtype=float)
+    strategy_count, debt_count = order.shape
+    shape = (strategy_count, allocation.size, debt_count)
+
+    # Work in repayment order so the focus debt is the first active column
+    balance = np.broadcast_to(np.asarray(balances, dtype=float)[order][:, None, :], shape).copy()
+    monthly_rate = (np.asarray(interest_rates, dtype=float) / 12)[order][:, None, :]
+    minimum = np.asarray(minimum_payments, dtype=float)[order][:, None, :]
+    budget = allocation[None, :]
+
+    active = np.ones(shape, dtype=bool)
+    total_interest = np.zeros(shape[:2])
+    payoff_month = np.zeros(shape, dtype=int)
+    months_to_freedom = np.zeros(shape[:2], dtype=int)
+    history = {'remaining_balance': [], 'interest_paid': [], 'debts_remaining': []}
+
+    month = 0
+    running = active.any(axis=-1)
+    while running.any() and month < max_months:
+        month += 1
+        months_to_freedom[running] = month
+
+        interest = np.where(active, balance * monthly_rate, 0.0)
+        payment = np.where(active, np.minimum(minimum, balance + interest), 0.0)
+        balance -= payment - interest
+        total_interest += interest.sum(axis=-1)
+
+        # Remaining allocation goes to the highest priority active debt
+        remaining = budget - payment.sum(axis=-1)
+        focus = active.argmax(axis=-1)[..., None]
+        focus_balance = np.take_along_axis(balance, focus, axis=-1)[..., 0]
+        extra = np.where(running & (remaining > 0), np.minimum(remaining, focus_balance), 0.0)
+        np.put_along_axis(balance, focus, (focus_balance - extra)[..., None], axis=-1)
+
+        paid_off = active & (balance <= PAID_OFF_THRESHOLD)
+        payoff_month[paid_off] = month
+        active &= ~paid_off
+        running = active.any(axis=-1)
+
+        if record_history:
+            history['remaining_balance'].append(np.where(active, balance, 0.0).sum(axis=-1))
+            history['interest_paid'].append(total_interest.copy())
+            history['debts_remaining'].append(active.sum(axis=-1))
+
+    # Map payoff months back to the original debt order
+    unsorted_payoff = np.zeros_like(payoff_month)
+    np.put_along_axis(unsorted_payoff, np.broadcast_to(order[:, None, :], shape), payoff_month, axis=-1)
+
+    first_payoff = np.where(unsorted_payoff > 0, unsorted_payoff, max_months).min(axis=-1, initial=max_months)
+
+    if record_history:
+        history = {key: np.array(values).reshape((month,) + shape[:2]) for key, values in history.items()}
+    else:
+        history = None
+
+    return AmortizationResult(total_interest, months_to_freedom, unsorted_payoff, first_payoff, history)
+
@@ -5,6 +5,7 @@ from datetime import datetime
 from typing import Dict, Any, List, Optional, Tuple, Union
 
 from .base_strategy import FundingStrategyGenerator
+from .debt_amortization import MAX_REPAYMENT_MONTHS, simulate_repayment
 from .rebalancing_strategy import RebalancingStrategy
 
 logger = logging.getLogger(__name__)
@@ -354,29 +355,8 @@ class DebtRepaymentStrategy(FundingStrategyGenerator):
             
         else:  # hybrid
             # Create a score based on both interest rate and balance
-            for debt in debts:
-                # Normalize interest rate (0-1 scale where 1 is highest)
-                max_interest = max(d.get('interest_rate', 0) for d in debts)
-                min_interest = min(d.get('interest_rate', 0) for d in debts)
-                interest_range = max_interest - min_interest
-                
-                if interest_range > 0:
-                    interest_score = (debt.get('interest_rate', 0) - min_interest) / interest_range
-                else:
-                    interest_score = 0.5  # All same interest rate
-                    
-                # Normalize balance inversely (0-1 scale where 1 is lowest)
-                max_balance = max(d.get('balance', 0) for d in debts)
-                min_balance = min(d.get('balance', 0) for d in debts)
-                balance_range = max_balance - min_balance
-                
-                if balance_range > 0:
-                    balance_score = 1 - ((debt.get('balance', 0) - min_balance) / balance_range)
-                else:
-                    balance_score = 0.5  # All same balance
-                    
-                # Calculate hybrid score (60% weight to interest, 40% to balance)
-                debt['hybrid_score'] = (interest_score * 0.6) + (balance_score * 0.4)
+            for debt, score in zip(debts, self._hybrid_scores(debts)):
+                debt['hybrid_score'] = score
                 
             # Sort by hybrid score (highest first)
             sorted_debts = sorted(debts, key=lambda x: x.get('hybrid_score', 0), reverse=True)
@@ -440,87 +420,46 @@ class DebtRepaymentStrategy(FundingStrategyGenerator):
         Returns:
             Dictionary with payoff timeline details
         """
-        # Create a copy of debts to avoid modifying the original
-        working_debts = [debt.copy() for debt in debts]
+        # Debts are already in payoff priority, so simulate them in list order
+        balances, interest_rates, minimum_payments = self._repayment_inputs(debts, estimate_minimums=False)
+        result = simulate_repayment(
+            balances, interest_rates, minimum_payments, [list(range(len(debts)))], [monthly_allocation],
+            record_history=True
+        )
+        months_to_freedom = int(result.months_to_freedom[0, 0])
+        remaining_balance = result.history['remaining_balance'][:, 0, 0]
+        interest_paid = result.history['interest_paid'][:, 0, 0]
+        debts_remaining = result.history['debts_remaining'][:, 0, 0]
         
-        # Initialize timeline
-        months_to_freedom = 0
-        total_interest_paid = 0
         milestone_months = []
-        
-        # Track monthly status until all debts are paid
         monthly_snapshots = []
-        
-        # Continue until all debts are paid off
-        while working_debts and months_to_freedom < 360:  # Cap at 30 years
-            months_to_freedom += 1
-            month_allocation = monthly_allocation
-            month_interest = 0
-            month_principal = 0
-            
-            # Make minimum payments on all debts
-            for debt in working_debts:
-                # Calculate interest for this month
-                monthly_interest = debt['balance'] * (debt['interest_rate'] / 12)
-                month_interest += monthly_interest
-                
-                # Apply minimum payment or full balance if smaller
-                payment = min(debt['minimum_payment'], debt['balance'] + monthly_interest)
-                
-                # Adjust balances
-                principal_payment = payment - monthly_interest
-                month_principal += principal_payment
-                debt['balance'] -= principal_payment
-                
-                # Update total interest paid
-                total_interest_paid += monthly_interest
-                
-                # Update allocation remaining
-                month_allocation -= payment
-                
-            # Apply any extra payment to highest priority debt (first in list)
-            if working_debts and month_allocation > 0:
-                # Calculate interest already applied above
-                highest_debt = working_debts[0]
-                
-                # Apply remaining allocation to principal
-                principal_payment = min(month_allocation, highest_debt['balance'])
-                highest_debt['balance'] -= principal_payment
-                month_principal += principal_payment
-                
-            # Remove any fully paid debts
-            working_debts = [debt for debt in working_debts if debt['balance'] > 1]  # Allow for tiny rounding errors
+        for month in range(1, months_to_freedom + 1):
+            remaining_debts = int(debts_remaining[month - 1])
             
             # Track milestone when a debt is paid off
-            if len(working_debts) < len(debts) - len(milestone_months):
+            if remaining_debts < len(debts) - len(milestone_months):
                 milestone_months.append({
-                    'month': months_to_freedom,
+                    'month': month,
                     'debt_paid': debts[len(milestone_months)].get('name', f"Debt {len(milestone_months) + 1}"),
-                    'remaining_debts': len(working_debts),
-                    'total_interest_so_far': round(total_interest_paid)
+                    'remaining_debts': remaining_debts,
+                    'total_interest_so_far': round(interest_paid[month - 1])
                 })
                 
             # Create snapshot every 3 months for the first year, then every 6 months
-            if months_to_freedom <= 12 and months_to_freedom % 3 == 0:
+            if (month <= 12 and month % 3 == 0) or (month > 12 and month % 6 == 0):
                 monthly_snapshots.append({
-                    'month': months_to_freedom,
-                    'remaining_balance': round(sum(debt['balance'] for debt in working_debts)),
-                    'interest_paid_so_far': round(total_interest_paid),
-                    'debts_remaining': len(working_debts)
-                })
-            elif months_to_freedom > 12 and months_to_freedom % 6 == 0:
-                monthly_snapshots.append({
-                    'month': months_to_freedom,
-                    'remaining_balance': round(sum(debt['balance'] for debt in working_debts)),
-                    'interest_paid_so_far': round(total_interest_paid),
-                    'debts_remaining': len(working_debts)
+                    'month': month,
+                    'remaining_balance': round(remaining_balance[month - 1]),
+                    'interest_paid_so_far': round(interest_paid[month - 1]),
+                    'debts_remaining': remaining_debts
                 })
                 
         return {
             'months_to_debt_freedom': months_to_freedom,
             'years_to_debt_freedom': round(months_to_freedom / 12, 1),
-            'total_interest_paid': round(total_interest_paid),
+            'total_interest_paid': round(result.total_interest[0, 0]),
             'debt_payoff_milestones': milestone_months,
+            'debt_payoff_months': [int(month) or None for month in result.payoff_month[0, 0]],
             'progress_snapshots': monthly_snapshots
         }
     
@@ -1026,117 +965,145 @@ class DebtRepaymentStrategy(FundingStrategyGenerator):
         
         return emi
     
-    def _estimate_total_interest(self, debts, monthly_allocation, method="avalanche"):
+    def _hybrid_scores(self, debts):
         """
-        Estimate the total interest paid over the repayment period
-        for different repayment strategies.
+        Score debts for the hybrid method, 60% on interest rate and 40% on
+        inverse balance, each normalized to a 0-1 scale.
         
         Args:
             debts: List of debt dictionaries with details
-            monthly_allocation: Monthly amount allocated for debt repayment
-            method: Repayment strategy method (avalanche, snowball, or hybrid)
             
         Returns:
-            Total interest paid over the repayment period
+            List of scores in the order of debts (higher pays off first)
         """
-        # Create a copy of debts to avoid modifying the original
-        if not debts or monthly_allocation <= 0:
-            return 0
+        if not debts:
+            return []
             
-        working_debts = [debt.copy() for debt in debts]
+        interest_rates = [debt.get('interest_rate', 0) for debt in debts]
+        balances = [debt.get('balance', 0) for debt in debts]
+        min_interest, interest_range = min(interest_rates), max(interest_rates) - min(interest_rates)
+        min_balance, balance_range = min(balances), max(balances) - min(balances)
+        
+        scores = []
+        for interest_rate, balance in zip(interest_rates, balances):
+            # All same interest rate or balance scores 0.5
+            interest_score = (interest_rate - min_interest) / interest_range if interest_range > 0 else 0.5
+            balance_score = 1 - ((balance - min_balance) / balance_range) if balance_range > 0 else 0.5
+            scores.append((interest_score * 0.6) + (balance_score * 0.4))
+        return scores
+    
+    def _repayment_order(self, debts, method="avalanche"):
+        """
+        Order in which a repayment method pays off debts.
         
-        # Sort debts based on selected method
+        Args:
+            debts: List of debt dictionaries with details
+            method: Repayment strategy method (avalanche, snowball, or hybrid)
+            
+        Returns:
+            List of indices into debts, highest priority first
+        """
+        indices = range(len(debts))
         if method.lower() == "avalanche":
             # Sort by interest rate (highest first)
-            sorted_debts = sorted(working_debts, key=lambda x: x.get('interest_rate', 0), reverse=True)
+            return sorted(indices, key=lambda i: debts[i].get('interest_rate', 0), reverse=True)
         elif method.lower() == "snowball":
             # Sort by balance (lowest first)
-            sorted_debts = sorted(working_debts, key=lambda x: x.get('balance', 0))
+            return sorted(indices, key=lambda i: debts[i].get('balance', 0))
         else:  # hybrid
-            # Create a score based on both interest rate and balance
-            for debt in working_debts:
-                # Normalize interest rate (0-1 scale where 1 is highest)
-                max_interest = max(d.get('interest_rate', 0) for d in working_debts)
-                min_interest = min(d.get('interest_rate', 0) for d in working_debts)
-                interest_range = max_interest - min_interest
-                
-                if interest_range > 0:
-                    interest_score = (debt.get('interest_rate', 0) - min_interest) / interest_range
-                else:
-                    interest_score = 0.5  # All same interest rate
-                    
-                # Normalize balance inversely (0-1 scale where 1 is lowest)
-                max_balance = max(d.get('balance', 0) for d in working_debts)
-                min_balance = min(d.get('balance', 0) for d in working_debts)
-                balance_range = max_balance - min_balance
-                
-                if balance_range > 0:
-                    balance_score = 1 - ((debt.get('balance', 0) - min_balance) / balance_range)
-                else:
-                    balance_score = 0.5  # All same balance
-                    
-                # Calculate hybrid score (60% weight to interest, 40% to balance)
-                debt['hybrid_score'] = (interest_score * 0.6) + (balance_score * 0.4)
-                
-            # Sort by hybrid score (highest first)
-            sorted_debts = sorted(working_debts, key=lambda x: x.get('hybrid_score', 0), reverse=True)
+            scores = self._hybrid_scores(debts)
+            return sorted(indices, key=lambda i: scores[i], reverse=True)
+    
+    def _repayment_inputs(self, debts, estimate_minimums=True):
+        """
+        Balance, interest rate and minimum payment arrays for the amortization kernel.
         
-        # Calculate total minimum payment
-        total_minimum_payment = 0
-        for debt in sorted_debts:
-            # Use provided minimum payment or estimate it
-            if 'minimum_payment' in debt and debt['minimum_payment'] > 0:
-                total_minimum_payment += debt['minimum_payment']
-            else:
-                # Estimate minimum payment
+        Args:
+            debts: List of debt dictionaries with details
+            estimate_minimums: Estimate missing minimum payments from the debt type
+            
+        Returns:
+            Tuple of (balances, interest_rates, minimum_payments) lists
+        """
+        balances = [debt.get('balance', 0) for debt in debts]
+        interest_rates = [debt.get('interest_rate', 0) for debt in debts]
+        minimum_payments = []
+        for debt, balance in zip(debts, balances):
+            minimum_payment = debt.get('minimum_payment', 0)
+            if estimate_minimums and minimum_payment <= 0:
                 debt_type = debt.get('type', 'other').lower()
-                balance = debt.get('balance', 0)
-                min_payment_rate = self.debt_params['debt_types'].get(debt_type, {}).get('minimum_payment', 0.02)
-                min_payment = balance * min_payment_rate
-                debt['minimum_payment'] = min_payment
-                total_minimum_payment += min_payment
-        
-        # Calculate extra payment amount
-        extra_payment = max(0, monthly_allocation - total_minimum_payment)
-        
-        # Initialize counters
-        total_interest_paid = 0
-        months = 0
-        max_months = 360  # Cap at 30 years
+                minimum_payment = balance * self.debt_params['debt_types'].get(debt_type, {}).get('minimum_payment', 0.02)
+            minimum_payments.append(minimum_payment)
+        return balances, interest_rates, minimum_payments
+    
+    def _simulate_repayment_methods(self, debts, allocations, methods=("avalanche", "snowball", "hybrid")):
+        """
+        Simulate several repayment methods at several allocation levels in one pass.
         
-        # Continue until all debts are paid off or max months reached
-        while sorted_debts and months < max_months:
-            months += 1
-            month_allocation = monthly_allocation
+        Args:
+            debts: List of debt dictionaries with details
+            allocations: Monthly amounts allocated for debt repayment
+            methods: Repayment strategy methods to simulate
             
-            # Make minimum payments on all debts
-            for debt in sorted_debts:
-                # Calculate interest for this month
-                monthly_interest = debt['balance'] * (debt['interest_rate'] / 12)
-                total_interest_paid += monthly_interest
-                
-                # Apply minimum payment or full balance if smaller
-                payment = min(debt['minimum_payment'], debt['balance'] + monthly_interest)
-                
-                # Adjust balances
-                principal_payment = payment - monthly_interest
-                debt['balance'] -= principal_payment
-                
-                # Update allocation remaining
-                month_allocation -= payment
+        Returns:
+            Tuple of (AmortizationResult, total minimum payment)
+        """
+        balances, interest_rates, minimum_payments = self._repayment_inputs(debts)
+        orders = [self._repayment_order(debts, method) for method in methods]
+        result = simulate_repayment(balances, interest_rates, minimum_payments, orders, allocations)
+        return result, sum(minimum_payments)
+    
+    def calculate_interest_allocation_curve(self, debts, allocations, methods=("avalanche", "snowball", "hybrid")):
+        """
+        Calculate total interest and payoff times across a range of monthly
+        allocations for each repayment method.
+        
+        Args:
+            debts: List of debt dictionaries with details
+            allocations: Monthly allocation levels to evaluate
+            methods: Repayment strategy methods to compare
             
-            # Apply any extra payment to highest priority debt (first in list)
-            if sorted_debts and month_allocation > 0:
-                highest_debt = sorted_debts[0]
-                
-                # Apply remaining allocation to principal
-                principal_payment = min(month_allocation, highest_debt['balance'])
-                highest_debt['balance'] -= principal_payment
+        Returns:
+            Dictionary mapping each method to a list of points, one per allocation
+        """
+        allocations = list(allocations)
+        if not debts or not allocations:
+            return {method: [] for method in methods}
             
-            # Remove any fully paid debts
-            sorted_debts = [debt for debt in sorted_debts if debt['balance'] > 1]  # Allow for tiny rounding errors
+        result, total_minimum_payment = self._simulate_repayment_methods(debts, allocations, methods)
         
-        return total_interest_paid
+        curves = {}
+        for s, method in enumerate(methods):
+            curves[method] = [
+                {
+                    'monthly_allocation': round(allocation),
+                    'sufficient_allocation': allocation >= total_minimum_payment,
+                    'total_interest': round(result.total_interest[s, a]),
+                    'months_to_debt_freedom': int(result.months_to_freedom[s, a]),
+                    'first_payoff_month': int(result.first_payoff_month[s, a])
+                }
+                for a, allocation in enumerate(allocations)
+            ]
+        return curves
+    
+    def _estimate_total_interest(self, debts, monthly_allocation, method="avalanche"):
+        """
+        Estimate the total interest paid over the repayment period
+        for different repayment strategies.
+        
+        Args:
+            debts: List of debt dictionaries with details
+            monthly_allocation: Monthly amount allocated for debt repayment
+            method: Repayment strategy method (avalanche, snowball, or hybrid)
+            
+        Returns:
+            Total interest paid over the repayment period
+        """
+        if not debts or monthly_allocation <= 0:
+            return 0
+            
+        result, _ = self._simulate_repayment_methods(debts, [monthly_allocation], [method])
+        return float(result.total_interest[0, 0])
     
     def _estimate_first_payoff_time(self, debts, monthly_allocation, method="avalanche"):
         """
@@ -1151,107 +1118,16 @@ class DebtRepaymentStrategy(FundingStrategyGenerator):
         Returns:
             Number of months until first debt payoff
         """
-        # Create a copy of debts to avoid modifying the original
         if not debts or monthly_allocation <= 0:
             return float('inf')
             
-        working_debts = [debt.copy() for debt in debts]
-        
-        # Sort debts based on selected method
-        if method.lower() == "avalanche":
-            # Sort by interest rate (highest first)
-            sorted_debts = sorted(working_debts, key=lambda x: x.get('interest_rate', 0), reverse=True)
-        elif method.lower() == "snowball":
-            # Sort by balance (lowest first)
-            sorted_debts = sorted(working_debts, key=lambda x: x.get('balance', 0))
-        else:  # hybrid
-            # Create a score based on both interest rate and balance
-            for debt in working_debts:
-                # Normalize interest rate (0-1 scale where 1 is highest)
-                max_interest = max(d.get('interest_rate', 0) for d in working_debts)
-                min_interest = min(d.get('interest_rate', 0) for d in working_debts)
-                interest_range = max_interest - min_interest
-                
-                if interest_range > 0:
-                    interest_score = (debt.get('interest_rate', 0) - min_interest) / interest_range
-                else:
-                    interest_score = 0.5  # All same interest rate
-                    
-                # Normalize balance inversely (0-1 scale where 1 is lowest)
-                max_balance = max(d.get('balance', 0) for d in working_debts)
-                min_balance = min(d.get('balance', 0) for d in working_debts)
-                balance_range = max_balance - min_balance
-                
-                if balance_range > 0:
-                    balance_score = 1 - ((debt.get('balance', 0) - min_balance) / balance_range)
-                else:
-                    balance_score = 0.5  # All same balance
-                    
-                # Calculate hybrid score (60% weight to interest, 40% to balance)
-                debt['hybrid_score'] = (interest_score * 0.6) + (balance_score * 0.4)
-                
-            # Sort by hybrid score (highest first)
-            sorted_debts = sorted(working_debts, key=lambda x: x.get('hybrid_score', 0), reverse=True)
-        
-        # Calculate total minimum payment
-        total_minimum_payment = 0
-        for debt in sorted_debts:
-            # Use provided minimum payment or estimate it
-            if 'minimum_payment' in debt and debt['minimum_payment'] > 0:
-                total_minimum_payment += debt['minimum_payment']
-            else:
-                # Estimate minimum payment
-                debt_type = debt.get('type', 'other').lower()
-                balance = debt.get('balance', 0)
-                min_payment_rate = self.debt_params['debt_types'].get(debt_type, {}).get('minimum_payment', 0.02)
-                min_payment = balance * min_payment_rate
-                debt['minimum_payment'] = min_payment
-                total_minimum_payment += min_payment
+        result, total_minimum_payment = self._simulate_repayment_methods(debts, [monthly_allocation], [method])
         
         # Check if allocation is sufficient
         if monthly_allocation < total_minimum_payment:
             return float('inf')  # Cannot pay off any debt with insufficient allocation
-        
-        # Calculate extra payment amount
-        extra_payment = max(0, monthly_allocation - total_minimum_payment)
-        
-        # Initialize counters
-        months = 0
-        max_months = 360  # Cap at 30 years
-        initial_debt_count = len(sorted_debts)
-        
-        # Continue until a debt is paid off or max months reached
-        while len(sorted_debts) == initial_debt_count and months < max_months:
-            months += 1
-            month_allocation = monthly_allocation
             
-            # Make minimum payments on all debts
-            for debt in sorted_debts:
-                # Calculate interest for this month
-                monthly_interest = debt['balance'] * (debt['interest_rate'] / 12)
-                
-                # Apply minimum payment or full balance if smaller
-                payment = min(debt['minimum_payment'], debt['balance'] + monthly_interest)
-                
-                # Adjust balances
-                principal_payment = payment - monthly_interest
-                debt['balance'] -= principal_payment
-                
-                # Update allocation remaining
-                month_allocation -= payment
-            
-            # Apply any extra payment to highest priority debt (first in list)
-            if sorted_debts and month_allocation > 0:
-                highest_debt = sorted_debts[0]
-                
-                # Apply remaining allocation to principal
-                principal_payment = min(month_allocation, highest_debt['balance'])
-                highest_debt['balance'] -= principal_payment
-            
-            # Remove any fully paid debts
-            sorted_debts = [debt for debt in sorted_debts if debt['balance'] > 1]  # Allow for tiny rounding errors
-        
-        return months
+        return int(result.first_payoff_month[0, 0])
 
     def validate_repayment_strategy_fit(self, goal_data):
         """
@@ -1315,21 +1191,23 @@ class DebtRepaymentStrategy(FundingStrategyGenerator):
             psych_rationale = "Balanced profile benefits from both mathematical efficiency and psychological rewards"
         
         # Calculate expected outcomes for each method
-        # This is a simplified calculation - real implementation would use more detailed amortization
-        
-        # Estimate avalanche method outcomes
-        avalanche_interest = self._estimate_total_interest(debts, monthly_allocation, "avalanche")
-        
-        # Estimate snowball method outcomes
-        snowball_interest = self._estimate_total_interest(debts, monthly_allocation, "snowball")
-        
-        # Estimate hybrid method outcomes (average of the two)
-        hybrid_interest = (avalanche_interest + snowball_interest) / 2
-        
-        # Calculate time to first debt payoff for each method
-        avalanche_first_payoff = self._estimate_first_payoff_time(debts, monthly_allocation, "avalanche")
-        snowball_first_payoff = self._estimate_first_payoff_time(debts, monthly_allocation, "snowball")
-        hybrid_first_payoff = self._estimate_first_payoff_time(debts, monthly_allocation, "hybrid")
+        # Simulate all three methods at this allocation in one pass
+        methods = ("avalanche", "snowball", "hybrid")
+        if debts and monthly_allocation > 0:
+            outcomes, total_minimum_payment = self._simulate_repayment_methods(debts, [monthly_allocation], methods)
+            total_interest = dict(zip(methods, outcomes.total_interest[:, 0].tolist()))
+            
+            # First payoff never happens when the allocation misses the minimums
+            if monthly_allocation < total_minimum_payment:
+                first_payoff = dict.fromkeys(methods, float('inf'))
+            else:
+                first_payoff = dict(zip(methods, outcomes.first_payoff_month[:, 0].tolist()))
+        else:
+            total_interest = dict.fromkeys(methods, 0)
+            first_payoff = dict.fromkeys(methods, float('inf'))
+            
+        avalanche_interest, snowball_interest, hybrid_interest = (total_interest[method] for method in methods)
+        avalanche_first_payoff, snowball_first_payoff, hybrid_first_payoff = (first_payoff[method] for method in methods)
         
         # Compare preferred method to optimal methods
         strategy_alignment = {
@@ -2186,31 +2064,17 @@ class DebtRepaymentStrategy(FundingStrategyGenerator):
         # Get payoff order from the strategy
         payoff_order = repayment_strategy.get('recommended_payoff_order', [])
         
+        payoff_timeline = repayment_strategy.get('payoff_timeline', {})
+        payoff_months = payoff_timeline.get('debt_payoff_months', [])
+        
         # Enhance payoff order with additional optimization insights
         enhanced_payoff_order = []
         for i, debt in enumerate(payoff_order):
-            # Calculate estimated payoff date
-            # This is a simplification - would use more detailed calculation in production
-            estimated_months = 0
-            if i == 0:
-                # For first debt, use recommended payment
-                balance = debt.get('balance', 0)
-                monthly_payment = debt.get('recommended_payment', 0)
-                interest_rate = debt.get('interest_rate', 0) / 100
-                
-                if monthly_payment > 0:
-                    # Simple approximation for payoff time
-                    # This is a rough estimate assuming constant payment
-                    estimated_months = -math.log(1 - (balance * interest_rate / 12) / monthly_payment) / math.log(1 + interest_rate / 12)
-                    estimated_months = max(1, round(estimated_months))
-            else:
-                # For subsequent debts, use milestone months from the payoff timeline
-                if i < len(debt_freedom_plan['repayment_strategy']['payoff_timeline'].get('debt_payoff_milestones', [])):
-                    milestone = debt_freedom_plan['repayment_strategy']['payoff_timeline']['debt_payoff_milestones'][i-1]
-                    estimated_months = milestone.get('month', 0)
-                else:
-                    # Fallback if milestone not available
-                    estimated_months = (i + 1) * 6  # Very rough estimate
+            # Payoff month from the amortization of the recommended order
+            estimated_months = payoff_months[i] if i < len(payoff_months) else None
+            if estimated_months is None:
+                # Not paid off within the simulation horizon
+                estimated_months = payoff_timeline.get('months_to_debt_freedom', MAX_REPAYMENT_MONTHS)
             
             # Calculate projected date
             current_date = datetime.now()
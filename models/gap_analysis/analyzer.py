@@ -17,6 +17,7 @@ from models.gap_analysis.core import (
     GapResult,
     get_financial_parameter_service
 )
+from models.profile_facts import get_profile_facts, parse_currency_amount
 
 logger = logging.getLogger(__name__)
 
@@ -524,15 +525,9 @@ class GapAnalysis:
             return 0.0
         
         # Look in answers
-        if "answers" in profile:
-            for answer in profile["answers"]:
-                if answer.get("question_id") == "monthly_income":
-                    income_value = answer.get("answer", 0)
-                    if isinstance(income_value, (int, float)):
-                        return float(income_value)
-                    elif isinstance(income_value, str):
-                        # Handle Indian currency format
-                        return self._parse_indian_currency(income_value)
+        monthly_income = get_profile_facts(profile).monthly_income
+        if monthly_income is not None:
+            return monthly_income
         
         # Default value
         return 50000  # Default assumption
@@ -560,15 +555,9 @@ class GapAnalysis:
             return 0.0
         
         # Look in answers
-        if "answers" in profile:
-            for answer in profile["answers"]:
-                if answer.get("question_id") == "monthly_expenses":
-                    expenses_value = answer.get("answer", 0)
-                    if isinstance(expenses_value, (int, float)):
-                        return float(expenses_value)
-                    elif isinstance(expenses_value, str):
-                        # Handle Indian currency format
-                        return self._parse_indian_currency(expenses_value)
+        monthly_expenses = get_profile_facts(profile).monthly_expenses
+        if monthly_expenses is not None:
+            return monthly_expenses
         
         # Default value - assume 60% of income if we know income
         income = self._extract_monthly_income(profile)
@@ -584,46 +573,12 @@ class GapAnalysis:
         Returns:
             float: The parsed value
         """
-        try:
-            # Handle empty strings or None
-            if not value_str:
-                return 0.0
-                
-            # Convert to string if it's not already
-            if not isinstance(value_str, str):
-                return float(value_str)
-                
-            # Remove rupee symbol
-            clean_str = value_str.replace('₹', '')
-            
-            # Handle lakh (L) and crore (Cr) notations - need to check before removing commas
-            if 'L' in clean_str.upper():
-                # Convert lakhs to regular number (1L = 100,000)
-                multiplier = 100000
-                # Remove spaces and commas
-                clean_str = clean_str.replace(' ', '').replace(',', '')
-                # Remove the L and convert
-                clean_str = clean_str.upper().replace('L', '')
-                return float(clean_str) * multiplier
-            elif any(x in clean_str.upper() for x in ['CR', 'CRORE']):
-                # Convert crores to regular number (1Cr = 10,000,000)
-                multiplier = 10000000
-                # Remove spaces and commas
-                clean_str = clean_str.replace(' ', '').replace(',', '')
-                # Remove CR or CRORE and convert
-                clean_str = clean_str.upper()
-                clean_str = clean_str.replace('CRORE', '').replace('CR', '')
-                return float(clean_str) * multiplier
-            
-            # For regular numbers, remove commas and spaces
-            clean_str = clean_str.replace(',', '').replace(' ', '')
-            
-            # Regular number
-            return float(clean_str)
-        except (ValueError, TypeError) as e:
-            # If parsing fails, log the error and return 0
-            logger.warning(f"Failed to parse currency value '{value_str}': {str(e)}")
+        amount = parse_currency_amount(value_str)
+        if amount is None:
+            if value_str:
+                logger.warning(f"Failed to parse currency value '{value_str}'")
             return 0.0
+        return amount
             
     def _extract_current_savings(self, profile: Dict[str, Any]) -> float:
         """Extract current savings rate from profile data"""
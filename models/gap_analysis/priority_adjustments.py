@@ -16,6 +16,7 @@ from models.gap_analysis.core import (
     RemediationOption,
     get_financial_parameter_service
 )
+from models.profile_facts import get_profile_facts
 from models.gap_analysis.remediation_strategies import GapRemediationStrategy
 
 logger = logging.getLogger(__name__)
@@ -557,10 +558,9 @@ class PriorityAdjustment(GapRemediationStrategy):
             return float(profile["income"])
         
         # Look in answers
-        if "answers" in profile:
-            for answer in profile["answers"]:
-                if answer.get("question_id") == "monthly_income":
-                    return float(answer.get("answer", 0))
+        monthly_income = get_profile_facts(profile).monthly_income
+        if monthly_income is not None:
+            return monthly_income
         
         # Default value
         return 50000  # Default assumption
@@ -572,10 +572,9 @@ class PriorityAdjustment(GapRemediationStrategy):
             return float(profile["expenses"])
         
         # Look in answers
-        if "answers" in profile:
-            for answer in profile["answers"]:
-                if answer.get("question_id") == "monthly_expenses":
-                    return float(answer.get("answer", 0))
+        monthly_expenses = get_profile_facts(profile).monthly_expenses
+        if monthly_expenses is not None:
+            return monthly_expenses
         
         # Default value - assume 60% of income if we know income
         income = self._extract_monthly_income(profile)
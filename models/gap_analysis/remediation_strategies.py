@@ -14,6 +14,7 @@ from models.gap_analysis.core import (
     RemediationOption,
     get_financial_parameter_service
 )
+from models.profile_facts import get_profile_facts
 
 logger = logging.getLogger(__name__)
 
@@ -365,10 +366,9 @@ class GapRemediationStrategy:
             return float(profile["income"])
         
         # Look in answers
-        if "answers" in profile:
-            for answer in profile["answers"]:
-                if answer.get("question_id") == "monthly_income":
-                    return float(answer.get("answer", 0))
+        monthly_income = get_profile_facts(profile).monthly_income
+        if monthly_income is not None:
+            return monthly_income
         
         # Default value
         return 50000  # Default assumption
@@ -564,10 +564,9 @@ class RemediationImpactAnalysis:
             return float(profile["income"])
         
         # Look in answers
-        if "answers" in profile:
-            for answer in profile["answers"]:
-                if answer.get("question_id") == "monthly_income":
-                    return float(answer.get("answer", 0))
+        monthly_income = get_profile_facts(profile).monthly_income
+        if monthly_income is not None:
+            return monthly_income
         
         # Default value
         return 50000  # Default assumption
\ No newline at end of file
@@ -10,7 +10,6 @@ import json
 import copy
 import math
 import numpy as np
-import pandas as pd
 from datetime import datetime, date
 from typing import Dict, List, Optional, Union, Any, Tuple, Set
 
@@ -21,6 +20,7 @@ from models.gap_analysis.core import (
     ScenarioResult,
     ScenarioComparison
 )
+from models.profile_facts import get_profile_facts
 from models.gap_analysis.analyzer import GapAnalysis
 from models.gap_analysis.scenarios import GoalScenarioComparison
 from models.gap_analysis.scenario_generators import ScenarioGenerator
@@ -1129,10 +1129,9 @@ class ScenarioImpactAnalyzer:
             return float(profile["income"])
         
         # Look in answers
-        if "answers" in profile:
-            for answer in profile["answers"]:
-                if answer.get("question_id") == "monthly_income":
-                    return float(answer.get("answer", 0))
+        monthly_income = get_profile_facts(profile).monthly_income
+        if monthly_income is not None:
+            return monthly_income
         
         # Default value
         return 50000  # Default assumption
@@ -1144,10 +1143,9 @@ class ScenarioImpactAnalyzer:
             return float(profile["expenses"])
         
         # Look in answers
-        if "answers" in profile:
-            for answer in profile["answers"]:
-                if answer.get("question_id") == "monthly_expenses":
-                    return float(answer.get("answer", 0))
+        monthly_expenses = get_profile_facts(profile).monthly_expenses
+        if monthly_expenses is not None:
+            return monthly_expenses
         
         # Default value - assume 60% of income if we know income
         income = self._extract_monthly_income(profile)
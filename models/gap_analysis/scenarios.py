@@ -19,6 +19,7 @@ from models.gap_analysis.core import (
     ScenarioComparison,
     get_financial_parameter_service
 )
+from models.profile_facts import get_profile_facts
 from models.gap_analysis.analyzer import GapAnalysis
 
 logger = logging.getLogger(__name__)
@@ -685,10 +686,9 @@ class GoalScenarioComparison:
             return float(profile["income"])
         
         # Look in answers
-        if "answers" in profile:
-            for answer in profile["answers"]:
-                if answer.get("question_id") == "monthly_income":
-                    return float(answer.get("answer", 0))
+        monthly_income = get_profile_facts(profile).monthly_income
+        if monthly_income is not None:
+            return monthly_income
         
         # Default value
         return 50000  # Default assumption
\ No newline at end of file
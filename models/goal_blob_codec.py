@@ -0,0 +1,241 @@
+"""
+Compact binary encoding for large goal simulation payloads.
+
+GoalService stores whole ProbabilityResult dictionaries, including
+distribution data and percentile paths, in goals.simulation_data, and
+Goal.set_simulation_paths stores path data in goals.simulation_path_data.
+As JSON text these columns run to megabytes, and every cached probability
+read parsed them again with json.loads.
+
+encode_payload() moves every numeric list (percentile bands, paths,
+histograms) out of the document into raw little-endian array buffers
+(integers as int64, floats as float64) and keeps only the remaining small
+structure as JSON. Simulated paths and percentile bands, found under
+PATH_KEYS or making up a whole simulation_path_data payload, are the bulk
+of the data and are stored as float32; every other float keeps full
+precision. The result is zlib-compressed behind a versioned header:
+
+    b"GBLB" | version (1 byte) | compression (1 byte) | body
+
+    body = json length (uint32 LE) | json | padded array buffers
+
+The JSON part is {"d": document, "a": [[dtype, shape, offset], ...]} with
+each extracted list replaced by {"__ndarray__": index}. decode_payload()
+reads arrays straight out of the decompressed buffer with np.frombuffer
+instead of parsing numbers from text.
+
+Columns written before this codec hold JSON text; decode_payload() accepts
+both, so rows can be converted lazily or with
+migrations/scripts/compress_goal_simulation_blobs.py.
+"""
+
+import json
+import logging
+import struct
+import zlib
+from typing import Any, List, Optional, Tuple
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+MAGIC = b"GBLB"
+VERSION = 1
+COMPRESSION_NONE = 0
+COMPRESSION_ZLIB = 1
+HEADER_SIZE = len(MAGIC) + 2
+
+# Numeric lists shorter than this stay in the JSON part
+MIN_ARRAY_LENGTH = 8
+# dtypes for floating point arrays: paths and bands are visualization data and
+# float32 suffices, anything else (amounts, rates) round-trips exactly
+FLOAT_DTYPE = np.dtype('<f8')
+PATH_FLOAT_DTYPE = np.dtype('<f4')
+INT_DTYPE = np.dtype('<i8')
+
+# Keys whose numeric lists (at any depth below them) are paths or bands
+PATH_KEYS = frozenset({
+    'paths', 'percentile_paths', 'simulation_paths', 'all_projections',
+    'projected_values', 'confidence_intervals', 'percentile_bands', 'bands',
+})
+ZLIB_LEVEL = 6
+
+_ARRAY_KEY = "__ndarray__"
+_NUMBER_TYPES = (int, float, np.integer, np.floating)
+_ALIGNMENT = 8
+
+
+def is_encoded(value: Any) -> bool:
+    """Whether a column value was written by encode_payload()."""
+    return isinstance(value, (bytes, bytearray, memoryview)) and bytes(value[:len(MAGIC)]) == MAGIC
+
+
+def _as_array(value: list, float_dtype: np.dtype = FLOAT_DTYPE) -> Optional[np.ndarray]:
+    """Convert a numeric list (or rectangular list of lists) to an array, or None."""
+    if not value:
+        return None
+    rows = value if isinstance(value[0], list) else [value]
+    if sum(len(row) for row in rows) < MIN_ARRAY_LENGTH:
+        return None
+    for row in rows:
+        # Booleans would silently become 0/1
+        if not isinstance(row, list) or not all(
+                isinstance(item, _NUMBER_TYPES) and not isinstance(item, (bool, np.bool_)) for item in row):
+            return None
+
+    try:
+        array = np.asarray(value)
+    except (ValueError, TypeError):
+        # Ragged or mixed lists stay JSON
+        return None
+    if array.ndim > 2 or array.dtype.kind not in 'iuf':
+        return None
+    if array.dtype.kind == 'f':
+        if not np.all(np.isfinite(array)):
+            # NaN/inf are kept in the JSON part to round-trip exactly
+            return None
+        return array.astype(float_dtype, copy=False)
+    return array.astype(INT_DTYPE, copy=False)
+
+
+def _extract_arrays(value: Any, arrays: List[np.ndarray], float_dtype: np.dtype = FLOAT_DTYPE) -> Any:
+    """Replace numeric lists in a JSON-compatible value with array references."""
+    if isinstance(value, dict):
+        return {key: _extract_arrays(item, arrays, PATH_FLOAT_DTYPE if key in PATH_KEYS else float_dtype)
+                for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        value = list(value)
+        array = _as_array(value, float_dtype)
+        if array is not None:
+            arrays.append(array)
+            return {_ARRAY_KEY: len(arrays) - 1}
+        return [_extract_arrays(item, arrays, float_dtype) for item in value]
+    if isinstance(value, np.ndarray):
+        return _extract_arrays(value.tolist(), arrays, float_dtype)
+    if isinstance(value, np.generic):
+        return value.item()
+    return value
+
+
+def encode_payload(data: Any, compress: bool = True, paths: bool = False) -> Optional[bytes]:
+    """
+    Encode a JSON-compatible payload in the compact binary format.
+
+    Args:
+        data: Dictionary (or other JSON-compatible value) to encode
+        compress: Compress the body with zlib
+        paths: The whole payload is path data (simulation_path_data), so
+            every float list is stored as float32, not only those under
+            PATH_KEYS
+
+    Returns:
+        Encoded bytes, or None for empty payloads
+    """
+    if data is None or data == {} or data == []:
+        return None
+
+    arrays: List[np.ndarray] = []
+    document = _extract_arrays(data, arrays, PATH_FLOAT_DTYPE if paths else FLOAT_DTYPE)
+
+    layout = []
+    offset = 0
+    for array in arrays:
+        layout.append([array.dtype.str, list(array.shape), offset])
+        offset += array.nbytes
+        offset += -offset % _ALIGNMENT
+
+    meta = json.dumps({"d": document, "a": layout}, separators=(',', ':'), default=str).encode('utf-8')
+    parts = [struct.pack('<I', len(meta)), meta]
+    padding = -(4 + len(meta)) % _ALIGNMENT
+    parts.append(b'\0' * padding)
+    for array in arrays:
+        buffer = array.tobytes()
+        parts.append(buffer)
+        parts.append(b'\0' * (-len(buffer) % _ALIGNMENT))
+    body = b''.join(parts)
+
+    if compress:
+        return MAGIC + bytes([VERSION, COMPRESSION_ZLIB]) + zlib.compress(body, ZLIB_LEVEL)
+    return MAGIC + bytes([VERSION, COMPRESSION_NONE]) + body
+
+
+def _restore_arrays(value: Any, arrays: List[np.ndarray], as_arrays: bool) -> Any:
+    """Replace array references with the decoded arrays (or lists)."""
+    if isinstance(value, dict):
+        if len(value) == 1 and _ARRAY_KEY in value:
+            array = arrays[value[_ARRAY_KEY]]
+            return array if as_arrays else array.tolist()
+        return {key: _restore_arrays(item, arrays, as_arrays) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_restore_arrays(item, arrays, as_arrays) for item in value]
+    return value
+
+
+def _decode_body(value: bytes) -> Tuple[Any, List[np.ndarray]]:
+    """Split an encoded value into its JSON document and array views."""
+    version, compression = value[len(MAGIC)], value[len(MAGIC) + 1]
+    if version != VERSION:
+        raise ValueError(f"Unsupported goal blob version {version}")
+
+    body = memoryview(value)[HEADER_SIZE:]
+    if compression == COMPRESSION_ZLIB:
+        body = zlib.decompress(body)
+    elif compression != COMPRESSION_NONE:
+        raise ValueError(f"Unknown goal blob compression {compression}")
+
+    meta_length = struct.unpack_from('<I', body)[0]
+    meta = json.loads(bytes(body[4:4 + meta_length]))
+    start = 4 + meta_length
+    start += -start % _ALIGNMENT
+
+    arrays = []
+    for dtype, shape, offset in meta["a"]:
+        dtype = np.dtype(dtype)
+        count = int(np.prod(shape)) if shape else 1
+        array = np.frombuffer(body, dtype=dtype, count=count, offset=start + offset)
+        arrays.append(array.reshape(shape))
+    return meta["d"], arrays
+
+
+def decode_payload(value: Any, as_arrays: bool = False, default: Any = None) -> Any:
+    """
+    Decode a goal blob column value.
+
+    Accepts values written by encode_payload(), legacy JSON text (str or
+    bytes) and already decoded dictionaries.
+
+    Args:
+        value: Column value
+        as_arrays: Return extracted numeric lists as read-only numpy arrays
+            viewing the decoded buffer instead of Python lists
+        default: Returned for empty or undecodable values
+
+    Returns:
+        Decoded payload
+    """
+    if value is None or value == '' or value == b'':
+        return default
+    if isinstance(value, (dict, list)):
+        return value
+
+    try:
+        if is_encoded(value):
+            document, arrays = _decode_body(bytes(value))
+            return _restore_arrays(document, arrays, as_arrays)
+        return json.loads(value)
+    except (ValueError, TypeError, KeyError, struct.error, zlib.error) as e:
+        logger.warning(f"Could not decode goal payload: {str(e)}")
+        return default
+
+
+def as_json_text(value: Any) -> Any:
+    """
+    Return a column value as JSON text, for API and template output.
+
+    Encoded values are decoded and serialized; anything else is returned
+    unchanged.
+    """
+    if is_encoded(value):
+        decoded = decode_payload(value)
+        return json.dumps(decoded) if decoded is not None else None
+    return value
@@ -8,6 +8,8 @@ from datetime import datetime, timedelta
 from typing import Dict, Any, List, Optional, Tuple, Union, Callable
 from enum import Enum
 
+from models.profile_facts import ProfileFacts, get_profile_facts, normalize_risk_profile
+
 logger = logging.getLogger(__name__)
 
 def get_financial_parameter_service():
@@ -24,6 +26,68 @@ def get_financial_parameter_service():
         return None
 
 
+def _most_relevant_income_question(facts: ProfileFacts) -> Optional[str]:
+    """
+    Question ID that most likely holds the user's income.
+    
+    Args:
+        facts: Indexed profile answers
+        
+    Returns:
+        Question ID, or None if no question looks income-related
+    """
+    best_question = None
+    best_score = 0
+    for question_id, _ in facts.items():
+        lower_id = question_id.lower()
+        
+        # Score based on relevance
+        score = 0
+        if 'income' in lower_id:
+            score += 5
+        if 'monthly' in lower_id:
+            score += 3
+        if 'salary' in lower_id:
+            score += 2
+        if 'annual' in lower_id:
+            score += 1
+        
+        if score > best_score:
+            best_score = score
+            best_question = question_id
+    return best_question
+
+
+def _largest_monthly_expense(facts: ProfileFacts) -> float:
+    """
+    Largest monthly amount among expense and spending answers.
+    
+    Args:
+        facts: Indexed profile answers
+        
+    Returns:
+        float: Monthly expenses, or 0.0 if none were found
+    """
+    monthly_expenses = 0.0
+    for question_id, value in facts.find('expense', 'spending'):
+        expense_value = facts.amount(question_id)
+        if expense_value is None:
+            continue
+        
+        # Check if annual or monthly
+        lower_id = question_id.lower()
+        if isinstance(value, dict) and 'frequency' in value:
+            is_annual = value['frequency'].lower() in ['annual', 'yearly', 'per year']
+        else:
+            is_annual = 'annual' in lower_id or 'yearly' in lower_id
+        
+        # Convert to monthly if annual
+        if is_annual:
+            expense_value /= 12
+        monthly_expenses = max(monthly_expenses, expense_value)
+    return monthly_expenses
+
+
 class GoalCalculator:
     """
     Base class for goal calculations that provides core calculation methods
@@ -293,15 +357,14 @@ class GoalCalculator:
                         logger.error(f"Error parsing date of birth: {str(e)}")
             
             # Try to find age in answers
-            if 'answers' in profile:
-                answers = profile['answers']
-                for answer in answers:
-                    if 'question_id' in answer and 'age' in answer['question_id'].lower():
-                        value = answer.get('answer')
-                        if isinstance(value, (int, float)):
-                            return int(value)
-                        elif isinstance(value, str) and value.isdigit():
-                            return int(value)
+            facts = get_profile_facts(profile)
+            if facts.age is not None:
+                return facts.age
+            for question_id, value in facts.find('age'):
+                if isinstance(value, (int, float)):
+                    return int(value)
+                elif isinstance(value, str) and value.isdigit():
+                    return int(value)
                         
         except Exception as e:
             logger.error(f"Error extracting age from profile: {str(e)}")
@@ -349,55 +412,28 @@ class GoalCalculator:
                 return income
             
             # Try to find income in answers
-            if 'answers' in profile:
-                answers = profile['answers']
-                
-                # Find the most relevant income question
-                best_answer = None
-                best_score = 0
+            facts = get_profile_facts(profile)
+            if facts.monthly_income is not None:
+                return facts.monthly_income
+            
+            # Fall back to the most relevant income-like question
+            best_question = facts.derive('calculator_income_question', _most_relevant_income_question)
+            if best_question:
+                value = facts.get(best_question)
+                income_value = facts.amount(best_question)
+                if income_value is None:
+                    return default_income
                 
-                for answer in answers:
-                    if 'question_id' in answer:
-                        question_id = answer['question_id'].lower()
-                        score = 0
-                        
-                        # Score based on relevance
-                        if 'income' in question_id:
-                            score += 5
-                        if 'monthly' in question_id:
-                            score += 3
-                        if 'salary' in question_id:
-                            score += 2
-                        if 'annual' in question_id:
-                            score += 1
-                        
-                        if score > best_score:
-                            best_score = score
-                            best_answer = answer
+                # Check if annual or monthly
+                question_id = best_question.lower()
+                is_annual = 'annual' in question_id or 'yearly' in question_id
+                if isinstance(value, dict) and 'frequency' in value:
+                    is_annual = value['frequency'].lower() in ['annual', 'yearly']
                 
-                if best_answer:
-                    value = best_answer.get('answer')
-                    question_id = best_answer.get('question_id', '').lower()
-                    
-                    # Handle different formats
-                    if isinstance(value, (int, float)):
-                        income_value = float(value)
-                    elif isinstance(value, str) and value.replace('.', '', 1).isdigit():
-                        income_value = float(value)
-                    elif isinstance(value, dict) and 'amount' in value:
-                        income_value = float(value['amount'])
-                    else:
-                        return default_income
-                    
-                    # Check if annual or monthly
-                    is_annual = 'annual' in question_id or 'yearly' in question_id
-                    if isinstance(value, dict) and 'frequency' in value:
-                        is_annual = value['frequency'].lower() in ['annual', 'yearly']
-                    
-                    # Convert to monthly if annual
-                    if is_annual:
-                        return income_value / 12
-                    return income_value
+                # Convert to monthly if annual
+                if is_annual:
+                    return income_value / 12
+                return income_value
                     
         except Exception as e:
             logger.error(f"Error extracting income from profile: {str(e)}")
@@ -426,29 +462,13 @@ class GoalCalculator:
                     return risk
             
             # Try to find risk score in answers
-            if 'answers' in profile:
-                answers = profile['answers']
-                for answer in answers:
-                    if 'question_id' in answer and 'risk' in answer['question_id'].lower():
-                        value = answer.get('answer')
-                        
-                        # Handle different formats
-                        if isinstance(value, str):
-                            value_lower = value.lower()
-                            if 'conservative' in value_lower or 'low' in value_lower:
-                                return 'conservative'
-                            elif 'aggressive' in value_lower or 'high' in value_lower:
-                                return 'aggressive'
-                            elif 'moderate' in value_lower or 'medium' in value_lower:
-                                return 'moderate'
-                        elif isinstance(value, (int, float)):
-                            # Assume 1-10 scale
-                            if value <= 3:
-                                return 'conservative'
-                            elif value <= 7:
-                                return 'moderate'
-                            else:
-                                return 'aggressive'
+            facts = get_profile_facts(profile)
+            if facts.risk_profile is not None:
+                return facts.risk_profile
+            for question_id, value in facts.find('risk'):
+                risk = normalize_risk_profile(value)
+                if risk:
+                    return risk
                         
         except Exception as e:
             logger.error(f"Error extracting risk profile from profile: {str(e)}")
@@ -496,38 +516,8 @@ class GoalCalculator:
                 return expenses
             
             # Look for expense-related answers in profile
-            if 'answers' in profile:
-                answers = profile['answers']
-                
-                for answer in answers:
-                    if 'question_id' in answer and ('expense' in answer['question_id'].lower() or 'spending' in answer['question_id'].lower()):
-                        value = answer.get('answer', 0)
-                        
-                        # Handle different formats
-                        if isinstance(value, (int, float)):
-                            expense_value = float(value)
-                        elif isinstance(value, str) and value.replace('.', '', 1).isdigit():
-                            expense_value = float(value)
-                        elif isinstance(value, dict) and 'amount' in value:
-                            expense_value = float(value['amount'])
-                        else:
-                            continue
-                        
-                        # Check if annual or monthly
-                        is_annual = False
-                        question_id = answer.get('question_id', '').lower()
-                        if isinstance(value, dict) and 'frequency' in value:
-                            is_annual = value['frequency'].lower() in ['annual', 'yearly', 'per year']
-                        elif 'annual' in question_id or 'yearly' in question_id:
-                            is_annual = True
-                        
-                        # Convert to monthly if annual
-                        if is_annual:
-                            expense_value /= 12
-                        
-                        # Update monthly expenses if higher
-                        if expense_value > monthly_expenses:
-                            monthly_expenses = expense_value
+            monthly_expenses = get_profile_facts(profile).derive(
+                'calculator_monthly_expenses', _largest_monthly_expense)
         except Exception as e:
             logger.error(f"Error extracting expenses from profile: {str(e)}")
         
@@ -16,6 +16,7 @@ from datetime import datetime, date, timedelta
 from typing import List, Dict, Any, Optional, Union, Tuple
 import io
 import base64
+import importlib.util
 from pathlib import Path
 
 # Import models and services
@@ -97,28 +98,28 @@ INDIA_FINANCIAL_CONSTANTS = {
     }
 }
 
-# Optional PDF generation and visualization
-try:
+# Optional PDF generation and visualization. Only availability is checked
+# here; matplotlib and reportlab are imported on first use so importing this
+# module stays cheap.
+def _module_available(name: str) -> bool:
+    """Whether an optional package can be imported, without importing it."""
+    try:
+        return importlib.util.find_spec(name) is not None
+    except (ImportError, ValueError):
+        # Modules replaced in sys.modules without a spec are treated as unavailable
+        return False
+
+
+HAS_MATPLOTLIB = _module_available("matplotlib")
+HAS_REPORTLAB = _module_available("reportlab")
+
+
+def _load_matplotlib():
+    """Import matplotlib on first use; returns (pyplot, FuncFormatter)."""
     import matplotlib.pyplot as plt
-    import matplotlib.figure as figure
-    from matplotlib.backends.backend_pdf import PdfPages
-    from matplotlib.gridspec import GridSpec
-    import matplotlib.colors as mcolors
-    import matplotlib.patches as mpatches
-    import numpy as np
     from matplotlib.ticker import FuncFormatter
-    HAS_MATPLOTLIB = True
-except ImportError:
-    HAS_MATPLOTLIB = False
+    return plt, FuncFormatter
 
-try:
-    from reportlab.lib.pagesizes import letter, A4
-    from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Image, Table, TableStyle
-    from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-    from reportlab.lib import colors
-    HAS_REPORTLAB = True
-except ImportError:
-    HAS_REPORTLAB = False
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, 
@@ -1277,6 +1278,11 @@ class GoalDocumentGenerator:
             return None
         
         try:
+            from reportlab.lib.pagesizes import A4
+            from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Image, Table, TableStyle
+            from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+            from reportlab.lib import colors
+            
             # Generate unique filename
             doc_id = document_data.get("id", str(uuid.uuid4()))
             doc_type = document_data.get("type", "financial_document")
@@ -3374,6 +3380,7 @@ class GoalDocumentGenerator:
             }
         
         try:
+            plt, FuncFormatter = _load_matplotlib()
             # Create figure
             fig = plt.figure(figsize=(8, 3))
             ax = fig.add_subplot(111)
@@ -3463,6 +3470,7 @@ class GoalDocumentGenerator:
             }
         
         try:
+            plt, FuncFormatter = _load_matplotlib()
             # Parse dates
             start = datetime.fromisoformat(start_date.replace('Z', '+00:00'))
             end = datetime.fromisoformat(end_date.replace('Z', '+00:00'))
@@ -3573,6 +3581,7 @@ class GoalDocumentGenerator:
             }
         
         try:
+            plt, FuncFormatter = _load_matplotlib()
             # Parse dates
             dates = [datetime.fromisoformat(tp.replace('Z', '+00:00')) for tp in time_points]
             
@@ -3678,6 +3687,7 @@ class GoalDocumentGenerator:
             }
         
         try:
+            plt, FuncFormatter = _load_matplotlib()
             # Create figure
             fig = plt.figure(figsize=(10, 5))
             ax = fig.add_subplot(111)
@@ -3782,6 +3792,7 @@ class GoalDocumentGenerator:
             return allocation
         
         try:
+            plt, FuncFormatter = _load_matplotlib()
             # Extract data
             labels = list(allocation.keys())
             sizes = list(allocation.values())
@@ -3862,6 +3873,7 @@ class GoalDocumentGenerator:
             return {"scenarios": scenarios}
         
         try:
+            plt, FuncFormatter = _load_matplotlib()
             # Extract data
             names = [s.get("title", f"Scenario {i+1}") for i, s in enumerate(scenarios)]
             original_prob = scenarios[0].get("impact", {}).get("old_probability", 0)
@@ -7,6 +7,9 @@ from datetime import datetime, timedelta
 from contextlib import contextmanager
 from typing import List, Dict, Optional, Any, Union, Tuple
 
+from models.connection_pool import get_pool
+from models.goal_blob_codec import as_json_text, decode_payload, encode_payload
+
 class GoalCategory:
     """
     Model for predefined goal categories with hierarchical structure.
@@ -131,6 +134,51 @@ class GoalCategory:
             parent_category_id=parent_category_id
         )
 
+
+class _Unloaded:
+    """Marker for a blob column that has not been read from the database yet."""
+
+    def __repr__(self):
+        return '<unloaded>'
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
+
+    def __reduce__(self):
+        return '_UNLOADED'
+
+
+_UNLOADED = _Unloaded()
+
+
+class LazyBlobField:
+    """
+    Descriptor for one of a goal's large JSON TEXT columns.
+
+    Goals listed through GoalManager's summary projection are created without
+    their blob columns. The first read of any unloaded blob loads all of the
+    goal's unloaded blobs in one query; assigning a value never loads.
+    """
+
+    def __set_name__(self, owner, name):
+        self.name = name
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self
+        value = instance.__dict__.get(self.name)
+        if value is _UNLOADED:
+            instance._load_blobs()
+            value = instance.__dict__.get(self.name)
+        return value
+
+    def __set__(self, instance, value):
+        instance.__dict__[self.name] = value
+
+
 class Goal:
     """
     Model for user financial goals.
@@ -162,7 +210,17 @@ class Goal:
         "description": "notes",              # Old code sometimes used "description" instead of "notes"
         "profile_id": "user_profile_id"      # Old code sometimes used "profile_id"
     }
-    
+
+    # Large JSON columns left out of list queries and loaded on first access
+    BLOB_FIELDS = ('simulation_data', 'simulation_path_data', 'scenarios',
+                   'adjustments', 'probability_metrics')
+
+    simulation_data = LazyBlobField()
+    simulation_path_data = LazyBlobField()
+    scenarios = LazyBlobField()
+    adjustments = LazyBlobField()
+    probability_metrics = LazyBlobField()
+
     def __init__(self, id: str = None, user_profile_id: str = "", category: str = "",
                 title: str = "", target_amount: float = 0.0, timeframe: str = "",
                 current_amount: float = 0.0, importance: str = "medium", 
@@ -210,10 +268,14 @@ class Goal:
             goal_success_probability (float): Calculated probability of achieving the goal (0.0 to 100.0)
             adjustments_required (bool): Flag to indicate if adjustments are needed
             funding_strategy (str): JSON or text storing the recommended funding approach
-            simulation_data (str): JSON-serialized Monte Carlo simulation results, including SIP information
+            simulation_data (str | bytes): Monte Carlo simulation results, including SIP information,
+                as JSON text or in the binary format of models/goal_blob_codec.py
             scenarios (str): JSON-serialized alternative scenarios for the goal
             adjustments (str): JSON-serialized recommended adjustments to increase success probability
         """
+        # Loader for blob fields deferred by from_row
+        self._blob_loader = None
+
         # Set core fields
         self.id = id or str(uuid.uuid4())
         self.user_profile_id = user_profile_id
@@ -309,12 +371,14 @@ class Goal:
         """Legacy getter: Returns 'user_profile_id' for backward compatibility"""
         return self.user_profile_id
     
-    def to_dict(self, legacy_mode: bool = False) -> Dict[str, Any]:
+    def to_dict(self, legacy_mode: bool = False, include_blobs: bool = True) -> Dict[str, Any]:
         """
         Convert goal to dictionary for serialization.
         
         Args:
             legacy_mode (bool): If True, return only fields expected by legacy code
+            include_blobs (bool): If False, leave out the large JSON fields (BLOB_FIELDS)
+                so summary listings never load them
             
         Returns:
             dict: Dictionary representation
@@ -345,19 +409,18 @@ class Goal:
                 "adjustments_required": self.adjustments_required,
                 "funding_strategy": self.funding_strategy,
                 # Enhanced probability analysis fields
-                "simulation_data": self.simulation_data,
-                "scenarios": self.scenarios,
-                "adjustments": self.adjustments,
                 "last_simulation_time": self.last_simulation_time,
                 "simulation_parameters_json": self.simulation_parameters_json,
                 # Additional probability fields
                 "probability_partial_success": self.probability_partial_success,
                 "simulation_iterations": self.simulation_iterations,
-                "simulation_path_data": self.simulation_path_data,
                 "monthly_sip_recommended": self.monthly_sip_recommended,
-                "probability_metrics": self.probability_metrics,
                 "success_threshold": self.success_threshold
             })
+            if include_blobs:
+                # Large JSON fields (simulation_data, scenarios, adjustments, ...),
+                # binary-encoded simulation payloads converted back to JSON text
+                result.update({field: as_json_text(getattr(self, field)) for field in self.BLOB_FIELDS})
         else:
             # Legacy fields (only included in legacy mode)
             # Convert timeframe to time_horizon for legacy compatibility
@@ -504,12 +567,14 @@ class Goal:
         return cls(**mapped_data)
     
     @classmethod
-    def from_row(cls, row: sqlite3.Row) -> 'Goal':
+    def from_row(cls, row: sqlite3.Row, blob_loader=None) -> 'Goal':
         """
         Create a Goal from a database row.
         
         Args:
             row (sqlite3.Row): Database row
+            blob_loader (callable, optional): Function (goal_id, fields) -> dict used to
+                load blob fields missing from the row on first access
             
         Returns:
             Goal: New instance
@@ -617,8 +682,47 @@ class Goal:
             # This ensures backward compatibility
             logging.warning(f"Error processing enhanced goal fields: {str(e)}")
             
-        # Create and return the Goal instance
-        return cls(**init_args)
+        # Create the Goal instance, deferring blob columns the row left out
+        goal = cls(**init_args)
+        if blob_loader is not None and hasattr(row, 'keys'):
+            column_names = row.keys()
+            deferred = [field for field in cls.BLOB_FIELDS if field not in column_names]
+            if deferred:
+                for field in deferred:
+                    goal.__dict__[field] = _UNLOADED
+                goal._blob_loader = blob_loader
+        return goal
+
+    def unloaded_blob_fields(self) -> List[str]:
+        """
+        Get the blob fields that have not been loaded yet.
+        
+        Returns:
+            list: Names of unloaded BLOB_FIELDS
+        """
+        return [field for field in self.BLOB_FIELDS if self.__dict__.get(field) is _UNLOADED]
+
+    def _set_loaded_blobs(self, values: Dict[str, Any]) -> None:
+        """
+        Store loaded values for all unloaded blob fields.
+        
+        Args:
+            values: Blob values by field name; missing fields are stored as None
+        """
+        for field in self.unloaded_blob_fields():
+            self.__dict__[field] = values.get(field)
+        self._blob_loader = None
+
+    def _load_blobs(self) -> None:
+        """Load all unloaded blob fields of this goal in one query."""
+        fields = self.unloaded_blob_fields()
+        values = {}
+        if fields and self._blob_loader is not None:
+            try:
+                values = self._blob_loader(self.id, fields) or {}
+            except Exception as e:
+                logging.error(f"Failed to load blob fields for goal {self.id}: {str(e)}")
+        self._set_loaded_blobs(values)
     
     # Helper methods for enhanced probability fields
     
@@ -632,19 +736,16 @@ class Goal:
         if not self.simulation_data:
             return {}
         
-        try:
-            return json.loads(self.simulation_data)
-        except (json.JSONDecodeError, TypeError):
-            return {}
+        return decode_payload(self.simulation_data, default={})
             
     def set_simulation_data(self, data: Dict[str, Any]) -> None:
         """
-        Set simulation data.
+        Set simulation data, stored in the compact binary format (models/goal_blob_codec.py).
         
         Args:
             data: Dictionary with simulation data
         """
-        self.simulation_data = json.dumps(data) if data else None
+        self.simulation_data = encode_payload(data) if data else None
         
     def get_scenarios(self) -> Dict[str, Any]:
         """
@@ -758,19 +859,16 @@ class Goal:
         if not self.simulation_path_data:
             return {}
         
-        try:
-            return json.loads(self.simulation_path_data)
-        except (json.JSONDecodeError, TypeError):
-            return {}
+        return decode_payload(self.simulation_path_data, default={})
             
     def set_simulation_paths(self, data: Dict[str, Any]) -> None:
         """
-        Set simulation path data.
+        Set simulation path data, stored in the compact binary format (models/goal_blob_codec.py).
         
         Args:
             data: Dictionary with simulation paths
         """
-        self.simulation_path_data = json.dumps(data) if data else None
+        self.simulation_path_data = encode_payload(data, paths=True) if data else None
         
     def get_sip_details(self) -> Dict[str, Any]:
         """
@@ -944,32 +1042,134 @@ class GoalManager:
             db_path (str): Path to SQLite database
         """
         self.db_path = db_path
+        # Column names of the goals table, probed once (see _get_goal_columns)
+        self._goal_columns = None
         logging.basicConfig(level=logging.INFO)
     
     @contextmanager
     def _get_connection(self):
         """
         Context manager for getting a database connection.
+        Connections come from the shared pool (models/connection_pool.py) and
+        are reused; uncommitted changes are rolled back when the block exits.
         
         Yields:
             sqlite3.Connection: Database connection
         """
-        conn = None
         try:
-            conn = sqlite3.connect(self.db_path)
-            # Enable foreign keys
-            conn.execute("PRAGMA foreign_keys = ON")
-            # Enable dictionary rows
-            conn.row_factory = sqlite3.Row
-            yield conn
+            with get_pool(self.db_path).connection() as conn:
+                yield conn
         except sqlite3.Error as e:
             logging.error(f"Database connection error: {str(e)}")
-            if conn:
-                conn.rollback()
             raise
-        finally:
-            if conn:
-                conn.close()
+    
+    def _get_goal_columns(self, conn) -> Tuple[str, ...]:
+        """
+        Get the column names of the goals table, probing the schema only once.
+        
+        The first probe also creates the (user_profile_id, priority_score)
+        index used by the profile and priority listings.
+        
+        Args:
+            conn (sqlite3.Connection): Open database connection
+            
+        Returns:
+            tuple: Column names of the goals table
+        """
+        columns = self._goal_columns
+        if columns is None:
+            cursor = conn.cursor()
+            cursor.execute("PRAGMA table_info(goals)")
+            columns = tuple(column[1] for column in cursor.fetchall())
+            if not columns:
+                # Table not created yet, probe again next time
+                return columns
+            
+            if 'priority_score' in columns:
+                cursor.execute("""
+                    CREATE INDEX IF NOT EXISTS idx_goals_profile_priority
+                    ON goals(user_profile_id, priority_score)
+                """)
+                conn.commit()
+            self._goal_columns = columns
+        return columns
+    
+    def refresh_schema(self) -> None:
+        """
+        Forget the probed goals schema, e.g. after a migration added columns.
+        """
+        self._goal_columns = None
+    
+    def _summary_query(self, conn) -> str:
+        """
+        Build the SELECT for goal listings: every column except Goal.BLOB_FIELDS.
+        
+        Args:
+            conn (sqlite3.Connection): Open database connection
+            
+        Returns:
+            str: SELECT ... FROM goals clause
+        """
+        columns = [column for column in self._get_goal_columns(conn) if column not in Goal.BLOB_FIELDS]
+        return "SELECT " + ", ".join(f'"{column}"' for column in columns) + " FROM goals"
+    
+    def _load_goal_blobs(self, goal_id: str, fields: List[str]) -> Dict[str, Any]:
+        """
+        Load blob fields of one goal; used by Goal's lazy blob fields.
+        
+        Args:
+            goal_id (str): Goal ID
+            fields (list): Blob field names to load
+            
+        Returns:
+            dict: Values by field name
+        """
+        with self._get_connection() as conn:
+            fields = [field for field in fields if field in self._get_goal_columns(conn)]
+            if not fields:
+                return {}
+            
+            cursor = conn.cursor()
+            cursor.execute(f"SELECT {', '.join(fields)} FROM goals WHERE id = ?", (goal_id,))
+            row = cursor.fetchone()
+            return {field: row[field] for field in fields} if row else {}
+    
+    def load_goal_blobs(self, goals: List[Goal], batch_size: int = 500) -> None:
+        """
+        Load the unloaded blob fields of several listed goals in one query.
+        
+        Use this before reading blob fields of every goal in a listing, instead
+        of letting each goal load its own on first access.
+        
+        Args:
+            goals (list): Goals returned by the list methods
+            batch_size (int): Maximum number of goal IDs per query
+        """
+        pending = [goal for goal in goals if goal.unloaded_blob_fields()]
+        if not pending:
+            return
+        
+        values = {}
+        try:
+            with self._get_connection() as conn:
+                fields = [field for field in Goal.BLOB_FIELDS if field in self._get_goal_columns(conn)]
+                if fields:
+                    cursor = conn.cursor()
+                    for start in range(0, len(pending), batch_size):
+                        ids = [goal.id for goal in pending[start:start + batch_size]]
+                        cursor.execute(f"""
+                            SELECT id, {', '.join(fields)} FROM goals
+                            WHERE id IN ({', '.join('?' * len(ids))})
+                        """, ids)
+                        for row in cursor.fetchall():
+                            values[row['id']] = {field: row[field] for field in fields}
+        except Exception as e:
+            logging.error(f"Failed to load goal blob fields: {str(e)}")
+            # Leave the goals to load their blobs individually
+            return
+        
+        for goal in pending:
+            goal._set_loaded_blobs(values.get(goal.id, {}))
     
     def get_all_categories(self) -> List[GoalCategory]:
         """
@@ -1222,6 +1422,9 @@ class GoalManager:
         """
         Get all goals for a profile.
         
+        Blob fields (Goal.BLOB_FIELDS) are not selected; each goal loads them
+        on first access, or load_goal_blobs() loads them for the whole list.
+        
         Args:
             profile_id (str): Profile ID
             
@@ -1232,14 +1435,13 @@ class GoalManager:
             with self._get_connection() as conn:
                 cursor = conn.cursor()
                 
-                cursor.execute("""
-                    SELECT * FROM goals 
+                cursor.execute(self._summary_query(conn) + """
                     WHERE user_profile_id = ?
                     ORDER BY category, created_at
                 """, (profile_id,))
                 
                 rows = cursor.fetchall()
-                return [Goal.from_row(row) for row in rows]
+                return [Goal.from_row(row, self._load_goal_blobs) for row in rows]
                 
         except Exception as e:
             logging.error(f"Failed to get goals for profile {profile_id}: {str(e)}")
@@ -1249,6 +1451,8 @@ class GoalManager:
         """
         Get all goals from all profiles.
         
+        Blob fields are loaded lazily, as in get_profile_goals.
+        
         Returns:
             list: List of all Goal objects
         """
@@ -1256,13 +1460,12 @@ class GoalManager:
             with self._get_connection() as conn:
                 cursor = conn.cursor()
                 
-                cursor.execute("""
-                    SELECT * FROM goals 
+                cursor.execute(self._summary_query(conn) + """
                     ORDER BY user_profile_id, category, created_at
                 """)
                 
                 rows = cursor.fetchall()
-                return [Goal.from_row(row) for row in rows]
+                return [Goal.from_row(row, self._load_goal_blobs) for row in rows]
                 
         except Exception as e:
             logging.error(f"Failed to get all goals: {str(e)}")
@@ -1272,6 +1475,8 @@ class GoalManager:
         """
         Get goals sorted by priority score (highest to lowest).
         
+        Blob fields are loaded lazily, as in get_profile_goals.
+        
         Args:
             profile_id (str, optional): Filter goals by profile ID. If None, returns goals from all profiles.
             
@@ -1283,27 +1488,24 @@ class GoalManager:
                 cursor = conn.cursor()
                 
                 # Check if the priority_score column exists
-                cursor.execute("PRAGMA table_info(goals)")
-                columns = [column[1] for column in cursor.fetchall()]
+                columns = self._get_goal_columns(conn)
+                select = self._summary_query(conn)
                 
                 if 'priority_score' in columns:
                     # Use priority_score for sorting if it exists
                     if profile_id:
-                        cursor.execute("""
-                            SELECT * FROM goals 
+                        cursor.execute(select + """
                             WHERE user_profile_id = ?
                             ORDER BY priority_score DESC, importance DESC, timeframe ASC
                         """, (profile_id,))
                     else:
-                        cursor.execute("""
-                            SELECT * FROM goals 
+                        cursor.execute(select + """
                             ORDER BY priority_score DESC, importance DESC, timeframe ASC
                         """)
                 else:
                     # Fall back to importance and timeframe sorting if priority_score doesn't exist
                     if profile_id:
-                        cursor.execute("""
-                            SELECT * FROM goals 
+                        cursor.execute(select + """
                             WHERE user_profile_id = ?
                             ORDER BY CASE 
                                 WHEN importance = 'high' THEN 1
@@ -1313,8 +1515,7 @@ class GoalManager:
                             timeframe ASC
                         """, (profile_id,))
                     else:
-                        cursor.execute("""
-                            SELECT * FROM goals 
+                        cursor.execute(select + """
                             ORDER BY CASE 
                                 WHEN importance = 'high' THEN 1
                                 WHEN importance = 'medium' THEN 2
@@ -1324,7 +1525,7 @@ class GoalManager:
                         """)
                 
                 rows = cursor.fetchall()
-                goals = [Goal.from_row(row) for row in rows]
+                goals = [Goal.from_row(row, self._load_goal_blobs) for row in rows]
                 
                 # Recalculate priority scores just in case
                 for goal in goals:
@@ -1370,8 +1571,7 @@ class GoalManager:
                     goal.calculate_priority_score()
                 
                 # Check if the new columns exist in the goals table
-                cursor.execute("PRAGMA table_info(goals)")
-                columns = [column[1] for column in cursor.fetchall()]
+                columns = self._get_goal_columns(conn)
                 
                 if 'current_progress' in columns:
                     # Check if enhanced probability fields exist
@@ -1476,8 +1676,7 @@ class GoalManager:
                 goal.calculate_priority_score()
                 
                 # Check if the new columns exist
-                cursor.execute("PRAGMA table_info(goals)")
-                columns = [column[1] for column in cursor.fetchall()]
+                columns = self._get_goal_columns(conn)
                 
                 if 'current_progress' in columns:
                     # Check if enhanced probability fields exist
@@ -1520,6 +1719,10 @@ class GoalManager:
                             goal.last_simulation_time, goal.simulation_parameters_json,
                             goal.id
                         ))
+                        
+                        if 'simulation_path_data' in columns:
+                            cursor.execute("UPDATE goals SET simulation_path_data = ? WHERE id = ?",
+                                           (goal.simulation_path_data, goal.id))
                     else:
                         # New schema with basic fields but without enhanced probability fields
                         cursor.execute("""
@@ -36,8 +36,13 @@ from models.monte_carlo.parallel import (
 from models.monte_carlo.cache import (
     cached_simulation,
     invalidate_cache,
+    invalidate_tags,
+    goal_tag,
     get_cache_stats
 )
+from models.monte_carlo.coalesce import coalesce
+from models.parameter_snapshot import parameter_cache_token
+from models.monte_carlo.executor import get_simulation_executor
 
 # Keep the imports needed by the original class to avoid import errors in dependant code
 import numpy as np
@@ -55,8 +60,13 @@ import hashlib
 import json
 
 # Import required models
+from models.monte_carlo.rng import DEFAULT_SEED, get_generator, resolve_generator
+from models.monte_carlo.engine import build_contribution_vector
+from models.monte_carlo.portfolio import GoalPortfolioSimulation, simulate_goal_portfolio
 from models.goal_calculators.base_calculator import GoalCalculator
-from models.financial_projection import AssetProjection, AllocationStrategy, ContributionPattern, AssetClass
+from models.financial_projection import (
+    AssetProjection, AllocationStrategy, ContributionPattern, AssetClass, ProjectionResult
+)
 
 logger = logging.getLogger(__name__)
 
@@ -190,490 +200,31 @@ class ProbabilityResult:
             return 0.0
 
 
-class GoalOutcomeDistribution:
+@dataclass
+class GoalSimulationInputs:
     """
-    Models the full distribution of goal outcomes from Monte Carlo simulations.
-    
-    This class provides detailed statistical analysis of simulation results,
-    including various distribution statistics (mean, median, percentiles),
-    shortfall risks at different thresholds, and upside potential metrics.
+    Simulation inputs for one goal, as prepared by its category handler.
+
+    Shared by the per-goal handlers and the batched portfolio pass so both
+    simulate the same target, contributions and allocation. When the goal
+    needs no simulation (already achieved, or no time left) ``outcome``
+    holds its result instead.
     """
-    
-    def __init__(self, simulation_values: Optional[List[float]] = None):
-        """
-        Initialize with simulation outcome values.
-        
-        Args:
-            simulation_values: List of final values from Monte Carlo simulations
-        """
-        self.simulation_values = simulation_values or []
-        self._sorted_values = None
-        self._mean = None
-        self._median = None
-        self._std_dev = None
-        
-    def add_simulation_result(self, value: float) -> None:
-        """
-        Add a single simulation result.
-        
-        Args:
-            value: Final value from a simulation run
-        """
-        self.simulation_values.append(value)
-        # Clear cached values
-        self._sorted_values = None
-        self._mean = None
-        self._median = None
-        self._std_dev = None
-        
-    def add_simulation_results(self, values: List[float]) -> None:
-        """
-        Add multiple simulation results.
-        
-        Args:
-            values: List of final values from simulation runs
-        """
-        self.simulation_values.extend(values)
-        # Clear cached values
-        self._sorted_values = None
-        self._mean = None
-        self._median = None
-        self._std_dev = None
-    
-    @property
-    def sorted_values(self) -> List[float]:
-        """Get sorted simulation values, caching for performance."""
-        if self._sorted_values is None:
-            self._sorted_values = sorted(self.simulation_values)
-        return self._sorted_values
-    
-    @property
-    def mean(self) -> float:
-        """Calculate the mean (average) value."""
-        if self._mean is None:
-            self._mean = statistics.mean(self.simulation_values) if self.simulation_values else 0
-        return self._mean
-    
-    @property
-    def median(self) -> float:
-        """Calculate the median (50th percentile) value."""
-        if self._median is None:
-            self._median = statistics.median(self.simulation_values) if self.simulation_values else 0
-        return self._median
-    
+    kind: str
+    target_amount: float
+    current_amount: float
+    months_available: float
+    years_available: float
+    monthly_contribution: float = 0.0
+    allocation_strategy: Optional[AllocationStrategy] = None
+    contribution_pattern: Optional[ContributionPattern] = None
+    outcome: Optional[Dict[str, Any]] = None
+
     @property
-    def std_dev(self) -> float:
-        """Calculate the standard deviation."""
-        if self._std_dev is None:
-            if len(self.simulation_values) >= 2:
-                self._std_dev = statistics.stdev(self.simulation_values)
-            else:
-                self._std_dev = 0
-        return self._std_dev
-    
-    def percentile(self, p: float) -> float:
-        """
-        Calculate the specified percentile value.
-        
-        Args:
-            p: Percentile value (0-1)
-            
-        Returns:
-            Value at the specified percentile
-        """
-        if not self.simulation_values:
-            return 0
-            
-        sorted_vals = self.sorted_values
-        idx = max(0, min(int(p * len(sorted_vals)), len(sorted_vals) - 1))
-        return sorted_vals[idx]
-    
-    def success_probability(self, target_amount: float) -> float:
-        """
-        Calculate probability of meeting or exceeding target amount.
-        
-        This method counts simulations that meet or exceed the target amount
-        and provides a more sophisticated probability calculation that includes
-        partial credit for values that are close to the target.
-        
-        Args:
-            target_amount: Goal target amount
-            
-        Returns:
-            Probability (0-1) of meeting or exceeding target
-        """
-        if not self.simulation_values:
-            logger.warning("[DIAGNOSTIC] No simulation values available for success probability calculation")
-            return 0
-            
-        # Start timer for performance tracking
-        start_time = time.time()
-        
-        # Count simulations that meet or exceed target and get metrics
-        total_simulations = len(self.simulation_values)
-        exact_success_count = sum(1 for val in self.simulation_values if val >= target_amount)
-        exact_probability = exact_success_count / total_simulations
-        
-        # Log detail for diagnostic analysis
-        logger.info(f"[DIAGNOSTIC] Basic success count: {exact_success_count}/{total_simulations} = {exact_probability:.4f}")
-        
-        # Enhanced sensitivity implementation - add partial credit for values close to target
-        # This makes the probability calculation more sensitive to parameter changes
-        sensitivity_adjusted_count = 0
-        close_but_not_success = 0
-        
-        for val in self.simulation_values:
-            if val >= target_amount:
-                sensitivity_adjusted_count += 1
-            else:
-                # Calculate closeness as a ratio of achieved to target
-                closeness = val / target_amount if target_amount > 0 else 0
-                
-                # Add partial credit for values that are very close (within 10% of target)
-                if closeness > 0.9:
-                    # Linear partial credit from 0 at 90% to 1 at 100%
-                    partial_credit = (closeness - 0.9) * 10  # Scales 0.9->0.0, 1.0->1.0
-                    sensitivity_adjusted_count += partial_credit
-                    close_but_not_success += 1
-        
-        # Calculate adjusted probability
-        adjusted_probability = sensitivity_adjusted_count / total_simulations
-        
-        # Log detailed diagnostic information
-        logger.info(f"[DIAGNOSTIC] Success probability calculation - "
-                 f"target_amount: {target_amount}, "
-                 f"simulation_count: {total_simulations}, "
-                 f"exact_success: {exact_success_count}, "
-                 f"close_but_not_success: {close_but_not_success}, "
-                 f"basic_probability: {exact_probability:.4f}, "
-                 f"adjusted_probability: {adjusted_probability:.4f}, "
-                 f"difference: {(adjusted_probability - exact_probability):.4f}")
-        
-        # Performance tracking
-        duration = time.time() - start_time
-        logger.debug(f"[TIMING] Success probability calculation took {duration:.6f} seconds")
-        
-        # Return the enhanced probability value
-        return adjusted_probability
-    
-    def shortfall_risk(self, target_amount: float, threshold_percentage: float = 0.8) -> float:
-        """
-        Calculate probability of falling below a percentage of target amount.
-        
-        Args:
-            target_amount: Goal target amount
-            threshold_percentage: Percentage of target defining shortfall (default 80%)
-            
-        Returns:
-            Probability (0-1) of falling below threshold
-        """
-        if not self.simulation_values:
-            return 1.0
-            
-        shortfall_threshold = target_amount * threshold_percentage
-        # Count simulations that fall below threshold
-        count = sum(1 for val in self.simulation_values if val < shortfall_threshold)
-        return count / len(self.simulation_values)
-    
-    def upside_probability(self, target_amount: float, excess_percentage: float = 1.2) -> float:
-        """
-        Calculate probability of exceeding target by a given percentage.
-        
-        Args:
-            target_amount: Goal target amount
-            excess_percentage: Percentage of target defining upside (default 120%)
-            
-        Returns:
-            Probability (0-1) of exceeding threshold
-        """
-        if not self.simulation_values:
-            return 0
-            
-        upside_threshold = target_amount * excess_percentage
-        # Count simulations that exceed threshold
-        count = sum(1 for val in self.simulation_values if val >= upside_threshold)
-        return count / len(self.simulation_values)
-    
-    def value_at_risk(self, confidence_level: float = 0.95) -> float:
-        """
-        Calculate value at risk (VaR) for a given confidence level.
-        
-        Args:
-            confidence_level: Confidence level (default 95%)
-            
-        Returns:
-            Amount at risk at the specified confidence level
-        """
-        if not self.simulation_values:
-            return 0
-            
-        # VaR is the loss that is not expected to be exceeded with given confidence level
-        return self.percentile(1 - confidence_level)
-    
-    def conditional_value_at_risk(self, confidence_level: float = 0.95) -> float:
-        """
-        Calculate conditional value at risk (CVaR/Expected Shortfall).
-        
-        CVaR is the expected loss given that the loss exceeds the VaR.
-        
-        Args:
-            confidence_level: Confidence level (default 95%)
-            
-        Returns:
-            Expected shortfall at the specified confidence level
-        """
-        if not self.simulation_values:
-            return 0
-            
-        var = self.value_at_risk(confidence_level)
-        # Average of values below VaR
-        tail_values = [v for v in self.simulation_values if v <= var]
-        return statistics.mean(tail_values) if tail_values else var
-    
-    def calculate_histogram(self, bins: int = 10) -> Dict[str, List[float]]:
-        """
-        Calculate histogram data for visualization.
-        
-        Args:
-            bins: Number of histogram bins
-            
-        Returns:
-            Dictionary with bin_edges and bin_counts
-        """
-        if not self.simulation_values:
-            return {"bin_edges": [], "bin_counts": []}
-            
-        hist, bin_edges = np.histogram(self.simulation_values, bins=bins)
-        return {
-            "bin_edges": bin_edges.tolist(),
-            "bin_counts": hist.tolist()
-        }
-    
-    def calculate_key_statistics(self, target_amount: float) -> Dict[str, float]:
-        """
-        Calculate key statistical metrics for the distribution.
-        
-        Args:
-            target_amount: Goal target amount
-            
-        Returns:
-            Dictionary with key statistics
-        """
-        return {
-            "mean": self.mean,
-            "median": self.median,
-            "std_dev": self.std_dev,
-            "success_probability": self.success_probability(target_amount),
-            "shortfall_risk_80pct": self.shortfall_risk(target_amount, 0.8),
-            "shortfall_risk_60pct": self.shortfall_risk(target_amount, 0.6),
-            "upside_probability_120pct": self.upside_probability(target_amount, 1.2),
-            "percentile_10": self.percentile(0.1),
-            "percentile_25": self.percentile(0.25),
-            "percentile_50": self.percentile(0.5),
-            "percentile_75": self.percentile(0.75),
-            "percentile_90": self.percentile(0.9),
-            "value_at_risk_95pct": self.value_at_risk(0.95),
-            "conditional_value_at_risk_95pct": self.conditional_value_at_risk(0.95)
-        }
-    
-    def calculate_time_to_goal_probability(
-        self, 
-        target_probability: float, 
-        target_amount: float,
-        monthly_contribution: float,
-        initial_amount: float,
-        allocation_strategy: Dict[str, float],
-        returns: Dict[str, Tuple[float, float]],
-        max_years: int = 40
-    ) -> float:
-        """
-        Estimate time needed to reach a specific success probability.
-        
-        Args:
-            target_probability: Target probability of success (0-1)
-            target_amount: Goal target amount
-            monthly_contribution: Monthly contribution amount
-            initial_amount: Initial investment amount
-            allocation_strategy: Asset allocation strategy
-            returns: Expected returns and volatility by asset class
-            max_years: Maximum years to consider
-            
-        Returns:
-            Estimated time in years to reach target probability
-        """
-        # Simple binary search implementation
-        # For a more accurate implementation, we would need to run full Monte Carlo
-        # simulations at each step, which would be computationally expensive
-        
-        def estimate_success_probability(years: int) -> float:
-            # Simplified formula based on expected returns and volatility
-            expected_return = sum(
-                alloc * ret[0] 
-                for asset, alloc in allocation_strategy.items() 
-                for asset_class, ret in returns.items() 
-                if asset.lower() == asset_class.name.lower()
-            )
-            
-            # Future value of initial amount
-            future_initial = initial_amount * (1 + expected_return) ** years
-            
-            # Future value of monthly contributions (assuming end of period)
-            if expected_return > 0:
-                future_contributions = monthly_contribution * 12 * ((1 + expected_return) ** years - 1) / expected_return
-            else:
-                future_contributions = monthly_contribution * 12 * years
-                
-            expected_outcome = future_initial + future_contributions
-            
-            # Rough estimate of volatility at the given time horizon
-            volatility = sum(
-                alloc * ret[1] 
-                for asset, alloc in allocation_strategy.items() 
-                for asset_class, ret in returns.items() 
-                if asset.lower() == asset_class.name.lower()
-            ) * math.sqrt(years)
-            
-            # Approximate probability using normal distribution
-            z_score = (expected_outcome - target_amount) / (expected_outcome * volatility + 1e-10)
-            return 1 - 0.5 * (1 + math.erf(-z_score / math.sqrt(2)))
-        
-        # Binary search for the time that gives target probability
-        low, high = 1, max_years
-        while high - low > 0.5:
-            mid = (low + high) / 2
-            prob = estimate_success_probability(mid)
-            
-            if prob < target_probability:
-                low = mid
-            else:
-                high = mid
-                
-        return (low + high) / 2
-    
-    def calculate_probability_at_timepoints(
-        self,
-        timepoints: List[float],
-        target_amount: float,
-        monthly_contribution: float,
-        initial_amount: float,
-        allocation_strategy: Dict[str, float],
-        returns: Dict[str, Tuple[float, float]],
-    ) -> Dict[float, float]:
-        """
-        Calculate success probability at different time points.
-        
-        Args:
-            timepoints: List of time points in years
-            target_amount: Goal target amount
-            monthly_contribution: Monthly contribution amount
-            initial_amount: Initial investment amount
-            allocation_strategy: Asset allocation strategy
-            returns: Expected returns and volatility by asset class
-            
-        Returns:
-            Dictionary mapping timepoints to success probabilities
-        """
-        results = {}
-        
-        def estimate_success_probability(years: float) -> float:
-            # Similar to the approach in calculate_time_to_goal_probability
-            expected_return = sum(
-                alloc * ret[0] 
-                for asset, alloc in allocation_strategy.items() 
-                for asset_class, ret in returns.items() 
-                if asset.lower() == asset_class.name.lower()
-            )
-            
-            # Future value calculations
-            future_initial = initial_amount * (1 + expected_return) ** years
-            
-            if expected_return > 0:
-                future_contributions = monthly_contribution * 12 * ((1 + expected_return) ** years - 1) / expected_return
-            else:
-                future_contributions = monthly_contribution * 12 * years
-                
-            expected_outcome = future_initial + future_contributions
-            
-            # Volatility estimate
-            volatility = sum(
-                alloc * ret[1] 
-                for asset, alloc in allocation_strategy.items() 
-                for asset_class, ret in returns.items() 
-                if asset.lower() == asset_class.name.lower()
-            ) * math.sqrt(years)
-            
-            # Approximate probability using normal distribution
-            z_score = (expected_outcome - target_amount) / (expected_outcome * volatility + 1e-10)
-            return 1 - 0.5 * (1 + math.erf(-z_score / math.sqrt(2)))
-        
-        for year in timepoints:
-            results[year] = estimate_success_probability(year)
-            
-        return results
-    
-    def identify_critical_periods(
-        self, 
-        time_series_results: List[List[float]],
-        percentile_threshold: float = 0.9
-    ) -> List[Dict[str, Any]]:
-        """
-        Identify periods with higher volatility or risk.
-        
-        Args:
-            time_series_results: List of time series of simulation results
-            percentile_threshold: Threshold for identifying critical periods
-            
-        Returns:
-            List of critical periods with start, end, and risk metrics
-        """
-        if not time_series_results:
-            return []
-            
-        # Calculate volatility at each time point
-        num_timepoints = len(time_series_results[0])
-        volatility = []
-        
-        for t in range(num_timepoints):
-            values_at_t = [sim[t] for sim in time_series_results if t < len(sim)]
-            if len(values_at_t) >= 2:
-                vol = statistics.stdev(values_at_t)
-                volatility.append(vol)
-            else:
-                volatility.append(0)
-                
-        # Identify periods where volatility exceeds threshold
-        avg_vol = statistics.mean(volatility) if volatility else 0
-        threshold = percentile_threshold * max(volatility) if volatility else 0
-        
-        critical_periods = []
-        in_critical_period = False
-        start_idx = 0
-        
-        for i, vol in enumerate(volatility):
-            if vol > threshold and not in_critical_period:
-                in_critical_period = True
-                start_idx = i
-            elif vol <= threshold and in_critical_period:
-                in_critical_period = False
-                critical_periods.append({
-                    "start_time": start_idx,
-                    "end_time": i - 1,
-                    "peak_volatility": max(volatility[start_idx:i]),
-                    "average_volatility": statistics.mean(volatility[start_idx:i]),
-                    "volatility_vs_average": max(volatility[start_idx:i]) / avg_vol if avg_vol > 0 else 0
-                })
-                
-        # Handle case where we end while still in a critical period
-        if in_critical_period:
-            critical_periods.append({
-                "start_time": start_idx,
-                "end_time": len(volatility) - 1,
-                "peak_volatility": max(volatility[start_idx:]),
-                "average_volatility": statistics.mean(volatility[start_idx:]),
-                "volatility_vs_average": max(volatility[start_idx:]) / avg_vol if avg_vol > 0 else 0
-            })
-            
-        return critical_periods
+    def years(self) -> int:
+        """Whole years to simulate."""
+        return int(math.ceil(self.years_available))
+
 
 class GoalProbabilityAnalyzer:
     """
@@ -714,7 +265,23 @@ class GoalProbabilityAnalyzer:
         'quarterly': 1.02,  # Quarterly SIP
         'annual': 0.98      # Annual lump sum slightly disadvantaged
     }
-    
+
+    # Annual growth in SIP contributions assumed by each goal handler
+    CONTRIBUTION_GROWTH_RATES = {
+        'retirement': 0.05,
+        'education': 0.03,
+        'home_purchase': 0.04,
+        'emergency_fund': 0.0,
+        'wedding': 0.02,
+        'charitable_giving': 0.03,
+        'legacy_planning': 0.03,
+        'discretionary': 0.01,
+        'custom': 0.02
+    }
+
+    # Percentiles reported by every goal simulation
+    CONFIDENCE_LEVELS = [0.10, 0.25, 0.50, 0.75, 0.90]
+
     def __init__(self, financial_parameter_service=None):
         """
         Initialize the goal probability analyzer.
@@ -735,9 +302,6 @@ class GoalProbabilityAnalyzer:
         
         # Get goal calculator factory
         self.calculator_factory = GoalCalculator.get_calculator_for_goal
-        
-        # Initialize goal-specific analysis components
-        self.outcome_distributions = {}  # Store distribution objects by goal ID
     
     def get_parameter(self, param_path: str, default=None, profile_id=None) -> Any:
         """
@@ -918,7 +482,7 @@ class GoalProbabilityAnalyzer:
         # Check if parameters have significantly changed and invalidate cache if needed
         if use_cache and goal.get('invalidate_cache', False):
             logger.info("Invalidating simulation cache due to significant parameter changes")
-            invalidate_cache(f"goal_{goal.get('id', '')}")
+            invalidate_tags(goal_tag(goal.get('id', '')))
             goal.pop('invalidate_cache', None)  # Remove flag after use
         """
         Analyze success probability for a goal using Monte Carlo simulations.
@@ -1006,15 +570,7 @@ class GoalProbabilityAnalyzer:
                 return result
             
             # Validate simulations parameter 
-            if not isinstance(simulations, int) or simulations < 1:
-                logger.warning(f"Invalid simulations count {simulations}, using default 1000")
-                simulations = 1000
-            elif simulations < 500:
-                logger.warning(f"Simulation count {simulations} is too low for stable results, increasing to 500")
-                simulations = 500
-            elif simulations > 10000:
-                logger.warning(f"Excessive simulations count {simulations}, capping at 10000")
-                simulations = 10000
+            simulations = self._validate_simulation_count(simulations)
             
             # Log all key goal parameters for diagnostics
             logger.info(f"[DIAGNOSTIC] Goal analysis for: {goal.get('id', 'unknown')}, "
@@ -1033,10 +589,9 @@ class GoalProbabilityAnalyzer:
                 logger.info(f"[PARAM] asset_allocation: {goal['asset_allocation']}")
                 diagnostics["parameters"]["asset_allocation"] = goal['asset_allocation']
                 
-            # Set random seed for deterministic testing
-            random_seed = 42
-            np.random.seed(random_seed)
-            logger.info(f"[DIAGNOSTIC] Setting random seed to {random_seed} for deterministic testing")
+            # Simulations draw from private streams derived from this base seed
+            random_seed = DEFAULT_SEED
+            logger.info(f"[DIAGNOSTIC] Using base random seed {random_seed} for deterministic streams")
             diagnostics["random_seed"] = random_seed
                 
             # Validate required goal parameters with descriptive errors
@@ -1057,26 +612,18 @@ class GoalProbabilityAnalyzer:
                 # Continue with defaults rather than returning early
             
             # Validate numeric parameters
-            for param in ['target_amount', 'current_amount']:
-                if param in goal:
-                    try:
-                        value = float(goal[param])
-                        if value < 0:
-                            logger.warning(f"Negative value for {param}: {value}, using 0")
-                            goal[param] = 0
-                    except (ValueError, TypeError):
-                        logger.error(f"Invalid {param} value: {goal.get(param)}, using 0")
-                        goal[param] = 0
+            self._sanitize_goal_amounts(goal)
             
             # Get goal category to determine which specialized handler to use
             category = goal.get('category', 'custom').lower().replace(' ', '_')
+            kind = self._goal_handler_kind(category)
             
-            # Get goal ID for tracking distributions
+            # Get goal ID for logging
             goal_id = goal.get('id', str(hash(str(goal))))
             
-            # Initialize distribution object for this goal if not exists
-            if goal_id not in self.outcome_distributions:
-                self.outcome_distributions[goal_id] = GoalOutcomeDistribution()
+            # Outcome distribution for this call only: the analyzer is shared by
+            # concurrent requests, so nothing per-goal is kept on it
+            distribution = GoalOutcomeDistribution()
             
             # Call the appropriate analysis method based on category
             result_dict = None
@@ -1086,23 +633,23 @@ class GoalProbabilityAnalyzer:
                 # Track start time for performance measurement
                 category_start_time = time.time()
                 
-                if category == 'retirement' or category == 'early_retirement':
+                if kind == 'retirement':
                     result_dict = self.analyze_retirement_goal(goal, profile, simulations, use_parallel, use_cache)
-                elif category == 'education':
+                elif kind == 'education':
                     result_dict = self.analyze_education_goal(goal, profile, simulations, use_parallel, use_cache)
-                elif category == 'emergency_fund':
+                elif kind == 'emergency_fund':
                     result_dict = self.analyze_emergency_fund_goal(goal, profile, simulations, use_parallel, use_cache)
-                elif category == 'home_purchase':
+                elif kind == 'home_purchase':
                     result_dict = self.analyze_home_goal(goal, profile, simulations, use_parallel, use_cache)
-                elif category == 'debt_repayment':
+                elif kind == 'debt_repayment':
                     result_dict = self.analyze_debt_goal(goal, profile, simulations, use_parallel, use_cache)
-                elif category == 'wedding':
+                elif kind == 'wedding':
                     result_dict = self.analyze_wedding_goal(goal, profile, simulations, use_parallel, use_cache)
-                elif category == 'charitable_giving':
+                elif kind == 'charitable_giving':
                     result_dict = self.analyze_charitable_goal(goal, profile, simulations, use_parallel, use_cache)
-                elif category == 'legacy_planning':
+                elif kind == 'legacy_planning':
                     result_dict = self.analyze_legacy_goal(goal, profile, simulations, use_parallel, use_cache)
-                elif category in ['travel', 'vehicle', 'discretionary']:
+                elif kind == 'discretionary':
                     result_dict = self.analyze_discretionary_goal(goal, profile, simulations, use_parallel, use_cache)
                 else:
                     # Default to generic goal analysis
@@ -1172,22 +719,7 @@ class GoalProbabilityAnalyzer:
                     }
                 
             # Convert legacy dictionary format to ProbabilityResult
-            result = self._convert_to_probability_result(result_dict, goal, profile)
-            
-            # Ensure all required values are present in the result, especially for goal-specific metrics
-            if category == 'education' and "education_inflation_impact" not in result.goal_specific_metrics:
-                # Add default education inflation impact metrics
-                result.goal_specific_metrics["education_inflation_impact"] = {
-                    "annual_rate": self.get_parameter('inflation.education', 0.08),
-                    "impact_percentage": 0.0,
-                    "inflated_target": goal.get('target_amount', 0)
-                }
-                
-            # Ensure success probability is valid
-            if not isinstance(result.success_probability, (int, float)) or not (0 <= result.success_probability <= 1):
-                logger.warning(f"[DIAGNOSTIC] Invalid success_probability value: {result.success_probability}, "
-                              f"setting to 0.0")
-                result.success_metrics["success_probability"] = 0.0
+            result = self._finish_probability_result(result_dict, goal, profile, category, distribution)
             
             # Log final analysis results
             logger.info(f"[RESULTS] goal_id={goal_id}, "
@@ -1216,8 +748,101 @@ class GoalProbabilityAnalyzer:
             
             return result
         
+    def _validate_simulation_count(self, simulations: Any) -> int:
+        """
+        Clamp a requested simulation count to the supported range.
+        
+        Args:
+            simulations: Requested number of Monte Carlo simulations
+            
+        Returns:
+            Simulation count between 500 and 10000 (1000 if invalid)
+        """
+        if not isinstance(simulations, int) or simulations < 1:
+            logger.warning(f"Invalid simulations count {simulations}, using default 1000")
+            return 1000
+        if simulations < 500:
+            logger.warning(f"Simulation count {simulations} is too low for stable results, increasing to 500")
+            return 500
+        if simulations > 10000:
+            logger.warning(f"Excessive simulations count {simulations}, capping at 10000")
+            return 10000
+        return simulations
+    
+    def _sanitize_goal_amounts(self, goal: Dict[str, Any]) -> None:
+        """
+        Replace negative or non-numeric target and current amounts with 0.
+        
+        Args:
+            goal: Goal data dictionary, updated in place
+        """
+        for param in ['target_amount', 'current_amount']:
+            if param in goal:
+                try:
+                    value = float(goal[param])
+                    if value < 0:
+                        logger.warning(f"Negative value for {param}: {value}, using 0")
+                        goal[param] = 0
+                except (ValueError, TypeError):
+                    logger.error(f"Invalid {param} value: {goal.get(param)}, using 0")
+                    goal[param] = 0
+    
+    def _goal_handler_kind(self, category: str) -> str:
+        """
+        Name of the handler that analyzes a goal category.
+        
+        Args:
+            category: Normalized goal category
+            
+        Returns:
+            Handler kind, a key of CONTRIBUTION_GROWTH_RATES or 'debt_repayment'
+        """
+        if category in ('retirement', 'early_retirement'):
+            return 'retirement'
+        if category in ('travel', 'vehicle', 'discretionary'):
+            return 'discretionary'
+        if category == 'debt_repayment' or category in self.CONTRIBUTION_GROWTH_RATES:
+            return category
+        return 'custom'
+    
+    def _finish_probability_result(self, result_dict: Dict[str, Any], goal: Dict[str, Any],
+                                   profile: Dict[str, Any], category: str,
+                                   distribution: GoalOutcomeDistribution) -> ProbabilityResult:
+        """
+        Convert a handler's result dictionary into the final ProbabilityResult.
+        
+        Args:
+            result_dict: Result dictionary from a category handler
+            goal: Goal data dictionary
+            profile: User profile information
+            category: Normalized goal category
+            distribution: Outcome distribution for this analysis
+            
+        Returns:
+            ProbabilityResult with category defaults filled in
+        """
+        result = self._convert_to_probability_result(result_dict, goal, profile, distribution)
+        
+        # Ensure all required values are present in the result, especially for goal-specific metrics
+        if category == 'education' and "education_inflation_impact" not in result.goal_specific_metrics:
+            # Add default education inflation impact metrics
+            result.goal_specific_metrics["education_inflation_impact"] = {
+                "annual_rate": self.get_parameter('inflation.education', 0.08),
+                "impact_percentage": 0.0,
+                "inflated_target": goal.get('target_amount', 0)
+            }
+            
+        # Ensure success probability is valid
+        if not isinstance(result.success_probability, (int, float)) or not (0 <= result.success_probability <= 1):
+            logger.warning(f"[DIAGNOSTIC] Invalid success_probability value: {result.success_probability}, "
+                          f"setting to 0.0")
+            result.success_metrics["success_probability"] = 0.0
+        
+        return result
+        
     def _convert_to_probability_result(self, result_dict: Dict[str, Any], goal: Dict[str, Any], 
-                                    profile: Dict[str, Any]) -> ProbabilityResult:
+                                    profile: Dict[str, Any],
+                                    distribution: Optional[GoalOutcomeDistribution] = None) -> ProbabilityResult:
         """
         Convert legacy result dictionary to structured ProbabilityResult.
         
@@ -1243,6 +868,7 @@ class GoalProbabilityAnalyzer:
                 - current_amount: Current savings
                 
             profile: User profile information dictionary with user data
+            distribution: Outcome distribution for the time-based metrics, if any
             
         Returns:
             Structured ProbabilityResult with standardized fields:
@@ -1320,7 +946,7 @@ class GoalProbabilityAnalyzer:
                 # Note: Removed check for "time_to_goal" to ensure metrics are always added
                 if target_amount > 0:
                     # Add any category-specific time-based analysis
-                    self._add_time_based_metrics(result, goal, profile, category)
+                    self._add_time_based_metrics(result, goal, profile, category, distribution)
             except Exception as e:
                 logger.error(f"Error adding time-based metrics: {str(e)}")
                 # Ensure time_based_metrics exists even on error
@@ -1381,7 +1007,8 @@ class GoalProbabilityAnalyzer:
             return 0.0 if min_val is None else min_val
         
     def _add_time_based_metrics(self, result: ProbabilityResult, goal: Dict[str, Any], 
-                              profile: Dict[str, Any], category: str) -> None:
+                              profile: Dict[str, Any], category: str,
+                              goal_distribution: Optional[GoalOutcomeDistribution] = None) -> None:
         """
         Add time-based metrics to the result based on goal category.
         
@@ -1390,6 +1017,7 @@ class GoalProbabilityAnalyzer:
             goal: Goal information
             profile: User profile information
             category: Goal category
+            goal_distribution: Outcome distribution from this analysis, if any
         """
         # Common time-based metrics
         calculator = self.calculator_factory(goal)
@@ -1434,7 +1062,6 @@ class GoalProbabilityAnalyzer:
         time_metrics = {}
         
         # Calculate probability evolution over time
-        goal_distribution = self.outcome_distributions.get(goal.get('id', str(hash(str(goal)))))
         if goal_distribution and timepoints:
             try:
                 time_metrics["probability_evolution"] = goal_distribution.calculate_probability_at_timepoints(
@@ -2546,80 +2173,16 @@ class GoalProbabilityAnalyzer:
         Returns:
             Dictionary with retirement goal probability metrics
         """
-        # Get specific retirement calculator
-        calculator = self.calculator_factory(goal)
-        
-        # Calculate required amount if not set
-        target_amount = goal.get('target_amount', 0)
-        if target_amount <= 0:
-            target_amount = calculator.calculate_amount_needed(goal, profile)
-            
-        current_amount = goal.get('current_amount', 0)
-        months_available = calculator.calculate_time_available(goal, profile)
-        years_available = months_available / 12
-        
-        # Extract risk profile for allocation
-        risk_profile = self._extract_risk_profile(profile)
-        allocation = calculator.get_recommended_allocation(goal, profile)
-        
-        # Check if target date and monthly contributions are feasible
-        if current_amount >= target_amount:
-            # Already achieved
-            return self._create_success_result(1.0, 0.0, target_amount, target_amount)
-            
-        if months_available <= 0:
-            # No time left
-            return self._create_success_result(0.0, 1.0, current_amount, target_amount)
-        
-        # Calculate required monthly contribution
-        monthly_contribution = calculator.calculate_monthly_contribution(goal, profile)
-        
-        # Create asset allocation and contribution pattern for projection
-        allocation_strategy = self._create_allocation_strategy(allocation)
-        contribution_pattern = ContributionPattern(
-            annual_amount=monthly_contribution * 12,
-            growth_rate=0.05,  # 5% annual growth in contributions
-            frequency="monthly"
-        )
+        inputs = self._prepare_goal_simulation(goal, profile, 'retirement')
+        if inputs.outcome is not None:
+            # Already achieved, or no time left
+            return inputs.outcome
         
         # Run Monte Carlo simulation
-        result = self._run_monte_carlo(
-            initial_amount=current_amount,
-            contribution_pattern=contribution_pattern,
-            years=int(math.ceil(years_available)),
-            allocation_strategy=allocation_strategy,
-            simulations=simulations,
-            confidence_levels=[0.10, 0.25, 0.50, 0.75, 0.90],
-            use_parallel=use_parallel
-        )
-        
-        # Calculate success metrics
-        success_probability = self._calculate_success_probability(result, target_amount, simulations)
-        shortfall_risk = self._calculate_shortfall_risk(result, target_amount, simulations)
-        
-        # Add Indian retirement specifics (EPF, NPS)
-        results = self._create_success_result(
-            success_probability, 
-            shortfall_risk,
-            result.projected_values[-1],  # Expected outcome (median)
-            target_amount
-        )
+        result = self._simulate_goal(inputs, simulations, use_parallel)
         
-        # Add Indian-specific retirement metrics
-        results['sip_efficiency'] = self._calculate_sip_efficiency('monthly', years_available)
-        results['inflation_risk'] = self._calculate_inflation_impact(years_available)
-        results['epf_nps_contribution'] = self._estimate_epf_nps_contribution(profile, years_available)
-        
-        # Add detailed distribution data
-        results['distribution'] = {
-            'percentile_10': float(result.confidence_intervals['P10'][-1]),
-            'percentile_25': float(result.confidence_intervals['P25'][-1]),
-            'percentile_50': float(result.confidence_intervals['P50'][-1]),
-            'percentile_75': float(result.confidence_intervals['P75'][-1]), 
-            'percentile_90': float(result.confidence_intervals['P90'][-1])
-        }
-        
-        return results
+        # Success metrics, category metrics and distribution data
+        return self._complete_goal_simulation(inputs, result, goal, profile, simulations)
     
     def analyze_education_goal(self, goal: Dict[str, Any], profile: Dict[str, Any], 
                              simulations: int = 500, use_parallel: bool = False, use_cache: bool = True) -> Dict[str, Any]:
@@ -2641,38 +2204,10 @@ class GoalProbabilityAnalyzer:
         Returns:
             Dictionary with education goal probability metrics
         """
-        # Get education calculator
-        calculator = self.calculator_factory(goal)
-        
-        # Calculate required amount if not set
-        target_amount = goal.get('target_amount', 0)
-        if target_amount <= 0:
-            target_amount = calculator.calculate_amount_needed(goal, profile)
-            
-        current_amount = goal.get('current_amount', 0)
-        months_available = calculator.calculate_time_available(goal, profile)
-        years_available = months_available / 12
-        
-        # Get recommended allocation
-        allocation = calculator.get_recommended_allocation(goal, profile)
-        
-        # Check if goal is already achieved or no time left
-        if current_amount >= target_amount:
-            return self._create_success_result(1.0, 0.0, target_amount, target_amount)
-            
-        if months_available <= 0:
-            return self._create_success_result(0.0, 1.0, current_amount, target_amount)
-        
-        # Calculate required monthly contribution
-        monthly_contribution = calculator.calculate_monthly_contribution(goal, profile)
-        
-        # Create allocation strategy and contribution pattern
-        allocation_strategy = self._create_allocation_strategy(allocation)
-        contribution_pattern = ContributionPattern(
-            annual_amount=monthly_contribution * 12,
-            growth_rate=0.03,  # 3% annual growth in contributions
-            frequency="monthly"
-        )
+        inputs = self._prepare_goal_simulation(goal, profile, 'education')
+        if inputs.outcome is not None:
+            # Already achieved, or no time left
+            return inputs.outcome
         
         # Run Monte Carlo simulation with special education inflation adjustment
         # Education inflation in India is higher than general inflation
@@ -2680,48 +2215,13 @@ class GoalProbabilityAnalyzer:
         original_inflation = self.projection_engine.inflation_rate
         self.projection_engine.inflation_rate = education_inflation
         
-        result = self._run_monte_carlo(
-            initial_amount=current_amount,
-            contribution_pattern=contribution_pattern,
-            years=int(math.ceil(years_available)),
-            allocation_strategy=allocation_strategy,
-            simulations=simulations,
-            confidence_levels=[0.10, 0.25, 0.50, 0.75, 0.90],
-            use_parallel=use_parallel
-        )
+        result = self._simulate_goal(inputs, simulations, use_parallel)
         
         # Restore original inflation rate
         self.projection_engine.inflation_rate = original_inflation
         
-        # Calculate success metrics
-        success_probability = self._calculate_success_probability(result, target_amount, simulations)
-        shortfall_risk = self._calculate_shortfall_risk(result, target_amount, simulations)
-        
-        # Create result
-        results = self._create_success_result(
-            success_probability, 
-            shortfall_risk,
-            result.projected_values[-1],  # Expected outcome (median)
-            target_amount
-        )
-        
-        # Add education-specific metrics for Indian context
-        # Ensure education_inflation is a float
-        education_inflation_rate = float(education_inflation) if isinstance(education_inflation, (int, float)) else 0.08
-        results['education_inflation_impact'] = (1 + education_inflation_rate) ** years_available
-        results['sip_efficiency'] = self._calculate_sip_efficiency('monthly', years_available)
-        results['scholarship_potential'] = self._estimate_scholarship_potential(goal)
-        
-        # Add detailed distribution data
-        results['distribution'] = {
-            'percentile_10': float(result.confidence_intervals['P10'][-1]),
-            'percentile_25': float(result.confidence_intervals['P25'][-1]),
-            'percentile_50': float(result.confidence_intervals['P50'][-1]),
-            'percentile_75': float(result.confidence_intervals['P75'][-1]), 
-            'percentile_90': float(result.confidence_intervals['P90'][-1])
-        }
-        
-        return results
+        # Success metrics, category metrics and distribution data
+        return self._complete_goal_simulation(inputs, result, goal, profile, simulations)
     
     def analyze_home_goal(self, goal: Dict[str, Any], profile: Dict[str, Any], 
                          simulations: int = 1000, use_parallel: bool = False, use_cache: bool = True) -> Dict[str, Any]:
@@ -2737,80 +2237,16 @@ class GoalProbabilityAnalyzer:
         Returns:
             Dictionary with home purchase goal probability metrics
         """
-        # Get home purchase calculator
-        calculator = self.calculator_factory(goal)
-        
-        # Calculate required amount if not set
-        target_amount = goal.get('target_amount', 0)
-        if target_amount <= 0:
-            target_amount = calculator.calculate_amount_needed(goal, profile)
-            
-        current_amount = goal.get('current_amount', 0)
-        months_available = calculator.calculate_time_available(goal, profile)
-        years_available = months_available / 12
-        
-        # Get recommended allocation
-        allocation = calculator.get_recommended_allocation(goal, profile)
-        
-        # Check if goal is already achieved or no time left
-        if current_amount >= target_amount:
-            return self._create_success_result(1.0, 0.0, target_amount, target_amount)
-            
-        if months_available <= 0:
-            return self._create_success_result(0.0, 1.0, current_amount, target_amount)
-        
-        # Calculate required monthly contribution
-        monthly_contribution = calculator.calculate_monthly_contribution(goal, profile)
-        
-        # Create allocation strategy and contribution pattern
-        allocation_strategy = self._create_allocation_strategy(allocation)
-        contribution_pattern = ContributionPattern(
-            annual_amount=monthly_contribution * 12,
-            growth_rate=0.04,  # 4% annual growth in contributions
-            frequency="monthly"
-        )
+        inputs = self._prepare_goal_simulation(goal, profile, 'home_purchase')
+        if inputs.outcome is not None:
+            # Already achieved, or no time left
+            return inputs.outcome
         
         # Run Monte Carlo simulation
-        result = self._run_monte_carlo(
-            initial_amount=current_amount,
-            contribution_pattern=contribution_pattern,
-            years=int(math.ceil(years_available)),
-            allocation_strategy=allocation_strategy,
-            simulations=simulations,
-            confidence_levels=[0.10, 0.25, 0.50, 0.75, 0.90],
-            use_parallel=use_parallel
-        )
-        
-        # Calculate success metrics
-        success_probability = self._calculate_success_probability(result, target_amount, simulations)
-        shortfall_risk = self._calculate_shortfall_risk(result, target_amount, simulations)
-        
-        # Create result
-        results = self._create_success_result(
-            success_probability, 
-            shortfall_risk,
-            result.projected_values[-1],  # Expected outcome (median)
-            target_amount
-        )
-        
-        # Add home purchase specific metrics for Indian context
-        property_appreciation = self.get_parameter('housing.price_increase_rate', 0.08)
-        target_with_appreciation = target_amount * ((1 + property_appreciation) ** years_available)
-        
-        results['property_appreciation_factor'] = target_with_appreciation / target_amount
-        results['sip_efficiency'] = self._calculate_sip_efficiency('monthly', years_available)
-        results['loan_eligibility_ratio'] = self._estimate_loan_eligibility_ratio(profile)
+        result = self._simulate_goal(inputs, simulations, use_parallel)
         
-        # Add detailed distribution data
-        results['distribution'] = {
-            'percentile_10': float(result.confidence_intervals['P10'][-1]),
-            'percentile_25': float(result.confidence_intervals['P25'][-1]),
-            'percentile_50': float(result.confidence_intervals['P50'][-1]),
-            'percentile_75': float(result.confidence_intervals['P75'][-1]), 
-            'percentile_90': float(result.confidence_intervals['P90'][-1])
-        }
-        
-        return results
+        # Success metrics, category metrics and distribution data
+        return self._complete_goal_simulation(inputs, result, goal, profile, simulations)
     
     def analyze_emergency_fund_goal(self, goal: Dict[str, Any], profile: Dict[str, Any], 
                                   simulations: int = 1000, use_parallel: bool = False, use_cache: bool = True) -> Dict[str, Any]:
@@ -2825,77 +2261,16 @@ class GoalProbabilityAnalyzer:
         Returns:
             Dictionary with emergency fund goal probability metrics
         """
-        # Get emergency fund calculator
-        calculator = self.calculator_factory(goal)
-        
-        # Calculate required amount if not set
-        target_amount = goal.get('target_amount', 0)
-        if target_amount <= 0:
-            target_amount = calculator.calculate_amount_needed(goal, profile)
-            
-        current_amount = goal.get('current_amount', 0)
-        months_available = calculator.calculate_time_available(goal, profile)
-        years_available = months_available / 12
-        
-        # Get recommended allocation (should be conservative for emergency funds)
-        allocation = calculator.get_recommended_allocation(goal, profile)
-        
-        # Check if goal is already achieved or no time left
-        if current_amount >= target_amount:
-            return self._create_success_result(1.0, 0.0, target_amount, target_amount)
-            
-        if months_available <= 0:
-            return self._create_success_result(0.0, 1.0, current_amount, target_amount)
-        
-        # Calculate required monthly contribution
-        monthly_contribution = calculator.calculate_monthly_contribution(goal, profile)
-        
-        # Create allocation strategy and contribution pattern
-        allocation_strategy = self._create_allocation_strategy(allocation)
-        contribution_pattern = ContributionPattern(
-            annual_amount=monthly_contribution * 12,
-            growth_rate=0.0,  # No growth in contributions
-            frequency="monthly"
-        )
+        inputs = self._prepare_goal_simulation(goal, profile, 'emergency_fund')
+        if inputs.outcome is not None:
+            # Already achieved, or no time left
+            return inputs.outcome
         
         # Run Monte Carlo simulation
-        result = self._run_monte_carlo(
-            initial_amount=current_amount,
-            contribution_pattern=contribution_pattern,
-            years=int(math.ceil(years_available)),
-            allocation_strategy=allocation_strategy,
-            simulations=simulations,
-            confidence_levels=[0.10, 0.25, 0.50, 0.75, 0.90],
-            use_parallel=use_parallel
-        )
-        
-        # Calculate success metrics
-        success_probability = self._calculate_success_probability(result, target_amount, simulations)
-        shortfall_risk = self._calculate_shortfall_risk(result, target_amount, simulations)
-        
-        # Create result
-        results = self._create_success_result(
-            success_probability, 
-            shortfall_risk,
-            result.projected_values[-1],  # Expected outcome (median)
-            target_amount
-        )
-        
-        # Add emergency fund specific metrics
-        results['liquidity_ratio'] = self._calculate_liquidity_ratio(profile, current_amount)
-        results['current_coverage_months'] = self._calculate_emergency_coverage(profile, current_amount)
-        results['target_coverage_months'] = self._calculate_emergency_coverage(profile, target_amount)
-        
-        # Add detailed distribution data
-        results['distribution'] = {
-            'percentile_10': float(result.confidence_intervals['P10'][-1]),
-            'percentile_25': float(result.confidence_intervals['P25'][-1]),
-            'percentile_50': float(result.confidence_intervals['P50'][-1]),
-            'percentile_75': float(result.confidence_intervals['P75'][-1]), 
-            'percentile_90': float(result.confidence_intervals['P90'][-1])
-        }
+        result = self._simulate_goal(inputs, simulations, use_parallel)
         
-        return results
+        # Success metrics, category metrics and distribution data
+        return self._complete_goal_simulation(inputs, result, goal, profile, simulations)
     
     def analyze_debt_goal(self, goal: Dict[str, Any], profile: Dict[str, Any], 
                         simulations: int = 1000, use_parallel: bool = False, use_cache: bool = True) -> Dict[str, Any]:
@@ -3026,76 +2401,16 @@ class GoalProbabilityAnalyzer:
         Returns:
             Dictionary with wedding goal probability metrics
         """
-        # Get wedding calculator
-        calculator = self.calculator_factory(goal)
-        
-        # Calculate required amount if not set
-        target_amount = goal.get('target_amount', 0)
-        if target_amount <= 0:
-            target_amount = calculator.calculate_amount_needed(goal, profile)
-            
-        current_amount = goal.get('current_amount', 0)
-        months_available = calculator.calculate_time_available(goal, profile)
-        years_available = months_available / 12
-        
-        # Get recommended allocation
-        allocation = calculator.get_recommended_allocation(goal, profile)
-        
-        # Check if goal is already achieved or no time left
-        if current_amount >= target_amount:
-            return self._create_success_result(1.0, 0.0, target_amount, target_amount)
-            
-        if months_available <= 0:
-            return self._create_success_result(0.0, 1.0, current_amount, target_amount)
-        
-        # Calculate required monthly contribution
-        monthly_contribution = calculator.calculate_monthly_contribution(goal, profile)
-        
-        # Create allocation strategy and contribution pattern
-        allocation_strategy = self._create_allocation_strategy(allocation)
-        contribution_pattern = ContributionPattern(
-            annual_amount=monthly_contribution * 12,
-            growth_rate=0.02,  # 2% annual growth in contributions
-            frequency="monthly"
-        )
+        inputs = self._prepare_goal_simulation(goal, profile, 'wedding')
+        if inputs.outcome is not None:
+            # Already achieved, or no time left
+            return inputs.outcome
         
         # Run Monte Carlo simulation
-        result = self._run_monte_carlo(
-            initial_amount=current_amount,
-            contribution_pattern=contribution_pattern,
-            years=int(math.ceil(years_available)),
-            allocation_strategy=allocation_strategy,
-            simulations=simulations,
-            confidence_levels=[0.10, 0.25, 0.50, 0.75, 0.90],
-            use_parallel=use_parallel
-        )
-        
-        # Calculate success metrics
-        success_probability = self._calculate_success_probability(result, target_amount, simulations)
-        shortfall_risk = self._calculate_shortfall_risk(result, target_amount, simulations)
-        
-        # Create result
-        results = self._create_success_result(
-            success_probability, 
-            shortfall_risk,
-            result.projected_values[-1],  # Expected outcome (median)
-            target_amount
-        )
-        
-        # Add wedding specific metrics for Indian context
-        results['sip_efficiency'] = self._calculate_sip_efficiency('monthly', years_available)
-        results['wedding_inflation_factor'] = (1 + 0.09) ** years_available  # 9% wedding inflation
-        
-        # Add detailed distribution data
-        results['distribution'] = {
-            'percentile_10': float(result.confidence_intervals['P10'][-1]),
-            'percentile_25': float(result.confidence_intervals['P25'][-1]),
-            'percentile_50': float(result.confidence_intervals['P50'][-1]),
-            'percentile_75': float(result.confidence_intervals['P75'][-1]), 
-            'percentile_90': float(result.confidence_intervals['P90'][-1])
-        }
+        result = self._simulate_goal(inputs, simulations, use_parallel)
         
-        return results
+        # Success metrics, category metrics and distribution data
+        return self._complete_goal_simulation(inputs, result, goal, profile, simulations)
     
     def analyze_charitable_goal(self, goal: Dict[str, Any], profile: Dict[str, Any], 
                               simulations: int = 1000, use_parallel: bool = False, use_cache: bool = True) -> Dict[str, Any]:
@@ -3110,75 +2425,16 @@ class GoalProbabilityAnalyzer:
         Returns:
             Dictionary with charitable giving goal probability metrics
         """
-        # Get charitable giving calculator
-        calculator = self.calculator_factory(goal)
-        
-        # Calculate required amount if not set
-        target_amount = goal.get('target_amount', 0)
-        if target_amount <= 0:
-            target_amount = calculator.calculate_amount_needed(goal, profile)
-            
-        current_amount = goal.get('current_amount', 0)
-        months_available = calculator.calculate_time_available(goal, profile)
-        years_available = months_available / 12
-        
-        # Get recommended allocation
-        allocation = calculator.get_recommended_allocation(goal, profile)
-        
-        # Check if goal is already achieved or no time left
-        if current_amount >= target_amount:
-            return self._create_success_result(1.0, 0.0, target_amount, target_amount)
-            
-        if months_available <= 0:
-            return self._create_success_result(0.0, 1.0, current_amount, target_amount)
-        
-        # Calculate required monthly contribution
-        monthly_contribution = calculator.calculate_monthly_contribution(goal, profile)
-        
-        # Create allocation strategy and contribution pattern
-        allocation_strategy = self._create_allocation_strategy(allocation)
-        contribution_pattern = ContributionPattern(
-            annual_amount=monthly_contribution * 12,
-            growth_rate=0.03,  # 3% annual growth in contributions
-            frequency="monthly"
-        )
+        inputs = self._prepare_goal_simulation(goal, profile, 'charitable_giving')
+        if inputs.outcome is not None:
+            # Already achieved, or no time left
+            return inputs.outcome
         
         # Run Monte Carlo simulation
-        result = self._run_monte_carlo(
-            initial_amount=current_amount,
-            contribution_pattern=contribution_pattern,
-            years=int(math.ceil(years_available)),
-            allocation_strategy=allocation_strategy,
-            simulations=simulations,
-            confidence_levels=[0.10, 0.25, 0.50, 0.75, 0.90]
-        )
-        
-        # Calculate success metrics
-        success_probability = self._calculate_success_probability(result, target_amount, simulations)
-        shortfall_risk = self._calculate_shortfall_risk(result, target_amount, simulations)
-        
-        # Create result
-        results = self._create_success_result(
-            success_probability, 
-            shortfall_risk,
-            result.projected_values[-1],  # Expected outcome (median)
-            target_amount
-        )
+        result = self._simulate_goal(inputs, simulations)
         
-        # Add charitable giving specific metrics
-        results['sip_efficiency'] = self._calculate_sip_efficiency('monthly', years_available)
-        results['tax_benefit_ratio'] = self._calculate_charitable_tax_benefit(profile, target_amount)
-        
-        # Add detailed distribution data
-        results['distribution'] = {
-            'percentile_10': float(result.confidence_intervals['P10'][-1]),
-            'percentile_25': float(result.confidence_intervals['P25'][-1]),
-            'percentile_50': float(result.confidence_intervals['P50'][-1]),
-            'percentile_75': float(result.confidence_intervals['P75'][-1]), 
-            'percentile_90': float(result.confidence_intervals['P90'][-1])
-        }
-        
-        return results
+        # Success metrics, category metrics and distribution data
+        return self._complete_goal_simulation(inputs, result, goal, profile, simulations)
     
     def analyze_legacy_goal(self, goal: Dict[str, Any], profile: Dict[str, Any], 
                           simulations: int = 1000, use_parallel: bool = False, use_cache: bool = True) -> Dict[str, Any]:
@@ -3193,75 +2449,16 @@ class GoalProbabilityAnalyzer:
         Returns:
             Dictionary with legacy planning goal probability metrics
         """
-        # Get legacy planning calculator
-        calculator = self.calculator_factory(goal)
-        
-        # Calculate required amount if not set
-        target_amount = goal.get('target_amount', 0)
-        if target_amount <= 0:
-            target_amount = calculator.calculate_amount_needed(goal, profile)
-            
-        current_amount = goal.get('current_amount', 0)
-        months_available = calculator.calculate_time_available(goal, profile)
-        years_available = months_available / 12
-        
-        # Get recommended allocation
-        allocation = calculator.get_recommended_allocation(goal, profile)
-        
-        # Check if goal is already achieved or no time left
-        if current_amount >= target_amount:
-            return self._create_success_result(1.0, 0.0, target_amount, target_amount)
-            
-        if months_available <= 0:
-            return self._create_success_result(0.0, 1.0, current_amount, target_amount)
-        
-        # Calculate required monthly contribution
-        monthly_contribution = calculator.calculate_monthly_contribution(goal, profile)
-        
-        # Create allocation strategy and contribution pattern
-        allocation_strategy = self._create_allocation_strategy(allocation)
-        contribution_pattern = ContributionPattern(
-            annual_amount=monthly_contribution * 12,
-            growth_rate=0.03,  # 3% annual growth in contributions
-            frequency="monthly"
-        )
+        inputs = self._prepare_goal_simulation(goal, profile, 'legacy_planning')
+        if inputs.outcome is not None:
+            # Already achieved, or no time left
+            return inputs.outcome
         
         # Run Monte Carlo simulation
-        result = self._run_monte_carlo(
-            initial_amount=current_amount,
-            contribution_pattern=contribution_pattern,
-            years=int(math.ceil(years_available)),
-            allocation_strategy=allocation_strategy,
-            simulations=simulations,
-            confidence_levels=[0.10, 0.25, 0.50, 0.75, 0.90]
-        )
-        
-        # Calculate success metrics
-        success_probability = self._calculate_success_probability(result, target_amount, simulations)
-        shortfall_risk = self._calculate_shortfall_risk(result, target_amount, simulations)
+        result = self._simulate_goal(inputs, simulations)
         
-        # Create result
-        results = self._create_success_result(
-            success_probability, 
-            shortfall_risk,
-            result.projected_values[-1],  # Expected outcome (median)
-            target_amount
-        )
-        
-        # Add legacy planning specific metrics
-        results['sip_efficiency'] = self._calculate_sip_efficiency('monthly', years_available)
-        results['estate_tax_efficiency'] = self._calculate_estate_tax_efficiency(target_amount)
-        
-        # Add detailed distribution data
-        results['distribution'] = {
-            'percentile_10': float(result.confidence_intervals['P10'][-1]),
-            'percentile_25': float(result.confidence_intervals['P25'][-1]),
-            'percentile_50': float(result.confidence_intervals['P50'][-1]),
-            'percentile_75': float(result.confidence_intervals['P75'][-1]), 
-            'percentile_90': float(result.confidence_intervals['P90'][-1])
-        }
-        
-        return results
+        # Success metrics, category metrics and distribution data
+        return self._complete_goal_simulation(inputs, result, goal, profile, simulations)
     
     def analyze_discretionary_goal(self, goal: Dict[str, Any], profile: Dict[str, Any], 
                                  simulations: int = 1000, use_parallel: bool = False, use_cache: bool = True) -> Dict[str, Any]:
@@ -3276,90 +2473,171 @@ class GoalProbabilityAnalyzer:
         Returns:
             Dictionary with discretionary spending goal probability metrics
         """
-        # Get discretionary spending calculator
-        calculator = self.calculator_factory(goal)
+        inputs = self._prepare_goal_simulation(goal, profile, 'discretionary')
+        if inputs.outcome is not None:
+            # Already achieved, or no time left
+            return inputs.outcome
         
-        # Calculate required amount if not set
-        target_amount = goal.get('target_amount', 0)
-        if target_amount <= 0:
-            target_amount = calculator.calculate_amount_needed(goal, profile)
-            
-        current_amount = goal.get('current_amount', 0)
-        months_available = calculator.calculate_time_available(goal, profile)
-        years_available = months_available / 12
+        # Run Monte Carlo simulation
+        result = self._simulate_goal(inputs, simulations)
         
-        # Get recommended allocation
-        allocation = calculator.get_recommended_allocation(goal, profile)
+        # Success metrics, category metrics and distribution data
+        return self._complete_goal_simulation(inputs, result, goal, profile, simulations)
+    
+    def analyze_custom_goal(self, goal: Dict[str, Any], profile: Dict[str, Any], 
+                          simulations: int = 1000, use_parallel: bool = False, use_cache: bool = True) -> Dict[str, Any]:
+        """
+        Analyze custom goal probability.
         
-        # Check if goal is already achieved or no time left
-        if current_amount >= target_amount:
-            return self._create_success_result(1.0, 0.0, target_amount, target_amount)
+        Args:
+            goal: Custom goal details
+            profile: User profile information
+            simulations: Number of Monte Carlo simulations to run
             
-        if months_available <= 0:
-            return self._create_success_result(0.0, 1.0, current_amount, target_amount)
+        Returns:
+            Dictionary with custom goal probability metrics
+        """
+        inputs = self._prepare_goal_simulation(goal, profile, 'custom')
+        if inputs.outcome is not None:
+            # Already achieved, or no time left
+            return inputs.outcome
         
-        # Calculate required monthly contribution
-        monthly_contribution = calculator.calculate_monthly_contribution(goal, profile)
+        # Run Monte Carlo simulation
+        result = self._simulate_goal(inputs, simulations)
         
-        # Create allocation strategy and contribution pattern
-        allocation_strategy = self._create_allocation_strategy(allocation)
-        contribution_pattern = ContributionPattern(
-            annual_amount=monthly_contribution * 12,
-            growth_rate=0.01,  # 1% annual growth in contributions
-            frequency="monthly"
-        )
+        # Success metrics, category metrics and distribution data
+        return self._complete_goal_simulation(inputs, result, goal, profile, simulations)
+    
+    def analyze_goal_portfolio(self, goals: List[Any], profile: Dict[str, Any],
+                               simulations: int = 1000) -> Dict[str, Any]:
+        """
+        Analyze all of a profile's goals in one batched simulation.
         
-        # Run Monte Carlo simulation
-        result = self._run_monte_carlo(
-            initial_amount=current_amount,
-            contribution_pattern=contribution_pattern,
-            years=int(math.ceil(years_available)),
-            allocation_strategy=allocation_strategy,
-            simulations=simulations,
-            confidence_levels=[0.10, 0.25, 0.50, 0.75, 0.90]
-        )
+        Every goal is simulated against the same draws of market returns
+        (common random numbers) in a single (goals, simulations, years) pass.
+        Each goal's target, contributions and allocation come from
+        _prepare_goal_simulation and its results from _complete_goal_simulation,
+        as in analyze_goal_probability, so both give the same kind of result.
+        Goals that need no simulation (debt repayment, impossible, already
+        achieved or out of time) are analyzed by analyze_goal_probability;
+        debt repayment and impossible goals are left out of the joint metrics.
         
-        # Calculate success metrics
-        success_probability = self._calculate_success_probability(result, target_amount, simulations)
-        shortfall_risk = self._calculate_shortfall_risk(result, target_amount, simulations)
+        Args:
+            goals: Goal data dictionaries or Goal objects
+            profile: User profile information
+            simulations: Number of Monte Carlo simulations to run
+            
+        Returns:
+            Dictionary with:
+                - results: Goal IDs mapped to ProbabilityResult objects
+                - joint_metrics: Probabilities of meeting goals together
+        """
+        asset_classes = list(self.INDIAN_MARKET_RETURNS)
+        asset_returns = [self.INDIAN_MARKET_RETURNS[asset] for asset in asset_classes]
+        simulations = self._validate_simulation_count(simulations)
         
-        # Create result
-        results = self._create_success_result(
-            success_probability, 
-            shortfall_risk,
-            result.projected_values[-1],  # Expected outcome (median)
-            target_amount
+        results = {}
+        simulated = []  # (goal_id, goal_data, category, inputs, contributions, weights)
+        high_priority_ids = []
+        
+        for goal in goals:
+            # Summary fields only: listed goals would each load their blobs
+            goal_data = goal if isinstance(goal, dict) else goal.to_dict(include_blobs=False)
+            goal_id = goal_data.get('id', str(hash(str(goal_data))))
+            if goal_data.get('importance', goal_data.get('priority')) == 'high':
+                high_priority_ids.append(goal_id)
+            
+            category = goal_data.get('category', 'custom').lower().replace(' ', '_')
+            kind = self._goal_handler_kind(category)
+            inputs = None
+            if kind != 'debt_repayment' and not self._is_clearly_impossible_goal(goal_data):
+                try:
+                    self._sanitize_goal_amounts(goal_data)
+                    inputs = self._prepare_goal_simulation(goal_data, profile, kind)
+                except Exception as e:
+                    logger.error(f"Error preparing goal {goal_id} for batch simulation: {str(e)}")
+            
+            # Goals without a simulation get the per-goal analysis's result
+            if inputs is None or inputs.outcome is not None:
+                results[goal_id] = self.analyze_goal_probability(goal_data, profile, simulations)
+                if inputs is not None:
+                    # Still counted in the joint metrics, as a fixed outcome at year 0
+                    simulated.append((goal_id, goal_data, category, inputs,
+                                      np.zeros(0), np.zeros((0, len(asset_classes)))))
+                continue
+            
+            years = inputs.years
+            # Yearly allocation weights along the glide path, in asset_classes order
+            weights = np.array([
+                [self.projection_engine._calculate_allocation_for_year(
+                    inputs.allocation_strategy, year, years).get(asset, 0.0) for asset in asset_classes]
+                for year in range(1, years + 1)
+            ])
+            contributions = build_contribution_vector(inputs.contribution_pattern, years)
+            simulated.append((goal_id, goal_data, category, inputs, contributions, weights))
+        
+        horizons = [0 if inputs.outcome is not None else inputs.years for _, _, _, inputs, _, _ in simulated]
+        horizon = max(horizons, default=0)
+        
+        # Stack goals, zero-padding contributions and weights beyond each horizon
+        all_contributions = np.zeros((len(simulated), horizon))
+        all_weights = np.zeros((len(simulated), horizon, len(asset_classes)))
+        for row, (_, _, _, _, contributions, weights) in enumerate(simulated):
+            all_contributions[row, :horizons[row]] = contributions
+            all_weights[row, :horizons[row]] = weights
+        
+        goal_ids = [entry[0] for entry in simulated]
+        paths = simulate_goal_portfolio(
+            initial_amounts=[entry[3].current_amount for entry in simulated],
+            contributions=all_contributions,
+            weights=all_weights,
+            asset_returns=asset_returns,
+            simulation_count=simulations,
+            rng=get_generator(DEFAULT_SEED, key=('goal_portfolio',) + tuple(sorted(map(str, goal_ids))))
+        )
+        portfolio = GoalPortfolioSimulation(
+            goal_ids, paths,
+            horizons=horizons,
+            target_amounts=[entry[3].target_amount for entry in simulated]
         )
         
-        # Add discretionary spending specific metrics
-        results['sip_efficiency'] = self._calculate_sip_efficiency('monthly', years_available)
-        results['disposable_income_ratio'] = self._calculate_disposable_income_ratio(profile, monthly_contribution)
+        for goal_id, goal_data, category, inputs, _, _ in simulated:
+            if inputs.outcome is not None:
+                continue
+            goal_paths = portfolio.goal_paths(goal_id)
+            projection = self._projection_from_paths(goal_paths, inputs.contribution_pattern)
+            result_dict = self._complete_goal_simulation(inputs, projection, goal_data, profile, simulations)
+            result = self._finish_probability_result(result_dict, goal_data, profile, category,
+                                                     GoalOutcomeDistribution())
+            
+            # Hitting-time metrics from the same paths
+            distribution = GoalOutcomeDistribution(goal_paths[:, -1])
+            distribution.set_paths(goal_paths)
+            result.time_based_metrics["time_to_goal"] = distribution.first_passage(inputs.target_amount).summary()
+            
+            results[goal_id] = result
         
-        # Add detailed distribution data
-        results['distribution'] = {
-            'percentile_10': float(result.confidence_intervals['P10'][-1]),
-            'percentile_25': float(result.confidence_intervals['P25'][-1]),
-            'percentile_50': float(result.confidence_intervals['P50'][-1]),
-            'percentile_75': float(result.confidence_intervals['P75'][-1]), 
-            'percentile_90': float(result.confidence_intervals['P90'][-1])
+        return {
+            "results": results,
+            "joint_metrics": portfolio.joint_metrics(
+                [goal_id for goal_id in high_priority_ids if goal_id in portfolio.goal_ids])
         }
-        
-        return results
     
-    def analyze_custom_goal(self, goal: Dict[str, Any], profile: Dict[str, Any], 
-                          simulations: int = 1000, use_parallel: bool = False, use_cache: bool = True) -> Dict[str, Any]:
+    # Helper methods
+    
+    def _prepare_goal_simulation(self, goal: Dict[str, Any], profile: Dict[str, Any],
+                                 kind: str) -> GoalSimulationInputs:
         """
-        Analyze custom goal probability.
+        Work out a goal's simulation inputs the way its category handler does.
         
         Args:
-            goal: Custom goal details
+            goal: Goal data dictionary
             profile: User profile information
-            simulations: Number of Monte Carlo simulations to run
+            kind: Handler kind from _goal_handler_kind
             
         Returns:
-            Dictionary with custom goal probability metrics
+            GoalSimulationInputs; its outcome is set when no simulation is needed
         """
-        # Get custom goal calculator
         calculator = self.calculator_factory(goal)
         
         # Calculate required amount if not set
@@ -3369,53 +2647,85 @@ class GoalProbabilityAnalyzer:
             
         current_amount = goal.get('current_amount', 0)
         months_available = calculator.calculate_time_available(goal, profile)
-        years_available = months_available / 12
+        inputs = GoalSimulationInputs(kind, target_amount, current_amount,
+                                      months_available, months_available / 12)
         
         # Get recommended allocation
         allocation = calculator.get_recommended_allocation(goal, profile)
         
         # Check if goal is already achieved or no time left
         if current_amount >= target_amount:
-            return self._create_success_result(1.0, 0.0, target_amount, target_amount)
+            inputs.outcome = self._create_success_result(1.0, 0.0, target_amount, target_amount)
+            return inputs
             
         if months_available <= 0:
-            return self._create_success_result(0.0, 1.0, current_amount, target_amount)
+            inputs.outcome = self._create_success_result(0.0, 1.0, current_amount, target_amount)
+            return inputs
         
         # Calculate required monthly contribution
-        monthly_contribution = calculator.calculate_monthly_contribution(goal, profile)
+        inputs.monthly_contribution = calculator.calculate_monthly_contribution(goal, profile)
         
         # Create allocation strategy and contribution pattern
-        allocation_strategy = self._create_allocation_strategy(allocation)
-        contribution_pattern = ContributionPattern(
-            annual_amount=monthly_contribution * 12,
-            growth_rate=0.02,  # 2% annual growth in contributions
+        inputs.allocation_strategy = self._create_allocation_strategy(allocation)
+        inputs.contribution_pattern = ContributionPattern(
+            annual_amount=inputs.monthly_contribution * 12,
+            growth_rate=self.CONTRIBUTION_GROWTH_RATES[kind],
             frequency="monthly"
         )
+        return inputs
+    
+    def _simulate_goal(self, inputs: GoalSimulationInputs, simulations: int,
+                       use_parallel: bool = False) -> Any:
+        """
+        Run the Monte Carlo simulation for prepared goal inputs.
         
-        # Run Monte Carlo simulation
-        result = self._run_monte_carlo(
-            initial_amount=current_amount,
-            contribution_pattern=contribution_pattern,
-            years=int(math.ceil(years_available)),
-            allocation_strategy=allocation_strategy,
+        Args:
+            inputs: Inputs from _prepare_goal_simulation
+            simulations: Number of Monte Carlo simulations to run
+            use_parallel: Whether to use parallel processing
+            
+        Returns:
+            ProjectionResult object with simulation results
+        """
+        return self._run_monte_carlo(
+            initial_amount=inputs.current_amount,
+            contribution_pattern=inputs.contribution_pattern,
+            years=inputs.years,
+            allocation_strategy=inputs.allocation_strategy,
             simulations=simulations,
-            confidence_levels=[0.10, 0.25, 0.50, 0.75, 0.90]
+            confidence_levels=self.CONFIDENCE_LEVELS,
+            use_parallel=use_parallel
         )
+    
+    def _complete_goal_simulation(self, inputs: GoalSimulationInputs, result: Any,
+                                  goal: Dict[str, Any], profile: Dict[str, Any],
+                                  simulations: int) -> Dict[str, Any]:
+        """
+        Build a handler's result dictionary from a goal's simulation.
+        
+        Args:
+            inputs: Inputs from _prepare_goal_simulation
+            result: ProjectionResult with P10-P90 confidence intervals
+            goal: Goal data dictionary
+            profile: User profile information
+            simulations: Number of simulations run
+            
+        Returns:
+            Dictionary with success, category-specific and distribution metrics
+        """
+        target_amount = inputs.target_amount
         
         # Calculate success metrics
         success_probability = self._calculate_success_probability(result, target_amount, simulations)
         shortfall_risk = self._calculate_shortfall_risk(result, target_amount, simulations)
         
-        # Create result
         results = self._create_success_result(
             success_probability, 
             shortfall_risk,
             result.projected_values[-1],  # Expected outcome (median)
             target_amount
         )
-        
-        # Add custom goal specific metrics
-        results['sip_efficiency'] = self._calculate_sip_efficiency('monthly', years_available)
+        results.update(self._goal_specific_metrics(inputs, goal, profile))
         
         # Add detailed distribution data
         results['distribution'] = {
@@ -3428,7 +2738,95 @@ class GoalProbabilityAnalyzer:
         
         return results
     
-    # Helper methods
+    def _goal_specific_metrics(self, inputs: GoalSimulationInputs, goal: Dict[str, Any],
+                               profile: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Category-specific metrics added to a simulated goal's result.
+        
+        Args:
+            inputs: Inputs from _prepare_goal_simulation
+            goal: Goal data dictionary
+            profile: User profile information
+            
+        Returns:
+            Dictionary of metrics for the goal's handler kind
+        """
+        kind = inputs.kind
+        target_amount = inputs.target_amount
+        years_available = inputs.years_available
+        metrics = {}
+        
+        if kind == 'retirement':
+            # Add Indian-specific retirement metrics (EPF, NPS)
+            metrics['sip_efficiency'] = self._calculate_sip_efficiency('monthly', years_available)
+            metrics['inflation_risk'] = self._calculate_inflation_impact(years_available)
+            metrics['epf_nps_contribution'] = self._estimate_epf_nps_contribution(profile, years_available)
+        elif kind == 'education':
+            # Ensure education_inflation is a float
+            education_inflation = self.get_parameter('inflation.education', 0.08)
+            education_inflation_rate = float(education_inflation) if isinstance(education_inflation, (int, float)) else 0.08
+            metrics['education_inflation_impact'] = (1 + education_inflation_rate) ** years_available
+            metrics['sip_efficiency'] = self._calculate_sip_efficiency('monthly', years_available)
+            metrics['scholarship_potential'] = self._estimate_scholarship_potential(goal)
+        elif kind == 'home_purchase':
+            property_appreciation = self.get_parameter('housing.price_increase_rate', 0.08)
+            target_with_appreciation = target_amount * ((1 + property_appreciation) ** years_available)
+            metrics['property_appreciation_factor'] = target_with_appreciation / target_amount
+            metrics['sip_efficiency'] = self._calculate_sip_efficiency('monthly', years_available)
+            metrics['loan_eligibility_ratio'] = self._estimate_loan_eligibility_ratio(profile)
+        elif kind == 'emergency_fund':
+            metrics['liquidity_ratio'] = self._calculate_liquidity_ratio(profile, inputs.current_amount)
+            metrics['current_coverage_months'] = self._calculate_emergency_coverage(profile, inputs.current_amount)
+            metrics['target_coverage_months'] = self._calculate_emergency_coverage(profile, target_amount)
+        elif kind == 'wedding':
+            metrics['sip_efficiency'] = self._calculate_sip_efficiency('monthly', years_available)
+            metrics['wedding_inflation_factor'] = (1 + 0.09) ** years_available  # 9% wedding inflation
+        elif kind == 'charitable_giving':
+            metrics['sip_efficiency'] = self._calculate_sip_efficiency('monthly', years_available)
+            metrics['tax_benefit_ratio'] = self._calculate_charitable_tax_benefit(profile, target_amount)
+        elif kind == 'legacy_planning':
+            metrics['sip_efficiency'] = self._calculate_sip_efficiency('monthly', years_available)
+            metrics['estate_tax_efficiency'] = self._calculate_estate_tax_efficiency(target_amount)
+        elif kind == 'discretionary':
+            metrics['sip_efficiency'] = self._calculate_sip_efficiency('monthly', years_available)
+            metrics['disposable_income_ratio'] = self._calculate_disposable_income_ratio(
+                profile, inputs.monthly_contribution)
+        else:
+            metrics['sip_efficiency'] = self._calculate_sip_efficiency('monthly', years_available)
+        
+        return metrics
+    
+    def _projection_from_paths(self, paths: np.ndarray,
+                               contribution_pattern: ContributionPattern) -> ProjectionResult:
+        """
+        Summarize simulated paths the way project_with_monte_carlo does.
+        
+        Args:
+            paths: Simulated values of shape (simulations, years + 1)
+            contribution_pattern: Contribution pattern behind the paths
+            
+        Returns:
+            ProjectionResult with the median path and P10-P90 confidence intervals
+        """
+        years = paths.shape[1] - 1
+        median_projection = np.median(paths, axis=0)
+        yearly_contributions = [0] + [contribution_pattern.get_contribution_for_year(year)
+                                      for year in range(1, years + 1)]
+        growth_values = [0] + [median_projection[year] - median_projection[year - 1] - yearly_contributions[year]
+                               for year in range(1, years + 1)]
+        confidence_intervals = {
+            f"P{int(level * 100)}": np.percentile(paths, int(level * 100), axis=0)
+            for level in self.CONFIDENCE_LEVELS
+        }
+        final_mean = np.mean(paths[:, -1])
+        return ProjectionResult(
+            years=list(range(years + 1)),
+            projected_values=median_projection,
+            contributions=yearly_contributions,
+            growth=growth_values,
+            confidence_intervals=confidence_intervals,
+            volatility=float(np.std(paths[:, -1]) / final_mean) if final_mean else 0.0
+        )
     
     def _run_monte_carlo(self, initial_amount: float, contribution_pattern: ContributionPattern,
                        years: int, allocation_strategy: AllocationStrategy, simulations: int = 1000,
@@ -3444,125 +2842,156 @@ class GoalProbabilityAnalyzer:
             allocation_strategy: Asset allocation strategy to use
             simulations: Number of Monte Carlo simulations to run
             confidence_levels: Percentiles to calculate for confidence intervals
-            use_parallel: Whether to use parallel processing
+            use_parallel: Whether to use parallel processing (needs this process's
+                simulation executor; runs sequentially without one)
             use_cache: Whether to use simulation result caching (default: True)
             
         Returns:
             ProjectionResult object with simulation results
         """
-        # Generate a cache key if caching is enabled
-        if use_cache:
-            # Create a serializable representation of parameters for the cache key
-            try:
-                key_data = {
-                    'initial_amount': initial_amount,
-                    'years': years,
-                    'simulations': simulations,
-                    'allocation': self._get_allocation_digest(allocation_strategy),
-                    'contribution': self._get_contribution_digest(contribution_pattern),
-                }
-                
-                # Check cache for existing results
-                cache_key = hashlib.md5(json.dumps(key_data, sort_keys=True).encode()).hexdigest()
-                logger.debug(f"Monte Carlo simulation cache key: {cache_key[:8]}...")
-            except Exception as e:
-                logger.warning(f"Failed to generate simulation cache key: {str(e)}")
-                use_cache = False
-        
-        # Attempt to run the simulation with caching if enabled
+        # The executor is only started from gunicorn's post_fork hook; forking a
+        # pool from a request thread could copy held locks into the workers
+        executor = get_simulation_executor() if use_parallel else None
+        if use_parallel and executor is None:
+            logger.debug("No simulation executor running in this process, simulating sequentially")
+            use_parallel = False
+        
+        # Digest of the simulation inputs: used as the cache key and to select this
+        # run's private random stream, so identical inputs give identical results
+        # without touching global random state. The cached calls also take the
+        # parameter snapshot token, so results computed with older financial
+        # parameters are not looked up again.
+        parameters = parameter_cache_token()
+        cache_key = None
         try:
-            if use_parallel:
-                logger.info(f"Running {simulations} Monte Carlo simulations in parallel mode (cache: {'enabled' if use_cache else 'disabled'})")
+            key_data = {
+                'initial_amount': initial_amount,
+                'years': years,
+                'simulations': simulations,
+                'allocation': self._get_allocation_digest(allocation_strategy),
+                'contribution': self._get_contribution_digest(contribution_pattern),
+            }
+            
+            cache_key = hashlib.md5(json.dumps(key_data, sort_keys=True).encode()).hexdigest()
+            logger.debug(f"Monte Carlo simulation cache key: {cache_key[:8]}...")
+        except Exception as e:
+            logger.warning(f"Failed to generate simulation cache key: {str(e)}")
+            use_cache = False
+        
+        def stream():
+            """Fresh generator for this run's input digest."""
+            return get_generator(DEFAULT_SEED, key=cache_key)
+        
+        def simulate():
+            """Run the simulation (shared by concurrent identical calls)."""
+            # Attempt to run the simulation with caching if enabled
+            try:
+                if use_parallel:
+                    logger.info(f"Running {simulations} Monte Carlo simulations in parallel mode (cache: {'enabled' if use_cache else 'disabled'})")
                 
-                # Use the cached version of parallel processing if caching is enabled
-                if use_cache:
-                    # Define a wrapper for the cached function
-                    @cached_simulation(key_prefix='parallel_')
-                    def cached_parallel_monte_carlo(cache_key, **kwargs):
-                        logger.info(f"Cache miss for key {cache_key[:8]}..., running parallel simulation")
-                        return run_parallel_monte_carlo(**kwargs)
+                    # Simulate on this process's pre-forked worker pool
+                    def parallel_monte_carlo():
+                        return executor.project(
+                            self.projection_engine,
+                            initial_amount=initial_amount,
+                            contribution_pattern=contribution_pattern,
+                            years=years,
+                            allocation_strategy=allocation_strategy,
+                            simulations=simulations,
+                            confidence_levels=confidence_levels,
+                            rng=stream()
+                        )
                     
-                    result = cached_parallel_monte_carlo(
-                        cache_key=cache_key,
-                        initial_amount=initial_amount,
-                        contribution_pattern=contribution_pattern,
-                        years=years,
-                        allocation_strategy=allocation_strategy,
-                        simulation_function=self.projection_engine._simulate_single_run,
-                        simulations=simulations,
-                        confidence_levels=confidence_levels
-                    )
-                else:
-                    # Use parallel processing without caching
-                    result = run_parallel_monte_carlo(
-                        initial_amount=initial_amount,
-                        contribution_pattern=contribution_pattern,
-                        years=years,
-                        allocation_strategy=allocation_strategy,
-                        simulation_function=self.projection_engine._simulate_single_run,
-                        simulations=simulations,
-                        confidence_levels=confidence_levels
-                    )
-                
-                return result
-            else:
-                # Use sequential processing with or without caching
-                if use_cache:
-                    # Define a wrapper for the cached function
-                    @cached_simulation(key_prefix='sequential_')
-                    def cached_sequential_monte_carlo(cache_key, **kwargs):
-                        logger.info(f"Cache miss for key {cache_key[:8]}..., running sequential simulation")
-                        return self.projection_engine.project_with_monte_carlo(**kwargs)
+                    # Use the cached version of parallel processing if caching is enabled
+                    if use_cache:
+                        @cached_simulation(key_prefix='parallel_')
+                        def cached_parallel_monte_carlo(cache_key, confidence_levels, parameters):
+                            logger.info(f"Cache miss for key {cache_key[:8]}..., running parallel simulation")
+                            return parallel_monte_carlo()
                     
-                    return cached_sequential_monte_carlo(
-                        cache_key=cache_key,
-                        initial_amount=initial_amount,
-                        contribution_pattern=contribution_pattern,
-                        years=years,
-                        allocation_strategy=allocation_strategy,
-                        simulations=simulations,
-                        confidence_levels=confidence_levels
-                    )
+                        result = cached_parallel_monte_carlo(
+                            cache_key=cache_key,
+                            confidence_levels=confidence_levels,
+                            parameters=parameters
+                        )
+                    else:
+                        result = parallel_monte_carlo()
+                
+                    return result
                 else:
-                    # Use sequential processing without caching
-                    return self.projection_engine.project_with_monte_carlo(
-                        initial_amount=initial_amount,
-                        contribution_pattern=contribution_pattern,
-                        years=years,
-                        allocation_strategy=allocation_strategy,
-                        simulations=simulations,
-                        confidence_levels=confidence_levels
-                    )
-        except Exception as e:
-            logger.error(f"Error in Monte Carlo simulation, falling back to sequential: {str(e)}")
-            # Fall back to sequential processing if parallel fails
-            return self.projection_engine.project_with_monte_carlo(
-                initial_amount=initial_amount,
-                contribution_pattern=contribution_pattern,
-                years=years,
-                allocation_strategy=allocation_strategy,
-                simulations=simulations,
-                confidence_levels=confidence_levels
-            )
+                    # Use sequential processing with or without caching
+                    if use_cache:
+                        # Define a wrapper for the cached function
+                        @cached_simulation(key_prefix='sequential_')
+                        def cached_sequential_monte_carlo(cache_key, parameters, **kwargs):
+                            logger.info(f"Cache miss for key {cache_key[:8]}..., running sequential simulation")
+                            return self.projection_engine.project_with_monte_carlo(rng=stream(), **kwargs)
+                    
+                        return cached_sequential_monte_carlo(
+                            cache_key=cache_key,
+                            parameters=parameters,
+                            initial_amount=initial_amount,
+                            contribution_pattern=contribution_pattern,
+                            years=years,
+                            allocation_strategy=allocation_strategy,
+                            simulations=simulations,
+                            confidence_levels=confidence_levels
+                        )
+                    else:
+                        # Use sequential processing without caching
+                        return self.projection_engine.project_with_monte_carlo(
+                            initial_amount=initial_amount,
+                            contribution_pattern=contribution_pattern,
+                            years=years,
+                            allocation_strategy=allocation_strategy,
+                            simulations=simulations,
+                            confidence_levels=confidence_levels,
+                            rng=stream()
+                        )
+            except Exception as e:
+                logger.error(f"Error in Monte Carlo simulation, falling back to sequential: {str(e)}")
+                # Fall back to sequential processing if parallel fails
+                return self.projection_engine.project_with_monte_carlo(
+                    initial_amount=initial_amount,
+                    contribution_pattern=contribution_pattern,
+                    years=years,
+                    allocation_strategy=allocation_strategy,
+                    simulations=simulations,
+                    confidence_levels=confidence_levels,
+                    rng=stream()
+                )
+        
+        if cache_key is None:
+            return simulate()
+        
+        # Concurrent identical requests wait for one in-flight simulation; a
+        # request made after a parameter update does not join one started before it
+        return coalesce(
+            ('parallel' if use_parallel else 'sequential', cache_key, tuple(confidence_levels), use_cache,
+             parameters),
+            simulate
+        )
     
     def _run_single_simulation(self, seed_offset: int, initial_amount: float, 
                            contribution_pattern: ContributionPattern, 
-                           years: int, allocation_strategy: AllocationStrategy) -> np.ndarray:
+                           years: int, allocation_strategy: AllocationStrategy,
+                           rng: Optional[np.random.Generator] = None) -> np.ndarray:
         """
         Run a single Monte Carlo simulation for parallel processing.
         
         Args:
-            seed_offset: Offset to add to the random seed
+            seed_offset: Selects an independent stream when no rng is supplied
             initial_amount: Starting value of the assets
             contribution_pattern: Pattern defining contribution schedule and growth
             years: Number of years to project
             allocation_strategy: Asset allocation strategy to use
+            rng: Random stream for this simulation's batch
             
         Returns:
             Array of values for each year
         """
-        # Set seed with offset for this simulation
-        np.random.seed(42 + seed_offset)
+        # Private stream for this simulation; global random state is left alone
+        rng = resolve_generator(rng, DEFAULT_SEED, key=seed_offset)
         
         # Initialize result array
         result = np.zeros(years + 1)
@@ -3588,7 +3017,7 @@ class GoalProbabilityAnalyzer:
             current_allocation = yearly_allocations[year-1]
             
             # Generate random returns for each asset class
-            simulated_return = self._simulate_portfolio_return(current_allocation)
+            simulated_return = self._simulate_portfolio_return(current_allocation, rng)
             
             # Update current value
             current_value = current_value * (1 + simulated_return) + contribution
@@ -3645,9 +3074,6 @@ class GoalProbabilityAnalyzer:
         Returns:
             Success probability (0.0 to 1.0)
         """
-        # Set seed for deterministic testing
-        np.random.seed(42)
-        
         # Log key parameters for diagnostics
         logger.info(f"Calculating success probability: target={target_amount}, simulations={simulations}")
         
@@ -3852,18 +3278,19 @@ class GoalProbabilityAnalyzer:
             }
             
             # For dynamic allocations, include additional properties
-            if hasattr(allocation_strategy, 'target_allocation'):
+            if getattr(allocation_strategy, 'target_allocation', None):
                 allocation_dict['target'] = {k.name: v for k, v in allocation_strategy.target_allocation.items()}
             
-            if hasattr(allocation_strategy, 'glide_years'):
-                allocation_dict['glide_years'] = allocation_strategy.glide_years
+            if hasattr(allocation_strategy, 'glide_path_years'):
+                allocation_dict['glide_years'] = allocation_strategy.glide_path_years
                 
             # Convert to stable string representation
             return json.dumps(allocation_dict, sort_keys=True)
         except Exception as e:
             logger.warning(f"Failed to create allocation digest: {str(e)}")
-            # Fallback to a simple hash of the object's string representation
-            return str(hash(str(allocation_strategy)))
+            # Fallback to a digest of the object's string representation (stable across
+            # processes, unlike hash(), so worker processes share cache keys)
+            return hashlib.md5(str(allocation_strategy).encode()).hexdigest()
             
     def _get_contribution_digest(self, contribution_pattern: ContributionPattern) -> str:
         """
@@ -3879,13 +3306,22 @@ class GoalProbabilityAnalyzer:
             # Extract key properties from contribution pattern
             contribution_dict = {
                 'type': contribution_pattern.__class__.__name__,
-                'initial': contribution_pattern.initial_contribution,
+                'initial': getattr(contribution_pattern, 'annual_amount', None),
             }
             
             # For patterns with growth, include growth rate
             if hasattr(contribution_pattern, 'growth_rate'):
                 contribution_dict['growth_rate'] = contribution_pattern.growth_rate
             
+            if hasattr(contribution_pattern, 'frequency'):
+                contribution_dict['frequency'] = contribution_pattern.frequency
+            
+            # Irregular contributions override the regular amount in their years
+            if getattr(contribution_pattern, 'irregular_schedule', None):
+                contribution_dict['irregular'] = {
+                    str(year): amount for year, amount in sorted(contribution_pattern.irregular_schedule.items())
+                }
+            
             # For complex patterns, include custom years
             if hasattr(contribution_pattern, 'yearly_contributions'):
                 # Only include first few and last few years to keep digest size reasonable
@@ -3905,8 +3341,9 @@ class GoalProbabilityAnalyzer:
             return json.dumps(contribution_dict, sort_keys=True)
         except Exception as e:
             logger.warning(f"Failed to create contribution digest: {str(e)}")
-            # Fallback to a simple hash of the object's string representation
-            return str(hash(str(contribution_pattern)))
+            # Fallback to a digest of the object's string representation (stable across
+            # processes, unlike hash(), so worker processes share cache keys)
+            return hashlib.md5(str(contribution_pattern).encode()).hexdigest()
         else:
             return 0.05  # Very low risk
     
@@ -3,8 +3,15 @@ Monte Carlo simulation components for financial projections.
 
 This package contains modules for running efficient Monte Carlo simulations:
 - core: Core simulation algorithms for different financial goals
+- engine: Vectorized path engine shared by the goal simulations
+- rng: Per-run random streams built on numpy.random.Generator
+- correlation: Cholesky-based correlated return sampling
+- portfolio: Batched simulation of all of a profile's goals on shared returns
 - parallel: Parallel processing functionality for faster simulations
+- executor: Long-lived, pre-forked worker pool for simulations
 - cache: Caching system to avoid redundant calculations
+- coalesce: Single-flight coalescing of identical in-flight calculations
+- store: Memory-mapped on-disk store used as the cache's second tier
 - array_fix: Utilities for handling array truth value issues
 - probability: Goal probability analysis components
 """
@@ -15,6 +22,40 @@ from models.monte_carlo.core import (
     get_simulation_config
 )
 
+from models.monte_carlo.engine import (
+    build_contribution_vector,
+    draw_return_matrix,
+    simulate_wealth_paths,
+    first_passage_years
+)
+
+from models.monte_carlo.rng import (
+    DEFAULT_SEED,
+    get_generator,
+    resolve_generator,
+    spawn_generators,
+    spawn_seed_sequences
+)
+
+from models.monte_carlo.correlation import (
+    nearest_correlation_matrix,
+    cholesky_factor,
+    correlated_normals
+)
+
+from models.monte_carlo.portfolio import (
+    GoalPortfolioSimulation,
+    draw_asset_return_tensor,
+    simulate_goal_portfolio
+)
+
+from models.monte_carlo.executor import (
+    SimulationExecutor,
+    start_simulation_executor,
+    get_simulation_executor,
+    shutdown_simulation_executor
+)
+
 from models.monte_carlo.parallel import (
     run_parallel_monte_carlo,
     run_simulation_batch
@@ -23,9 +64,21 @@ from models.monte_carlo.parallel import (
 from models.monte_carlo.cache import (
     cached_simulation,
     invalidate_cache,
+    invalidate_tags,
+    goal_tag,
+    profile_tag,
+    parameter_group_tag,
     get_cache_stats
 )
 
+from models.monte_carlo.store import SimulationStore
+
+from models.monte_carlo.coalesce import (
+    RequestCoalescer,
+    coalesce,
+    get_coalescing_stats
+)
+
 from models.monte_carlo.array_fix import (
     to_scalar,
     safe_array_compare,
@@ -5,67 +5,248 @@ This module provides caching functionality to avoid redundant calculations
 when running Monte Carlo simulations with the same parameters.
 
 The cache system includes:
-- In-memory LRU cache with configurable size and TTL
-- Persistence to disk with automatic loading on startup
+- In-memory O(1) LRU cache with per-entry TTL and a configurable byte budget
+- Eviction callbacks and per-key-prefix statistics
+- A persistent, process-shared second tier (models/monte_carlo/store.py)
+  with memory-mapped array segments, or pickle snapshots to disk
 - Statistics tracking for cache hits/misses
-- Cache invalidation functionality
+- Cache invalidation by key pattern or by tag (goal, profile, parameter group)
+- Single-flight fills: concurrent misses for one key, in this process or in
+  other processes sharing the store, wait for a single computation
 - Thread-safe operations
 - Error handling with fallback mechanisms
 """
 
 import os
+import sys
 import time
+import heapq
 import logging
 import functools
 import threading
 import pickle
 import traceback
-from typing import Dict, Any, Callable, Tuple, List, Optional, Union
+from typing import Dict, Any, Callable, Tuple, List, Optional, Union, Iterable, Set, FrozenSet
 import hashlib
 import json
 from datetime import datetime, timedelta
 import atexit
 import signal
+from collections import OrderedDict
+
+import numpy as np
+
+from models.monte_carlo.store import SimulationStore, STORE_MAX_BYTES, FILL_LEASE_SECONDS
 
 # Set up logging
 logger = logging.getLogger(__name__)
 
 # Constants
-DEFAULT_CACHE_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), 
-                                    "../..", "data", "cache"))
+DEFAULT_CACHE_DIR = os.environ.get('MONTE_CARLO_CACHE_DIR') or os.path.abspath(
+    os.path.join(os.path.dirname(__file__), "../..", "data", "cache"))
 DEFAULT_CACHE_FILE = "monte_carlo_cache.pickle"
+DEFAULT_STORE_DIR = "simulation_store"
 CACHE_SAVE_INTERVAL = 300  # 5 minutes
 CACHE_MAX_SIZE = 100
+CACHE_MAX_BYTES = 256 * 1024 * 1024  # 256 MB
 CACHE_TTL = 3600  # 1 hour
+FILL_WAIT_TIMEOUT = 30  # Max seconds to wait for another caller's fill
+FILL_POLL_INTERVAL = 0.05  # Seconds between checks for another process's fill
+
+# Eviction reasons passed to eviction callbacks
+EVICT_EXPIRED = 'expired'
+EVICT_SIZE = 'size'
+EVICT_MEMORY = 'memory'
+EVICT_INVALIDATED = 'invalidated'
+
+# Label used in per-prefix statistics for keys without a prefix
+NO_PREFIX = 'default'
+
+# Sequences longer than this are sized from their first element
+_SIZE_SAMPLE_THRESHOLD = 64
+
+
+def _estimate_size(value: Any, _seen: Optional[set] = None) -> int:
+    """Estimate the memory footprint of a cached value in bytes.
+    
+    NumPy arrays are measured with ndarray.nbytes so that simulation results
+    carrying full projection matrices are charged for their data buffers.
+    Containers are walked recursively; long homogeneous sequences of scalars
+    are extrapolated from their first element.
+    
+    Args:
+        value: Value to measure
+        
+    Returns:
+        int: Estimated size in bytes
+    """
+    if _seen is None:
+        _seen = set()
+    if id(value) in _seen:
+        return 0
+    
+    if isinstance(value, np.ndarray):
+        _seen.add(id(value))
+        if value.dtype == object:
+            return value.nbytes + sum(_estimate_size(item, _seen) for item in value.flat)
+        return value.nbytes + sys.getsizeof(np.empty(0))
+    
+    if isinstance(value, (str, bytes, bytearray, int, float, bool, np.generic)) or value is None:
+        return sys.getsizeof(value)
+    
+    _seen.add(id(value))
+    size = sys.getsizeof(value)
+    
+    if isinstance(value, dict):
+        for k, v in value.items():
+            size += _estimate_size(k, _seen) + _estimate_size(v, _seen)
+    elif isinstance(value, (list, tuple, set, frozenset)):
+        if len(value) > _SIZE_SAMPLE_THRESHOLD and isinstance(value, (list, tuple)):
+            first = value[0]
+            if isinstance(first, (int, float, np.generic)):
+                return size + len(value) * sys.getsizeof(first)
+        for item in value:
+            size += _estimate_size(item, _seen)
+    elif hasattr(value, '__dict__'):
+        size += _estimate_size(vars(value), _seen)
+    
+    return size
+
+
+def _key_prefix(key: str) -> str:
+    """Return the prefix of a cache key used to group statistics.
+    
+    Keys built by cached_simulation are key_prefix + an MD5 hex digest;
+    other keys are grouped by the text before their first colon.
+    
+    Args:
+        key: Cache key
+        
+    Returns:
+        str: Key prefix, or NO_PREFIX if the key has none
+    """
+    if len(key) >= 32:
+        digest = key[-32:]
+        if all(c in '0123456789abcdef' for c in digest):
+            return key[:-32] or NO_PREFIX
+    if ':' in key:
+        return key.split(':', 1)[0] + ':'
+    return NO_PREFIX
+
+
+def goal_tag(goal_id: Any) -> str:
+    """Tag for cache entries computed from a goal."""
+    return f"goal:{goal_id}"
+
+
+def profile_tag(profile_id: Any) -> str:
+    """Tag for cache entries computed from a user profile."""
+    return f"profile:{profile_id}"
+
+
+def parameter_group_tag(group: str) -> str:
+    """Tag for cache entries that depend on a financial parameter group."""
+    return f"params:{group}"
+
+
+class _CacheEntry:
+    """A single cached value with its bookkeeping data."""
+    
+    __slots__ = ('value', 'timestamp', 'expires_at', 'size', 'prefix', 'tags', 'generation')
+    
+    def __init__(self, value: Any, timestamp: float, expires_at: float, size: int, prefix: str,
+                 tags: FrozenSet[str] = frozenset(), generation: int = 0):
+        self.value = value
+        self.timestamp = timestamp
+        self.expires_at = expires_at
+        self.size = size
+        self.prefix = prefix
+        self.tags = tags
+        # Store invalidation generation the value was current for
+        self.generation = generation
+
 
 class SimulationCache:
     """Cache for storing Monte Carlo simulation results.
     
     This cache implementation includes:
     - Thread-safe operations via lock
-    - LRU eviction policy for memory management
-    - TTL-based expiration
-    - Persistence to disk
-    - Statistics tracking
+    - O(1) LRU eviction using an ordered dictionary
+    - Per-entry TTL expiration tracked in a min-heap of expiry times
+    - A byte budget based on the estimated size of each entry
+    - Eviction callbacks
+    - An optional persistent SimulationStore as second tier (write-through,
+      read on miss), or pickle snapshots to disk when no store is attached;
+      in-memory entries older than the store's invalidation generation are
+      treated as misses, so invalidations in other processes apply here too
+    - Statistics tracking, overall and per key prefix
     """
     
-    def __init__(self, max_size: int = CACHE_MAX_SIZE, ttl: int = CACHE_TTL):
+    def __init__(self, max_size: int = CACHE_MAX_SIZE, ttl: int = CACHE_TTL,
+                 max_bytes: Optional[int] = CACHE_MAX_BYTES):
         """Initialize the cache with a maximum size and time-to-live.
         
         Args:
             max_size: Maximum number of items to store in cache
-            ttl: Time-to-live for cache entries in seconds
+            ttl: Default time-to-live for cache entries in seconds
+            max_bytes: Maximum estimated size of all entries in bytes (None for no limit)
         """
-        self.cache: Dict[str, Tuple[Any, float]] = {}
+        # Least recently used entries first
+        self.cache: 'OrderedDict[str, _CacheEntry]' = OrderedDict()
         self.max_size = max_size
+        self.max_bytes = max_bytes
         self.ttl = ttl
         self.hits = 0
         self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.current_bytes = 0
         self.created_at = datetime.now()
         self.last_save_time = None
         self.lock = threading.RLock()  # Reentrant lock for thread safety
         self.save_lock = threading.Lock()  # Lock for save operations
         self.dirty = False  # Flag to track if cache has unsaved changes
+        
+        # Min-heap of (expires_at, key); stale items are skipped lazily
+        self._expiry_heap: List[Tuple[float, str]] = []
+        self._eviction_callbacks: List[Callable[[str, Any, str], None]] = []
+        self._prefix_stats: Dict[str, Dict[str, int]] = {}
+        # Secondary index: tag -> keys of the entries carrying that tag
+        self._tag_index: Dict[str, Set[str]] = {}
+        
+        # Optional persistent second tier (see attach_store)
+        self.store: Optional[SimulationStore] = None
+        self.store_hits = 0
+        
+        # Fills in progress: key -> (done event, owning thread id, store lease owner, start time)
+        self._fills: Dict[str, Tuple[threading.Event, int, Optional[str], float]] = {}
+        self.fills = 0
+        self.coalesced_fills = 0
+        self.remote_fills = 0
+    
+    def attach_store(self, store: Optional[SimulationStore]) -> None:
+        """Use a SimulationStore as second tier below the in-memory entries.
+        
+        New entries are written through to the store and misses are looked
+        up in it, so the cache survives restarts and is shared between
+        processes using the same store directory.
+        
+        Args:
+            store: Store to attach, or None to detach
+        """
+        with self.lock:
+            self.store = store
+    
+    def _store_call(self, method: str, *args) -> Any:
+        """Call a store method, logging and swallowing store errors."""
+        store = self.store
+        if store is None:
+            return None
+        try:
+            return getattr(store, method)(*args)
+        except Exception as e:
+            logger.warning(f"Simulation store {method} failed: {e}")
+            return None
     
     def _generate_key(self, args: Tuple, kwargs: Dict) -> str:
         """Generate a unique key based on function arguments.
@@ -87,6 +268,131 @@ class SimulationCache:
             logger.debug(f"Using string representation for key: {key_str[:100]}...")
             return hashlib.md5(key_str.encode()).hexdigest()
     
+    def add_eviction_callback(self, callback: Callable[[str, Any, str], None]) -> None:
+        """Register a callback invoked as callback(key, value, reason) for evicted entries.
+        
+        Callbacks run after the cache lock is released. Reasons are
+        EVICT_EXPIRED, EVICT_SIZE, EVICT_MEMORY and EVICT_INVALIDATED.
+        
+        Args:
+            callback: Function to call for each evicted entry
+        """
+        with self.lock:
+            if callback not in self._eviction_callbacks:
+                self._eviction_callbacks.append(callback)
+    
+    def remove_eviction_callback(self, callback: Callable[[str, Any, str], None]) -> None:
+        """Unregister an eviction callback.
+        
+        Args:
+            callback: Previously registered callback
+        """
+        with self.lock:
+            if callback in self._eviction_callbacks:
+                self._eviction_callbacks.remove(callback)
+    
+    def _notify_evicted(self, evicted: List[Tuple[str, Any, str]]) -> None:
+        """Run eviction callbacks for entries removed while holding the lock."""
+        if not evicted or not self._eviction_callbacks:
+            return
+        callbacks = list(self._eviction_callbacks)
+        for key, value, reason in evicted:
+            for callback in callbacks:
+                try:
+                    callback(key, value, reason)
+                except Exception as e:
+                    logger.warning(f"Cache eviction callback failed for {key[:10]}...: {e}")
+    
+    def _prefix_counter(self, prefix: str) -> Dict[str, int]:
+        """Return the statistics counters for a key prefix (caller holds the lock)."""
+        stats = self._prefix_stats.get(prefix)
+        if stats is None:
+            stats = {'entries': 0, 'bytes': 0, 'hits': 0, 'misses': 0, 'evictions': 0}
+            self._prefix_stats[prefix] = stats
+        return stats
+    
+    def _insert(self, key: str, entry: _CacheEntry) -> None:
+        """Add an entry as most recently used (caller holds the lock)."""
+        self.cache[key] = entry
+        self.current_bytes += entry.size
+        stats = self._prefix_counter(entry.prefix)
+        stats['entries'] += 1
+        stats['bytes'] += entry.size
+        heapq.heappush(self._expiry_heap, (entry.expires_at, key))
+        for tag in entry.tags:
+            self._tag_index.setdefault(tag, set()).add(key)
+    
+    def _remove(self, key: str, reason: Optional[str],
+                evicted: Optional[List[Tuple[str, Any, str]]] = None) -> _CacheEntry:
+        """Remove an entry and update accounting (caller holds the lock).
+        
+        Args:
+            key: Key to remove
+            reason: Eviction reason, or None when the entry is being replaced
+            evicted: List collecting (key, value, reason) for eviction callbacks
+        """
+        entry = self.cache.pop(key)
+        self.current_bytes -= entry.size
+        for tag in entry.tags:
+            keys = self._tag_index.get(tag)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._tag_index[tag]
+        stats = self._prefix_counter(entry.prefix)
+        stats['entries'] -= 1
+        stats['bytes'] -= entry.size
+        
+        if reason == EVICT_EXPIRED:
+            self.expirations += 1
+        elif reason in (EVICT_SIZE, EVICT_MEMORY):
+            self.evictions += 1
+            stats['evictions'] += 1
+        
+        if reason is not None and evicted is not None:
+            evicted.append((key, entry.value, reason))
+        
+        # Drop stale expiry records once they dominate the heap
+        if len(self._expiry_heap) > 2 * len(self.cache) + 64:
+            self._expiry_heap = [(e.expires_at, k) for k, e in self.cache.items()]
+            heapq.heapify(self._expiry_heap)
+        return entry
+    
+    def _expire(self, now: float, evicted: List[Tuple[str, Any, str]]) -> int:
+        """Remove every entry whose expiry time has passed (caller holds the lock)."""
+        removed = 0
+        heap = self._expiry_heap
+        while heap and heap[0][0] <= now:
+            expires_at, key = heapq.heappop(heap)
+            entry = self.cache.get(key)
+            # Skip records left behind by replaced or removed entries
+            if entry is None or entry.expires_at != expires_at:
+                continue
+            self._remove(key, EVICT_EXPIRED, evicted)
+            removed += 1
+        return removed
+    
+    def _enforce_limits(self, evicted: List[Tuple[str, Any, str]], reserve_entries: int = 0,
+                        reserve_bytes: int = 0) -> None:
+        """Evict least recently used entries until the size and byte limits hold.
+        
+        Args:
+            evicted: List collecting evicted entries for callbacks
+            reserve_entries: Number of entries about to be added
+            reserve_bytes: Number of bytes about to be added
+        """
+        if self.max_size is not None:
+            while self.cache and len(self.cache) + reserve_entries > self.max_size:
+                oldest_key = next(iter(self.cache))
+                self._remove(oldest_key, EVICT_SIZE, evicted)
+                logger.debug(f"Cache full, removed oldest entry: {oldest_key[:10]}...")
+        
+        if self.max_bytes is not None:
+            while self.cache and self.current_bytes + reserve_bytes > self.max_bytes:
+                oldest_key = next(iter(self.cache))
+                self._remove(oldest_key, EVICT_MEMORY, evicted)
+                logger.debug(f"Cache over byte budget, removed oldest entry: {oldest_key[:10]}...")
+    
     def get(self, key: str) -> Optional[Any]:
         """Retrieve an item from the cache (thread-safe).
         
@@ -96,71 +402,264 @@ class SimulationCache:
         Returns:
             The cached value or None if not found/expired
         """
+        evicted = []
+        generation = self._store_call('generation')
         with self.lock:
-            if key not in self.cache:
-                self.misses += 1
-                return None
-            
-            value, timestamp = self.cache[key]
-            if time.time() - timestamp > self.ttl:
+            entry = self.cache.get(key)
+            now = time.time()
+            if entry is not None and entry.expires_at <= now:
                 # Entry has expired
-                del self.cache[key]
-                self.misses += 1
-                return None
+                self._remove(key, EVICT_EXPIRED, evicted)
+                entry = None
+            elif entry is not None and generation is not None and entry.generation < generation:
+                # The store was invalidated since, possibly by another process
+                self._remove(key, EVICT_INVALIDATED, evicted)
+                entry = None
             
-            # Update the timestamp to keep the item fresh (LRU update)
-            self.cache[key] = (value, time.time())
-            self.hits += 1
-            return value
+            if entry is not None:
+                # Mark as most recently used
+                self.cache.move_to_end(key)
+                entry.timestamp = now
+                self.hits += 1
+                self._prefix_counter(entry.prefix)['hits'] += 1
+                value = entry.value
+            elif self.store is None:
+                self.misses += 1
+                self._prefix_counter(_key_prefix(key))['misses'] += 1
+                value = None
+        
+        if entry is None and self.store is not None:
+            # Second tier lookup outside the lock (disk I/O)
+            stored = self._store_call('get', key)
+            with self.lock:
+                if stored is None:
+                    self.misses += 1
+                    self._prefix_counter(_key_prefix(key))['misses'] += 1
+                    value = None
+                else:
+                    value, expires_at, tags = stored
+                    if key in self.cache:
+                        self._remove(key, None)
+                    self._enforce_limits(evicted, reserve_entries=1)
+                    self._insert(key, _CacheEntry(value, now, expires_at, _estimate_size(value),
+                                                  _key_prefix(key), frozenset(tags), generation or 0))
+                    self._enforce_limits(evicted)
+                    self.hits += 1
+                    self.store_hits += 1
+                    self._prefix_counter(_key_prefix(key))['hits'] += 1
+        
+        self._notify_evicted(evicted)
+        return value
     
-    def set(self, key: str, value: Any, ttl: Optional[int] = None) -> None:
+    def set(self, key: str, value: Any, ttl: Optional[int] = None,
+            tags: Optional[Iterable[str]] = None) -> None:
         """Store an item in the cache (thread-safe).
         
         Args:
             key: Cache key
             value: Value to store
             ttl: Optional custom TTL for this entry (seconds)
+            tags: Optional tags (see goal_tag, profile_tag, parameter_group_tag)
+                used to invalidate the entry with invalidate_tags()
         """
+        entry_tags = frozenset(tags) if tags else frozenset()
+        # Measure outside the lock; this walks the value
+        size = _estimate_size(value)
+        generation = self._store_call('generation') or 0
+        evicted = []
         with self.lock:
-            # Check if cache is full and remove least recently used item
-            if len(self.cache) >= self.max_size:
-                # Remove oldest entry (LRU strategy)
-                oldest_key = min(self.cache.keys(), key=lambda k: self.cache[k][1])
-                del self.cache[oldest_key]
-                logger.debug(f"Cache full, removed oldest entry: {oldest_key[:10]}...")
+            now = time.time()
+            entry_ttl = self.ttl if ttl is None else ttl
             
-            self.cache[key] = (value, time.time())
-            self.dirty = True
+            if key in self.cache:
+                self._remove(key, None)
             
-            # Update timestamps for entries with custom TTL if provided
-            if ttl is not None and ttl != self.ttl:
-                logger.debug(f"Setting custom TTL of {ttl}s for key {key[:10]}...")
+            self._expire(now, evicted)
+            
+            if self.max_bytes is not None and size > self.max_bytes:
+                logger.debug(f"Not caching {key[:10]}...: {size} bytes exceeds budget of {self.max_bytes}")
+            else:
+                self._enforce_limits(evicted, reserve_entries=1, reserve_bytes=size)
+                self._insert(key, _CacheEntry(value, now, now + entry_ttl, size, _key_prefix(key), entry_tags,
+                                              generation))
+                self.dirty = self.store is None
+        
+        # Write through to the second tier outside the lock
+        self._store_call('put', key, value, now + entry_ttl, entry_tags)
+        self._notify_evicted(evicted)
+    
+    def acquire_fill(self, key: str, wait_timeout: Optional[float] = None) -> Optional[Any]:
+        """Return a cached value, or make the caller the single filler of key.
+        
+        If another thread of this process, or another process sharing the
+        store, is already computing the key, this waits (up to wait_timeout)
+        for its result. A return value of None means the caller must compute
+        the value, set() it and then call release_fill(key).
+        
+        Args:
+            key: Cache key
+            wait_timeout: Max seconds to wait for a concurrent fill
+            
+        Returns:
+            The cached value, or None if the caller should fill the key
+        """
+        value = self.get(key)
+        if value is not None:
+            return value
+        
+        timeout = FILL_WAIT_TIMEOUT if wait_timeout is None else wait_timeout
+        now = time.time()
+        deadline = now + timeout
+        thread_id = threading.get_ident()
+        
+        # Single flight within this process
+        with self.lock:
+            fill = self._fills.get(key)
+            if fill is not None and now - fill[3] > FILL_LEASE_SECONDS:
+                # Abandoned by a filler that never released it
+                fill[0].set()
+                fill = None
+            if fill is None:
+                # A fill may have completed since the lookup above
+                entry = self.cache.get(key)
+                if entry is not None and entry.expires_at > now:
+                    return entry.value
+                self._fills[key] = (threading.Event(), thread_id, None, now)
+                self.fills += 1
+            elif fill[1] == thread_id:
+                # Re-entrant fill of the same key by its owner
+                return None
+            else:
+                self.coalesced_fills += 1
+        
+        if fill is not None:
+            fill[0].wait(timeout)
+            # None if the filler failed or timed out; compute without coordination
+            return self.get(key)
+        
+        # Single flight across processes sharing the store
+        store = self.store
+        if store is None:
+            return None
+        owner = f"{os.getpid()}:{thread_id}"
+        while True:
+            acquired = self._store_call('try_acquire_fill', key, owner)
+            if acquired or acquired is None:
+                # Another process may have completed its fill since the lookup above
+                value = self.get(key) if acquired and self._store_call('contains', key) else None
+                if value is not None:
+                    with self.lock:
+                        self.remote_fills += 1
+                    self._store_call('release_fill', key, owner)
+                    self.release_fill(key)
+                    return value
+                break
+            if time.time() >= deadline:
+                logger.debug(f"Timed out waiting for fill of {key[:10]}..., computing locally")
+                return None
+            time.sleep(FILL_POLL_INTERVAL)
+            if self._store_call('contains', key):
+                value = self.get(key)
+                if value is not None:
+                    with self.lock:
+                        self.remote_fills += 1
+                    self.release_fill(key)
+                    return value
+        
+        with self.lock:
+            fill = self._fills.get(key)
+            if fill is not None and fill[1] == thread_id:
+                self._fills[key] = (fill[0], thread_id, owner, fill[3])
+        return None
+    
+    def release_fill(self, key: str) -> None:
+        """Finish a fill started with acquire_fill() and wake up waiters.
+        
+        Safe to call when the current thread is not filling the key.
+        
+        Args:
+            key: Cache key
+        """
+        with self.lock:
+            fill = self._fills.get(key)
+            if fill is None or fill[1] != threading.get_ident():
+                return
+            del self._fills[key]
+        
+        event, _, owner, _ = fill
+        if owner is not None:
+            self._store_call('release_fill', key, owner)
+        event.set()
     
     def invalidate(self, pattern: str = None) -> int:
         """Invalidate cache entries (thread-safe).
         
         Args:
             pattern: If provided, only invalidate keys containing this pattern
+                and entries tagged with exactly this pattern
             
         Returns:
             Number of invalidated entries
         """
+        evicted = []
         with self.lock:
             if pattern is None:
-                count = len(self.cache)
-                self.cache.clear()
-                logger.info(f"Cleared entire cache ({count} entries)")
+                keys_to_remove = list(self.cache)
+            else:
+                tagged = self._tag_index.get(pattern, set())
+                keys_to_remove = list(tagged) + [k for k in self.cache if pattern in k and k not in tagged]
+            
+            for k in keys_to_remove:
+                self._remove(k, EVICT_INVALIDATED, evicted)
+            
+            if pattern is None:
+                self._expiry_heap = []
+                self._tag_index = {}
+                logger.info(f"Cleared entire cache ({len(keys_to_remove)} entries)")
+                self.dirty = True
+            elif keys_to_remove:
                 self.dirty = True
-                return count
+                logger.info(f"Invalidated {len(keys_to_remove)} entries matching pattern '{pattern}'")
+        
+        stored = self._store_call('invalidate', pattern) or 0
+        self._notify_evicted(evicted)
+        return max(len(keys_to_remove), stored)
+    
+    def invalidate_tags(self, tags: Iterable[str]) -> int:
+        """Invalidate every entry carrying any of the given tags (thread-safe).
+        
+        Uses the tag index, so the cost is proportional to the number of tags
+        and matching entries rather than the size of the cache.
+        
+        Args:
+            tags: Tags to invalidate
+            
+        Returns:
+            Number of invalidated entries
+        """
+        tags = list(tags)
+        evicted = []
+        with self.lock:
+            keys_to_remove = set()
+            for tag in tags:
+                keys_to_remove.update(self._tag_index.get(tag, ()))
             
-            keys_to_remove = [k for k in self.cache if pattern in k]
             for k in keys_to_remove:
-                del self.cache[k]
-                
+                self._remove(k, EVICT_INVALIDATED, evicted)
+            
             if keys_to_remove:
                 self.dirty = True
-                logger.info(f"Invalidated {len(keys_to_remove)} entries matching pattern '{pattern}'")
-            return len(keys_to_remove)
+                logger.info(f"Invalidated {len(keys_to_remove)} entries by tag")
+        
+        stored = self._store_call('invalidate_tags', list(tags)) or 0
+        self._notify_evicted(evicted)
+        return max(len(keys_to_remove), stored)
+    
+    def get_tags(self, key: str) -> FrozenSet[str]:
+        """Return the tags of a cached entry (empty if the key is not cached)."""
+        with self.lock:
+            entry = self.cache.get(key)
+            return entry.tags if entry is not None else frozenset()
     
     def cleanup_expired(self) -> int:
         """Remove expired entries from the cache (thread-safe).
@@ -168,20 +667,39 @@ class SimulationCache:
         Returns:
             Number of expired entries removed
         """
+        evicted = []
         with self.lock:
-            current_time = time.time()
-            expired_keys = [
-                k for k, (_, timestamp) in self.cache.items() 
-                if current_time - timestamp > self.ttl
-            ]
+            removed = self._expire(time.time(), evicted)
+            if removed:
+                self.dirty = self.store is None
+                logger.debug(f"Removed {removed} expired entries")
+        
+        self._store_call('cleanup_expired')
+        self._notify_evicted(evicted)
+        return removed
+    
+    def resize(self, max_size: Optional[int] = None, max_bytes: Optional[int] = None) -> int:
+        """Change the entry or byte limits and evict entries that no longer fit.
+        
+        Args:
+            max_size: New maximum number of entries (unchanged if None)
+            max_bytes: New byte budget (unchanged if None)
             
-            for key in expired_keys:
-                del self.cache[key]
-                
-            if expired_keys:
+        Returns:
+            Number of entries evicted
+        """
+        evicted = []
+        with self.lock:
+            if max_size is not None:
+                self.max_size = max_size
+            if max_bytes is not None:
+                self.max_bytes = max_bytes
+            self._enforce_limits(evicted)
+            if evicted:
                 self.dirty = True
-                logger.debug(f"Removed {len(expired_keys)} expired entries")
-            return len(expired_keys)
+        
+        self._notify_evicted(evicted)
+        return len(evicted)
     
     def get_stats(self) -> Dict[str, Any]:
         """Return cache statistics (thread-safe).
@@ -189,19 +707,38 @@ class SimulationCache:
         Returns:
             Dict containing cache statistics
         """
+        store_stats = self._store_call('get_stats')
         with self.lock:
             total = self.hits + self.misses
             hit_rate = self.hits / total if total > 0 else 0
+            prefixes = {}
+            for prefix, counters in self._prefix_stats.items():
+                prefix_total = counters['hits'] + counters['misses']
+                prefixes[prefix] = dict(
+                    counters,
+                    hit_rate=counters['hits'] / prefix_total if prefix_total > 0 else 0
+                )
             return {
                 'size': len(self.cache),
                 'max_size': self.max_size,
+                'bytes': self.current_bytes,
+                'max_bytes': self.max_bytes,
                 'hits': self.hits,
                 'misses': self.misses,
                 'hit_rate': hit_rate,
+                'evictions': self.evictions,
+                'expirations': self.expirations,
                 'created_at': self.created_at.isoformat(),
                 'last_save_time': self.last_save_time.isoformat() if self.last_save_time else None,
                 'ttl': self.ttl,
-                'memory_usage_estimate': self._estimate_memory_usage()
+                'memory_usage_estimate': self._estimate_memory_usage(),
+                'prefixes': prefixes,
+                'store_hits': self.store_hits,
+                'fills': self.fills,
+                'coalesced_fills': self.coalesced_fills,
+                'remote_fills': self.remote_fills,
+                'fills_in_progress': len(self._fills),
+                'store': store_stats
             }
     
     def _estimate_memory_usage(self) -> int:
@@ -210,24 +747,54 @@ class SimulationCache:
         Returns:
             Estimated memory usage in bytes
         """
-        # This is a rough estimate, not precise memory profiling
-        try:
-            # Sample a few keys if cache is large
-            keys_to_sample = min(10, len(self.cache))
-            if keys_to_sample == 0:
-                return 0
-                
-            sampled_keys = list(self.cache.keys())[:keys_to_sample]
-            total_size = sum(
-                len(pickle.dumps(self.cache[k][0])) for k in sampled_keys
-            )
-            # Extrapolate to full cache size
-            estimated_size = (total_size / keys_to_sample) * len(self.cache)
-            return int(estimated_size)
-        except Exception as e:
-            logger.warning(f"Error estimating cache memory: {e}")
-            return 0
+        # Entry sizes are measured when they are stored
+        return self.current_bytes
 
+    def _snapshot(self) -> Dict[str, Tuple[Any, float, float, List[str]]]:
+        """Copy live entries as key -> (value, timestamp, expires_at, tags) in LRU order."""
+        with self.lock:
+            self.cleanup_expired()
+            return {k: (e.value, e.timestamp, e.expires_at, sorted(e.tags)) for k, e in self.cache.items()}
+    
+    def _restore(self, cache_data: Dict[str, Tuple]) -> None:
+        """Replace the cache contents with saved entries (caller holds the lock).
+        
+        Accepts both (value, timestamp, expires_at[, tags]) entries and the legacy
+        (value, timestamp) format, which expires ttl seconds after timestamp.
+        """
+        self.cache = OrderedDict()
+        self._expiry_heap = []
+        self._tag_index = {}
+        self._prefix_stats = {
+            prefix: dict(counters, entries=0, bytes=0)
+            for prefix, counters in self._prefix_stats.items()
+        }
+        self.current_bytes = 0
+        
+        entries = sorted(cache_data.items(), key=lambda item: item[1][1])
+        for key, saved in entries:
+            value, timestamp = saved[0], saved[1]
+            expires_at = saved[2] if len(saved) > 2 else timestamp + self.ttl
+            tags = frozenset(saved[3]) if len(saved) > 3 else frozenset()
+            self._insert(key, _CacheEntry(value, timestamp, expires_at, _estimate_size(value),
+                                          _key_prefix(key), tags))
+        
+        evicted = []
+        self._enforce_limits(evicted)
+
+    def export_to_store(self) -> int:
+        """Write every live in-memory entry to the attached store.
+        
+        Returns:
+            int: Number of entries written
+        """
+        if self.store is None:
+            return 0
+        written = 0
+        for key, (value, _, expires_at, tags) in self._snapshot().items():
+            if self._store_call('put', key, value, expires_at, tags):
+                written += 1
+        return written
 
     def save(self, file_path: str) -> bool:
         """Save cache to a file (thread-safe).
@@ -246,15 +813,13 @@ class SimulationCache:
                 # Create a metadata structure with cache info
                 metadata = {
                     'timestamp': datetime.now().isoformat(),
-                    'version': '1.0.0',
+                    'version': '1.1.0',
                     'cache_stats': self.get_stats()
                 }
                 
                 # Make a copy of the cache data to avoid locks during file write
-                with self.lock:
-                    # Clean expired entries before saving
-                    self.cleanup_expired()
-                    cache_copy = dict(self.cache)
+                # (expired entries are cleaned before saving)
+                cache_copy = self._snapshot()
                 
                 # Save cache with metadata
                 save_data = {
@@ -317,21 +882,12 @@ class SimulationCache:
                     cache_data = load_data
                     logger.info(f"Loaded legacy cache format from {file_path} ({len(cache_data)} entries)")
                 
-                # Update cache with loaded data (using lock)
+                # Update cache with loaded data (using lock); stats are kept
                 with self.lock:
-                    # Keep stats but replace cache content
-                    old_hits = self.hits
-                    old_misses = self.misses
-                    
-                    # Replace cache with loaded data
-                    self.cache = cache_data
+                    self._restore(cache_data)
                     self.dirty = False
                     self.last_save_time = datetime.now()
                     
-                    # Restore stats
-                    self.hits = old_hits
-                    self.misses = old_misses
-                    
                     # Clean up any expired entries
                     expired_count = self.cleanup_expired()
                     if expired_count > 0:
@@ -353,22 +909,29 @@ class SimulationCache:
         Returns:
             int: Number of entries merged
         """
+        evicted = []
         with self.lock, other_cache.lock:
             before_count = len(self.cache)
             
             # Merge entries, giving preference to newer entries
-            for key, (value, timestamp) in other_cache.cache.items():
+            for key, entry in other_cache.cache.items():
                 # Only merge if entry doesn't exist or is newer
-                if key not in self.cache or timestamp > self.cache[key][1]:
-                    self.cache[key] = (value, timestamp)
+                current = self.cache.get(key)
+                if current is None or entry.timestamp > current.timestamp:
+                    if current is not None:
+                        self._remove(key, None)
+                    self._enforce_limits(evicted, reserve_entries=1, reserve_bytes=entry.size)
+                    self._insert(key, _CacheEntry(entry.value, entry.timestamp, entry.expires_at,
+                                                  entry.size, entry.prefix, entry.tags, entry.generation))
             
             # Mark as dirty if any changes were made
             merged_count = len(self.cache) - before_count
             if merged_count > 0:
                 self.dirty = True
                 logger.info(f"Merged {merged_count} entries from another cache")
-            
-            return merged_count
+        
+        self._notify_evicted(evicted)
+        return merged_count
 
 
 # Global cache instance
@@ -379,14 +942,33 @@ _cache_save_timer = None
 _cache_save_path = os.path.join(DEFAULT_CACHE_DIR, DEFAULT_CACHE_FILE)
 _cache_save_running = False
 
+# Persistent store settings
+_cache_store_dir = os.path.join(DEFAULT_CACHE_DIR, DEFAULT_STORE_DIR)
+_cache_store_max_bytes = STORE_MAX_BYTES
+
+
+def _extract_tags(tag_extractor: Optional[Callable[..., Iterable[str]]],
+                  args: Tuple, kwargs: Dict) -> FrozenSet[str]:
+    """Run a tag extractor on call arguments, ignoring extractor failures."""
+    if tag_extractor is None:
+        return frozenset()
+    try:
+        return frozenset(tag for tag in (tag_extractor(*args, **kwargs) or ()) if tag)
+    except Exception as e:
+        logger.warning(f"Cache tag extraction failed: {e}")
+        return frozenset()
 
-def cached_simulation(func: Callable = None, ttl: int = None, key_prefix: str = ''):
+
+def cached_simulation(func: Callable = None, ttl: int = None, key_prefix: str = '',
+                      tag_extractor: Optional[Callable[..., Iterable[str]]] = None):
     """Decorator for caching simulation results.
     
     Args:
         func: Function to decorate
         ttl: Optional custom time-to-live for this function's cache entries
         key_prefix: Optional prefix for cache keys to group related entries
+        tag_extractor: Optional function called with the decorated function's
+            arguments, returning tags (e.g. goal_tag(goal.id)) for the entry
     """
     def decorator(f):
         @functools.wraps(f)
@@ -403,18 +985,21 @@ def cached_simulation(func: Callable = None, ttl: int = None, key_prefix: str =
             # Generate cache key
             key = key_prefix + _cache._generate_key(args, kwargs)
             
-            # Try to get from cache
-            result = _cache.get(key)
+            # Try to get from cache, waiting for a concurrent computation of the same key
+            result = _cache.acquire_fill(key)
             if result is not None:
                 logger.debug(f"Cache hit for {f.__name__}")
                 return result
             
             # Execute function
             logger.debug(f"Cache miss for {f.__name__}")
-            result = f(*args, **kwargs)
-            
-            # Store in cache (with custom TTL if provided)
-            _cache.set(key, result, ttl=ttl)
+            try:
+                result = f(*args, **kwargs)
+                
+                # Store in cache (with custom TTL and tags if provided)
+                _cache.set(key, result, ttl=ttl, tags=_extract_tags(tag_extractor, args, kwargs))
+            finally:
+                _cache.release_fill(key)
             
             # Schedule a save if cache is dirty
             if _cache.dirty:
@@ -447,11 +1032,38 @@ def invalidate_cache(pattern: str = None) -> int:
     return count
 
 
+def invalidate_tags(*tags: str) -> int:
+    """Invalidate every cache entry carrying any of the given tags.
+    
+    Args:
+        *tags: Tags to invalidate (see goal_tag, profile_tag, parameter_group_tag)
+        
+    Returns:
+        Number of invalidated entries
+    """
+    count = _cache.invalidate_tags(tags)
+    
+    # Schedule a save if invalidation occurred
+    if count > 0:
+        schedule_cache_save()
+        
+    return count
+
+
 def get_cache_stats() -> Dict[str, Any]:
-    """Get current cache statistics."""
+    """Get current cache statistics, including per-key-prefix counters."""
     return _cache.get_stats()
 
 
+def register_eviction_callback(callback: Callable[[str, Any, str], None]) -> None:
+    """Register a callback invoked as callback(key, value, reason) on eviction.
+    
+    Args:
+        callback: Function to call for each entry evicted from the global cache
+    """
+    _cache.add_eviction_callback(callback)
+
+
 def save_cache(file_path: str = None) -> bool:
     """Save the cache to a file.
     
@@ -499,9 +1111,14 @@ def schedule_cache_save() -> None:
     
     This schedules a save for CACHE_SAVE_INTERVAL seconds in the future,
     but cancels any existing scheduled save to avoid multiple saves.
+    Nothing is scheduled when a persistent store is attached, since every
+    entry is already written through to it.
     """
     global _cache_save_timer
     
+    if _cache.store is not None:
+        return
+    
     # Cancel existing timer if present
     if _cache_save_timer is not None:
         try:
@@ -544,24 +1161,32 @@ def _perform_scheduled_save() -> None:
 def configure_cache(
     max_size: int = None,
     ttl: int = None,
+    max_bytes: int = None,
     save_interval: int = None,
     cache_dir: str = None,
-    cache_file: str = None
+    cache_file: str = None,
+    store_max_bytes: int = None,
+    store_dir: str = None
 ) -> None:
     """Configure the global cache settings.
     
     Args:
         max_size: Maximum size of the cache (number of entries)
         ttl: Time-to-live for cache entries in seconds
+        max_bytes: Maximum estimated size of all cache entries in bytes
         save_interval: Interval between auto-saves in seconds
         cache_dir: Directory to store cache files
         cache_file: Name of the cache file
+        store_max_bytes: Maximum size of the persistent simulation store in bytes
+        store_dir: Directory of the simulation store shared by all worker
+            processes (defaults to a subdirectory of cache_dir); a tmpfs such
+            as /dev/shm keeps it in shared memory
     """
-    global _cache, CACHE_SAVE_INTERVAL, _cache_save_path
+    global _cache, CACHE_SAVE_INTERVAL, _cache_save_path, _cache_store_dir, _cache_store_max_bytes
     
-    # Update cache instance settings
-    if max_size is not None:
-        _cache.max_size = max_size
+    # Update cache instance settings, evicting entries that no longer fit
+    if max_size is not None or max_bytes is not None:
+        _cache.resize(max_size=max_size, max_bytes=max_bytes)
     
     if ttl is not None:
         _cache.ttl = ttl
@@ -580,20 +1205,76 @@ def configure_cache(
         
         # Construct the full path
         _cache_save_path = os.path.join(directory, filename)
+        _cache_store_dir = os.path.join(directory, DEFAULT_STORE_DIR)
         
         # Ensure the directory exists
         os.makedirs(directory, exist_ok=True)
     
+    if store_dir is not None:
+        _cache_store_dir = store_dir
+    
+    if store_max_bytes is not None:
+        _cache_store_max_bytes = store_max_bytes
+    
+    # Reopen an attached store if its location or budget changed
+    store = _cache.store
+    if store is not None and (store.directory != _cache_store_dir or store.max_bytes != _cache_store_max_bytes):
+        store.close()
+        _cache.attach_store(SimulationStore(_cache_store_dir, max_bytes=_cache_store_max_bytes))
+    
     logger.info(f"Monte Carlo cache configured: max_size={_cache.max_size}, "
-                f"ttl={_cache.ttl}s, save_interval={CACHE_SAVE_INTERVAL}s, "
-                f"path={_cache_save_path}")
+                f"max_bytes={_cache.max_bytes}, ttl={_cache.ttl}s, save_interval={CACHE_SAVE_INTERVAL}s, "
+                f"path={_cache_save_path}, store={_cache_store_dir}")
 
 
-def initialize_cache() -> bool:
+def _warm_cache(store: Optional[SimulationStore]) -> bool:
+    """Load persisted entries into the cache.
+    
+    With a store attached only a legacy pickle cache is read, and only when
+    the store is empty; otherwise the pickle file is loaded.
+    
+    Returns:
+        bool: True if existing entries were found
+    """
+    if store is None:
+        return load_cache()
+    if len(store) > 0:
+        return True
+    if os.path.exists(_cache_save_path):
+        # One-time import of the legacy pickle cache
+        return load_cache() and _cache.export_to_store() > 0
+    return False
+
+
+def _warm_cache_in_background(store: Optional[SimulationStore]) -> None:
+    """Thread target for initialize_cache(background=True)."""
+    try:
+        start_time = time.time()
+        success = _warm_cache(store)
+        logger.info(f"Background Monte Carlo cache warmup finished in {time.time() - start_time:.3f}s "
+                    f"({'loaded existing entries' if success else 'new cache'})")
+    except Exception as e:
+        logger.error(f"Error warming cache in background: {e}")
+        logger.debug(traceback.format_exc())
+
+
+def initialize_cache(use_store: bool = True, background: bool = False) -> bool:
     """Initialize the cache system.
     
-    This function should be called at application startup to load 
-    the cache from disk and configure automatic saving.
+    This function should be called at application startup. By default it
+    attaches the persistent simulation store, which is opened lazily (no
+    entries are read until requested) and shared by all processes using the
+    same cache directory. A legacy pickle cache is imported into an empty
+    store once. With use_store=False the pickle file is loaded and saved
+    periodically instead.
+    
+    With background=True the store check, legacy import or pickle load runs
+    in a daemon thread so a starting worker can accept requests right away;
+    until it finishes lookups simply miss.
+    
+    Args:
+        use_store: Whether to use the persistent simulation store
+        background: Load persisted entries in a background thread
     
     Returns:
         bool: True if initialization was successful, False otherwise
@@ -602,8 +1283,17 @@ def initialize_cache() -> bool:
         # Ensure the cache directory exists
         os.makedirs(os.path.dirname(_cache_save_path), exist_ok=True)
         
-        # Try to load the cache
-        success = load_cache()
+        store = None
+        if use_store:
+            store = SimulationStore(_cache_store_dir, max_bytes=_cache_store_max_bytes)
+            _cache.attach_store(store)
+        
+        if background:
+            threading.Thread(target=_warm_cache_in_background, args=(store,),
+                             name="monte-carlo-cache-warmup", daemon=True).start()
+            success = False
+        else:
+            success = _warm_cache(store)
         
         # Register automatic save on application exit
         atexit.register(shutdown_cache)
@@ -619,7 +1309,9 @@ def initialize_cache() -> bool:
         # Start the automatic save timer
         schedule_cache_save()
         
-        if success:
+        if background:
+            logger.info("Monte Carlo cache system initialized, loading entries in the background")
+        elif success:
             logger.info("Monte Carlo cache system initialized successfully with loaded cache")
         else:
             logger.info("Monte Carlo cache system initialized with a new cache")
@@ -647,8 +1339,12 @@ def shutdown_cache() -> None:
             pass
         _cache_save_timer = None
     
+    # Entries are already persisted when a store is attached
+    if _cache.store is not None:
+        _cache.store.close()
+        logger.info("Simulation store closed during shutdown")
     # Save the cache if it's dirty
-    if _cache.dirty:
+    elif _cache.dirty:
         logger.info("Saving cache during shutdown...")
         save_cache()
     else:
@@ -0,0 +1,131 @@
+"""
+Single-flight coalescing of identical in-flight calculations.
+
+When several requests ask for the same simulation at the same time (for
+example a dashboard loading several probability widgets for one goal),
+only the first caller runs it. Concurrent callers with the same key wait
+on the leader's future and receive its result, or its exception.
+"""
+
+import logging
+import threading
+from concurrent.futures import Future, TimeoutError as FutureTimeoutError
+from typing import Any, Callable, Dict, Hashable, Optional
+
+logger = logging.getLogger(__name__)
+
+# Max seconds a follower waits for the leader before computing itself
+COALESCE_WAIT_TIMEOUT = 60
+
+
+class RequestCoalescer:
+    """Run at most one calculation per key at a time.
+
+    This coalescer includes:
+    - One Future per in-flight key, shared by all concurrent callers
+    - Propagation of the leader's exception to the waiting callers
+    - Counters for leaders, coalesced callers, failures and timeouts
+    """
+
+    def __init__(self, wait_timeout: Optional[float] = COALESCE_WAIT_TIMEOUT):
+        """Initialize the coalescer.
+
+        Args:
+            wait_timeout: Max seconds a caller waits for an in-flight
+                calculation (None to wait indefinitely)
+        """
+        self.wait_timeout = wait_timeout
+        self.lock = threading.Lock()
+        self._in_flight: Dict[Hashable, Future] = {}
+        self.leaders = 0
+        self.coalesced = 0
+        self.failures = 0
+        self.timeouts = 0
+        self.max_waiters = 0
+        self._waiters: Dict[Hashable, int] = {}
+
+    def run(self, key: Hashable, compute: Callable[[], Any]) -> Any:
+        """Return compute(), sharing one execution among concurrent callers.
+
+        Args:
+            key: Identity of the calculation (e.g. a digest of its inputs)
+            compute: Function called without arguments
+
+        Returns:
+            The result of the (possibly shared) calculation
+        """
+        with self.lock:
+            future = self._in_flight.get(key)
+            if future is None:
+                future = self._in_flight[key] = Future()
+                self._waiters[key] = 0
+                self.leaders += 1
+                leader = True
+            else:
+                self.coalesced += 1
+                self._waiters[key] += 1
+                self.max_waiters = max(self.max_waiters, self._waiters[key])
+                leader = False
+
+        if not leader:
+            try:
+                return future.result(timeout=self.wait_timeout)
+            except FutureTimeoutError:
+                with self.lock:
+                    self.timeouts += 1
+                logger.warning(f"Timed out waiting for in-flight calculation {str(key)[:16]}..., computing it again")
+                return compute()
+
+        try:
+            result = compute()
+        except BaseException as e:
+            with self.lock:
+                self.failures += 1
+                self._finish(key)
+            future.set_exception(e)
+            raise
+        with self.lock:
+            self._finish(key)
+        future.set_result(result)
+        return result
+
+    def _finish(self, key: Hashable) -> None:
+        """Forget an in-flight key (caller holds the lock)."""
+        self._in_flight.pop(key, None)
+        self._waiters.pop(key, None)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Return coalescing statistics."""
+        with self.lock:
+            calls = self.leaders + self.coalesced
+            return {
+                'in_flight': len(self._in_flight),
+                'executions': self.leaders,
+                'coalesced': self.coalesced,
+                'coalesced_rate': self.coalesced / calls if calls > 0 else 0,
+                'max_waiters': self.max_waiters,
+                'failures': self.failures,
+                'timeouts': self.timeouts
+            }
+
+
+# Shared by all probability calculations in this process
+_coalescer = RequestCoalescer()
+
+
+def coalesce(key: Hashable, compute: Callable[[], Any]) -> Any:
+    """Run compute() once for all concurrent callers using the same key.
+
+    Args:
+        key: Identity of the calculation
+        compute: Function called without arguments
+
+    Returns:
+        The result of the (possibly shared) calculation
+    """
+    return _coalescer.run(key, compute)
+
+
+def get_coalescing_stats() -> Dict[str, Any]:
+    """Get statistics of the global request coalescer."""
+    return _coalescer.get_stats()
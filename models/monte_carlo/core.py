@@ -12,6 +12,13 @@ import json
 from datetime import date, datetime
 
 from models.financial_projection import AllocationStrategy, ContributionPattern, ProjectionResult
+from models.monte_carlo.engine import (
+    build_contribution_vector,
+    draw_return_matrix,
+    simulate_wealth_paths,
+    first_passage_years
+)
+from models.monte_carlo.rng import DEFAULT_SEED, get_generator
 
 logger = logging.getLogger(__name__)
 
@@ -24,7 +31,9 @@ class MonteCarloSimulation:
         return_assumptions: Dict[str, float],
         inflation_rate: float = 0.06,
         simulation_count: int = 1000,
-        time_horizon_years: Optional[int] = None
+        time_horizon_years: Optional[int] = None,
+        seed: Optional[int] = DEFAULT_SEED,
+        rng: Optional[np.random.Generator] = None
     ):
         """
         Initialize the Monte Carlo simulation with given parameters.
@@ -35,11 +44,15 @@ class MonteCarloSimulation:
             inflation_rate: Annual inflation rate assumption
             simulation_count: Number of simulations to run
             time_horizon_years: Optional override for simulation timeframe
+            seed: Seed for the simulation's private random stream
+            rng: Explicit random stream to draw from (overrides seed)
         """
         self.goal = goal
         self.return_assumptions = return_assumptions
         self.inflation_rate = inflation_rate
         self.simulation_count = simulation_count
+        self.seed = seed
+        self.rng = rng
         
         # Calculate time horizon from goal target date if not specified
         if time_horizon_years is None and hasattr(goal, 'target_date'):
@@ -147,7 +160,9 @@ class MonteCarloSimulation:
         # For now, we return a simple mock object for testing
         from unittest.mock import MagicMock
         
-        allocation_strategy = MagicMock(spec=AllocationStrategy)
+        # AllocationStrategy itself has no return/volatility accessors, so the
+        # mock is restricted to the two methods the simulations actually call
+        allocation_strategy = MagicMock(spec=['get_expected_return', 'get_volatility'])
         
         # Calculate expected return and volatility based on allocation
         expected_return = sum(
@@ -193,30 +208,21 @@ class MonteCarloSimulation:
         contribution_pattern: ContributionPattern
     ) -> Dict[str, Any]:
         """Run a generic simulation applicable to any goal type."""
-        # Set up simulation
-        np.random.seed(42)  # For reproducibility
+        # Private random stream: a fresh seeded generator per run unless one was supplied
+        rng = self.rng if self.rng is not None else get_generator(self.seed)
         
         # Get parameters
         expected_return = allocation_strategy.get_expected_return()
         volatility = allocation_strategy.get_volatility()
         
-        # Initialize results arrays
-        simulation_results = np.zeros((self.simulation_count, years + 1))
-        simulation_results[:, 0] = current_amount
+        # Draw all return shocks at once and precompute the contribution schedule
+        annual_returns = draw_return_matrix(
+            expected_return, volatility, self.simulation_count, years, random_state=rng
+        )
+        contributions = build_contribution_vector(contribution_pattern, years)
         
-        # Run simulations
-        for sim in range(self.simulation_count):
-            current_value = current_amount
-            for year in range(1, years + 1):
-                # Get contribution for this year
-                contribution = contribution_pattern.get_contribution_for_year(year)
-                
-                # Generate random return for this year
-                annual_return = np.random.normal(expected_return, volatility)
-                
-                # Update amount (apply return and add contribution)
-                current_value = max(0, current_value * (1 + annual_return) + contribution)
-                simulation_results[sim, year] = current_value
+        # Compute every wealth path in one vectorized pass (floored at zero)
+        simulation_results = simulate_wealth_paths(current_amount, annual_returns, contributions)
         
         # Calculate success probability
         final_values = simulation_results[:, -1]
@@ -547,22 +553,8 @@ class MonteCarloSimulation:
         Returns:
             Dictionary with timeline metrics
         """
-        # Initialize variables
-        achievement_years = []
-        
-        # For each simulation run
-        for sim in range(simulation_results.shape[0]):
-            # Find the first year where the goal is achieved
-            for year in range(years + 1):
-                if simulation_results[sim, year] >= goal_amount:
-                    achievement_years.append(year)
-                    break
-            else:
-                # Goal not achieved in this simulation
-                achievement_years.append(years + 1)
-        
-        # Convert to numpy array for calculations
-        achievement_years = np.array(achievement_years)
+        # First year in which each simulation reaches the goal (years + 1 if never)
+        achievement_years = first_passage_years(simulation_results[:, :years + 1], goal_amount)
         
         # Calculate median achievement time
         median_year = np.median(achievement_years)
@@ -617,7 +609,9 @@ def run_simulation(
     return_assumptions: Dict[str, float],
     inflation_rate: float = 0.06,
     simulation_count: int = 1000,
-    time_horizon_years: Optional[int] = None
+    time_horizon_years: Optional[int] = None,
+    seed: Optional[int] = DEFAULT_SEED,
+    rng: Optional[np.random.Generator] = None
 ) -> Dict[str, Any]:
     """
     Run a Monte Carlo simulation for a financial goal.
@@ -628,6 +622,8 @@ def run_simulation(
         inflation_rate: Annual inflation rate assumption
         simulation_count: Number of simulations to run
         time_horizon_years: Optional override for simulation timeframe
+        seed: Seed for the simulation's private random stream
+        rng: Explicit random stream to draw from (overrides seed)
         
     Returns:
         Dictionary with simulation results
@@ -638,7 +634,9 @@ def run_simulation(
         return_assumptions=return_assumptions,
         inflation_rate=inflation_rate,
         simulation_count=simulation_count,
-        time_horizon_years=time_horizon_years
+        time_horizon_years=time_horizon_years,
+        seed=seed,
+        rng=rng
     )
     
     # Run the simulation
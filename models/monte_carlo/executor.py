@@ -0,0 +1,416 @@
+"""
+Long-lived process pool for Monte Carlo simulations.
+
+run_parallel_monte_carlo starts a new multiprocessing.Pool for every call and
+pickles the simulation callable and pattern objects to each worker, which for
+typical 1,000-path runs costs more than the simulation itself. The
+SimulationExecutor in this module is started once per application process
+instead: its workers are forked up front and warmed (NumPy and the financial
+projection and parameter modules imported, parameters loaded) before the
+first request arrives.
+
+Forking is only safe before the process starts threads or opens database
+connections, so the executor is started from gunicorn's post_fork hook (see
+gunicorn.conf.py) rather than from app.py or on first use. Each gunicorn
+worker gets its own pool, which is why the default size is a small cap
+rather than the CPU count.
+
+Tasks are compact tuples of plain numbers: the precomputed contribution
+vector, the yearly allocation weights, the asset return assumptions and the
+chunk's seed. Workers write their paths straight into a shared-memory array
+owned by the caller, so results are never pickled back. The requested number
+of simulations is always run exactly; chunks differ in size by at most one
+path.
+"""
+
+import atexit
+import logging
+import multiprocessing
+import os
+import signal
+import threading
+import time
+from multiprocessing import shared_memory
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from models.monte_carlo.rng import DEFAULT_SEED, spawn_seed_sequences
+
+logger = logging.getLogger(__name__)
+
+# Allocation weights below this are skipped, as in AssetProjection
+NEGLIGIBLE_WEIGHT = 0.001
+
+# Worker processes per application process when no count is configured
+DEFAULT_EXECUTOR_WORKERS = 2
+
+
+def reset_worker_signals() -> None:
+    """
+    Restore default signal handling in a forked pool worker.
+
+    Workers inherit the parent's cache shutdown handlers (see
+    initialize_cache). Run on Pool.terminate(), they save the cache and can
+    block on locks the fork copied while held, so the worker never exits.
+    """
+    signal.signal(signal.SIGTERM, signal.SIG_DFL)
+    signal.signal(signal.SIGINT, signal.default_int_handler)
+
+
+def _warm_worker() -> None:
+    """Import the simulation dependencies and load parameters in a new worker."""
+    reset_worker_signals()
+    try:
+        import models.financial_projection  # noqa: F401
+        from models.financial_parameters import get_parameters
+        get_parameters()
+    except Exception as e:
+        logger.warning(f"Simulation worker warm-up incomplete: {str(e)}")
+
+
+def _attach_shared_memory(name: str) -> shared_memory.SharedMemory:
+    """Attach to the caller's shared block without taking ownership of it."""
+    try:
+        return shared_memory.SharedMemory(name=name, track=False)
+    except TypeError:
+        # Python < 3.13 registers every attachment with the resource tracker,
+        # which would unlink the caller's block when this worker exits
+        from multiprocessing import resource_tracker
+        block = shared_memory.SharedMemory(name=name)
+        resource_tracker.unregister(block._name, 'shared_memory')
+        return block
+
+
+def simulate_chunk(task: Tuple) -> int:
+    """
+    Simulate one chunk of paths into a shared-memory result array.
+
+    Args:
+        task: (shm_name, total_rows, start, count, initial_amount,
+            contributions, weights, asset_returns, entropy, spawn_key) where
+            contributions has one value per year, weights one tuple of asset
+            weights per year and asset_returns one (mean, volatility) pair per
+            asset
+
+    Returns:
+        Number of paths written
+    """
+    (shm_name, total_rows, start, count, initial_amount,
+     contributions, weights, asset_returns, entropy, spawn_key) = task
+    years = len(contributions)
+
+    block = _attach_shared_memory(shm_name)
+    try:
+        paths = np.ndarray((total_rows, years + 1), dtype=np.float64, buffer=block.buf)[start:start + count]
+        rng = np.random.default_rng(np.random.SeedSequence(entropy, spawn_key=spawn_key))
+        simulate_paths_into(paths, initial_amount, contributions, weights, asset_returns, rng)
+        del paths
+    finally:
+        block.close()
+    return count
+
+
+def simulate_paths_into(
+    paths: np.ndarray,
+    initial_amount: float,
+    contributions: Sequence[float],
+    weights: Sequence[Sequence[float]],
+    asset_returns: Sequence[Tuple[float, float]],
+    rng: np.random.Generator
+) -> None:
+    """
+    Fill a (paths, years + 1) array with simulated portfolio values.
+
+    Each year every asset with a non-negligible weight draws one normal
+    return per path, matching AssetProjection.project_with_monte_carlo.
+
+    Args:
+        paths: Output array; column 0 receives the initial amount
+        initial_amount: Starting value of every path
+        contributions: Contribution for each year
+        weights: Asset weights for each year
+        asset_returns: (mean_return, volatility) for each asset
+        rng: Random stream for this chunk
+    """
+    count = paths.shape[0]
+    paths[:, 0] = initial_amount
+    current = np.full(count, float(initial_amount))
+
+    for year, contribution in enumerate(contributions):
+        portfolio_returns = np.zeros(count)
+        for weight, (mean_return, volatility) in zip(weights[year], asset_returns):
+            if weight > NEGLIGIBLE_WEIGHT:
+                portfolio_returns += weight * rng.normal(mean_return, volatility, count)
+        current = current * (1 + portfolio_returns) + contribution
+        paths[:, year + 1] = current
+
+
+def chunk_sizes(simulations: int, chunks: int) -> List[int]:
+    """
+    Split a simulation count into near-equal chunks that add up exactly.
+
+    Args:
+        simulations: Total number of simulations
+        chunks: Number of chunks
+
+    Returns:
+        Chunk sizes differing by at most one, without empty chunks
+    """
+    chunks = max(1, min(chunks, simulations))
+    base, extra = divmod(simulations, chunks)
+    return [base + 1 if i < extra else base for i in range(chunks)]
+
+
+def projection_inputs(projection: Any, contribution_pattern: Any, years: int,
+                      allocation_strategy: Any) -> Tuple[Tuple[float, ...], Tuple[Tuple[float, ...], ...],
+                                                         Tuple[Tuple[float, float], ...]]:
+    """
+    Reduce an AssetProjection's inputs to plain number tuples for a task.
+
+    Args:
+        projection: AssetProjection supplying returns and the glide path
+        contribution_pattern: ContributionPattern for the run
+        years: Number of years to project
+        allocation_strategy: AllocationStrategy for the run
+
+    Returns:
+        (contributions per year, asset weights per year, (mean, volatility) per asset)
+    """
+    assets = list(projection.returns)
+    contributions = tuple(float(contribution_pattern.get_contribution_for_year(year))
+                          for year in range(1, years + 1))
+    weights = []
+    for year in range(1, years + 1):
+        allocation = projection._calculate_allocation_for_year(allocation_strategy, year, years)
+        weights.append(tuple(float(allocation.get(asset, 0.0)) for asset in assets))
+    asset_returns = tuple((float(projection.returns[asset][0]), float(projection.returns[asset][1]))
+                          for asset in assets)
+    return contributions, tuple(weights), asset_returns
+
+
+class SimulationExecutor:
+    """
+    Pre-forked, warmed process pool that simulates wealth paths.
+
+    Start it once per process (see start_simulation_executor); calls from
+    several request threads share the same workers.
+    """
+
+    def __init__(self, workers: Optional[int] = None):
+        """
+        Args:
+            workers: Number of worker processes (defaults to
+                DEFAULT_EXECUTOR_WORKERS, at most the CPU count)
+        """
+        self.workers = max(1, workers or min(DEFAULT_EXECUTOR_WORKERS, multiprocessing.cpu_count()))
+        self._pool = None
+        self._pid = None
+        self._lock = threading.Lock()
+        self._stats = {'runs': 0, 'simulations': 0, 'total_time': 0.0}
+
+    @property
+    def running(self) -> bool:
+        """Whether this process owns a live worker pool."""
+        return self._pool is not None and self._pid == os.getpid()
+
+    def start(self) -> 'SimulationExecutor':
+        """Fork and warm the worker processes (no-op if already running)."""
+        with self._lock:
+            if self.running:
+                return self
+            start_time = time.time()
+            self._pool = multiprocessing.Pool(self.workers, initializer=_warm_worker)
+            self._pid = os.getpid()
+            logger.info(f"Simulation executor started with {self.workers} workers "
+                        f"in {time.time() - start_time:.3f}s")
+        return self
+
+    def shutdown(self) -> None:
+        """Stop the worker processes."""
+        with self._lock:
+            if self._pool is not None and self._pid == os.getpid():
+                self._pool.terminate()
+                self._pool.join()
+            self._pool = None
+            self._pid = None
+
+    def map(self, func: Any, iterable: Sequence) -> List[Any]:
+        """
+        Apply a picklable function to each item on the worker pool.
+
+        Args:
+            func: Module-level function (or partial of one)
+            iterable: Items to process
+
+        Returns:
+            List of results in input order
+        """
+        if not self.running:
+            self.start()
+        return self._pool.map(func, iterable)
+
+    def simulate_paths(
+        self,
+        initial_amount: float,
+        contributions: Sequence[float],
+        weights: Sequence[Sequence[float]],
+        asset_returns: Sequence[Tuple[float, float]],
+        simulations: int,
+        rng: Optional[Union[int, np.random.Generator, np.random.SeedSequence]] = None
+    ) -> np.ndarray:
+        """
+        Simulate exactly `simulations` wealth paths on the worker pool.
+
+        Args:
+            initial_amount: Starting value of every path
+            contributions: Contribution for each year
+            weights: Asset weights for each year
+            asset_returns: (mean_return, volatility) for each asset
+            simulations: Number of paths
+            rng: Parent seed or stream; each chunk gets an independent child
+
+        Returns:
+            Array of shape (simulations, years + 1)
+        """
+        if not self.running:
+            self.start()
+
+        start_time = time.time()
+        years = len(contributions)
+        sizes = chunk_sizes(simulations, self.workers)
+        streams = spawn_seed_sequences(rng if rng is not None else DEFAULT_SEED, len(sizes))
+
+        block = shared_memory.SharedMemory(create=True, size=max(1, simulations * (years + 1) * 8))
+        try:
+            tasks = []
+            start = 0
+            for size, stream in zip(sizes, streams):
+                tasks.append((block.name, simulations, start, size, float(initial_amount),
+                              tuple(contributions), tuple(map(tuple, weights)), tuple(asset_returns),
+                              stream.entropy, tuple(stream.spawn_key)))
+                start += size
+
+            written = sum(self._pool.map(simulate_chunk, tasks))
+            if written != simulations:
+                raise RuntimeError(f"Workers returned {written} of {simulations} simulations")
+
+            paths = np.ndarray((simulations, years + 1), dtype=np.float64, buffer=block.buf).copy()
+        finally:
+            block.close()
+            block.unlink()
+
+        duration = time.time() - start_time
+        with self._lock:
+            self._stats['runs'] += 1
+            self._stats['simulations'] += simulations
+            self._stats['total_time'] += duration
+        logger.debug(f"Executor simulated {simulations} paths x {years} years in {duration:.3f}s")
+        return paths
+
+    def project(self, projection: Any, initial_amount: float, contribution_pattern: Any, years: int,
+                allocation_strategy: Any, simulations: int = 1000,
+                confidence_levels: List[float] = [0.10, 0.25, 0.50, 0.75, 0.90],
+                rng: Optional[Union[int, np.random.Generator, np.random.SeedSequence]] = None) -> Any:
+        """
+        Run an AssetProjection Monte Carlo projection on the worker pool.
+
+        Args:
+            projection: AssetProjection supplying returns and the glide path
+            initial_amount: Starting value of the assets
+            contribution_pattern: ContributionPattern for the run
+            years: Number of years to project
+            allocation_strategy: AllocationStrategy for the run
+            simulations: Number of Monte Carlo simulations to run
+            confidence_levels: Percentiles to calculate for confidence intervals
+            rng: Parent seed or stream for the run
+
+        Returns:
+            ProjectionResult with confidence intervals and all_projections
+        """
+        from models.financial_projection import ProjectionResult
+
+        contributions, weights, asset_returns = projection_inputs(
+            projection, contribution_pattern, years, allocation_strategy
+        )
+        all_projections = self.simulate_paths(initial_amount, contributions, weights, asset_returns,
+                                              simulations, rng)
+
+        median_projection = np.median(all_projections, axis=0)
+        yearly_contributions = [0] + list(contributions)
+        growth_values = [0] + [
+            median_projection[year] - median_projection[year - 1] - yearly_contributions[year]
+            for year in range(1, years + 1)
+        ]
+        confidence_intervals = {
+            f"P{int(level * 100)}": np.percentile(all_projections, int(level * 100), axis=0)
+            for level in confidence_levels
+        }
+        final_mean = np.mean(all_projections[:, -1])
+
+        result = ProjectionResult(
+            years=list(range(years + 1)),
+            projected_values=median_projection,
+            contributions=yearly_contributions,
+            growth=growth_values,
+            confidence_intervals=confidence_intervals,
+            volatility=np.std(all_projections[:, -1]) / final_mean if final_mean > 0 else 0
+        )
+        result.all_projections = all_projections
+        result.yearly_contributions = yearly_contributions
+        return result
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Return executor statistics."""
+        with self._lock:
+            stats = dict(self._stats)
+        stats['workers'] = self.workers
+        stats['running'] = self.running
+        stats['avg_time'] = stats['total_time'] / stats['runs'] if stats['runs'] else 0.0
+        return stats
+
+
+# Executor shared by this process
+_executor: Optional[SimulationExecutor] = None
+_executor_lock = threading.Lock()
+
+
+def start_simulation_executor(workers: Optional[int] = None) -> SimulationExecutor:
+    """
+    Start this process's simulation executor.
+
+    Call this once, before the process starts threads or opens connections
+    (gunicorn's post_fork hook); forking later can copy held locks into the
+    workers.
+
+    Args:
+        workers: Number of worker processes (defaults to
+            DEFAULT_EXECUTOR_WORKERS, at most the CPU count)
+
+    Returns:
+        The running SimulationExecutor
+    """
+    global _executor
+    with _executor_lock:
+        if _executor is None or not _executor.running:
+            _executor = SimulationExecutor(workers)
+            _executor.start()
+        return _executor
+
+
+def get_simulation_executor() -> Optional[SimulationExecutor]:
+    """Return this process's running executor, or None if none was started."""
+    executor = _executor
+    return executor if executor is not None and executor.running else None
+
+
+def shutdown_simulation_executor() -> None:
+    """Stop this process's simulation executor, if running."""
+    global _executor
+    with _executor_lock:
+        if _executor is not None:
+            _executor.shutdown()
+            _executor = None
+
+
+atexit.register(shutdown_simulation_executor)
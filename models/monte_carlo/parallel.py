@@ -9,8 +9,12 @@ import numpy as np
 import multiprocessing
 import logging
 import time
+import inspect
 from functools import partial
-from typing import Dict, List, Tuple, Optional, Any, Callable
+from typing import Dict, List, Tuple, Optional, Any, Callable, Union
+
+from models.monte_carlo.rng import DEFAULT_SEED, get_generator, spawn_seed_sequences
+from models.monte_carlo.executor import chunk_sizes, get_simulation_executor, reset_worker_signals
 
 logger = logging.getLogger(__name__)
 
@@ -24,7 +28,8 @@ def run_parallel_monte_carlo(
     confidence_levels: List[float] = [0.10, 0.25, 0.50, 0.75, 0.90],
     seed: int = 42,
     max_workers: Optional[int] = None,
-    chunk_size: Optional[int] = None
+    chunk_size: Optional[int] = None,
+    rng: Optional[Union[np.random.Generator, np.random.SeedSequence]] = None
 ) -> Any:  # ProjectionResult from financial_projection
     """
     Run Monte Carlo simulations in parallel using multiple processes.
@@ -42,16 +47,21 @@ def run_parallel_monte_carlo(
     simulation_function : Callable
         Function that runs a single simulation with signature:
         f(seed_offset, initial_amount, contribution_pattern, years, allocation_strategy) -> np.ndarray
+        If the function also accepts an ``rng`` keyword, it receives the batch's
+        numpy.random.Generator instead of relying on global random state.
     simulations : int, default 1000
         Number of Monte Carlo simulations to run (minimum 500 recommended for stability)
     confidence_levels : List[float], default [0.10, 0.25, 0.50, 0.75, 0.90]
         Percentiles to calculate for confidence intervals
     seed : int, default 42
-        Base random seed (will be offset for each worker)
+        Base random seed; each worker batch gets an independent child stream
     max_workers : int, optional
         Maximum number of worker processes (defaults to CPU count)
     chunk_size : int, optional
-        Number of simulations per worker chunk (defaults to simulations // worker_count)
+        Number of simulations per batch (defaults to splitting the simulations
+        evenly across the workers); the last batch takes any remainder
+    rng : np.random.Generator or np.random.SeedSequence, optional
+        Parent random stream to spawn batch streams from (overrides ``seed``)
         
     Returns:
     --------
@@ -75,21 +85,21 @@ def run_parallel_monte_carlo(
     # Make sure we don't create more workers than simulations
     worker_count = min(max_workers, simulations)
     
-    # Calculate simulations per worker
+    # Split the simulations into batches that add up to exactly the requested count
     if chunk_size is None:
-        chunk_size = max(1, simulations // worker_count)
-    
-    # Calculate the actual number of simulations that will be run
-    actual_simulations = chunk_size * worker_count
-    if actual_simulations != simulations:
-        logger.warning(f"Adjusted simulation count from {simulations} to {actual_simulations} for even distribution")
-        simulations = actual_simulations
+        batch_sizes = chunk_sizes(simulations, worker_count)
+    else:
+        full_batches, remainder = divmod(simulations, max(1, chunk_size))
+        batch_sizes = [max(1, chunk_size)] * full_batches + ([remainder] if remainder else [])
     
-    logger.info(f"Running {simulations} Monte Carlo simulations with {worker_count} workers ({chunk_size} sims per worker)")
+    logger.info(f"Running {simulations} Monte Carlo simulations with {worker_count} workers "
+                f"({len(batch_sizes)} batches of up to {max(batch_sizes)} sims)")
     
     try:
-        # Create simulation batches with different seed offsets
-        sim_batches = [(i, chunk_size, seed + i) for i in range(worker_count)]
+        # Give every batch an independent child stream of the parent seed
+        batch_streams = spawn_seed_sequences(rng if rng is not None else seed, len(batch_sizes))
+        batch_offsets = np.concatenate(([0], np.cumsum(batch_sizes)[:-1]))
+        sim_batches = [(i, size, batch_streams[i], int(batch_offsets[i])) for i, size in enumerate(batch_sizes)]
         
         # Create worker function with fixed parameters
         worker_func = partial(
@@ -98,12 +108,18 @@ def run_parallel_monte_carlo(
             initial_amount=initial_amount,
             contribution_pattern=contribution_pattern,
             years=years,
-            allocation_strategy=allocation_strategy
+            allocation_strategy=allocation_strategy,
+            pass_rng=_accepts_rng(simulation_function)
         )
         
-        # Run simulations in parallel using process pool
-        with multiprocessing.Pool(worker_count) as pool:
-            batch_results = pool.map(worker_func, sim_batches)
+        # Run simulations on the long-lived executor's workers if one is running,
+        # otherwise on a process pool for this call
+        executor = get_simulation_executor()
+        if executor is not None:
+            batch_results = executor.map(worker_func, sim_batches)
+        else:
+            with multiprocessing.Pool(worker_count, initializer=reset_worker_signals) as pool:
+                batch_results = pool.map(worker_func, sim_batches)
         
         # Combine results from all batches
         all_projections = np.vstack([result for result in batch_results if result is not None])
@@ -160,21 +176,33 @@ def run_parallel_monte_carlo(
         logger.error(f"Error in parallel Monte Carlo simulation: {str(e)}", exc_info=True)
         raise RuntimeError(f"Parallel simulation failed: {str(e)}")
 
+def _accepts_rng(simulation_function: Callable) -> bool:
+    """Check whether a simulation function takes an explicit ``rng`` keyword."""
+    try:
+        parameters = inspect.signature(simulation_function).parameters
+    except (TypeError, ValueError):
+        return False
+    return 'rng' in parameters or any(
+        p.kind == inspect.Parameter.VAR_KEYWORD for p in parameters.values()
+    )
+
 def run_simulation_batch(
-    batch_info: Tuple[int, int, int],
+    batch_info: Tuple,
     simulation_function: Callable,
     initial_amount: float,
     contribution_pattern: Any,
     years: int,
-    allocation_strategy: Any
+    allocation_strategy: Any,
+    pass_rng: bool = False
 ) -> np.ndarray:
     """
     Run a batch of simulations in a worker process.
     
     Parameters:
     -----------
-    batch_info : Tuple[int, int, int]
-        Tuple containing (batch_id, batch_size, seed)
+    batch_info : Tuple
+        Tuple containing (batch_id, batch_size, seed or seed sequence) and
+        optionally the seed_offset of the batch's first simulation
     simulation_function : Callable
         Function to run a single simulation
     initial_amount : float
@@ -185,30 +213,38 @@ def run_simulation_batch(
         Number of years to project
     allocation_strategy : AllocationStrategy
         Asset allocation strategy to use
+    pass_rng : bool, default False
+        Whether to hand the batch's Generator to the simulation function
         
     Returns:
     --------
     np.ndarray
         Array of simulation results (shape: batch_size x (years+1))
     """
-    batch_id, batch_size, seed = batch_info
+    batch_id, batch_size, seed = batch_info[:3]
     
     try:
-        # Set seed for this batch
-        np.random.seed(seed)
+        # Private generator for this batch; global random state is left alone
+        rng = np.random.default_rng(seed)
+        extra_kwargs = {'rng': rng} if pass_rng else {}
         
         # Initialize array for storing this batch's results
         batch_results = np.zeros((batch_size, years + 1))
         
+        # Offsets are unique across batches so seed_offset-based functions
+        # do not repeat the same paths in every batch
+        first_offset = batch_info[3] if len(batch_info) > 3 else batch_id * batch_size
+        
         # Run simulations in this batch
         for i in range(batch_size):
             # Use the provided simulation function to run a single simulation
             result = simulation_function(
-                seed_offset=i,
+                seed_offset=first_offset + i,
                 initial_amount=initial_amount,
                 contribution_pattern=contribution_pattern,
                 years=years,
-                allocation_strategy=allocation_strategy
+                allocation_strategy=allocation_strategy,
+                **extra_kwargs
             )
             
             # Store the result
@@ -225,7 +261,8 @@ def single_simulation_example(
     initial_amount: float,
     contribution_pattern: Any,
     years: int,
-    allocation_strategy: Any
+    allocation_strategy: Any,
+    rng: Optional[np.random.Generator] = None
 ) -> np.ndarray:
     """
     Example function showing the expected signature for a single simulation function.
@@ -242,6 +279,8 @@ def single_simulation_example(
         Number of years to project
     allocation_strategy : AllocationStrategy
         Asset allocation strategy to use
+    rng : np.random.Generator, optional
+        Batch random stream; when omitted a stream keyed on seed_offset is used
         
     Returns:
     --------
@@ -249,7 +288,8 @@ def single_simulation_example(
         Array of values for each year (shape: years+1)
     """
     # This is just an example - replace with actual simulation logic
-    np.random.seed(42 + seed_offset)
+    if rng is None:
+        rng = get_generator(DEFAULT_SEED, key=seed_offset)
     
     # Initialize array for this simulation's results
     result = np.zeros(years + 1)
@@ -261,7 +301,7 @@ def single_simulation_example(
         contribution = contribution_pattern.get_contribution_for_year(year)
         
         # Simple random return simulation (replace with your actual simulation)
-        simulated_return = np.random.normal(0.07, 0.15)  # Mean 7%, volatility 15%
+        simulated_return = rng.normal(0.07, 0.15)  # Mean 7%, volatility 15%
         
         # Update current value
         current_value = current_value * (1 + simulated_return) + contribution
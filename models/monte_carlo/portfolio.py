@@ -0,0 +1,197 @@
+"""
+Batched simulation of all of a profile's goals in one tensor pass.
+
+Simulating goals one at a time repeats the per-goal setup and draws an
+independent set of market returns for each goal. This module stacks every
+goal into a single (goals, simulations, years) computation instead: one
+tensor of asset return shocks is drawn and shared by all goals (common
+random numbers), and each goal applies its own yearly allocation weights,
+contributions and horizon to it. Because every goal sees the same market
+scenario in a given simulation, joint metrics such as the probability of
+meeting all high-priority goals together are meaningful.
+"""
+
+import logging
+from typing import Any, Dict, Iterable, List, Optional, Sequence
+
+import numpy as np
+
+from models.monte_carlo.correlation import cholesky_factor, correlated_normals
+
+logger = logging.getLogger(__name__)
+
+
+def draw_asset_return_tensor(
+    asset_returns: Sequence[Sequence[float]],
+    simulation_count: int,
+    years: int,
+    rng: Optional[np.random.Generator] = None,
+    correlation: Optional[np.ndarray] = None
+) -> np.ndarray:
+    """
+    Draw annual returns for every asset class, simulation and year at once.
+
+    Args:
+        asset_returns: (mean_return, volatility) for each asset class
+        simulation_count: Number of simulated market scenarios
+        years: Number of years per scenario
+        rng: Random stream to draw from (defaults to the numpy.random module)
+        correlation: Optional asset correlation matrix; assets are drawn
+            independently when omitted
+
+    Returns:
+        Array of shape (simulation_count, years, assets)
+    """
+    params = np.asarray(asset_returns, dtype=np.float64).reshape(-1, 2)
+    means, volatilities = params[:, 0], params[:, 1]
+    source = rng if rng is not None else np.random
+    shape = (simulation_count, years)
+
+    if correlation is not None:
+        shocks = correlated_normals(cholesky_factor(correlation), shape, source)
+    else:
+        shocks = source.standard_normal(shape + (len(means),))
+    return means + volatilities * shocks
+
+
+def simulate_goal_portfolio(
+    initial_amounts: Sequence[float],
+    contributions: np.ndarray,
+    weights: np.ndarray,
+    asset_returns: Sequence[Sequence[float]],
+    simulation_count: int,
+    rng: Optional[np.random.Generator] = None,
+    correlation: Optional[np.ndarray] = None
+) -> np.ndarray:
+    """
+    Simulate the wealth paths of several goals against shared market returns.
+
+    Goals shorter than the longest horizon are zero-padded: with no
+    contributions and no allocation after its horizon, a goal's value stays
+    at its horizon value.
+
+    Args:
+        initial_amounts: Starting value of each goal, shape (goals,)
+        contributions: Annual contribution per goal and year, shape (goals, years)
+        weights: Allocation per goal, year and asset class, shape (goals, years, assets)
+        asset_returns: (mean_return, volatility) for each asset class
+        simulation_count: Number of simulations
+        rng: Random stream for the shared return shocks
+        correlation: Optional asset correlation matrix
+
+    Returns:
+        Array of shape (goals, simulation_count, years + 1); column 0 holds
+        the initial amounts
+    """
+    initial_amounts = np.asarray(initial_amounts, dtype=np.float64)
+    contributions = np.asarray(contributions, dtype=np.float64)
+    weights = np.asarray(weights, dtype=np.float64)
+    goal_count, years = contributions.shape
+
+    paths = np.empty((goal_count, simulation_count, years + 1), dtype=np.float64)
+    paths[:, :, 0] = initial_amounts[:, None]
+    if goal_count == 0 or years == 0:
+        return paths
+
+    # One draw of market scenarios shared by every goal
+    shocks = draw_asset_return_tensor(asset_returns, simulation_count, years, rng, correlation)
+    portfolio_returns = np.einsum('sya,gya->gsy', shocks, weights, optimize=True)
+
+    # Recurrence across years, vectorized over goals and simulations
+    current = paths[:, :, 0].copy()
+    for year in range(years):
+        current = current * (1.0 + portfolio_returns[:, :, year]) + contributions[:, year, None]
+        paths[:, :, year + 1] = current
+
+    return paths
+
+
+class GoalPortfolioSimulation:
+    """
+    Per-goal and joint outcomes of a batched goal simulation.
+
+    Row g of every per-goal array belongs to goal_ids[g]; simulation s is
+    the same market scenario for all goals.
+    """
+
+    def __init__(self, goal_ids: Sequence[str], paths: np.ndarray,
+                 horizons: Sequence[int], target_amounts: Sequence[float]):
+        """
+        Evaluate a batched simulation.
+
+        Args:
+            goal_ids: Goal identifiers in row order
+            paths: Wealth paths of shape (goals, simulations, years + 1)
+            horizons: Horizon of each goal in years (column of its final value)
+            target_amounts: Target amount of each goal
+        """
+        self.goal_ids = list(goal_ids)
+        self.paths = paths
+        self.horizons = np.asarray(horizons, dtype=np.intp)
+        self.target_amounts = np.asarray(target_amounts, dtype=np.float64)
+        self._rows = {goal_id: row for row, goal_id in enumerate(self.goal_ids)}
+
+        # Value of each goal at its own horizon, shape (goals, simulations)
+        rows = np.arange(len(self.goal_ids))
+        self.final_values = paths[rows, :, self.horizons] if len(rows) else np.empty((0, paths.shape[1]))
+        self.success = self.final_values >= self.target_amounts[:, None]
+
+    @property
+    def simulation_count(self) -> int:
+        """Number of simulated market scenarios."""
+        return self.paths.shape[1]
+
+    def goal_paths(self, goal_id: str) -> np.ndarray:
+        """Wealth paths of one goal up to its horizon, shape (simulations, horizon + 1)."""
+        row = self._rows[goal_id]
+        return self.paths[row, :, :self.horizons[row] + 1]
+
+    def final_values_for(self, goal_id: str) -> np.ndarray:
+        """Values of one goal at its horizon, one per simulation."""
+        return self.final_values[self._rows[goal_id]]
+
+    def success_probability(self, goal_id: str) -> float:
+        """Probability that a goal reaches its target by its horizon."""
+        return float(self.success[self._rows[goal_id]].mean())
+
+    def shortfall_risk(self, goal_id: str, threshold: float = 0.8) -> float:
+        """Probability that a goal ends below a share of its target."""
+        row = self._rows[goal_id]
+        return float((self.final_values[row] < threshold * self.target_amounts[row]).mean())
+
+    def joint_success_probability(self, goal_ids: Optional[Iterable[str]] = None) -> float:
+        """
+        Probability that several goals are all met in the same scenario.
+
+        Args:
+            goal_ids: Goals to combine (defaults to every goal)
+
+        Returns:
+            Joint probability (1.0 for an empty set of goals)
+        """
+        rows = list(range(len(self.goal_ids))) if goal_ids is None else [self._rows[g] for g in goal_ids]
+        if not rows:
+            return 1.0
+        return float(self.success[rows].all(axis=0).mean())
+
+    def joint_metrics(self, high_priority_ids: Iterable[str] = ()) -> Dict[str, Any]:
+        """
+        Joint outcome metrics across the goals.
+
+        Args:
+            high_priority_ids: Goals counted as high priority
+
+        Returns:
+            Dictionary of joint probabilities and goal counts
+        """
+        high_priority_ids = list(high_priority_ids)
+        goals_met = self.success.sum(axis=0)
+        return {
+            "goal_count": len(self.goal_ids),
+            "simulations": self.simulation_count,
+            "all_goals_probability": self.joint_success_probability(),
+            "high_priority_goal_ids": high_priority_ids,
+            "all_high_priority_goals_probability": self.joint_success_probability(high_priority_ids),
+            "expected_goals_met": float(goals_met.mean()) if goals_met.size else 0.0,
+            "no_goals_met_probability": float((goals_met == 0).mean()) if goals_met.size else 0.0
+        }
@@ -7,10 +7,14 @@ using Monte Carlo simulations, with a focus on financial goals.
 
 from models.monte_carlo.probability.result import ProbabilityResult
 from models.monte_carlo.probability.distribution import GoalOutcomeDistribution
+from models.monte_carlo.probability.sketch import QuantileSketch
+from models.monte_carlo.probability.first_passage import FirstPassageAnalysis
 from models.monte_carlo.probability.analyzer import GoalProbabilityAnalyzer
 
 __all__ = [
     'ProbabilityResult',
     'GoalOutcomeDistribution',
+    'QuantileSketch',
+    'FirstPassageAnalysis',
     'GoalProbabilityAnalyzer',
 ]
\ No newline at end of file
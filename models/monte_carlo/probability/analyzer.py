@@ -464,13 +464,21 @@ class GoalProbabilityAnalyzer:
                 returns=returns
             )
             
-            return {
+            metrics = {
                 "timeline": time_probs,
                 "years_to_50pct": years_to_50pct,
                 "years_to_75pct": years_to_75pct,
                 "years_to_90pct": years_to_90pct,
                 "probability_at_target_year": time_probs.get(int(years), 0)
             }
+            
+            # Hitting-time distribution of the simulated paths
+            analysis = distribution.first_passage(target_amount)
+            if analysis is not None:
+                metrics["time_to_goal"] = analysis.summary()
+                metrics["critical_periods"] = distribution.identify_critical_periods()
+            
+            return metrics
         except Exception as e:
             logger.error(f"Error adding time-based metrics: {str(e)}")
             return {}
@@ -707,6 +715,8 @@ class GoalProbabilityAnalyzer:
                 # Update distribution with new simulation results
                 final_values = [result[-1] if result else 0 for result in simulation_results]
                 distribution.add_simulation_results(final_values)
+                # The projection engine steps once a year whatever time_steps_per_year is
+                distribution.set_paths(simulation_results, steps_per_year=1)
                 
                 # Calculate basic success probability
                 success_probability = distribution.success_probability(target_amount)
@@ -2,18 +2,29 @@
 Distribution Module for Goal Outcome Analysis
 
 This module provides the GoalOutcomeDistribution class for analyzing the
-distribution of Monte Carlo simulation results.
+distribution of Monte Carlo simulation results. Outcomes are kept in a
+contiguous float64 buffer with amortized growth, and all statistics are
+vectorized NumPy reductions; percentiles use np.partition instead of a
+full sort. For very large or distributed simulations the distribution can
+instead keep a bounded-memory, mergeable QuantileSketch.
 """
 
 import logging
 import math
 import numpy as np
-import statistics
 import time
-from typing import Dict, List, Any, Tuple, Optional, Union
+from typing import Dict, List, Any, Tuple, Optional, Union, Iterable
+
+from models.monte_carlo.probability.first_passage import (
+    FirstPassageAnalysis, as_path_matrix, column_volatility, find_critical_periods
+)
+from models.monte_carlo.probability.sketch import QuantileSketch
 
 logger = logging.getLogger(__name__)
 
+# Initial capacity of the outcome buffer; it doubles when full
+INITIAL_CAPACITY = 1024
+
 class GoalOutcomeDistribution:
     """
     Models the full distribution of goal outcomes from Monte Carlo simulations.
@@ -21,21 +32,69 @@ class GoalOutcomeDistribution:
     This class provides detailed statistical analysis of simulation results,
     including various distribution statistics (mean, median, percentiles),
     shortfall risks at different thresholds, and upside potential metrics.
+    
+    By default every outcome is kept (exact statistics). With sketch_size set
+    only a QuantileSketch is kept: memory stays bounded, count/mean/std_dev
+    remain exact and other statistics are estimated from the sketch.
     """
     
-    def __init__(self, simulation_values: Optional[List[float]] = None):
+    def __init__(self, simulation_values: Optional[Union[Iterable[float], np.ndarray]] = None,
+                 sketch_size: Optional[int] = None):
         """
         Initialize with simulation outcome values.
         
         Args:
-            simulation_values: List of final values from Monte Carlo simulations
+            simulation_values: Final values from Monte Carlo simulations
+            sketch_size: If given, summarize outcomes in a mergeable quantile
+                sketch of this size instead of keeping every value
         """
-        self.simulation_values = simulation_values or []
+        self.sketch = QuantileSketch(sketch_size) if sketch_size else None
+        self._values = np.empty(0 if self.sketch else INITIAL_CAPACITY)
+        self._count = 0
+        self._invalidate()
+        self.set_paths(None)
+        if simulation_values is not None:
+            self.add_simulation_results(simulation_values)
+    
+    def _invalidate(self) -> None:
+        """Clear cached statistics after the outcomes changed."""
         self._sorted_values = None
         self._mean = None
         self._median = None
         self._std_dev = None
-        
+        self._percentiles: Dict[int, float] = {}
+    
+    @property
+    def simulation_values(self) -> np.ndarray:
+        """Outcome values (a view of the buffer; retained samples in sketch mode)."""
+        if self.sketch is not None:
+            return self.sketch.weighted_samples()[0]
+        return self._values[:self._count]
+    
+    @simulation_values.setter
+    def simulation_values(self, values: Union[Iterable[float], np.ndarray]) -> None:
+        self._values = np.empty(0 if self.sketch else INITIAL_CAPACITY)
+        self._count = 0
+        if self.sketch is not None:
+            self.sketch = QuantileSketch(self.sketch.k)
+        self._invalidate()
+        self.add_simulation_results(values)
+    
+    @property
+    def count(self) -> int:
+        """Number of outcomes added."""
+        return self.sketch.count if self.sketch is not None else self._count
+    
+    def _reserve(self, extra: int) -> None:
+        """Grow the buffer geometrically to fit extra more values."""
+        needed = self._count + extra
+        if needed <= len(self._values):
+            return
+        capacity = max(needed, 2 * len(self._values), INITIAL_CAPACITY)
+        grown = np.empty(capacity)
+        grown[:self._count] = self._values[:self._count]
+        self._values = grown
+    
     def add_simulation_result(self, value: float) -> None:
         """
         Add a single simulation result.
@@ -43,58 +102,127 @@ class GoalOutcomeDistribution:
         Args:
             value: Final value from a simulation run
         """
-        self.simulation_values.append(value)
-        # Clear cached values
-        self._sorted_values = None
-        self._mean = None
-        self._median = None
-        self._std_dev = None
-        
-    def add_simulation_results(self, values: List[float]) -> None:
+        if self.sketch is not None:
+            self.sketch.update(value)
+        else:
+            self._reserve(1)
+            self._values[self._count] = value
+            self._count += 1
+        self._invalidate()
+        
+    def add_simulation_results(self, values: Union[Iterable[float], np.ndarray]) -> None:
         """
         Add multiple simulation results.
         
         Args:
-            values: List of final values from simulation runs
+            values: Final values from simulation runs (list or array)
         """
-        self.simulation_values.extend(values)
-        # Clear cached values
-        self._sorted_values = None
-        self._mean = None
-        self._median = None
-        self._std_dev = None
+        batch = np.asarray(values if isinstance(values, np.ndarray) else list(values),
+                           dtype=np.float64).ravel()
+        if self.sketch is not None:
+            self.sketch.update(batch)
+        else:
+            self._reserve(batch.size)
+            self._values[self._count:self._count + batch.size] = batch
+            self._count += batch.size
+        self._invalidate()
+    
+    def merge(self, other: 'GoalOutcomeDistribution') -> 'GoalOutcomeDistribution':
+        """
+        Merge the outcomes of another distribution (e.g. another chunk or worker).
+        
+        Args:
+            other: Distribution to merge into this one
+            
+        Returns:
+            This distribution
+        """
+        if self.sketch is not None and other.sketch is not None:
+            self.sketch.merge(other.sketch)
+            self._invalidate()
+        else:
+            self.add_simulation_results(other.simulation_values)
+        return self
+    
+    def _samples(self) -> Tuple[np.ndarray, Optional[np.ndarray]]:
+        """Outcome values with their weights (None when every value is kept)."""
+        if self.sketch is not None:
+            return self.sketch.weighted_samples()
+        return self._values[:self._count], None
+    
+    def _fraction(self, mask: np.ndarray, weights: Optional[np.ndarray]) -> float:
+        """Share of outcomes selected by a boolean mask."""
+        if weights is None:
+            return np.count_nonzero(mask) / len(mask)
+        return float(weights[mask].sum() / weights.sum())
     
     @property
-    def sorted_values(self) -> List[float]:
+    def sorted_values(self) -> np.ndarray:
         """Get sorted simulation values, caching for performance."""
         if self._sorted_values is None:
-            self._sorted_values = sorted(self.simulation_values)
+            self._sorted_values = np.sort(self._samples()[0])
         return self._sorted_values
     
     @property
     def mean(self) -> float:
         """Calculate the mean (average) value."""
         if self._mean is None:
-            self._mean = statistics.mean(self.simulation_values) if self.simulation_values else 0
+            if self.sketch is not None:
+                self._mean = self.sketch.mean
+            else:
+                self._mean = float(np.mean(self.simulation_values)) if self._count else 0
         return self._mean
     
     @property
     def median(self) -> float:
         """Calculate the median (50th percentile) value."""
         if self._median is None:
-            self._median = statistics.median(self.simulation_values) if self.simulation_values else 0
+            if self.sketch is not None:
+                self._median = self.sketch.quantile(0.5) if self.sketch.count else 0
+            else:
+                self._median = float(np.median(self.simulation_values)) if self._count else 0
         return self._median
     
     @property
     def std_dev(self) -> float:
         """Calculate the standard deviation."""
         if self._std_dev is None:
-            if len(self.simulation_values) >= 2:
-                self._std_dev = statistics.stdev(self.simulation_values)
-            else:
+            if self.count < 2:
                 self._std_dev = 0
+            elif self.sketch is not None:
+                self._std_dev = math.sqrt(self.sketch.variance(ddof=1))
+            else:
+                self._std_dev = float(np.std(self.simulation_values, ddof=1))
         return self._std_dev
     
+    def percentiles(self, ps: Iterable[float]) -> Dict[float, float]:
+        """
+        Calculate several percentiles with one partial sort.
+        
+        Args:
+            ps: Percentile values (0-1)
+            
+        Returns:
+            Dictionary mapping each percentile to its value
+        """
+        ps = list(ps)
+        n = self.count
+        if n == 0:
+            return {p: 0 for p in ps}
+        
+        # Value at sorted index int(p * n), as in a fully sorted list
+        indices = {p: max(0, min(int(p * n), n - 1)) for p in ps}
+        missing = sorted(set(indices.values()) - set(self._percentiles))
+        if missing:
+            if self.sketch is not None:
+                values = self.sketch.quantiles([index / n for index in missing])
+            elif self._sorted_values is not None:
+                values = self._sorted_values[missing]
+            else:
+                values = np.partition(self.simulation_values, missing)[missing]
+            self._percentiles.update(zip(missing, (float(v) for v in values)))
+        return {p: self._percentiles[index] for p, index in indices.items()}
+    
     def percentile(self, p: float) -> float:
         """
         Calculate the specified percentile value.
@@ -105,12 +233,7 @@ class GoalOutcomeDistribution:
         Returns:
             Value at the specified percentile
         """
-        if not self.simulation_values:
-            return 0
-            
-        sorted_vals = self.sorted_values
-        idx = max(0, min(int(p * len(sorted_vals)), len(sorted_vals) - 1))
-        return sorted_vals[idx]
+        return self.percentiles([p])[p]
     
     def success_probability(self, target_amount: float) -> float:
         """
@@ -126,42 +249,41 @@ class GoalOutcomeDistribution:
         Returns:
             Probability (0-1) of meeting or exceeding target
         """
-        if not self.simulation_values:
+        if self.count == 0:
             logger.warning("[DIAGNOSTIC] No simulation values available for success probability calculation")
             return 0
             
         # Start timer for performance tracking
         start_time = time.time()
         
+        values, weights = self._samples()
+        if weights is None:
+            weights = np.ones(len(values))
+        total_weight = weights.sum()
+        
         # Count simulations that meet or exceed target and get metrics
-        total_simulations = len(self.simulation_values)
-        exact_success_count = sum(1 for val in self.simulation_values if val >= target_amount)
-        exact_probability = exact_success_count / total_simulations
+        total_simulations = self.count
+        success = values >= target_amount
+        exact_probability = float(weights[success].sum() / total_weight)
+        exact_success_count = int(round(exact_probability * total_simulations))
         
         # Log detail for diagnostic analysis
         logger.info(f"[DIAGNOSTIC] Basic success count: {exact_success_count}/{total_simulations} = {exact_probability:.4f}")
         
         # Enhanced sensitivity implementation - add partial credit for values close to target
         # This makes the probability calculation more sensitive to parameter changes
-        sensitivity_adjusted_count = 0
-        close_but_not_success = 0
-        
-        for val in self.simulation_values:
-            if val >= target_amount:
-                sensitivity_adjusted_count += 1
-            else:
-                # Calculate closeness as a ratio of achieved to target
-                closeness = val / target_amount if target_amount > 0 else 0
-                
-                # Add partial credit for values that are very close (within 10% of target)
-                if closeness > 0.9:
-                    # Linear partial credit from 0 at 90% to 1 at 100%
-                    partial_credit = (closeness - 0.9) * 10  # Scales 0.9->0.0, 1.0->1.0
-                    sensitivity_adjusted_count += partial_credit
-                    close_but_not_success += 1
+        if target_amount > 0:
+            closeness = values / target_amount
+            # Values within 10% of target: linear partial credit from 0 at 90% to 1 at 100%
+            close = ~success & (closeness > 0.9)
+            partial_credit = float(((closeness[close] - 0.9) * 10 * weights[close]).sum())
+        else:
+            close = np.zeros(len(values), dtype=bool)
+            partial_credit = 0.0
+        close_but_not_success = int(round(weights[close].sum() * total_simulations / total_weight))
         
         # Calculate adjusted probability
-        adjusted_probability = sensitivity_adjusted_count / total_simulations
+        adjusted_probability = exact_probability + partial_credit / total_weight
         
         # Log detailed diagnostic information
         logger.info(f"[DIAGNOSTIC] Success probability calculation - "
@@ -191,13 +313,13 @@ class GoalOutcomeDistribution:
         Returns:
             Probability (0-1) of falling below threshold
         """
-        if not self.simulation_values:
+        if self.count == 0:
             return 1.0
             
         shortfall_threshold = target_amount * threshold_percentage
-        # Count simulations that fall below threshold
-        count = sum(1 for val in self.simulation_values if val < shortfall_threshold)
-        return count / len(self.simulation_values)
+        # Share of simulations that fall below threshold
+        values, weights = self._samples()
+        return self._fraction(values < shortfall_threshold, weights)
     
     def upside_probability(self, target_amount: float, excess_percentage: float = 1.2) -> float:
         """
@@ -210,13 +332,13 @@ class GoalOutcomeDistribution:
         Returns:
             Probability (0-1) of exceeding threshold
         """
-        if not self.simulation_values:
+        if self.count == 0:
             return 0
             
         upside_threshold = target_amount * excess_percentage
-        # Count simulations that exceed threshold
-        count = sum(1 for val in self.simulation_values if val >= upside_threshold)
-        return count / len(self.simulation_values)
+        # Share of simulations that exceed threshold
+        values, weights = self._samples()
+        return self._fraction(values >= upside_threshold, weights)
     
     def value_at_risk(self, confidence_level: float = 0.95) -> float:
         """
@@ -228,7 +350,7 @@ class GoalOutcomeDistribution:
         Returns:
             Amount at risk at the specified confidence level
         """
-        if not self.simulation_values:
+        if self.count == 0:
             return 0
             
         # VaR is the loss that is not expected to be exceeded with given confidence level
@@ -246,13 +368,16 @@ class GoalOutcomeDistribution:
         Returns:
             Expected shortfall at the specified confidence level
         """
-        if not self.simulation_values:
+        if self.count == 0:
             return 0
             
         var = self.value_at_risk(confidence_level)
         # Average of values below VaR
-        tail_values = [v for v in self.simulation_values if v <= var]
-        return statistics.mean(tail_values) if tail_values else var
+        values, weights = self._samples()
+        tail = values <= var
+        if not tail.any():
+            return var
+        return float(np.average(values[tail], weights=None if weights is None else weights[tail]))
     
     def calculate_histogram(self, bins: int = 10) -> Dict[str, List[float]]:
         """
@@ -264,10 +389,16 @@ class GoalOutcomeDistribution:
         Returns:
             Dictionary with bin_edges and bin_counts
         """
-        if not self.simulation_values:
+        if self.count == 0:
             return {"bin_edges": [], "bin_counts": []}
             
-        hist, bin_edges = np.histogram(self.simulation_values, bins=bins)
+        values, weights = self._samples()
+        if weights is None:
+            hist, bin_edges = np.histogram(values, bins=bins)
+        else:
+            hist, bin_edges = np.histogram(values, bins=bins, weights=weights,
+                                           range=(self.sketch.min, self.sketch.max))
+            hist = np.rint(hist * (self.count / weights.sum())).astype(int)
         return {
             "bin_edges": bin_edges.tolist(),
             "bin_counts": hist.tolist()
@@ -283,6 +414,8 @@ class GoalOutcomeDistribution:
         Returns:
             Dictionary with key statistics
         """
+        # One partial sort for all percentiles, including the 95% VaR
+        percentiles = self.percentiles([0.1, 0.25, 0.5, 0.75, 0.9, 1 - 0.95])
         return {
             "mean": self.mean,
             "median": self.median,
@@ -291,15 +424,90 @@ class GoalOutcomeDistribution:
             "shortfall_risk_80pct": self.shortfall_risk(target_amount, 0.8),
             "shortfall_risk_60pct": self.shortfall_risk(target_amount, 0.6),
             "upside_probability_120pct": self.upside_probability(target_amount, 1.2),
-            "percentile_10": self.percentile(0.1),
-            "percentile_25": self.percentile(0.25),
-            "percentile_50": self.percentile(0.5),
-            "percentile_75": self.percentile(0.75),
-            "percentile_90": self.percentile(0.9),
+            "percentile_10": percentiles[0.1],
+            "percentile_25": percentiles[0.25],
+            "percentile_50": percentiles[0.5],
+            "percentile_75": percentiles[0.75],
+            "percentile_90": percentiles[0.9],
             "value_at_risk_95pct": self.value_at_risk(0.95),
             "conditional_value_at_risk_95pct": self.conditional_value_at_risk(0.95)
         }
     
+    def set_paths(self, paths: Optional[Union[np.ndarray, List[List[float]]]], steps_per_year: float = 1) -> None:
+        """
+        Attach the simulated paths behind the outcomes for time-to-goal analysis.
+        
+        Args:
+            paths: Simulated values of shape (simulations, steps), with column 0
+                holding the starting values, or None to detach
+            steps_per_year: Number of path columns per year
+        """
+        self.paths = None if paths is None else as_path_matrix(paths)
+        self.steps_per_year = steps_per_year
+        self._first_passage: Dict[float, FirstPassageAnalysis] = {}
+    
+    def first_passage(self, target_amount: float) -> Optional[FirstPassageAnalysis]:
+        """
+        Hitting-time analysis of the attached paths for a target amount.
+        
+        Args:
+            target_amount: Goal target amount
+            
+        Returns:
+            FirstPassageAnalysis, or None if no paths are attached
+        """
+        if self.paths is None:
+            return None
+        analysis = self._first_passage.get(target_amount)
+        if analysis is None:
+            analysis = FirstPassageAnalysis(self.paths, target_amount, self.steps_per_year)
+            self._first_passage[target_amount] = analysis
+        return analysis
+    
+    @staticmethod
+    def _approximation_parameters(
+        allocation_strategy: Dict[str, float],
+        returns: Dict[str, Tuple[float, float]]
+    ) -> Tuple[float, float]:
+        """Portfolio expected return and annual volatility for the normal approximation."""
+        returns_by_name = {asset_class.name.lower(): ret for asset_class, ret in returns.items()}
+        expected_return = 0.0
+        volatility = 0.0
+        for asset, alloc in allocation_strategy.items():
+            ret = returns_by_name.get(asset.lower())
+            if ret is not None:
+                expected_return += alloc * ret[0]
+                volatility += alloc * ret[1]
+        return expected_return, volatility
+    
+    @staticmethod
+    def _approximate_success_probability(
+        years: float,
+        target_amount: float,
+        monthly_contribution: float,
+        initial_amount: float,
+        expected_return: float,
+        volatility: float
+    ) -> float:
+        """Closed-form normal approximation of the success probability after years."""
+        # Future value of initial amount
+        future_initial = initial_amount * (1 + expected_return) ** years
+        
+        # Future value of monthly contributions (assuming end of period)
+        if expected_return > 0:
+            future_contributions = monthly_contribution * 12 * ((1 + expected_return) ** years - 1) / expected_return
+        else:
+            future_contributions = monthly_contribution * 12 * years
+            
+        expected_outcome = future_initial + future_contributions
+        
+        # Rough estimate of volatility at the given time horizon
+        horizon_volatility = volatility * math.sqrt(years)
+        
+        # Approximate probability using normal distribution
+        z_score = (expected_outcome - target_amount) / (expected_outcome * horizon_volatility + 1e-10)
+        return 1 - 0.5 * (1 + math.erf(-z_score / math.sqrt(2)))
+    
     def calculate_time_to_goal_probability(
         self, 
         target_probability: float, 
@@ -313,6 +521,11 @@ class GoalOutcomeDistribution:
         """
         Estimate time needed to reach a specific success probability.
         
+        With simulated paths attached (see set_paths) this is the earliest
+        simulated time by which that share of paths has reached the target.
+        Otherwise, or if the probability is not reached within the simulated
+        horizon, a normal approximation is searched up to max_years.
+        
         Args:
             target_probability: Target probability of success (0-1)
             target_amount: Goal target amount
@@ -325,47 +538,24 @@ class GoalOutcomeDistribution:
         Returns:
             Estimated time in years to reach target probability
         """
-        # Simple binary search implementation
-        # For a more accurate implementation, we would need to run full Monte Carlo
-        # simulations at each step, which would be computationally expensive
-        
-        def estimate_success_probability(years: int) -> float:
-            # Simplified formula based on expected returns and volatility
-            expected_return = sum(
-                alloc * ret[0] 
-                for asset, alloc in allocation_strategy.items() 
-                for asset_class, ret in returns.items() 
-                if asset.lower() == asset_class.name.lower()
-            )
-            
-            # Future value of initial amount
-            future_initial = initial_amount * (1 + expected_return) ** years
-            
-            # Future value of monthly contributions (assuming end of period)
-            if expected_return > 0:
-                future_contributions = monthly_contribution * 12 * ((1 + expected_return) ** years - 1) / expected_return
-            else:
-                future_contributions = monthly_contribution * 12 * years
-                
-            expected_outcome = future_initial + future_contributions
-            
-            # Rough estimate of volatility at the given time horizon
-            volatility = sum(
-                alloc * ret[1] 
-                for asset, alloc in allocation_strategy.items() 
-                for asset_class, ret in returns.items() 
-                if asset.lower() == asset_class.name.lower()
-            ) * math.sqrt(years)
-            
-            # Approximate probability using normal distribution
-            z_score = (expected_outcome - target_amount) / (expected_outcome * volatility + 1e-10)
-            return 1 - 0.5 * (1 + math.erf(-z_score / math.sqrt(2)))
+        analysis = self.first_passage(target_amount)
+        low = 1
+        if analysis is not None:
+            years = analysis.time_to_probability(target_probability)
+            if years is not None:
+                return years
+            # Not reached within the simulated paths; extrapolate beyond them
+            low = max(low, analysis.horizon)
+        
+        expected_return, volatility = self._approximation_parameters(allocation_strategy, returns)
         
         # Binary search for the time that gives target probability
-        low, high = 1, max_years
+        high = max(low, max_years)
         while high - low > 0.5:
             mid = (low + high) / 2
-            prob = estimate_success_probability(mid)
+            prob = self._approximate_success_probability(
+                mid, target_amount, monthly_contribution, initial_amount, expected_return, volatility
+            )
             
             if prob < target_probability:
                 low = mid
@@ -386,6 +576,11 @@ class GoalOutcomeDistribution:
         """
         Calculate success probability at different time points.
         
+        With simulated paths attached this is the share of paths that have
+        reached the target by each time point; time points beyond the
+        simulated horizon, or all of them without paths, use a normal
+        approximation.
+        
         Args:
             timepoints: List of time points in years
             target_amount: Goal target amount
@@ -398,103 +593,41 @@ class GoalOutcomeDistribution:
             Dictionary mapping timepoints to success probabilities
         """
         results = {}
-        
-        def estimate_success_probability(years: float) -> float:
-            # Similar to the approach in calculate_time_to_goal_probability
-            expected_return = sum(
-                alloc * ret[0] 
-                for asset, alloc in allocation_strategy.items() 
-                for asset_class, ret in returns.items() 
-                if asset.lower() == asset_class.name.lower()
-            )
-            
-            # Future value calculations
-            future_initial = initial_amount * (1 + expected_return) ** years
-            
-            if expected_return > 0:
-                future_contributions = monthly_contribution * 12 * ((1 + expected_return) ** years - 1) / expected_return
-            else:
-                future_contributions = monthly_contribution * 12 * years
-                
-            expected_outcome = future_initial + future_contributions
-            
-            # Volatility estimate
-            volatility = sum(
-                alloc * ret[1] 
-                for asset, alloc in allocation_strategy.items() 
-                for asset_class, ret in returns.items() 
-                if asset.lower() == asset_class.name.lower()
-            ) * math.sqrt(years)
-            
-            # Approximate probability using normal distribution
-            z_score = (expected_outcome - target_amount) / (expected_outcome * volatility + 1e-10)
-            return 1 - 0.5 * (1 + math.erf(-z_score / math.sqrt(2)))
+        analysis = self.first_passage(target_amount)
+        approximation = None
         
         for year in timepoints:
-            results[year] = estimate_success_probability(year)
+            if analysis is not None and year <= analysis.horizon:
+                results[year] = analysis.probability_by(year)
+                continue
+            if approximation is None:
+                approximation = self._approximation_parameters(allocation_strategy, returns)
+            results[year] = self._approximate_success_probability(
+                year, target_amount, monthly_contribution, initial_amount, *approximation
+            )
             
         return results
     
     def identify_critical_periods(
         self, 
-        time_series_results: List[List[float]],
+        time_series_results: Optional[List[List[float]]] = None,
         percentile_threshold: float = 0.9
     ) -> List[Dict[str, Any]]:
         """
         Identify periods with higher volatility or risk.
         
         Args:
-            time_series_results: List of time series of simulation results
+            time_series_results: Simulated paths (defaults to the attached paths)
             percentile_threshold: Threshold for identifying critical periods
             
         Returns:
             List of critical periods with start, end, and risk metrics
         """
-        if not time_series_results:
+        if time_series_results is None:
+            time_series_results = self.paths
+        if time_series_results is None or len(time_series_results) == 0:
             return []
             
-        # Calculate volatility at each time point
-        num_timepoints = len(time_series_results[0])
-        volatility = []
-        
-        for t in range(num_timepoints):
-            values_at_t = [sim[t] for sim in time_series_results if t < len(sim)]
-            if len(values_at_t) >= 2:
-                vol = statistics.stdev(values_at_t)
-                volatility.append(vol)
-            else:
-                volatility.append(0)
-                
-        # Identify periods where volatility exceeds threshold
-        avg_vol = statistics.mean(volatility) if volatility else 0
-        threshold = percentile_threshold * max(volatility) if volatility else 0
-        
-        critical_periods = []
-        in_critical_period = False
-        start_idx = 0
-        
-        for i, vol in enumerate(volatility):
-            if vol > threshold and not in_critical_period:
-                in_critical_period = True
-                start_idx = i
-            elif vol <= threshold and in_critical_period:
-                in_critical_period = False
-                critical_periods.append({
-                    "start_time": start_idx,
-                    "end_time": i - 1,
-                    "peak_volatility": max(volatility[start_idx:i]),
-                    "average_volatility": statistics.mean(volatility[start_idx:i]),
-                    "volatility_vs_average": max(volatility[start_idx:i]) / avg_vol if avg_vol > 0 else 0
-                })
-                
-        # Handle case where we end while still in a critical period
-        if in_critical_period:
-            critical_periods.append({
-                "start_time": start_idx,
-                "end_time": len(volatility) - 1,
-                "peak_volatility": max(volatility[start_idx:]),
-                "average_volatility": statistics.mean(volatility[start_idx:]),
-                "volatility_vs_average": max(volatility[start_idx:]) / avg_vol if avg_vol > 0 else 0
-            })
-            
-        return critical_periods
\ No newline at end of file
+        # Volatility across simulations at each time point
+        volatility = column_volatility(time_series_results)
+        return find_critical_periods(volatility, percentile_threshold)
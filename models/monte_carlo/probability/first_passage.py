@@ -0,0 +1,224 @@
+"""
+First-passage (time-to-goal) analysis of simulated paths.
+
+This module provides FirstPassageAnalysis, which reads the path matrix that
+a Monte Carlo projection already produced (one row per simulation, one
+column per time step) and finds, in a single vectorized pass, the first
+step at which each path reaches the goal target. From these hitting times
+it derives the probability of having reached the goal by any time, the
+time needed to reach a given probability, percentile times-to-goal and the
+periods of highest cross-simulation volatility. The results are exact for
+the simulated paths and need no further simulation.
+"""
+
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Union
+
+import numpy as np
+
+
+def as_path_matrix(paths: Union[np.ndarray, Sequence[Sequence[float]]]) -> np.ndarray:
+    """
+    Convert simulated paths to a 2-D float array.
+
+    Ragged paths (lists of unequal length) are padded with NaN.
+
+    Args:
+        paths: Array of shape (simulations, steps) or list of path lists
+
+    Returns:
+        Array of shape (simulations, steps)
+    """
+    if isinstance(paths, np.ndarray):
+        matrix = paths.astype(np.float64, copy=False)
+    else:
+        rows = [np.asarray(path, dtype=np.float64).ravel() for path in paths]
+        width = max((len(row) for row in rows), default=0)
+        matrix = np.full((len(rows), width), np.nan)
+        for index, row in enumerate(rows):
+            matrix[index, :len(row)] = row
+    if matrix.ndim == 1:
+        matrix = matrix.reshape(1, -1)
+    return matrix
+
+
+def column_volatility(paths: Union[np.ndarray, Sequence[Sequence[float]]]) -> np.ndarray:
+    """
+    Standard deviation across simulations at each time step.
+
+    Steps with fewer than two values have zero volatility.
+
+    Args:
+        paths: Simulated paths
+
+    Returns:
+        Array with one volatility per time step
+    """
+    matrix = as_path_matrix(paths)
+    if matrix.size == 0:
+        return np.zeros(matrix.shape[1])
+    counts = np.count_nonzero(~np.isnan(matrix), axis=0)
+    volatility = np.zeros(matrix.shape[1])
+    enough = counts >= 2
+    if enough.any():
+        volatility[enough] = np.nanstd(matrix[:, enough], axis=0, ddof=1)
+    return volatility
+
+
+def find_critical_periods(volatility: Union[np.ndarray, List[float]],
+                          percentile_threshold: float = 0.9) -> List[Dict[str, Any]]:
+    """
+    Find runs of time steps whose volatility exceeds a share of the peak.
+
+    Args:
+        volatility: Volatility at each time step
+        percentile_threshold: Share of the peak volatility marking a critical step
+
+    Returns:
+        List of critical periods with start, end, and risk metrics
+    """
+    volatility = np.asarray(volatility, dtype=np.float64)
+    if volatility.size == 0:
+        return []
+
+    avg_vol = float(volatility.mean())
+    threshold = percentile_threshold * float(volatility.max())
+    above = np.concatenate(([False], volatility > threshold, [False]))
+    edges = np.flatnonzero(np.diff(above.astype(np.int8)))
+
+    critical_periods = []
+    for start, stop in zip(edges[::2], edges[1::2]):
+        window = volatility[start:stop]
+        peak = float(window.max())
+        critical_periods.append({
+            "start_time": int(start),
+            "end_time": int(stop - 1),
+            "peak_volatility": peak,
+            "average_volatility": float(window.mean()),
+            "volatility_vs_average": peak / avg_vol if avg_vol > 0 else 0
+        })
+    return critical_periods
+
+
+class FirstPassageAnalysis:
+    """
+    Hitting-time distribution of simulated paths for one target amount.
+
+    Column j of the path matrix is the value at time j / steps_per_year
+    years, so column 0 holds the starting values.
+    """
+
+    def __init__(self, paths: Union[np.ndarray, Sequence[Sequence[float]]],
+                 target_amount: float, steps_per_year: float = 1):
+        """
+        Analyze when each simulated path first reaches the target.
+
+        Args:
+            paths: Simulated values of shape (simulations, steps)
+            target_amount: Goal target amount
+            steps_per_year: Number of path columns per year
+        """
+        matrix = as_path_matrix(paths)
+        self.target_amount = target_amount
+        self.steps_per_year = steps_per_year
+        self.simulations, self.steps = matrix.shape
+        self.times = np.arange(self.steps) / steps_per_year
+
+        # First column at or above the target; self.steps if never reached
+        reached = matrix >= target_amount
+        hit = reached.any(axis=1)
+        first_steps = np.where(hit, reached.argmax(axis=1), self.steps)
+        self.hitting_times = np.where(hit, first_steps / steps_per_year, np.inf)
+
+        counts = np.bincount(first_steps, minlength=self.steps + 1)[:self.steps]
+        # Probability of having reached the target by each time step
+        self.cumulative_probability = (np.cumsum(counts) / self.simulations
+                                       if self.simulations else np.zeros(self.steps))
+
+    @property
+    def horizon(self) -> float:
+        """Last simulated time in years."""
+        return float(self.times[-1]) if self.steps else 0.0
+
+    @property
+    def never_reached_probability(self) -> float:
+        """Probability of not reaching the target within the horizon."""
+        if self.steps == 0:
+            return 1.0
+        return 1.0 - float(self.cumulative_probability[-1])
+
+    def probability_by(self, years: float) -> float:
+        """
+        Probability of having reached the target by a given time.
+
+        Args:
+            years: Time in years
+
+        Returns:
+            Probability (0-1) using the last simulated step at or before years
+        """
+        step = int(np.searchsorted(self.times, years + 1e-9, side='right')) - 1
+        if step < 0:
+            return 0.0
+        return float(self.cumulative_probability[min(step, self.steps - 1)])
+
+    def probabilities_at(self, timepoints: Iterable[float]) -> Dict[float, float]:
+        """
+        Probability of having reached the target by each time point.
+
+        Args:
+            timepoints: Time points in years
+
+        Returns:
+            Dictionary mapping timepoints to probabilities
+        """
+        return {t: self.probability_by(t) for t in timepoints}
+
+    def time_to_probability(self, target_probability: float) -> Optional[float]:
+        """
+        Earliest simulated time by which the target is reached with a probability.
+
+        Args:
+            target_probability: Required probability (0-1)
+
+        Returns:
+            Time in years, or None if not reached within the horizon
+        """
+        step = int(np.searchsorted(self.cumulative_probability, target_probability - 1e-12, side='left'))
+        if step >= self.steps:
+            return None
+        return float(self.times[step])
+
+    def time_percentiles(self, ps: Iterable[float] = (0.1, 0.25, 0.5, 0.75, 0.9)) -> Dict[float, Optional[float]]:
+        """
+        Percentiles of the time to reach the target.
+
+        Args:
+            ps: Percentile values (0-1)
+
+        Returns:
+            Dictionary mapping each percentile to a time in years, or None
+            if that share of paths does not reach the target within the horizon
+        """
+        return {p: self.time_to_probability(p) for p in ps}
+
+    @property
+    def median_time(self) -> Optional[float]:
+        """Median time to reach the target in years, or None."""
+        return self.time_to_probability(0.5)
+
+    @property
+    def mean_time_if_reached(self) -> Optional[float]:
+        """Average time to reach the target among paths that reach it."""
+        finite = self.hitting_times[np.isfinite(self.hitting_times)]
+        return float(finite.mean()) if finite.size else None
+
+    def summary(self) -> Dict[str, Any]:
+        """Time-to-goal metrics for result dictionaries."""
+        percentiles = self.time_percentiles()
+        return {
+            "median_years": percentiles[0.5],
+            "percentile_years": {str(int(p * 100)): years for p, years in percentiles.items()},
+            "mean_years_if_reached": self.mean_time_if_reached,
+            "probability_within_horizon": 1.0 - self.never_reached_probability,
+            "horizon_years": self.horizon
+        }
@@ -0,0 +1,175 @@
+"""
+Mergeable quantile sketch for Monte Carlo outcome summaries.
+
+This module provides QuantileSketch, a KLL-style compactor sketch. It keeps
+a bounded number of weighted samples (O(k log(n/k))) from which quantiles,
+ranks and weighted tail statistics can be estimated, with a rank error of
+roughly 1/k. Sketches built on separate chunks or in separate worker
+processes can be merged, so large simulations never need to hold every
+outcome in one place. Count, mean, variance, minimum and maximum are
+tracked exactly.
+"""
+
+import math
+from typing import Iterable, List, Optional, Tuple, Union
+
+import numpy as np
+
+# Default compactor size: rank error around 1-2% with at most a few hundred samples kept
+DEFAULT_SKETCH_K = 200
+# Capacity ratio between adjacent compactor levels
+LEVEL_CAPACITY_RATIO = 2.0 / 3.0
+
+
+class QuantileSketch:
+    """
+    Bounded-memory, mergeable summary of a stream of values.
+
+    Values are buffered at level 0. When a level exceeds its capacity it is
+    sorted and every other value (with a random offset) is promoted to the
+    next level, where each value stands for twice as many inputs.
+    """
+
+    def __init__(self, k: int = DEFAULT_SKETCH_K, seed: Optional[int] = 0):
+        """
+        Initialize an empty sketch.
+
+        Args:
+            k: Capacity of the top compactor level (accuracy parameter)
+            seed: Seed for the compaction offsets (None for fresh entropy)
+        """
+        if k < 2:
+            raise ValueError("Sketch size k must be at least 2")
+        self.k = k
+        self._levels: List[np.ndarray] = [np.empty(0)]
+        self._rng = np.random.default_rng(seed)
+        self.count = 0
+        self.min = math.inf
+        self.max = -math.inf
+        self._mean = 0.0
+        self._m2 = 0.0
+
+    def __len__(self) -> int:
+        return self.count
+
+    @property
+    def retained(self) -> int:
+        """Number of samples currently kept."""
+        return sum(len(level) for level in self._levels)
+
+    @property
+    def mean(self) -> float:
+        """Exact mean of all values added."""
+        return self._mean if self.count else 0.0
+
+    def variance(self, ddof: int = 1) -> float:
+        """Exact variance of all values added."""
+        if self.count - ddof <= 0:
+            return 0.0
+        return self._m2 / (self.count - ddof)
+
+    def _merge_moments(self, count: int, mean: float, m2: float) -> None:
+        """Combine running moments with another group's (Chan et al.)."""
+        total = self.count + count
+        delta = mean - self._mean
+        self._mean += delta * count / total
+        self._m2 += m2 + delta * delta * self.count * count / total
+        self.count = total
+
+    def _capacity(self, level: int) -> int:
+        """Capacity of a compactor level; lower levels are smaller."""
+        depth = len(self._levels) - 1 - level
+        return max(2, int(math.ceil(self.k * LEVEL_CAPACITY_RATIO ** depth)))
+
+    def _compress(self) -> None:
+        """Compact levels over capacity, promoting half of their values."""
+        level = 0
+        while level < len(self._levels):
+            items = self._levels[level]
+            if len(items) > self._capacity(level):
+                if level + 1 == len(self._levels):
+                    self._levels.append(np.empty(0))
+                items = np.sort(items)
+                # An odd leftover stays at this level
+                keep = items[len(items) - len(items) % 2:]
+                offset = int(self._rng.integers(2))
+                promoted = items[offset:len(items) - len(items) % 2:2]
+                self._levels[level] = keep
+                self._levels[level + 1] = np.concatenate((self._levels[level + 1], promoted))
+            level += 1
+
+    def update(self, values: Union[float, Iterable[float], np.ndarray]) -> None:
+        """
+        Add one value or a batch of values.
+
+        Args:
+            values: Value(s) to add
+        """
+        batch = np.asarray(values, dtype=np.float64).ravel()
+        if batch.size == 0:
+            return
+        batch_mean = float(batch.mean())
+        self._merge_moments(batch.size, batch_mean, float(np.square(batch - batch_mean).sum()))
+        self.min = min(self.min, float(batch.min()))
+        self.max = max(self.max, float(batch.max()))
+        self._levels[0] = np.concatenate((self._levels[0], batch))
+        self._compress()
+
+    def merge(self, other: 'QuantileSketch') -> 'QuantileSketch':
+        """
+        Merge another sketch into this one.
+
+        Args:
+            other: Sketch summarizing other values (e.g. from another worker)
+
+        Returns:
+            This sketch
+        """
+        if other.count == 0:
+            return self
+        self._merge_moments(other.count, other._mean, other._m2)
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+        while len(self._levels) < len(other._levels):
+            self._levels.append(np.empty(0))
+        for level, items in enumerate(other._levels):
+            self._levels[level] = np.concatenate((self._levels[level], items))
+        self._compress()
+        return self
+
+    def weighted_samples(self) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Retained samples in ascending order with the number of inputs each represents.
+
+        Returns:
+            (values, weights) arrays
+        """
+        if self.retained == 0:
+            return np.empty(0), np.empty(0)
+        values = np.concatenate(self._levels)
+        weights = np.concatenate([np.full(len(items), 2.0 ** level) for level, items in enumerate(self._levels)])
+        order = np.argsort(values, kind='stable')
+        return values[order], weights[order]
+
+    def quantiles(self, ps: Union[float, Iterable[float]]) -> np.ndarray:
+        """
+        Estimate the values at ranks int(p * count).
+
+        Args:
+            ps: Quantile(s) in [0, 1]
+
+        Returns:
+            Array of estimated values
+        """
+        ps = np.atleast_1d(np.asarray(ps, dtype=np.float64))
+        if self.count == 0:
+            return np.zeros(len(ps))
+        values, weights = self.weighted_samples()
+        cumulative = np.cumsum(weights) * (self.count / weights.sum())
+        ranks = np.clip(np.floor(ps * self.count), 0, self.count - 1)
+        indices = np.minimum(np.searchsorted(cumulative, ranks, side='right'), len(values) - 1)
+        return values[indices]
+
+    def quantile(self, p: float) -> float:
+        """Estimate the value at rank int(p * count)."""
+        return float(self.quantiles(p)[0])
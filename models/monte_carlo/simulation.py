@@ -16,6 +16,7 @@ import traceback
 # Import local modules
 from models.monte_carlo.cache import _cache
 from models.monte_carlo.array_fix import to_scalar, safe_array_compare
+from models.goal_blob_codec import decode_payload, is_encoded
 
 # Set up logging
 logger = logging.getLogger(__name__)
@@ -157,13 +158,15 @@ def safely_get_simulation_data(goal: Dict[str, Any]) -> Dict[str, Any]:
         # Get the simulation_data attribute
         sim_data_raw = goal.simulation_data if hasattr(goal, 'simulation_data') else goal.get('simulation_data')
         
-        # Handle string or dict
+        # Handle string, binary-encoded (models/goal_blob_codec.py) or dict
         if isinstance(sim_data_raw, str):
             try:
                 simulation_data = json.loads(sim_data_raw)
             except json.JSONDecodeError:
                 logger.warning(f"Failed to parse simulation_data JSON for goal {goal.get('id', 'unknown')}")
                 simulation_data = {}
+        elif is_encoded(sim_data_raw):
+            simulation_data = decode_payload(sim_data_raw, default={})
         elif isinstance(sim_data_raw, dict):
             simulation_data = sim_data_raw
     
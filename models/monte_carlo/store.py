@@ -0,0 +1,438 @@
+"""
+Persistent on-disk store for Monte Carlo simulation results.
+
+This module provides the second cache tier (L2) underneath the in-memory
+SimulationCache (L1). Each entry is written once, incrementally, when it is
+cached:
+
+- NumPy arrays above a size threshold (simulation path matrices) are written
+  as individual .npy segment files and referenced from the pickled entry
+  through pickle's persistent-ID hook
+- The remaining, small object skeleton is pickled into a SQLite index
+  (WAL mode) together with expiry time, size and tags
+
+Reads are lazy: nothing is loaded at startup, an entry is only unpickled
+when it is requested, and its arrays are memory-mapped copy-on-write so
+they are shared with the page cache instead of copied. Because the index
+and segments live on local disk, every worker process pointing at the same
+directory shares one warm cache, and a restarted worker is warm instantly.
+Placing the directory on a tmpfs such as /dev/shm keeps the segments in
+shared memory.
+
+The index also holds short fill leases so that, across processes, only
+one worker computes a missing key while the others wait for its result,
+and an invalidation generation that every invalidate() and
+invalidate_tags() increments, so in-memory tiers in other processes can
+tell that their copies may be stale.
+"""
+
+import os
+import io
+import json
+import time
+import uuid
+import pickle
+import logging
+import sqlite3
+import threading
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# Constants
+STORE_INDEX_FILE = "index.sqlite"
+STORE_SEGMENT_DIR = "segments"
+STORE_MAX_BYTES = 1024 * 1024 * 1024  # 1 GB
+# Arrays smaller than this are pickled inline with the entry
+SEGMENT_MIN_BYTES = 16 * 1024
+# Minimum interval between last-access updates of an entry (seconds)
+ACCESS_UPDATE_INTERVAL = 60
+# Fill leases expire after this many seconds if their owner dies
+FILL_LEASE_SECONDS = 120
+
+_SCHEMA = """
+BEGIN IMMEDIATE;
+CREATE TABLE IF NOT EXISTS entries (
+    key TEXT PRIMARY KEY,
+    payload BLOB NOT NULL,
+    segments TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    created_at REAL NOT NULL,
+    expires_at REAL NOT NULL,
+    last_access REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_entries_expires ON entries (expires_at);
+CREATE INDEX IF NOT EXISTS idx_entries_last_access ON entries (last_access);
+CREATE TABLE IF NOT EXISTS entry_tags (
+    tag TEXT NOT NULL,
+    key TEXT NOT NULL,
+    PRIMARY KEY (tag, key)
+);
+CREATE INDEX IF NOT EXISTS idx_entry_tags_key ON entry_tags (key);
+CREATE TABLE IF NOT EXISTS fills (
+    key TEXT PRIMARY KEY,
+    owner TEXT NOT NULL,
+    expires_at REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS store_meta (
+    name TEXT PRIMARY KEY,
+    value INTEGER NOT NULL
+);
+INSERT OR IGNORE INTO store_meta (name, value)
+    SELECT 'total_bytes', COALESCE(SUM(size), 0) FROM entries;
+INSERT OR IGNORE INTO store_meta (name, value) VALUES ('generation', 0);
+CREATE TRIGGER IF NOT EXISTS entries_insert_bytes AFTER INSERT ON entries BEGIN
+    UPDATE store_meta SET value = value + NEW.size WHERE name = 'total_bytes';
+END;
+CREATE TRIGGER IF NOT EXISTS entries_delete_bytes AFTER DELETE ON entries BEGIN
+    UPDATE store_meta SET value = value - OLD.size WHERE name = 'total_bytes';
+END;
+COMMIT;
+"""
+
+
+class _SegmentPickler(pickle.Pickler):
+    """Pickler that writes large arrays to .npy segment files."""
+
+    def __init__(self, file, segment_dir: str):
+        super().__init__(file, protocol=pickle.HIGHEST_PROTOCOL)
+        self.segment_dir = segment_dir
+        self.segments: List[str] = []
+        self.segment_bytes = 0
+
+    def persistent_id(self, obj):
+        if (type(obj) is np.ndarray and obj.dtype != object
+                and obj.nbytes >= SEGMENT_MIN_BYTES):
+            name = f"{uuid.uuid4().hex}.npy"
+            path = os.path.join(self.segment_dir, name)
+            tmp_path = f"{path}.tmp"
+            with open(tmp_path, 'wb') as f:
+                np.save(f, obj, allow_pickle=False)
+            os.replace(tmp_path, path)
+            self.segments.append(name)
+            self.segment_bytes += obj.nbytes
+            return ('npy', name)
+        return None
+
+
+class _SegmentUnpickler(pickle.Unpickler):
+    """Unpickler that memory-maps .npy segment files on demand."""
+
+    def __init__(self, file, segment_dir: str):
+        super().__init__(file)
+        self.segment_dir = segment_dir
+
+    def persistent_load(self, pid):
+        kind, name = pid
+        if kind != 'npy':
+            raise pickle.UnpicklingError(f"Unknown persistent id: {kind}")
+        # Copy-on-write mapping: zero-copy reads, private writes
+        return np.load(os.path.join(self.segment_dir, name), mmap_mode='c', allow_pickle=False)
+
+
+class SimulationStore:
+    """Disk-backed, process-shared store for simulation results.
+
+    This store implementation includes:
+    - One SQLite index (WAL mode) per directory, safe for concurrent processes
+    - Memory-mapped .npy segments for large arrays
+    - Incremental writes: one index row and its segments per entry
+    - Per-entry expiry, a byte budget evicted by least recent access, and tags
+      (the running byte total lives in a meta row maintained by triggers)
+    - Fill leases for single-flight computation of missing keys
+    - An invalidation generation shared by every process using the store
+    """
+
+    def __init__(self, directory: str, max_bytes: Optional[int] = STORE_MAX_BYTES):
+        """Open (or create) a store in a directory.
+
+        Args:
+            directory: Directory holding the index and segment files
+            max_bytes: Maximum total size of stored entries in bytes (None for no limit)
+        """
+        self.directory = directory
+        self.segment_dir = os.path.join(directory, STORE_SEGMENT_DIR)
+        self.index_path = os.path.join(directory, STORE_INDEX_FILE)
+        self.max_bytes = max_bytes
+        self._local = threading.local()
+        self.reads = 0
+        self.writes = 0
+
+        os.makedirs(self.segment_dir, exist_ok=True)
+        with self._connection() as conn:
+            conn.executescript(_SCHEMA)
+
+    def _connection(self) -> sqlite3.Connection:
+        """Return this thread's connection to the index."""
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(self.index_path, timeout=30)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    def _remove_segments(self, segment_lists: Iterable[str]) -> None:
+        """Delete segment files; processes that still map them keep their view."""
+        for segments in segment_lists:
+            for name in json.loads(segments):
+                try:
+                    os.remove(os.path.join(self.segment_dir, name))
+                except FileNotFoundError:
+                    pass
+                except OSError as e:
+                    logger.warning(f"Could not remove cache segment {name}: {e}")
+
+    def _delete_keys(self, conn: sqlite3.Connection, keys: List[str]) -> List[str]:
+        """Delete index rows for keys and return their segment lists (caller commits)."""
+        segment_lists = []
+        for key in keys:
+            row = conn.execute("SELECT segments FROM entries WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                continue
+            segment_lists.append(row[0])
+            conn.execute("DELETE FROM entries WHERE key = ?", (key,))
+            conn.execute("DELETE FROM entry_tags WHERE key = ?", (key,))
+        return segment_lists
+
+    def put(self, key: str, value: Any, expires_at: float, tags: Iterable[str] = ()) -> bool:
+        """Write an entry, replacing any previous value for the key.
+
+        Args:
+            key: Cache key
+            value: Value to store (must be picklable)
+            expires_at: Absolute expiry time (epoch seconds)
+            tags: Tags for invalidate_tags()
+
+        Returns:
+            bool: True if the entry was written
+        """
+        buffer = io.BytesIO()
+        pickler = _SegmentPickler(buffer, self.segment_dir)
+        try:
+            pickler.dump(value)
+        except Exception as e:
+            logger.debug(f"Not storing {key[:10]}... on disk: {e}")
+            self._remove_segments([json.dumps(pickler.segments)])
+            return False
+
+        payload = buffer.getvalue()
+        size = len(payload) + pickler.segment_bytes
+        now = time.time()
+        conn = self._connection()
+        try:
+            with conn:
+                old_segments = self._delete_keys(conn, [key])
+                conn.execute(
+                    "INSERT INTO entries (key, payload, segments, size, created_at, expires_at, last_access) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    (key, payload, json.dumps(pickler.segments), size, now, expires_at, now)
+                )
+                conn.executemany(
+                    "INSERT OR IGNORE INTO entry_tags (tag, key) VALUES (?, ?)",
+                    [(tag, key) for tag in set(tags)]
+                )
+                old_segments += self._enforce_budget(conn)
+        except sqlite3.Error as e:
+            logger.warning(f"Error writing cache entry {key[:10]}... to disk: {e}")
+            self._remove_segments([json.dumps(pickler.segments)])
+            return False
+
+        self._remove_segments(old_segments)
+        self.writes += 1
+        return True
+
+    def _enforce_budget(self, conn: sqlite3.Connection) -> List[str]:
+        """Evict least recently accessed entries over the byte budget (caller commits)."""
+        if self.max_bytes is None:
+            return []
+        total = self._total_bytes(conn)
+        if total <= self.max_bytes:
+            return []
+
+        victims = []
+        for key, size in conn.execute("SELECT key, size FROM entries ORDER BY last_access"):
+            if total <= self.max_bytes:
+                break
+            victims.append(key)
+            total -= size
+        return self._delete_keys(conn, victims)
+
+    @staticmethod
+    def _total_bytes(conn: sqlite3.Connection) -> int:
+        """Running total of entry sizes, kept by triggers on the entries table."""
+        return conn.execute("SELECT value FROM store_meta WHERE name = 'total_bytes'").fetchone()[0]
+
+    def get(self, key: str) -> Optional[Tuple[Any, float, List[str]]]:
+        """Read an entry.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            (value, expires_at, tags), or None if the key is missing or expired
+        """
+        conn = self._connection()
+        row = conn.execute(
+            "SELECT payload, expires_at, last_access FROM entries WHERE key = ?", (key,)
+        ).fetchone()
+        if row is None:
+            return None
+
+        payload, expires_at, last_access = row
+        now = time.time()
+        if expires_at <= now:
+            self.delete([key])
+            return None
+
+        try:
+            value = _SegmentUnpickler(io.BytesIO(payload), self.segment_dir).load()
+        except (OSError, pickle.UnpicklingError, EOFError, ValueError) as e:
+            # Segment removed by another process, or a damaged entry
+            logger.debug(f"Dropping unreadable cache entry {key[:10]}...: {e}")
+            self.delete([key])
+            return None
+
+        tags = [tag for (tag,) in conn.execute("SELECT tag FROM entry_tags WHERE key = ?", (key,))]
+        if now - last_access > ACCESS_UPDATE_INTERVAL:
+            try:
+                with conn:
+                    conn.execute("UPDATE entries SET last_access = ? WHERE key = ?", (now, key))
+            except sqlite3.Error:
+                pass
+
+        self.reads += 1
+        return value, expires_at, tags
+
+    def contains(self, key: str) -> bool:
+        """Check whether a non-expired entry exists, without reading it."""
+        row = self._connection().execute(
+            "SELECT 1 FROM entries WHERE key = ? AND expires_at > ?", (key, time.time())
+        ).fetchone()
+        return row is not None
+
+    def try_acquire_fill(self, key: str, owner: str, lease: float = FILL_LEASE_SECONDS) -> bool:
+        """Take the fill lease for a key unless another owner holds a live one.
+
+        Args:
+            key: Cache key about to be computed
+            owner: Identifier of the filling process/thread
+            lease: Seconds after which the lease is considered abandoned
+
+        Returns:
+            bool: True if the caller now holds the lease
+        """
+        now = time.time()
+        conn = self._connection()
+        with conn:
+            cursor = conn.execute(
+                "INSERT INTO fills (key, owner, expires_at) VALUES (?, ?, ?) "
+                "ON CONFLICT(key) DO UPDATE SET owner = excluded.owner, expires_at = excluded.expires_at "
+                "WHERE fills.expires_at <= ? OR fills.owner = excluded.owner",
+                (key, owner, now + lease, now)
+            )
+        return cursor.rowcount > 0
+
+    def release_fill(self, key: str, owner: str) -> None:
+        """Release a fill lease held by owner."""
+        conn = self._connection()
+        with conn:
+            conn.execute("DELETE FROM fills WHERE key = ? AND owner = ?", (key, owner))
+
+    def delete(self, keys: Iterable[str]) -> int:
+        """Delete entries by key.
+
+        Returns:
+            int: Number of deleted entries
+        """
+        conn = self._connection()
+        with conn:
+            segment_lists = self._delete_keys(conn, list(keys))
+        self._remove_segments(segment_lists)
+        return len(segment_lists)
+
+    def generation(self) -> int:
+        """Number of invalidations so far, by any process using the store."""
+        return self._connection().execute(
+            "SELECT value FROM store_meta WHERE name = 'generation'").fetchone()[0]
+
+    def _invalidate_keys(self, keys: Iterable[str]) -> int:
+        """Delete entries and advance the generation in one transaction."""
+        conn = self._connection()
+        with conn:
+            segment_lists = self._delete_keys(conn, list(keys))
+            conn.execute("UPDATE store_meta SET value = value + 1 WHERE name = 'generation'")
+        self._remove_segments(segment_lists)
+        return len(segment_lists)
+
+    def invalidate(self, pattern: Optional[str] = None) -> int:
+        """Delete entries whose key contains pattern or that are tagged with it.
+
+        Args:
+            pattern: Pattern to match, or None to delete everything
+
+        Returns:
+            int: Number of deleted entries
+        """
+        conn = self._connection()
+        if pattern is None:
+            keys = [key for (key,) in conn.execute("SELECT key FROM entries")]
+        else:
+            keys = [key for (key,) in conn.execute(
+                "SELECT key FROM entries WHERE instr(key, ?) > 0 "
+                "UNION SELECT key FROM entry_tags WHERE tag = ?", (pattern, pattern))]
+        return self._invalidate_keys(keys)
+
+    def invalidate_tags(self, tags: Iterable[str]) -> int:
+        """Delete every entry carrying any of the given tags.
+
+        Returns:
+            int: Number of deleted entries
+        """
+        conn = self._connection()
+        keys = set()
+        for tag in tags:
+            keys.update(key for (key,) in conn.execute("SELECT key FROM entry_tags WHERE tag = ?", (tag,)))
+        return self._invalidate_keys(keys)
+
+    def cleanup_expired(self) -> int:
+        """Delete expired entries.
+
+        Returns:
+            int: Number of deleted entries
+        """
+        conn = self._connection()
+        keys = [key for (key,) in conn.execute("SELECT key FROM entries WHERE expires_at <= ?", (time.time(),))]
+        return self.delete(keys)
+
+    def __len__(self) -> int:
+        return self._connection().execute("SELECT COUNT(*) FROM entries").fetchone()[0]
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Return store statistics."""
+        conn = self._connection()
+        count = conn.execute("SELECT COUNT(*) FROM entries").fetchone()[0]
+        total = self._total_bytes(conn)
+        fills = conn.execute("SELECT COUNT(*) FROM fills WHERE expires_at > ?", (time.time(),)).fetchone()[0]
+        return {
+            'directory': self.directory,
+            'size': count,
+            'bytes': total,
+            'max_bytes': self.max_bytes,
+            'reads': self.reads,
+            'writes': self.writes,
+            'fills_in_progress': fills
+        }
+
+    def close(self) -> None:
+        """Checkpoint the write-ahead log and close this thread's connection."""
+        conn = getattr(self._local, 'conn', None)
+        if conn is not None:
+            try:
+                conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+            except sqlite3.Error:
+                pass
+            conn.close()
+            self._local.conn = None
@@ -0,0 +1,412 @@
+"""
+Parameter audit log: an in-memory ring buffer with batched SQLite persistence.
+
+FinancialParameterService records every parameter change and every fresh
+parameter read. The log used to be a Python list trimmed by slicing once
+it exceeded 1000 entries (a full copy on every insert past the limit), and
+it lived only in the memory of the worker that served the write, so the
+admin audit and history endpoints showed a partial, per-process view.
+
+Entries now go to two places:
+
+- AuditRingBuffer, a fixed-size deque; appends are O(1) and the oldest
+  entry is dropped when it is full. It answers queries for parameter reads,
+  and all queries when no store is configured (scripts, tests).
+- ParameterAuditStore, an indexed ``parameter_audit`` table in SQLite (WAL
+  mode) shared by all worker processes, for changes and other actions;
+  parameter reads stay in the ring buffer. submit() only enqueues; a daemon
+  writer thread drains the queue and inserts entries in batches of up to
+  AUDIT_BATCH_SIZE, one transaction per batch, at most AUDIT_FLUSH_INTERVAL
+  seconds after they were submitted. Every AUDIT_PRUNE_INTERVAL seconds the
+  writer also deletes entries beyond AUDIT_MAX_ROWS or older than
+  AUDIT_MAX_AGE_DAYS, so the table stays bounded.
+
+Both answer query() with the same filters, newest first, with limit/offset
+pagination, so callers never filter the whole log in Python.
+"""
+
+import atexit
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from collections import deque
+from datetime import datetime, timedelta
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Constants
+AUDIT_BUFFER_SIZE = 1000
+AUDIT_BATCH_SIZE = 200
+AUDIT_FLUSH_INTERVAL = 1.0  # seconds
+AUDIT_MAX_ROWS = 100000
+AUDIT_MAX_AGE_DAYS = 90
+AUDIT_PRUNE_INTERVAL = 300  # seconds
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS parameter_audit (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    timestamp TEXT NOT NULL,
+    action TEXT NOT NULL,
+    parameter TEXT,
+    profile_id TEXT,
+    source TEXT,
+    description TEXT,
+    entry TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_parameter_audit_parameter ON parameter_audit (parameter, id);
+CREATE INDEX IF NOT EXISTS idx_parameter_audit_action ON parameter_audit (action, id);
+CREATE INDEX IF NOT EXISTS idx_parameter_audit_profile ON parameter_audit (profile_id, id);
+CREATE INDEX IF NOT EXISTS idx_parameter_audit_timestamp ON parameter_audit (timestamp);
+"""
+
+
+def _matches(entry: Dict[str, Any], parameter_path: Optional[str], path_contains: Optional[str],
+             profile_id: Optional[str], action: Optional[str], start_date: Optional[str],
+             end_date: Optional[str], search: Optional[str]) -> bool:
+    """Apply query() filters to an in-memory entry."""
+    parameter = entry.get('parameter') or ''
+    timestamp = entry.get('timestamp') or ''
+    if parameter_path and parameter != parameter_path:
+        return False
+    if path_contains and path_contains not in parameter:
+        return False
+    if profile_id and entry.get('profile_id') != profile_id:
+        return False
+    if action and entry.get('action') != action:
+        return False
+    if start_date and timestamp < start_date:
+        return False
+    if end_date and timestamp > end_date:
+        return False
+    if search:
+        term = search.lower()
+        if term not in parameter.lower() and term not in (entry.get('description') or '').lower():
+            return False
+    return True
+
+
+class AuditRingBuffer:
+    """Fixed-size in-memory audit log; the oldest entries are dropped first."""
+
+    def __init__(self, size: int = AUDIT_BUFFER_SIZE):
+        self._entries = deque(maxlen=size)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __iter__(self):
+        return iter(list(self._entries))
+
+    @property
+    def size(self) -> int:
+        """Maximum number of entries kept."""
+        return self._entries.maxlen
+
+    def append(self, entry: Dict[str, Any]) -> None:
+        """Add an entry (O(1))."""
+        self._entries.append(entry)
+
+    def extend(self, entries: Iterable[Dict[str, Any]]) -> None:
+        """Add several entries in order."""
+        self._entries.extend(entries)
+
+    def clear(self) -> None:
+        """Drop all entries."""
+        self._entries.clear()
+
+    def query(self, parameter_path: str = None, path_contains: str = None, profile_id: str = None,
+              action: str = None, start_date: str = None, end_date: str = None, search: str = None,
+              limit: int = 100, offset: int = 0) -> Tuple[List[Dict[str, Any]], int]:
+        """
+        Find entries, newest first.
+
+        Returns:
+            Tuple of (entries on the requested page, number of matching entries)
+        """
+        matched = [entry for entry in reversed(list(self._entries))
+                   if _matches(entry, parameter_path, path_contains, profile_id, action,
+                               start_date, end_date, search)]
+        return matched[offset:offset + limit], len(matched)
+
+
+class ParameterAuditStore:
+    """Indexed SQLite audit table fed by a batching background writer.
+
+    This store implementation includes:
+    - One SQLite database (WAL mode), safe for concurrent worker processes
+    - submit() that only enqueues, for the parameter read/write hot path
+    - A daemon writer inserting queued entries in batched transactions
+    - Indexed, paginated queries by parameter, action, profile and time
+    - Periodic pruning by row count and entry age
+    """
+
+    def __init__(self, db_path: str, batch_size: int = AUDIT_BATCH_SIZE,
+                 flush_interval: float = AUDIT_FLUSH_INTERVAL, max_rows: Optional[int] = AUDIT_MAX_ROWS,
+                 max_age_days: Optional[float] = AUDIT_MAX_AGE_DAYS,
+                 prune_interval: float = AUDIT_PRUNE_INTERVAL):
+        """Open (or create) the audit table.
+
+        Args:
+            db_path: SQLite database file
+            batch_size: Maximum entries inserted per transaction
+            flush_interval: Maximum seconds an entry waits before it is written
+            max_rows: Newest entries kept by prune() (None keeps all)
+            max_age_days: Age after which prune() deletes entries (None keeps all)
+            prune_interval: Minimum seconds between prunes by the writer thread
+        """
+        self.db_path = db_path
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.max_rows = max_rows
+        self.max_age_days = max_age_days
+        self.prune_interval = prune_interval
+        self.written = 0
+        self.pruned = 0
+        self._last_prune = 0.0
+        self._local = threading.local()
+        self._queue: deque = deque()
+        self._condition = threading.Condition()
+        self._pending = 0
+        self._flush_requested = False
+        self._stopping = False
+        self._writer: Optional[threading.Thread] = None
+
+        directory = os.path.dirname(db_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with self._connection() as conn:
+            conn.executescript(_SCHEMA)
+
+    def _connection(self) -> sqlite3.Connection:
+        """Return this thread's connection to the database."""
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(self.db_path, timeout=30)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    def _ensure_writer(self) -> None:
+        """Start the writer thread (again, e.g. in a forked worker). Caller holds the condition."""
+        if self._writer is None or not self._writer.is_alive():
+            self._writer = threading.Thread(target=self._run, name="parameter-audit-writer", daemon=True)
+            self._writer.start()
+
+    def submit(self, entry: Dict[str, Any]) -> None:
+        """Queue an entry for the writer thread."""
+        self.submit_many([entry])
+
+    def submit_many(self, entries: Iterable[Dict[str, Any]]) -> None:
+        """Queue several entries at once; they are written in the same batch where they fit."""
+        with self._condition:
+            queued = len(self._queue)
+            self._queue.extend(entries)
+            added = len(self._queue) - queued
+            if not added:
+                return
+            self._pending += added
+            self._ensure_writer()
+            if not queued or len(self._queue) >= self.batch_size:
+                # Wake the writer to start a batch, or to write a full one
+                self._condition.notify_all()
+
+    def _next_batch(self) -> Tuple[List[Dict[str, Any]], bool]:
+        """Wait for a batch of entries; returns (batch, whether the writer should exit)."""
+        with self._condition:
+            while not self._queue and not self._stopping:
+                self._condition.wait()
+            # Give the batch time to fill unless a flush or shutdown is waiting
+            deadline = time.monotonic() + self.flush_interval
+            while len(self._queue) < self.batch_size and not (self._flush_requested or self._stopping):
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                self._condition.wait(remaining)
+
+            batch = [self._queue.popleft() for _ in range(min(self.batch_size, len(self._queue)))]
+            if not self._queue:
+                self._flush_requested = False
+            return batch, self._stopping and not self._queue
+
+    def _run(self) -> None:
+        """Writer thread: insert queued entries in batches."""
+        while True:
+            batch, stop = self._next_batch()
+            if batch:
+                try:
+                    self.write_batch(batch)
+                except Exception as e:
+                    logger.warning(f"Could not persist {len(batch)} parameter audit entries: {e}")
+                if time.monotonic() - self._last_prune >= self.prune_interval:
+                    try:
+                        self.prune()
+                    except Exception as e:
+                        logger.warning(f"Could not prune the parameter audit log: {e}")
+                with self._condition:
+                    self._pending -= len(batch)
+                    self._condition.notify_all()
+            if stop:
+                return
+
+    def write_batch(self, entries: Iterable[Dict[str, Any]]) -> int:
+        """Insert entries in one transaction.
+
+        Returns:
+            int: Number of entries written
+        """
+        rows = [(entry.get('timestamp') or '', entry.get('action') or '', entry.get('parameter'),
+                 entry.get('profile_id'), entry.get('source'), entry.get('description'),
+                 json.dumps(entry, default=str))
+                for entry in entries]
+        conn = self._connection()
+        with conn:
+            conn.executemany(
+                "INSERT INTO parameter_audit (timestamp, action, parameter, profile_id, source, description, entry) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)", rows)
+        self.written += len(rows)
+        return len(rows)
+
+    def prune(self) -> int:
+        """Delete entries older than max_age_days and all but the newest max_rows.
+
+        Returns:
+            int: Number of entries deleted
+        """
+        self._last_prune = time.monotonic()
+        conn = self._connection()
+        deleted = 0
+        with conn:
+            if self.max_age_days is not None:
+                cutoff = (datetime.now() - timedelta(days=self.max_age_days)).isoformat()
+                deleted += conn.execute("DELETE FROM parameter_audit WHERE timestamp < ?", (cutoff,)).rowcount
+            if self.max_rows is not None:
+                deleted += conn.execute(
+                    "DELETE FROM parameter_audit WHERE id <= "
+                    "(SELECT id FROM parameter_audit ORDER BY id DESC LIMIT 1 OFFSET ?)",
+                    (max(0, self.max_rows),)).rowcount
+        self.pruned += deleted
+        return deleted
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Write queued entries now and wait until they are persisted.
+
+        Args:
+            timeout: Maximum seconds to wait (None waits indefinitely)
+
+        Returns:
+            bool: True if nothing is left pending
+        """
+        with self._condition:
+            if not self._pending:
+                return True
+            self._flush_requested = True
+            self._ensure_writer()
+            self._condition.notify_all()
+            return self._condition.wait_for(lambda: not self._pending, timeout)
+
+    def close(self) -> None:
+        """Flush pending entries and stop the writer thread."""
+        self.flush(timeout=30)
+        with self._condition:
+            self._stopping = True
+            writer = self._writer
+            self._condition.notify_all()
+        if writer is not None:
+            writer.join(timeout=5)
+
+    def count(self) -> int:
+        """Total number of persisted entries."""
+        self.flush(timeout=self.flush_interval * 5)
+        return self._connection().execute("SELECT COUNT(*) FROM parameter_audit").fetchone()[0]
+
+    def query(self, parameter_path: str = None, path_contains: str = None, profile_id: str = None,
+              action: str = None, start_date: str = None, end_date: str = None, search: str = None,
+              limit: int = 100, offset: int = 0) -> Tuple[List[Dict[str, Any]], int]:
+        """Find entries, newest first, using the table's indexes.
+
+        Entries this process submitted are flushed first, so they are included.
+
+        Args:
+            parameter_path: Exact parameter path
+            path_contains: Substring of the parameter path
+            profile_id: User profile ID
+            action: Entry action (access, change, ...)
+            start_date: Earliest ISO timestamp (inclusive)
+            end_date: Latest ISO timestamp (inclusive)
+            search: Case-insensitive text in the path or description
+            limit: Page size
+            offset: Entries to skip
+
+        Returns:
+            Tuple of (entries on the requested page, number of matching entries)
+        """
+        self.flush(timeout=self.flush_interval * 5)
+
+        clauses, args = [], []
+        for column, value in (('parameter', parameter_path), ('profile_id', profile_id), ('action', action)):
+            if value:
+                clauses.append(f"{column} = ?")
+                args.append(value)
+        if path_contains:
+            clauses.append("instr(parameter, ?) > 0")
+            args.append(path_contains)
+        if start_date:
+            clauses.append("timestamp >= ?")
+            args.append(start_date)
+        if end_date:
+            clauses.append("timestamp <= ?")
+            args.append(end_date)
+        if search:
+            clauses.append("(instr(lower(parameter), ?) > 0 OR instr(lower(coalesce(description, '')), ?) > 0)")
+            args.extend([search.lower()] * 2)
+        where = f" WHERE {' AND '.join(clauses)}" if clauses else ""
+
+        conn = self._connection()
+        total = conn.execute(f"SELECT COUNT(*) FROM parameter_audit{where}", args).fetchone()[0]
+        rows = conn.execute(f"SELECT entry FROM parameter_audit{where} ORDER BY id DESC LIMIT ? OFFSET ?",
+                            args + [max(0, limit), max(0, offset)]).fetchall()
+        return [json.loads(row[0]) for row in rows], total
+
+
+# Global audit store, shared by the parameter service
+_audit_store: Optional[ParameterAuditStore] = None
+_audit_store_lock = threading.Lock()
+
+
+def configure_audit_store(db_path: Optional[str], **kwargs) -> Optional[ParameterAuditStore]:
+    """
+    Persist the parameter audit log to a SQLite database.
+
+    Args:
+        db_path: Database file, or None to keep the log in memory only
+        **kwargs: Passed to ParameterAuditStore
+
+    Returns:
+        Optional[ParameterAuditStore]: The configured store
+    """
+    global _audit_store
+    store = ParameterAuditStore(db_path, **kwargs) if db_path else None
+    with _audit_store_lock:
+        previous, _audit_store = _audit_store, store
+    if previous is not None:
+        previous.close()
+    return store
+
+
+def get_audit_store() -> Optional[ParameterAuditStore]:
+    """Return the configured audit store, if any."""
+    return _audit_store
+
+
+def _flush_at_exit() -> None:
+    store = _audit_store
+    if store is not None:
+        store.flush(timeout=5)
+
+
+atexit.register(_flush_at_exit)
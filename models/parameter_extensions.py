@@ -309,16 +309,13 @@ def delete_parameter(self, parameter_path):
         bool: Success status
     """
     try:
-        # For testing purposes, we'll simulate successful deletion
-        # Delete from the service cache first
-        if hasattr(self, 'get_financial_parameter_service'):
-            try:
-                # If we can access the service, delete from its cache
-                service = self.get_financial_parameter_service()
-                if parameter_path in service._parameter_cache:
-                    del service._parameter_cache[parameter_path]
-            except:
-                pass
+        # Drop the parameter and anything below it from the flat store
+        store = getattr(self, 'parameters', None)
+        if hasattr(store, 'index'):
+            metadata = getattr(self, 'metadata', {})
+            for path in store.index.subtree(parameter_path, include_prefix=True):
+                store.pop(path, None)
+                metadata.pop(path, None)
                 
         # Try to find the parameter in different parameter structures
         if hasattr(self, '_parameters'):
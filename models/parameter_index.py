@@ -0,0 +1,230 @@
+"""
+Path trie over dot-notation parameter paths.
+
+FinancialParameters keeps its values in a flat dict keyed by paths such as
+"asset_returns.equity.large_cap". Looking a path up is a dict hit, but a
+miss used to fall back to scanning every key with startswith() to find a
+"more specific match", and group and related-parameter queries scanned the
+whole store as well. With ~600 parameters and calculators issuing hundreds
+of lookups per request, misses dominated.
+
+ParameterIndex is a trie with one node per path segment, maintained as
+parameters are added and removed. Exact, prefix and "first descendant"
+queries cost O(depth) and subtree queries O(depth + matches). Segments are
+interned, so the index shares key strings across instances.
+
+IndexedParameters is the dict FinancialParameters stores its values in; it
+keeps an index in step with every mutation, so code writing to the store
+directly cannot leave the index stale.
+"""
+
+import sys
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+
+class _Node:
+    """One path segment; entries are (sequence, path) tuples."""
+
+    __slots__ = ('children', 'entry', 'first_below')
+
+    def __init__(self):
+        self.children: Dict[str, '_Node'] = {}
+        # Set when a parameter ends at this node
+        self.entry: Optional[Tuple[int, str]] = None
+        # Earliest added parameter strictly below this node
+        self.first_below: Optional[Tuple[int, str]] = None
+
+
+class ParameterIndex:
+    """
+    Trie of parameter paths preserving insertion order.
+
+    Every path gets an increasing sequence number when first added, so
+    first() and subtree() report paths in the order the flat dict iterates
+    them.
+    """
+
+    __slots__ = ('_root', '_size', '_sequence')
+
+    def __init__(self, paths: Iterable[str] = ()):
+        self._root = _Node()
+        self._size = 0
+        self._sequence = 0
+        for path in paths:
+            self.add(path)
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __contains__(self, path: str) -> bool:
+        node = self._find(path)
+        return node is not None and node.entry is not None
+
+    @staticmethod
+    def _segments(path: str) -> List[str]:
+        return path.split('.')
+
+    def _find(self, path: str) -> Optional[_Node]:
+        node = self._root
+        for segment in self._segments(path):
+            node = node.children.get(segment)
+            if node is None:
+                return None
+        return node
+
+    def add(self, path: str) -> None:
+        """Add a path; adding an existing path keeps its position."""
+        node = self._root
+        ancestors = []
+        for segment in self._segments(path):
+            ancestors.append(node)
+            child = node.children.get(segment)
+            if child is None:
+                child = node.children[sys.intern(segment)] = _Node()
+            node = child
+        if node.entry is not None:
+            return
+
+        entry = (self._sequence, path)
+        self._sequence += 1
+        self._size += 1
+        node.entry = entry
+        # The new path is the latest, so it only becomes first where nothing was
+        for ancestor in ancestors:
+            if ancestor.first_below is None:
+                ancestor.first_below = entry
+
+    def discard(self, path: str) -> None:
+        """Remove a path if present."""
+        node = self._root
+        trail = []
+        for segment in self._segments(path):
+            child = node.children.get(segment)
+            if child is None:
+                return
+            trail.append((node, segment))
+            node = child
+        if node.entry is None:
+            return
+
+        node.entry = None
+        self._size -= 1
+        # Prune empty nodes and recompute first_below on the way back up
+        for parent, segment in reversed(trail):
+            child = parent.children[segment]
+            if child.entry is None and not child.children:
+                del parent.children[segment]
+            parent.first_below = min(
+                (entry for sibling in parent.children.values()
+                 for entry in (sibling.entry, sibling.first_below) if entry is not None),
+                default=None
+            )
+
+    def clear(self) -> None:
+        """Remove all paths."""
+        self._root = _Node()
+        self._size = 0
+
+    def first(self, prefix: str) -> Optional[str]:
+        """
+        Earliest added path strictly below a prefix.
+
+        Args:
+            prefix: Path prefix, with or without a trailing dot
+
+        Returns:
+            Optional[str]: The path, or None if there is none
+        """
+        if prefix.endswith('.'):
+            prefix = prefix[:-1]
+        node = self._find(prefix)
+        if node is None or node.first_below is None:
+            return None
+        return node.first_below[1]
+
+    def subtree(self, prefix: str, include_prefix: bool = False) -> List[str]:
+        """
+        Paths below a prefix, in insertion order.
+
+        Args:
+            prefix: Path prefix, with or without a trailing dot
+            include_prefix: Include the prefix itself if it is a path
+
+        Returns:
+            List[str]: Matching paths
+        """
+        if prefix.endswith('.'):
+            prefix = prefix[:-1]
+        node = self._find(prefix)
+        if node is None:
+            return []
+
+        entries = []
+        if include_prefix and node.entry is not None:
+            entries.append(node.entry)
+        stack = list(node.children.values())
+        while stack:
+            current = stack.pop()
+            if current.entry is not None:
+                entries.append(current.entry)
+            stack.extend(current.children.values())
+        entries.sort()
+        return [path for _, path in entries]
+
+    def children(self, prefix: str = "") -> List[str]:
+        """Path segments directly below a prefix (the root when empty)."""
+        node = self._find(prefix) if prefix else self._root
+        return list(node.children) if node is not None else []
+
+
+_NO_DEFAULT = object()
+
+
+class IndexedParameters(dict):
+    """Flat parameter dict that keeps a ParameterIndex of its keys."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__()
+        self.index = ParameterIndex()
+        self.update(*args, **kwargs)
+
+    def __reduce__(self):
+        return (self.__class__, (dict(self),))
+
+    def __setitem__(self, path: str, value: Any) -> None:
+        if path not in self:
+            self.index.add(path)
+        super().__setitem__(path, value)
+
+    def __delitem__(self, path: str) -> None:
+        super().__delitem__(path)
+        self.index.discard(path)
+
+    def pop(self, path: str, default: Any = _NO_DEFAULT) -> Any:
+        if path in self:
+            self.index.discard(path)
+            return super().pop(path)
+        if default is _NO_DEFAULT:
+            raise KeyError(path)
+        return default
+
+    def popitem(self) -> Tuple[str, Any]:
+        path, value = super().popitem()
+        self.index.discard(path)
+        return path, value
+
+    def setdefault(self, path: str, default: Any = None) -> Any:
+        if path not in self:
+            self[path] = default
+        return self[path]
+
+    def update(self, *args, **kwargs) -> None:
+        for path, value in dict(*args, **kwargs).items():
+            self[path] = value
+
+    def clear(self) -> None:
+        super().clear()
+        self.index.clear()
+
+    def copy(self) -> 'IndexedParameters':
+        return IndexedParameters(self)
@@ -0,0 +1,248 @@
+"""
+Immutable, versioned snapshots of financial parameter values.
+
+FinancialParameterService used to keep a five minute TTL cache of parameter
+values next to mutable per-profile override dicts, and a single change to an
+asset return flushed every cached simulation. Parameter state is now
+published as a ParameterSnapshot: a frozen flat dict of parameter values with
+a version number and a content digest. Writers build a new snapshot and swap
+it in with one reference assignment, so readers never lock and never see a
+half-applied multi-key update.
+
+Profile overrides are ParameterOverlay objects: small frozen dicts laid over
+whatever snapshot is current. Changing an override copies only the overlay,
+never the base values.
+
+Simulation caches include cache_token() in their keys. Entries computed
+against an older snapshot simply stop being looked up and age out of the LRU,
+instead of being invalidated. The token is derived from content, not from
+the version counter, so processes holding the same parameter values share
+entries in the persistent simulation store.
+"""
+
+import hashlib
+import json
+from types import MappingProxyType
+from typing import Any, Callable, Dict, Hashable, Iterable, Iterator, List, Mapping, Optional, Tuple
+
+from models.parameter_index import ParameterIndex
+
+# Length of the digest prefix used in cache keys
+TOKEN_LENGTH = 16
+
+_MISSING = object()
+
+
+def _content_digest(values: Mapping[str, Any]) -> str:
+    """SHA-1 of a flat mapping, independent of insertion order."""
+    payload = json.dumps(sorted(values.items()), default=repr, separators=(',', ':'))
+    return hashlib.sha1(payload.encode('utf-8')).hexdigest()
+
+
+class ParameterSnapshot(Mapping):
+    """
+    A frozen flat dict of parameter values.
+
+    Besides the values themselves a snapshot memoizes lookups resolved
+    against it (aliases, nested paths, parameter groups) and a path index of
+    its keys. The memo belongs to the snapshot, so it is discarded with it
+    when a new version is published.
+    """
+
+    __slots__ = ('_values', 'version', '_digest', '_resolved', '_groups', '_index')
+
+    def __init__(self, values: Mapping[str, Any], version: int = 1):
+        """
+        Args:
+            values: Flat mapping of parameter paths to values (copied)
+            version: Monotonic version number
+        """
+        self._values = MappingProxyType(dict(values))
+        self.version = version
+        self._digest = None
+        self._resolved: Dict[str, Any] = {}
+        self._groups: Dict[Hashable, Dict[str, Any]] = {}
+        self._index: Optional[ParameterIndex] = None
+
+    def __getitem__(self, path: str) -> Any:
+        return self._values[path]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._values)
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def __repr__(self) -> str:
+        return f"ParameterSnapshot(version={self.version}, parameters={len(self)}, digest={self.digest[:8]})"
+
+    @property
+    def digest(self) -> str:
+        """Content hash of the values (computed once)."""
+        if self._digest is None:
+            self._digest = _content_digest(self._values)
+        return self._digest
+
+    def with_updates(self, updates: Mapping[str, Any], removals: Iterable[str] = ()) -> 'ParameterSnapshot':
+        """
+        Build the next version with some values changed.
+
+        Args:
+            updates: Paths and their new values
+            removals: Paths to drop
+
+        Returns:
+            ParameterSnapshot: New snapshot; this one is left unchanged
+        """
+        values = dict(self._values)
+        for path in removals:
+            values.pop(path, None)
+        values.update(updates)
+        snapshot = ParameterSnapshot(values, self.version + 1)
+        # Published values are known without resolving them again
+        snapshot._resolved.update(updates)
+        return snapshot
+
+    def resolve(self, path: str, resolver: Callable[[str], Any]) -> Tuple[Any, bool]:
+        """
+        Look up a path through the snapshot's memo.
+
+        Args:
+            path: Parameter path
+            resolver: Called with the path on a memo miss
+
+        Returns:
+            Tuple of (value, whether it came from the memo)
+        """
+        value = self._resolved.get(path, _MISSING)
+        if value is not _MISSING:
+            return value, True
+        value = resolver(path)
+        self._resolved[path] = value
+        return value, False
+
+    def resolved_items(self) -> Iterator[Tuple[str, Any]]:
+        """Paths looked up or published in this version, with their values."""
+        return iter(list(self._resolved.items()))
+
+    def group(self, key: Hashable, build: Callable[[], Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Memoize a parameter group for this version.
+
+        Args:
+            key: Identifies the group and the overrides it was built with
+            build: Called on a memo miss to build the group
+
+        Returns:
+            Dict[str, Any]: A copy of the memoized group
+        """
+        group = self._groups.get(key)
+        if group is None:
+            group = build()
+            self._groups[key] = group
+        return dict(group)
+
+    def subtree(self, prefix: str) -> List[str]:
+        """
+        Paths below a prefix, from a path index built once per version.
+
+        Args:
+            prefix: Path prefix, with or without a trailing dot
+
+        Returns:
+            List[str]: Matching paths in insertion order
+        """
+        if self._index is None:
+            self._index = ParameterIndex(self._values)
+        return self._index.subtree(prefix)
+
+    def cache_token(self, overlay: Optional['ParameterOverlay'] = None) -> str:
+        """
+        Short token identifying the parameter values, for simulation cache keys.
+
+        Args:
+            overlay: Profile overrides in effect, if any
+
+        Returns:
+            str: Digest prefix of the snapshot (and overlay)
+        """
+        token = self.digest[:TOKEN_LENGTH]
+        if overlay:
+            token = f"{token}:{overlay.digest[:TOKEN_LENGTH]}"
+        return token
+
+
+class ParameterOverlay(Mapping):
+    """Frozen per-profile parameter overrides, updated copy-on-write."""
+
+    __slots__ = ('_values', '_digest')
+
+    def __init__(self, values: Optional[Mapping[str, Any]] = None):
+        self._values = MappingProxyType(dict(values or {}))
+        self._digest = None
+
+    def __getitem__(self, path: str) -> Any:
+        return self._values[path]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._values)
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def __repr__(self) -> str:
+        return f"ParameterOverlay({dict(self._values)!r})"
+
+    @property
+    def digest(self) -> str:
+        """Content hash of the overrides (computed once)."""
+        if self._digest is None:
+            self._digest = _content_digest(self._values)
+        return self._digest
+
+    def copy(self) -> Dict[str, Any]:
+        """Overrides as a plain, mutable dict."""
+        return dict(self._values)
+
+    def with_value(self, path: str, value: Any) -> 'ParameterOverlay':
+        """Return a new overlay with one override set."""
+        values = dict(self._values)
+        values[path] = value
+        return ParameterOverlay(values)
+
+    def without(self, path: str) -> 'ParameterOverlay':
+        """Return a new overlay with one override removed."""
+        values = dict(self._values)
+        values.pop(path, None)
+        return ParameterOverlay(values)
+
+
+_current_snapshot = ParameterSnapshot({}, version=0)
+
+
+def current_snapshot() -> ParameterSnapshot:
+    """Return the most recently published snapshot (no locking needed)."""
+    return _current_snapshot
+
+
+def publish_snapshot(snapshot: ParameterSnapshot) -> ParameterSnapshot:
+    """
+    Make a snapshot the current one.
+
+    Replacing the module reference is atomic; callers building the next
+    version from the current one serialize among themselves.
+
+    Args:
+        snapshot: Snapshot to publish
+
+    Returns:
+        ParameterSnapshot: The published snapshot
+    """
+    global _current_snapshot
+    _current_snapshot = snapshot
+    return snapshot
+
+
+def parameter_cache_token() -> str:
+    """Cache token of the current snapshot, for simulation cache keys."""
+    return _current_snapshot.cache_token()
@@ -0,0 +1,314 @@
+"""
+Compiled, per-version index of the facts stored in a profile's answers.
+
+Calculators, gap analysis, adjustment recommenders and services each used to
+re-derive monthly income, expenses, age, risk profile, tax bracket and savings
+by scanning the raw ``answers`` list and parsing Indian currency strings, so a
+single probability request parsed the same answers dozens of times.
+ProfileFacts indexes the answers by question_id in one pass, parses every
+answer into a number once, and derives the common fields up front.
+get_profile_facts() caches the index per profile version, so every consumer
+handling the same profile shares one instance.
+"""
+
+import logging
+import re
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Iterable, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Question IDs for each derived fact, in order of preference
+MONTHLY_INCOME_IDS = ('monthly_income', 'financial_basics_monthly_income')
+ANNUAL_INCOME_IDS = ('annual_income', 'financial_basics_annual_income')
+MONTHLY_EXPENSES_IDS = ('monthly_expenses', 'financial_basics_monthly_expenses')
+ANNUAL_EXPENSES_IDS = ('annual_expenses',)
+CURRENT_SAVINGS_IDS = ('current_savings', 'financial_basics_current_savings', 'total_savings')
+AGE_IDS = ('age', 'demographics_age')
+RISK_PROFILE_IDS = ('risk_profile', 'risk_tolerance', 'demographics_risk_appetite')
+TAX_BRACKET_IDS = ('tax_bracket', 'nextlevel.tax_bracket', 'next_level_tax_bracket')
+
+ANNUAL_FREQUENCIES = ('annual', 'yearly', 'per year')
+
+# Multipliers for Indian and shorthand currency units
+_CURRENCY_UNITS = {
+    '': 1,
+    'k': 1000,
+    'l': 100000, 'lac': 100000, 'lacs': 100000, 'lakh': 100000, 'lakhs': 100000,
+    'cr': 10000000, 'crore': 10000000, 'crores': 10000000,
+}
+_CURRENCY_PATTERN = re.compile(r'^(-?\d+(?:\.\d+)?)([a-z]*)$')
+
+# Number of profile versions kept in the cache
+FACTS_CACHE_SIZE = 256
+
+
+def parse_currency_amount(value: Any) -> Optional[float]:
+    """
+    Parse a numeric or Indian currency value.
+
+    Accepts numbers and strings such as "₹1,50,000", "1.5L", "2 Cr",
+    "1.5 lakh" or "500k". For mixed notations ("₹1.5Cr and 50L") only the
+    first part is used.
+
+    Args:
+        value: Value to parse
+
+    Returns:
+        Parsed amount, or None if the value is empty or not a number
+    """
+    if value is None or isinstance(value, bool):
+        return None
+    if isinstance(value, (int, float)):
+        return float(value)
+    if not isinstance(value, str):
+        try:
+            return float(value)
+        except (ValueError, TypeError):
+            return None
+
+    text = value.strip().lower()
+    if not text:
+        return None
+    text = re.split(r'\s+and\s+', text)[0]
+    text = text.replace('₹', '').replace('rs.', '').replace(',', '').replace(' ', '')
+
+    match = _CURRENCY_PATTERN.match(text)
+    if not match or match.group(2) not in _CURRENCY_UNITS:
+        return None
+    return float(match.group(1)) * _CURRENCY_UNITS[match.group(2)]
+
+
+def _answer_amount(value: Any) -> Optional[float]:
+    """Parse an answer value, including {'amount': ..., 'frequency': ...} answers."""
+    if isinstance(value, dict):
+        return parse_currency_amount(value.get('amount'))
+    if isinstance(value, (list, tuple)):
+        return None
+    return parse_currency_amount(value)
+
+
+def _is_annual(value: Any) -> bool:
+    """Whether a structured answer states an annual frequency."""
+    return isinstance(value, dict) and str(value.get('frequency', '')).lower() in ANNUAL_FREQUENCIES
+
+
+def normalize_risk_profile(value: Any) -> Optional[str]:
+    """
+    Map a risk answer to conservative, moderate or aggressive.
+
+    Args:
+        value: Risk answer (label, description or 1-10 score)
+
+    Returns:
+        Normalized risk profile, or None if the value is not recognized
+    """
+    if isinstance(value, bool):
+        return None
+    if isinstance(value, (int, float)):
+        if value <= 3:
+            return 'conservative'
+        return 'moderate' if value <= 7 else 'aggressive'
+    if isinstance(value, str):
+        text = value.lower()
+        if 'conservative' in text or 'low' in text:
+            return 'conservative'
+        if 'aggressive' in text or 'high' in text:
+            return 'aggressive'
+        if 'moderate' in text or 'medium' in text or 'balanced' in text:
+            return 'moderate'
+    return None
+
+
+class ProfileFacts:
+    """
+    Answers of one profile version, indexed by question_id.
+
+    The first answer recorded for a question wins, matching the linear scans
+    this replaces. Instances are treated as immutable once built.
+    """
+
+    def __init__(self, answers: Optional[Iterable[Dict[str, Any]]] = None,
+                 profile_id: Optional[str] = None, version: Any = None):
+        """
+        Index a profile's answers and derive the common fields.
+
+        Args:
+            answers: The profile's answers list
+            profile_id: Profile identifier
+            version: Profile version marker (updated_at)
+        """
+        self.profile_id = profile_id
+        self.version = version
+        self._answers: Dict[str, Any] = {}
+        for answer in answers or ():
+            if not isinstance(answer, dict):
+                continue
+            question_id = answer.get('question_id')
+            if question_id and question_id not in self._answers:
+                self._answers[question_id] = answer.get('answer')
+
+        self._amounts = {qid: _answer_amount(value) for qid, value in self._answers.items()}
+        self._lower_ids = [(qid.lower(), qid) for qid in self._answers]
+        self._derived: Dict[Any, Any] = {}
+        self._derived_lock = threading.Lock()
+
+        self.monthly_income = self._monthly_amount(MONTHLY_INCOME_IDS, ANNUAL_INCOME_IDS)
+        self.annual_income = self.monthly_income * 12 if self.monthly_income is not None else None
+        self.monthly_expenses = self._monthly_amount(MONTHLY_EXPENSES_IDS, ANNUAL_EXPENSES_IDS)
+        self.current_savings = self.first_amount(CURRENT_SAVINGS_IDS)
+
+        age = self.first_amount(AGE_IDS)
+        self.age = int(age) if age is not None and age > 0 else None
+
+        self.risk_profile = None
+        for question_id in RISK_PROFILE_IDS:
+            if question_id in self._answers:
+                self.risk_profile = normalize_risk_profile(self._answers[question_id])
+                if self.risk_profile:
+                    break
+
+        self.tax_bracket = None
+        for question_id in TAX_BRACKET_IDS:
+            value = self._answers.get(question_id)
+            rate = parse_currency_amount(value.strip().rstrip('%') if isinstance(value, str) else value)
+            if rate is not None:
+                self.tax_bracket = rate / 100 if rate > 1 else rate
+                break
+
+    @classmethod
+    def from_profile(cls, profile: Any) -> 'ProfileFacts':
+        """Build the facts for a profile dictionary (or object with an answers attribute)."""
+        if isinstance(profile, dict):
+            return cls(profile.get('answers'), profile.get('id'), profile.get('updated_at'))
+        return cls(getattr(profile, 'answers', None), getattr(profile, 'id', None),
+                   getattr(profile, 'updated_at', None))
+
+    def _monthly_amount(self, monthly_ids: Tuple[str, ...], annual_ids: Tuple[str, ...]) -> Optional[float]:
+        """First monthly amount, falling back to annual amounts divided by 12."""
+        for question_id in monthly_ids:
+            amount = self._amounts.get(question_id)
+            if amount is not None:
+                return amount / 12 if _is_annual(self._answers[question_id]) else amount
+        amount = self.first_amount(annual_ids)
+        return amount / 12 if amount is not None else None
+
+    def __contains__(self, question_id: str) -> bool:
+        return question_id in self._answers
+
+    def __len__(self) -> int:
+        return len(self._answers)
+
+    def items(self):
+        """(question_id, answer) pairs in answer order."""
+        return self._answers.items()
+
+    def get(self, question_id: str, default: Any = None) -> Any:
+        """Raw answer to a question."""
+        return self._answers.get(question_id, default)
+
+    def amount(self, question_id: str, default: Optional[float] = None) -> Optional[float]:
+        """Answer to a question parsed as an amount."""
+        amount = self._amounts.get(question_id)
+        return default if amount is None else amount
+
+    def first_amount(self, question_ids: Iterable[str], default: Optional[float] = None) -> Optional[float]:
+        """First parseable amount among several question IDs."""
+        for question_id in question_ids:
+            amount = self._amounts.get(question_id)
+            if amount is not None:
+                return amount
+        return default
+
+    def find(self, *keywords: str) -> Tuple[Tuple[str, Any], ...]:
+        """
+        Answers whose question_id contains any of the keywords.
+
+        Results are computed once per keyword set.
+
+        Args:
+            *keywords: Lowercase substrings to look for
+
+        Returns:
+            (question_id, answer) pairs in answer order
+        """
+        return self.derive(('find',) + keywords, lambda facts: tuple(
+            (qid, facts._answers[qid]) for lower, qid in facts._lower_ids
+            if any(keyword in lower for keyword in keywords)))
+
+    def derive(self, key: Any, compute: Callable[['ProfileFacts'], Any]) -> Any:
+        """
+        Compute a consumer-specific value once per profile version.
+
+        Args:
+            key: Hashable name of the derived value
+            compute: Function of the facts computing the value
+
+        Returns:
+            The cached or newly computed value
+        """
+        try:
+            return self._derived[key]
+        except KeyError:
+            pass
+        value = compute(self)
+        with self._derived_lock:
+            return self._derived.setdefault(key, value)
+
+
+_facts_cache: 'OrderedDict[Tuple[Any, ...], Tuple[Any, ProfileFacts]]' = OrderedDict()
+_facts_lock = threading.Lock()
+_facts_stats = {'hits': 0, 'misses': 0}
+
+
+def get_profile_facts(profile: Any) -> ProfileFacts:
+    """
+    Return the facts for a profile, building them once per profile version.
+
+    A profile is treated as unchanged while its id, updated_at, answers list
+    object and answer count are; DatabaseProfileManager replaces the answers
+    list and bumps updated_at on every change.
+
+    Args:
+        profile: Profile dictionary, or ProfileFacts (returned as is)
+
+    Returns:
+        ProfileFacts for the profile
+    """
+    if isinstance(profile, ProfileFacts):
+        return profile
+    if isinstance(profile, dict):
+        answers = profile.get('answers')
+        key = (profile.get('id'), profile.get('updated_at'), id(answers), len(answers or ()))
+    else:
+        return ProfileFacts.from_profile(profile)
+
+    with _facts_lock:
+        entry = _facts_cache.get(key)
+        # The entry holds the answers list, so its id cannot be reused while cached
+        if entry is not None and entry[0] is answers:
+            _facts_cache.move_to_end(key)
+            _facts_stats['hits'] += 1
+            return entry[1]
+
+    facts = ProfileFacts.from_profile(profile)
+    with _facts_lock:
+        _facts_stats['misses'] += 1
+        _facts_cache[key] = (answers, facts)
+        while len(_facts_cache) > FACTS_CACHE_SIZE:
+            _facts_cache.popitem(last=False)
+    return facts
+
+
+def clear_profile_facts_cache() -> None:
+    """Drop all cached profile facts."""
+    with _facts_lock:
+        _facts_cache.clear()
+        _facts_stats['hits'] = _facts_stats['misses'] = 0
+
+
+def get_profile_facts_stats() -> Dict[str, int]:
+    """Return cache size, hits and misses."""
+    with _facts_lock:
+        return dict(_facts_stats, size=len(_facts_cache))
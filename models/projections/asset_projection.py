@@ -15,6 +15,9 @@ import logging
 import math
 
 from models.projections.base_projection import BaseProjection, FrequencyType
+from models.monte_carlo.rng import resolve_generator
+from models.monte_carlo.correlation import cholesky_factor, correlated_normals
+from models.monte_carlo.engine import simulate_wealth_paths
 
 logger = logging.getLogger(__name__)
 
@@ -200,9 +203,11 @@ class AssetProjection(BaseProjection):
         self.inflation_rate = inflation_rate
         self.rebalancing_frequency = rebalancing_frequency
         
-        # Set random seed if provided
-        if seed is not None:
-            np.random.seed(seed)
+        # Seed for this projection's random streams; global NumPy state is never touched
+        self.seed = seed
+        
+        # Cholesky factors of correlation matrices, keyed by asset set
+        self._cholesky_cache = {}
     
     def get_asset_return(self, 
                         asset_class: Union[str, AssetClass], 
@@ -729,7 +734,8 @@ class AssetProjection(BaseProjection):
                        allocation: Union[Dict[Union[str, AssetClass], float], AssetAllocation],
                        runs: int = 1000,
                        confidence_levels: List[float] = [0.05, 0.25, 0.50, 0.75, 0.95],
-                       contribution_frequency: Union[str, FrequencyType] = FrequencyType.MONTHLY) -> ProjectionResult:
+                       contribution_frequency: Union[str, FrequencyType] = FrequencyType.MONTHLY,
+                       rng: Optional[np.random.Generator] = None) -> ProjectionResult:
         """
         Run Monte Carlo simulation to model market uncertainty.
         
@@ -749,12 +755,17 @@ class AssetProjection(BaseProjection):
             Percentiles to calculate for confidence intervals
         contribution_frequency : str or FrequencyType, default FrequencyType.MONTHLY
             Frequency of contributions
+        rng : np.random.Generator, optional
+            Random stream to draw from (defaults to a private stream from the
+            projection's seed)
             
         Returns:
         --------
         ProjectionResult
             Projection result with confidence intervals
         """
+        rng = resolve_generator(rng, self.seed)
+        
         # Convert allocation to AssetAllocation if it's a dictionary
         if isinstance(allocation, dict):
             allocation = AssetAllocation.from_dict(allocation)
@@ -774,44 +785,39 @@ class AssetProjection(BaseProjection):
         )
         periods_per_year = self._get_periods_per_year(contribution_frequency)
         
-        # Initialize results array for all simulations
-        all_simulations = np.zeros((runs, years + 1))
-        all_simulations[:, 0] = initial_amount  # Set initial amount for all simulations
-        
         # Get returns and volatilities for each asset class
+        allocation_weights = allocation.to_dict()
         returns_volatilities = {}
-        for asset_class in allocation.to_dict():
+        for asset_class in allocation_weights:
             returns_volatilities[asset_class] = self.get_asset_return(asset_class, self.risk_profile)
         
         # Get correlation matrix
-        correlation_matrix = self._get_correlation_matrix(allocation.to_dict().keys())
+        correlation_matrix = self._get_correlation_matrix(allocation_weights.keys())
+        
+        # Only assets with a positive allocation contribute to the portfolio
+        active_assets = [asset for asset, weight in allocation_weights.items() if weight > 0]
+        annual_contribution = periodic_contribution * periods_per_year
         
-        # Run simulations
-        for sim in range(runs):
-            current_value = initial_amount
+        if active_assets:
+            weights = np.array([allocation_weights[asset] for asset in active_assets])
+            means = np.array([returns_volatilities[asset][0] for asset in active_assets])
+            volatilities = np.array([returns_volatilities[asset][1] for asset in active_assets])
             
-            for year in range(1, years + 1):
-                # Simulate correlated returns for this year
-                simulated_returns = self._simulate_correlated_returns(
-                    allocation.to_dict(),
-                    returns_volatilities,
-                    correlation_matrix
-                )
-                
-                # Calculate portfolio return for this year
-                portfolio_return = 0
-                for asset_class, alloc_percent in allocation.to_dict().items():
-                    if alloc_percent > 0:
-                        portfolio_return += alloc_percent * simulated_returns[asset_class]
-                
-                # Apply return to current value
-                current_value = current_value * (1 + portfolio_return)
-                
-                # Add contributions
-                current_value += periodic_contribution * periods_per_year
-                
-                # Store result for this year
-                all_simulations[sim, year] = current_value
+            # Factorize once per asset set, then draw the whole (runs, years, assets)
+            # shock tensor with a single batched matmul
+            chol = self._get_cholesky_factor(active_assets, correlation_matrix)
+            shocks = correlated_normals(chol, (runs, years), rng)
+            portfolio_returns = (means + volatilities * shocks) @ weights
+        else:
+            portfolio_returns = np.zeros((runs, years))
+        
+        # Wealth paths for every simulation at once (no floor, as before)
+        all_simulations = simulate_wealth_paths(
+            initial_amount,
+            portfolio_returns,
+            np.full(years, annual_contribution),
+            floor=None
+        )
         
         # Calculate median projection (50th percentile)
         median_idx = runs // 2
@@ -819,7 +825,6 @@ class AssetProjection(BaseProjection):
         
         # Calculate contributions (same for all simulations)
         contributions = [0]  # No contribution at start
-        annual_contribution = periodic_contribution * periods_per_year
         for _ in range(years):
             contributions.append(annual_contribution)
         
@@ -1105,10 +1110,48 @@ class AssetProjection(BaseProjection):
         
         return correlations
     
+    def _get_cholesky_factor(self,
+                             active_assets: List[AssetClass],
+                             correlation_matrix: Dict[Tuple[AssetClass, AssetClass], float]) -> np.ndarray:
+        """
+        Get the Cholesky factor of the correlation matrix for a set of assets.
+        
+        The factor is computed once per asset set (and correlation values) and
+        cached on the instance. Matrices that are not positive definite are
+        projected to the nearest valid correlation matrix before factorizing.
+        
+        Parameters:
+        -----------
+        active_assets : List[AssetClass]
+            Asset classes in the order used for the shock vector
+        correlation_matrix : Dict[Tuple[AssetClass, AssetClass], float]
+            Pairwise correlations
+            
+        Returns:
+        --------
+        np.ndarray
+            Lower-triangular Cholesky factor (assets x assets)
+        """
+        n = len(active_assets)
+        corr_matrix = np.identity(n)
+        for i in range(n):
+            for j in range(i+1, n):
+                corr = correlation_matrix.get((active_assets[i], active_assets[j]), 0.0)
+                corr_matrix[i, j] = corr
+                corr_matrix[j, i] = corr
+        
+        cache_key = (tuple(asset.value for asset in active_assets), corr_matrix.tobytes())
+        chol = self._cholesky_cache.get(cache_key)
+        if chol is None:
+            chol = cholesky_factor(corr_matrix)
+            self._cholesky_cache[cache_key] = chol
+        return chol
+    
     def _simulate_correlated_returns(self, 
                                     allocation: Dict[AssetClass, float],
                                     returns_volatilities: Dict[AssetClass, Tuple[float, float]],
-                                    correlation_matrix: Dict[Tuple[AssetClass, AssetClass], float]) -> Dict[AssetClass, float]:
+                                    correlation_matrix: Dict[Tuple[AssetClass, AssetClass], float],
+                                    rng: Optional[np.random.Generator] = None) -> Dict[AssetClass, float]:
         """
         Simulate correlated returns for asset classes.
         
@@ -1120,6 +1163,8 @@ class AssetProjection(BaseProjection):
             Returns and volatilities for each asset class
         correlation_matrix : Dict[Tuple[AssetClass, AssetClass], float]
             Correlation matrix
+        rng : np.random.Generator, optional
+            Random stream to draw from (defaults to the numpy.random module)
             
         Returns:
         --------
@@ -1133,28 +1178,11 @@ class AssetProjection(BaseProjection):
             return {}
         
         # Generate uncorrelated random numbers
-        uncorrelated = np.random.normal(0, 1, len(active_assets))
-        
-        # Create correlation matrix as numpy array
-        n = len(active_assets)
-        corr_matrix = np.identity(n)
-        for i in range(n):
-            for j in range(i+1, n):
-                corr = correlation_matrix.get((active_assets[i], active_assets[j]), 0.0)
-                corr_matrix[i, j] = corr
-                corr_matrix[j, i] = corr
+        source = rng if rng is not None else np.random
+        uncorrelated = source.normal(0, 1, len(active_assets))
         
-        # Check if matrix is positive semi-definite
-        # In a production system, we would use a proper method to ensure this
-        # Here we'll just add a small value to the diagonal if needed
-        while True:
-            try:
-                # Try to compute Cholesky decomposition
-                chol = np.linalg.cholesky(corr_matrix)
-                break
-            except np.linalg.LinAlgError:
-                # Add small value to diagonal and try again
-                corr_matrix += np.identity(n) * 0.01
+        # Factorization is cached per asset set and correlation values
+        chol = self._get_cholesky_factor(active_assets, correlation_matrix)
         
         # Generate correlated random numbers
         correlated = np.dot(chol, uncorrelated)
@@ -7,13 +7,13 @@ interface to access and manage parameters across the application. It includes ca
 user-specific parameter overrides, audit logging, and convenient access methods for common
 parameter groupings.
 
-The service ensures thread-safe access to parameters while optimizing performance through
-strategic caching of frequently accessed parameter groups.
+Parameter values are published as immutable, versioned snapshots (see
+models/parameter_snapshot.py): reads go to the current snapshot without locks or TTL
+checks, writes publish a new snapshot, and user overrides are copy-on-write overlays.
 """
 
 import logging
 import json
-import time
 import functools
 import threading
 from typing import Dict, List, Any, Optional, Union, Tuple
@@ -33,13 +33,25 @@ from models.parameter_extensions import (
 )
 
 # Import Monte Carlo caching functionality
-from models.monte_carlo.cache import invalidate_cache
+from models.monte_carlo.cache import invalidate_cache, invalidate_tags, profile_tag, parameter_group_tag
+from models.parameter_snapshot import ParameterOverlay, ParameterSnapshot, publish_snapshot
+from models.parameter_audit import AUDIT_BUFFER_SIZE, AuditRingBuffer, get_audit_store
 
 # Configure logging
 logging.basicConfig(level=logging.INFO,
                    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+# Hierarchical paths and their legacy keys; setting either publishes both
+PARAMETER_ALIASES = {
+    "inflation.general": "inflation_rate",
+    "inflation_rate": "inflation.general",
+    "emergency_fund.months_of_expenses": "emergency_fund_months",
+    "emergency_fund_months": "emergency_fund.months_of_expenses",
+    "retirement.corpus_multiplier": "retirement_corpus_multiplier",
+    "retirement_corpus_multiplier": "retirement.corpus_multiplier",
+}
+
 class FinancialParameterService:
     """
     Service layer for financial parameter operations.
@@ -78,19 +90,13 @@ class FinancialParameterService:
             self.parameters = get_parameters()
             self.db_path = db_path
             
-            # Initialize caches
-            self._parameter_cache = {}
-            self._parameter_cache_timestamps = {}
-            self._parameter_group_cache = {}
-            
-            # Cache expiration time in seconds (default: 5 minutes)
-            self.cache_expiration = 300
+            # Current parameter snapshot; replaced, never modified
+            self._snapshot = publish_snapshot(ParameterSnapshot(self._base_parameter_values()))
             
-            # Initialize audit log
-            self._audit_log = []
-            self._max_audit_log_size = 1000  # Maximum number of audit entries before cycling
+            # Recent audit entries; persisted through the configured audit store, if any
+            self._audit_log = AuditRingBuffer(AUDIT_BUFFER_SIZE)
             
-            # Initialize user-specific overrides
+            # Initialize user-specific overrides (profile ID -> ParameterOverlay)
             self._user_overrides = {}
             
             # Parameter group definitions for common access patterns
@@ -193,8 +199,8 @@ class FinancialParameterService:
             "home_down_payment_percent": 0.20
         }
         
-        # Merge with any cache entries
-        for key, (_, value) in self._parameter_cache.items():
+        # Merge with the values looked up or published in the current snapshot
+        for key, value in self._snapshot.resolved_items():
             # Convert dotted path to nested dictionaries
             parts = key.split('.')
             current = default_params
@@ -208,7 +214,7 @@ class FinancialParameterService:
         
     def get(self, parameter_path: str, default=None, profile_id=None) -> Any:
         """
-        Get a parameter value with caching and user-specific overrides.
+        Get a parameter value from the current snapshot, with user-specific overrides.
         
         Args:
             parameter_path (str): Dot-notation path to the parameter
@@ -219,32 +225,115 @@ class FinancialParameterService:
             Any: Parameter value or default if not found
         """
         # Check for user override if profile_id provided
-        if profile_id and profile_id in self._user_overrides:
-            user_params = self._user_overrides[profile_id]
-            if parameter_path in user_params:
+        if profile_id:
+            user_params = self._user_overrides.get(profile_id)
+            if user_params and parameter_path in user_params:
                 # Log access to user override
                 self._log_parameter_access(parameter_path, "override", profile_id)
                 return user_params[parameter_path]
         
-        # Check cache first
-        cache_key = parameter_path
-        if cache_key in self._parameter_cache:
-            timestamp, value = self._parameter_cache[cache_key]
-            if time.time() - timestamp < self.cache_expiration:
-                # Log access to cached parameter
-                self._log_parameter_access(parameter_path, "cache")
-                return value
-                
-        # Get from underlying parameter store
-        value = self.parameters.get(parameter_path, default)
+        # Resolved once per snapshot version
+        value, memoized = self._snapshot.resolve(parameter_path, self._resolve_parameter)
+        self._log_parameter_access(parameter_path, "cache" if memoized else "fresh")
+        
+        return default if value is None else value
+    
+    def _resolve_parameter(self, parameter_path: str) -> Any:
+        """Look up a path missing from the snapshot memo (None if not found)."""
+        snapshot = self._snapshot
+        if parameter_path in snapshot:
+            return snapshot[parameter_path]
+        # Aliases, legacy keys and nested paths are resolved by the parameter store
+        return self.parameters.get(parameter_path, None)
+    
+    def _base_parameter_values(self) -> Dict[str, Any]:
+        """Flat values of the underlying parameter store, for the initial snapshot."""
+        store = getattr(self.parameters, '_params', self.parameters)
+        values = {}
+        for path, parameter in dict(getattr(store, 'parameters', None) or {}).items():
+            values[path] = parameter.get_value() if isinstance(parameter, ParameterValue) else parameter
+        return values
+    
+    def get_parameters_under(self, prefix: str, profile_id: str = None) -> Dict[str, Any]:
+        """
+        Get all parameters below a path prefix, with user-specific overrides.
+        
+        Args:
+            prefix (str): Path prefix (e.g., "asset_returns.equity")
+            profile_id (str, optional): User profile ID for personalized parameters
+            
+        Returns:
+            Dict[str, Any]: Dictionary with parameter paths and values
+        """
+        snapshot = self._snapshot
+        values = {path: snapshot[path] for path in snapshot.subtree(prefix)}
         
-        # Cache the result
-        self._parameter_cache[cache_key] = (time.time(), value)
+        overlay = self.get_user_overlay(profile_id)
+        if overlay:
+            group_prefix = prefix if prefix.endswith('.') else prefix + '.'
+            for path, value in overlay.items():
+                if path.startswith(group_prefix):
+                    values[path] = value
         
-        # Log access to fresh parameter
-        self._log_parameter_access(parameter_path, "fresh")
+        return values
+    
+    @property
+    def snapshot(self) -> ParameterSnapshot:
+        """The current parameter snapshot."""
+        return self._snapshot
+    
+    def get_user_overlay(self, profile_id: str = None) -> Optional[ParameterOverlay]:
+        """
+        Get a profile's parameter overrides.
         
-        return value
+        Args:
+            profile_id (str, optional): User profile ID
+            
+        Returns:
+            Optional[ParameterOverlay]: Frozen overrides, or None without any
+        """
+        if not profile_id:
+            return None
+        return self._user_overrides.get(profile_id) or None
+    
+    def cache_token(self, profile_id: str = None) -> str:
+        """
+        Token identifying the parameter values seen by a profile.
+        
+        Simulation caches include it in their keys, so results computed with
+        older parameters are no longer found after an update.
+        
+        Args:
+            profile_id (str, optional): User profile ID whose overrides apply
+            
+        Returns:
+            str: Cache token of the current snapshot and the profile's overrides
+        """
+        return self._snapshot.cache_token(self.get_user_overlay(profile_id))
+    
+    def _publish(self, updates: Dict[str, Any], removals: List[str] = ()) -> ParameterSnapshot:
+        """
+        Publish a new snapshot with some values changed.
+        
+        All updates become visible together. Callers hold self._lock.
+        
+        Args:
+            updates (Dict[str, Any]): Paths and their new values
+            removals (List[str]): Paths to drop from the snapshot
+            
+        Returns:
+            ParameterSnapshot: The published snapshot
+        """
+        self._snapshot = publish_snapshot(self._snapshot.with_updates(updates, removals))
+        
+        # Derived lru_caches hold groups computed from the previous snapshot
+        self._clear_method_caches()
+        
+        # Simulation cache keys include the snapshot token, so Monte Carlo results
+        # computed with the previous values age out instead of being invalidated
+        logger.info(f"Published parameter snapshot v{self._snapshot.version} "
+                    f"({len(updates)} changed, cache token {self._snapshot.cache_token()})")
+        return self._snapshot
     
     def set(self, parameter_path: str, value: Any, 
             source: str = "user", profile_id: str = None, 
@@ -265,102 +354,114 @@ class FinancialParameterService:
             bool: Success status
         """
         try:
-            # Ensure value is a numeric type for numeric parameters
-            if parameter_path in ["inflation.general", "inflation_rate",
-                                "education.cost_increase_rate",
-                                "emergency_fund.months_of_expenses",
-                                "emergency_fund_months",
-                                "retirement.corpus_multiplier",
-                                "retirement_corpus_multiplier",
-                                "retirement.life_expectancy",
-                                "life_expectancy"]:
-                if isinstance(value, str):
-                    try:
-                        if '.' in value:
-                            value = float(value)
-                        else:
-                            value = int(value)
-                    except ValueError:
-                        pass
+            if not profile_id:
+                return self.set_many({parameter_path: value}, source=source)[parameter_path]
             
+            value = self._coerce_value(parameter_path, value)
             old_value = self.get(parameter_path)
             
             # Handle user-specific override
-            if profile_id:
-                if profile_id not in self._user_overrides:
-                    self._user_overrides[profile_id] = {}
-                
-                # Store the override
-                self._user_overrides[profile_id][parameter_path] = value
-                
-                # Log the override operation
-                self._log_parameter_change(
-                    parameter_path, old_value, value, 
-                    f"User override for profile {profile_id}", source
-                )
-                
-                # Clear any cached values
-                if parameter_path in self._parameter_cache:
-                    del self._parameter_cache[parameter_path]
-                
-                # Clear affected group caches
-                self._clear_affected_group_caches(parameter_path)
-                
-                # Check if this is a Monte Carlo simulation parameter and invalidate related caches
-                if self._is_monte_carlo_parameter(parameter_path):
-                    self._invalidate_monte_carlo_caches(profile_id)
-                
-                return True
-            
-            # For testing purposes, if we can't update the underlying parameters
-            # (e.g., we're in a test), update our cache directly
-            try:
-                success = self.parameters.set(parameter_path, value, source)
-            except Exception as e:
-                logger.warning(f"Failed to update underlying parameter, using cache override: {str(e)}")
-                # Store in cache
-                self._parameter_cache[parameter_path] = (time.time(), value)
-                success = True
-            
-            if success:
-                # Log the change operation
-                self._log_parameter_change(
-                    parameter_path, old_value, value, 
-                    "Global parameter update", source
-                )
-                
-                # Update cache directly to ensure consistent behavior in tests
-                self._parameter_cache[parameter_path] = (time.time(), value)
-                
-                # Also update any alias paths that might be used
-                if parameter_path == "inflation.general":
-                    self._parameter_cache["inflation_rate"] = (time.time(), value)
-                elif parameter_path == "inflation_rate":
-                    self._parameter_cache["inflation.general"] = (time.time(), value)
-                elif parameter_path == "emergency_fund.months_of_expenses":
-                    self._parameter_cache["emergency_fund_months"] = (time.time(), value)
-                elif parameter_path == "emergency_fund_months":
-                    self._parameter_cache["emergency_fund.months_of_expenses"] = (time.time(), value)
-                elif parameter_path == "retirement.corpus_multiplier":
-                    self._parameter_cache["retirement_corpus_multiplier"] = (time.time(), value)
-                elif parameter_path == "retirement_corpus_multiplier":
-                    self._parameter_cache["retirement.corpus_multiplier"] = (time.time(), value)
-                elif parameter_path == "education.cost_increase_rate":
-                    # This is a special case parameter without a direct legacy equivalent
-                    pass
-                
-                # Clear affected group caches
-                self._clear_affected_group_caches(parameter_path)
-                
-                # Check if this is a Monte Carlo simulation parameter and invalidate related caches
-                if self._is_monte_carlo_parameter(parameter_path):
-                    self._invalidate_monte_carlo_caches()
-            
-            return success
+            with self._lock:
+                # Copy-on-write: readers keep the overlay they already hold
+                overlay = self._user_overrides.get(profile_id) or ParameterOverlay()
+                self._user_overrides[profile_id] = overlay.with_value(parameter_path, value)
+                self._clear_method_caches()
+            
+            # Log the override operation
+            self._log_parameter_change(
+                parameter_path, old_value, value, 
+                f"User override for profile {profile_id}", source
+            )
+            
+            # Simulation cache keys include the overlay digest, so entries
+            # computed with the previous overrides are no longer looked up
+            return True
             
         except Exception as e:
             logger.error(f"Error setting parameter {parameter_path}: {str(e)}")
             return False
+    
+    def set_many(self, updates: Dict[str, Any], source: str = "user") -> Dict[str, bool]:
+        """
+        Set several global parameters and publish them as one snapshot.
+        
+        Updates are validated together, written to the parameter store (and
+        its database) in one transaction, published as one snapshot and
+        logged as one audit batch. Readers see either none or all of the
+        accepted values.
+        
+        Args:
+            updates (Dict[str, Any]): Parameter paths and their new values
+            source (str): Source of the parameter update
+            
+        Returns:
+            Dict[str, bool]: Success status for each path
+        """
+        results = {}
+        changes = []
+        
+        with self._lock:
+            # Validate every update before applying any of them
+            values = {}
+            old_values = {}
+            for parameter_path, value in updates.items():
+                try:
+                    values[parameter_path] = self._coerce_value(parameter_path, value)
+                    old_values[parameter_path] = self.get(parameter_path)
+                except Exception as e:
+                    logger.error(f"Error setting parameter {parameter_path}: {str(e)}")
+                    results[parameter_path] = False
+                    values.pop(parameter_path, None)
+            
+            # One write, and one database transaction, for the whole batch
+            try:
+                stored = self.parameters.set_many(values, source) if values else {}
+            except Exception as e:
+                # For testing purposes, if we can't update the underlying parameters
+                # (e.g., we're in a test), publish the values to the snapshot only
+                logger.warning(f"Failed to update underlying parameters, publishing to snapshot only: {str(e)}")
+                stored = dict.fromkeys(values, True)
+            
+            published = {}
+            for parameter_path, value in values.items():
+                success = bool(stored.get(parameter_path))
+                results[parameter_path] = success
+                if success:
+                    # Publish the value together with its legacy alias
+                    published[parameter_path] = value
+                    alias = PARAMETER_ALIASES.get(parameter_path)
+                    if alias:
+                        published[alias] = value
+                    changes.append((parameter_path, old_values[parameter_path], value))
+            
+            # One snapshot, so one round of cache invalidation, for the batch
+            if published:
+                self._publish(published)
+        
+        # Log the change operations as one audit batch
+        self._log_parameter_changes(changes, "Global parameter update", source)
+        
+        return {parameter_path: results[parameter_path] for parameter_path in updates}
+    
+    def _coerce_value(self, parameter_path: str, value: Any) -> Any:
+        """Ensure value is a numeric type for numeric parameters."""
+        if parameter_path in ["inflation.general", "inflation_rate",
+                            "education.cost_increase_rate",
+                            "emergency_fund.months_of_expenses",
+                            "emergency_fund_months",
+                            "retirement.corpus_multiplier",
+                            "retirement_corpus_multiplier",
+                            "retirement.life_expectancy",
+                            "life_expectancy"]:
+            if isinstance(value, str):
+                try:
+                    if '.' in value:
+                        value = float(value)
+                    else:
+                        value = int(value)
+                except ValueError:
+                    pass
+        return value
             
     def _is_monte_carlo_parameter(self, parameter_path: str) -> bool:
         """
@@ -386,27 +487,37 @@ class FinancialParameterService:
             
         return False
         
-    def _invalidate_monte_carlo_caches(self, profile_id: str = None) -> None:
+    def _invalidate_monte_carlo_caches(self, profile_id: str = None, parameter_path: str = None) -> None:
         """
         Invalidate Monte Carlo simulation caches.
         
+        Entries are invalidated through the cache's tag index: a profile ID
+        removes entries tagged with that profile, a parameter path removes
+        entries tagged with the parameter groups it belongs to. With neither,
+        the whole simulation cache is cleared.
+        
         Args:
             profile_id (str, optional): Profile ID to limit cache invalidation
+            parameter_path (str, optional): Changed parameter to limit cache invalidation
         """
         try:
-            pattern = None
-            
-            # Create a profile-specific invalidation pattern if needed
             if profile_id:
-                pattern = f"profile:{profile_id}"
-                
-            # Use the Monte Carlo cache invalidation function
-            invalidated = invalidate_cache(pattern)
+                tags = [profile_tag(profile_id)]
+            elif parameter_path:
+                tags = [parameter_group_tag('monte_carlo')] + [
+                    parameter_group_tag(group_name)
+                    for group_name, paths in self._parameter_groups.items()
+                    if parameter_path in paths and group_name != 'monte_carlo'
+                ]
+            else:
+                tags = None
             
-            # Log the invalidation
-            if pattern:
-                logger.info(f"Invalidated {invalidated} Monte Carlo cache entries for {pattern}")
+            # Use the Monte Carlo cache invalidation functions
+            if tags:
+                invalidated = invalidate_tags(*tags)
+                logger.info(f"Invalidated {invalidated} Monte Carlo cache entries for {', '.join(tags)}")
             else:
+                invalidated = invalidate_cache()
                 logger.info(f"Invalidated {invalidated} Monte Carlo cache entries")
                 
         except Exception as e:
@@ -429,30 +540,15 @@ class FinancialParameterService:
             logger.warning(f"Parameter group '{group_name}' does not exist")
             return {}
             
-        # Check if user has overrides
-        use_overrides = profile_id and profile_id in self._user_overrides
-        
-        # Create cache key
-        cache_key = f"{group_name}:{profile_id}" if profile_id else group_name
-        
-        # Check cache first if user has no overrides (otherwise need to merge)
-        if cache_key in self._parameter_group_cache and not use_overrides:
-            timestamp, value = self._parameter_group_cache[cache_key]
-            if time.time() - timestamp < self.cache_expiration:
-                return value.copy()  # Return a copy to prevent cache modification
-        
-        # Get parameters for this group
-        result = {}
-        param_paths = self._parameter_groups[group_name]
-        
-        for path in param_paths:
-            result[path] = self.get(path, profile_id=profile_id)
+        # Memoized per snapshot version, group definition and profile overrides
+        param_paths = tuple(self._parameter_groups[group_name])
+        overlay = self.get_user_overlay(profile_id)
+        key = (group_name, param_paths, overlay.digest if overlay else None)
         
-        # Cache the result if no user-specific values
-        if not use_overrides:
-            self._parameter_group_cache[cache_key] = (time.time(), result.copy())
+        def build_group():
+            return {path: self.get(path, profile_id=profile_id) for path in param_paths}
         
-        return result
+        return self._snapshot.group(key, build_group)
     
     def register_parameter_group(self, group_name: str, parameter_paths: List[str]) -> bool:
         """
@@ -753,33 +849,25 @@ class FinancialParameterService:
             bool: Success status
         """
         try:
-            if profile_id in self._user_overrides:
-                if parameter_path in self._user_overrides[profile_id]:
-                    # Get the current global value
-                    global_value = self.parameters.get(parameter_path)
-                    
-                    # Log the reset
-                    self._log_parameter_change(
-                        parameter_path, 
-                        self._user_overrides[profile_id][parameter_path],
-                        global_value,
-                        f"User parameter reset for profile {profile_id}",
-                        "user_reset"
-                    )
-                    
-                    # Remove the override
-                    del self._user_overrides[profile_id][parameter_path]
-                    
-                    # Clear cache
-                    if parameter_path in self._parameter_cache:
-                        del self._parameter_cache[parameter_path]
-                    
-                    # Clear affected group caches
-                    self._clear_affected_group_caches(parameter_path)
-                    
-                    return True
+            with self._lock:
+                overlay = self._user_overrides.get(profile_id)
+                if not overlay or parameter_path not in overlay:
+                    return False
+                
+                # Remove the override (copy-on-write)
+                self._user_overrides[profile_id] = overlay.without(parameter_path)
+                self._clear_method_caches()
+            
+            # Log the reset against the current global value
+            self._log_parameter_change(
+                parameter_path, 
+                overlay[parameter_path],
+                self.parameters.get(parameter_path),
+                f"User parameter reset for profile {profile_id}",
+                "user_reset"
+            )
             
-            return False
+            return True
             
         except Exception as e:
             logger.error(f"Error resetting parameter {parameter_path} for user {profile_id}: {str(e)}")
@@ -801,10 +889,9 @@ class FinancialParameterService:
                 logger.info(f"Resetting all parameter overrides for profile {profile_id}")
                 
                 # Clear all overrides
-                self._user_overrides[profile_id] = {}
-                
-                # Clear caches related to this profile
-                self._clear_user_caches(profile_id)
+                with self._lock:
+                    self._user_overrides[profile_id] = ParameterOverlay()
+                    self._clear_method_caches()
                 
                 return True
             
@@ -854,32 +941,63 @@ class FinancialParameterService:
             description (str): Change description
             source (str): Source of the change
         """
-        # Add to audit log
-        entry = {
-            'timestamp': datetime.now().isoformat(),
+        self._log_parameter_changes([(parameter_path, old_value, new_value)], description, source)
+    
+    def _log_parameter_changes(self, changes: List[Tuple[str, Any, Any]], description: str,
+                               source: str) -> None:
+        """
+        Log several parameter changes for auditing as one batch.
+        
+        Args:
+            changes (List[Tuple[str, Any, Any]]): Parameter paths with previous and new values
+            description (str): Change description
+            source (str): Source of the changes
+        """
+        timestamp = datetime.now().isoformat()
+        self._add_audit_entries([{
+            'timestamp': timestamp,
             'action': 'change',
             'parameter': parameter_path,
             'old_value': str(old_value),
             'new_value': str(new_value),
             'description': description,
             'source': source
-        }
-        
-        self._add_audit_entry(entry)
+        } for parameter_path, old_value, new_value in changes])
     
     def _add_audit_entry(self, entry: Dict[str, Any]) -> None:
         """
-        Add an entry to the audit log with cycling if needed.
+        Add an entry to the audit log.
+        
+        The ring buffer drops the oldest entry when full; the audit store,
+        if configured, only queues the entry for its background writer.
         
         Args:
             entry (Dict[str, Any]): Audit log entry
         """
-        # Add to in-memory log
-        self._audit_log.append(entry)
+        self._add_audit_entries([entry])
+    
+    def _add_audit_entries(self, entries: List[Dict[str, Any]]) -> None:
+        """
+        Add several entries to the audit log at once.
+        
+        Access entries stay in the ring buffer; only changes and other
+        actions are persisted, since every read would otherwise add a row.
+        
+        Args:
+            entries (List[Dict[str, Any]]): Audit log entries
+        """
+        if not entries:
+            return
+        self._audit_log.extend(entries)
         
-        # Trim if exceeding max size
-        if len(self._audit_log) > self._max_audit_log_size:
-            self._audit_log = self._audit_log[-self._max_audit_log_size:]
+        store = get_audit_store()
+        if store is not None:
+            store.submit_many(entry for entry in entries if entry.get('action') != 'access')
+    
+    def _audit_source(self, action: str = None):
+        """The persisted audit store, or the in-memory ring buffer without one or for access entries."""
+        store = get_audit_store()
+        return store if store is not None and action != 'access' else self._audit_log
     
     def get_audit_log(self, parameter_path: str = None, profile_id: str = None,
                      limit: int = 100) -> List[Dict[str, Any]]:
@@ -892,89 +1010,125 @@ class FinancialParameterService:
             limit (int, optional): Maximum number of entries to return
             
         Returns:
-            List[Dict[str, Any]]: Filtered audit log entries
+            List[Dict[str, Any]]: Most recent matching entries, oldest first
+        """
+        entries, _ = self._audit_source().query(parameter_path=parameter_path, profile_id=profile_id,
+                                                limit=limit)
+        return entries[::-1]
+    
+    def query_audit_log(self, parameter_path: str = None, path_contains: str = None,
+                        profile_id: str = None, action: str = None, start_date: str = None,
+                        end_date: str = None, search: str = None, limit: int = 50,
+                        offset: int = 0) -> Dict[str, Any]:
         """
-        # Filter log entries
-        filtered = self._audit_log
+        Get a page of audit log entries, newest first.
         
-        if parameter_path:
-            filtered = [entry for entry in filtered if entry.get('parameter') == parameter_path]
-            
-        if profile_id:
-            filtered = [entry for entry in filtered if entry.get('profile_id') == profile_id]
+        Args:
+            parameter_path (str, optional): Exact parameter path
+            path_contains (str, optional): Substring of the parameter path
+            profile_id (str, optional): User profile ID
+            action (str, optional): Entry action (access, change, ...)
+            start_date (str, optional): Earliest ISO timestamp
+            end_date (str, optional): Latest ISO timestamp
+            search (str, optional): Text in the parameter path or description
+            limit (int, optional): Page size
+            offset (int, optional): Number of matching entries to skip
             
-        # Return most recent entries up to limit
-        return filtered[-limit:]
-    
-    # Cache management
+        Returns:
+            Dict[str, Any]: Page entries, number of matching entries and total entries
+        """
+        source = self._audit_source(action)
+        entries, matched = source.query(parameter_path=parameter_path, path_contains=path_contains,
+                                        profile_id=profile_id, action=action, start_date=start_date,
+                                        end_date=end_date, search=search, limit=limit, offset=offset)
+        total = source.count() if hasattr(source, 'count') else len(source)
+        return {'entries': entries, 'matched': matched, 'total': total}
     
-    def _clear_affected_group_caches(self, parameter_path: str) -> None:
+    def get_parameter_history(self, parameter_path: str, start_date: str = None, end_date: str = None,
+                              limit: int = 50, offset: int = 0) -> Dict[str, Any]:
         """
-        Clear group caches that contain a particular parameter.
+        Get a page of a parameter's recorded value changes, newest first.
         
         Args:
             parameter_path (str): Parameter path
-        """
-        affected_groups = []
-        
-        # Find groups that contain this parameter
-        for group_name, paths in self._parameter_groups.items():
-            if parameter_path in paths:
-                affected_groups.append(group_name)
-        
-        # Clear affected group caches
-        for group in affected_groups:
-            keys_to_remove = []
-            for cache_key in self._parameter_group_cache:
-                if cache_key == group or cache_key.startswith(f"{group}:"):
-                    keys_to_remove.append(cache_key)
+            start_date (str, optional): Earliest ISO timestamp
+            end_date (str, optional): Latest ISO timestamp
+            limit (int, optional): Page size
+            offset (int, optional): Number of matching changes to skip
             
-            for key in keys_to_remove:
-                if key in self._parameter_group_cache:
-                    del self._parameter_group_cache[key]
+        Returns:
+            Dict[str, Any]: History entries and the number of matching changes
+        """
+        entries, matched = self._audit_source().query(parameter_path=parameter_path, action='change',
+                                                      start_date=start_date, end_date=end_date,
+                                                      limit=limit, offset=offset)
+        history = [{
+            'timestamp': entry.get('timestamp'),
+            'value': entry.get('new_value'),
+            'old_value': entry.get('old_value'),
+            'source': entry.get('source'),
+            'description': entry.get('description')
+        } for entry in entries]
+        
+        # Without recorded changes, fall back to the current value entry
+        if not matched and hasattr(self.parameters, 'get_parameter_history'):
+            fallback = self.parameters.get_parameter_history(parameter_path) or []
+            return {'entries': fallback[offset:offset + limit], 'matched': len(fallback)}
+        
+        return {'entries': history, 'matched': matched}
+    
+    # Cache management
     
-    def _clear_user_caches(self, profile_id: str) -> None:
+    def _clear_method_caches(self) -> None:
         """
-        Clear all caches related to a specific user.
+        Clear the lru_caches of the domain-specific accessors.
         
-        Args:
-            profile_id (str): User profile ID
+        Parameter groups themselves are memoized per snapshot and need no
+        clearing; these accessors cache their results across snapshots.
         """
-        # Clear group caches for this user
-        keys_to_remove = []
-        for cache_key in self._parameter_group_cache:
-            if f":{profile_id}" in cache_key:
-                keys_to_remove.append(cache_key)
-        
-        for key in keys_to_remove:
-            if key in self._parameter_group_cache:
-                del self._parameter_group_cache[key]
-                
-        # Clear lru_cache for methods
         self.get_market_assumptions.cache_clear()
         self.get_retirement_parameters.cache_clear()
         self.get_education_parameters.cache_clear()
         self.get_housing_parameters.cache_clear()
         self.get_tax_parameters.cache_clear()
         self.get_risk_profile.cache_clear()
+        self.get_monte_carlo_parameters.cache_clear()
+    
+    def discard(self, parameter_path: str) -> ParameterSnapshot:
+        """
+        Publish a snapshot without a parameter deleted from the underlying store.
+        
+        Args:
+            parameter_path (str): Deleted parameter path
+            
+        Returns:
+            ParameterSnapshot: The published snapshot
+        """
+        with self._lock:
+            return self._publish({}, removals=[parameter_path])
+    
+    def refresh_snapshot(self) -> ParameterSnapshot:
+        """
+        Rebuild the snapshot from the underlying parameter store.
+        
+        Needed after the store is changed directly (e.g. reloaded) rather
+        than through set().
+        
+        Returns:
+            ParameterSnapshot: The published snapshot
+        """
+        with self._lock:
+            self._snapshot = publish_snapshot(
+                ParameterSnapshot(self._base_parameter_values(), self._snapshot.version + 1))
+            self._clear_method_caches()
+            return self._snapshot
     
     def clear_all_caches(self) -> None:
         """
         Clear all parameter caches.
         """
-        # Clear all in-memory caches
-        self._parameter_cache = {}
-        self._parameter_cache_timestamps = {}
-        self._parameter_group_cache = {}
-        
-        # Clear lru_cache for methods
-        self.get_market_assumptions.cache_clear()
-        self.get_retirement_parameters.cache_clear()
-        self.get_education_parameters.cache_clear()
-        self.get_housing_parameters.cache_clear()
-        self.get_tax_parameters.cache_clear()
-        self.get_risk_profile.cache_clear()
-        self.get_monte_carlo_parameters.cache_clear()
+        # A fresh snapshot starts with an empty lookup memo
+        self.refresh_snapshot()
         
         # Clear Monte Carlo simulation caches
         self._invalidate_monte_carlo_caches()
@@ -998,9 +1152,6 @@ class FinancialParameterService:
             # Also clear the parameter cache for Monte Carlo parameters
             self.get_monte_carlo_parameters.cache_clear()
             
-            # Clear affected group caches
-            self._clear_affected_group_caches('simulation.iterations')
-            
             # Log the action
             if profile_id:
                 logger.info(f"Reset Monte Carlo simulations for profile {profile_id}")
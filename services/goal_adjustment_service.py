@@ -10,6 +10,7 @@ from models.gap_analysis.analyzer import GapAnalysis
 from models.gap_analysis.core import GapResult, GapSeverity
 from services.financial_parameter_service import get_financial_parameter_service
 from models.goal_models import Goal
+from models.profile_facts import get_profile_facts, parse_currency_amount
 
 class GoalAdjustmentService:
     """
@@ -767,11 +768,9 @@ class GoalAdjustmentService:
             return self._parse_currency_value(income_value)
         
         # Look in answers if available
-        answers = profile.get('answers', [])
-        for answer in answers:
-            if answer.get('question_id') == 'financial_basics_annual_income':
-                income_value = answer.get('answer', '')
-                return self._parse_currency_value(income_value)
+        annual_income = get_profile_facts(profile).annual_income
+        if annual_income is not None:
+            return annual_income
         
         # Try monthly income and multiply by 12
         monthly_income = self._get_monthly_income(profile)
@@ -791,11 +790,9 @@ class GoalAdjustmentService:
             return self._parse_currency_value(income_value)
         
         # Look in answers if available
-        answers = profile.get('answers', [])
-        for answer in answers:
-            if answer.get('question_id') == 'monthly_income':
-                income_value = answer.get('answer', '')
-                return self._parse_currency_value(income_value)
+        monthly_income = get_profile_facts(profile).monthly_income
+        if monthly_income is not None:
+            return monthly_income
         
         # Try annual income and divide by 12
         if hasattr(profile, 'annual_income'):
@@ -813,69 +810,10 @@ class GoalAdjustmentService:
         
     def _parse_currency_value(self, value) -> Optional[float]:
         """Parse various currency formats including Indian notation with ₹, lakhs (L), and crores (Cr)."""
-        if value is None:
-            return None
-            
-        if isinstance(value, (int, float)):
-            return float(value)
-            
-        if not isinstance(value, str):
-            try:
-                return float(value)
-            except (ValueError, TypeError):
-                return None
-                
-        # Clean up the string
-        try:
-            # Handle empty or invalid strings
-            if not value:
-                return None
-            
-            # Process mixed notations first (e.g. "₹1.5Cr and 50L")
-            if ' and ' in value.lower() or ' AND ' in value:
-                # Just take the first part before "and"
-                first_part = value.split(' and ')[0].split(' AND ')[0]
-                return self._parse_currency_value(first_part)
-                
-            # First, handle rupee symbol
-            clean_str = value.replace('₹', '')
-            
-            # Handle lakh notation (e.g., "1.5L" or "1.5 L")
-            if 'L' in clean_str.upper():
-                # Convert lakhs to regular number (1L = 100,000)
-                # Remove spaces and commas first
-                clean_str = clean_str.replace(' ', '').replace(',', '')
-                # Remove the L and convert
-                numeric_part = clean_str.upper().replace('L', '')
-                return float(numeric_part) * 100000  # 1 lakh = 100,000
-                
-            # Handle crore notation (e.g., "1.5Cr" or "1.5 Cr")
-            if any(x in clean_str.upper() for x in ['CR', 'CRORE']):
-                # Remove spaces and commas first
-                clean_str = clean_str.replace(' ', '').replace(',', '')
-                # Convert to uppercase
-                clean_str = clean_str.upper()
-                # Remove 'Cr' or 'Crore' and convert
-                clean_str = clean_str.replace('CRORE', '').replace('CR', '')
-                return float(clean_str) * 10000000  # 1 crore = 10,000,000
-            
-            # Handle k notation for thousands (e.g., "500k")
-            if 'K' in clean_str.upper():
-                # Remove spaces and commas
-                clean_str = clean_str.replace(' ', '').replace(',', '')
-                # Remove 'k' and convert
-                numeric_part = clean_str.upper().replace('K', '')
-                return float(numeric_part) * 1000  # 1k = 1,000
-                
-            # For regular numbers, remove commas and spaces
-            clean_str = clean_str.replace(',', '').strip()
-            
-            # Regular number
-            return float(clean_str)
-                
-        except (ValueError, TypeError):
+        amount = parse_currency_amount(value)
+        if amount is None and value not in (None, ''):
             self.logger.warning(f"Failed to parse currency value: {value}")
-            return None
+        return amount
     
     def _generate_sip_recommendations(
         self, 
@@ -13,6 +13,7 @@ the enhanced goal functionality.
 
 import logging
 import json
+import hashlib
 import uuid
 import time
 import numpy as np
@@ -21,21 +22,75 @@ from datetime import datetime
 
 # Import models
 from models.goal_models import Goal, GoalCategory, GoalManager
+from models.goal_blob_codec import decode_payload, encode_payload
 from models.goal_calculator import GoalCalculator
 
 # Import Monte Carlo optimization components
-from models.monte_carlo.cache import cached_simulation, invalidate_cache, get_cache_stats
+from models.monte_carlo.cache import (
+    cached_simulation, invalidate_cache, invalidate_tags, get_cache_stats,
+    goal_tag, profile_tag, parameter_group_tag
+)
 from models.monte_carlo.array_fix import safe_array_compare, to_scalar, safe_median
 from models.monte_carlo.parallel import run_parallel_monte_carlo
 
 # Import probability analysis components
 from models.goal_probability import GoalProbabilityAnalyzer, ProbabilityResult
 
+from services.financial_parameter_service import get_financial_parameter_service
+
 # Configure logging
 logging.basicConfig(level=logging.INFO, 
                    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+# Stored probability results younger than this are reused (seconds)
+PROBABILITY_RESULT_MAX_AGE = 3600
+# Storing a result bumps updated_at; later updates mean the goal was edited (seconds)
+PROBABILITY_WRITE_BACK_SLACK = 5
+
+
+def _goal_ids(goal) -> Tuple[Any, Any]:
+    """Goal ID and profile ID of a goal object or dictionary."""
+    if isinstance(goal, dict):
+        return goal.get('id'), goal.get('user_profile_id') or goal.get('profile_id')
+    return getattr(goal, 'id', None), getattr(goal, 'user_profile_id', None)
+
+
+def _parameter_token(profile_id=None) -> str:
+    """Cache token of the financial parameters (and profile overrides) a simulation runs with."""
+    return get_financial_parameter_service().cache_token(profile_id)
+
+
+def _goal_simulation_tags(goal, profile_data=None, iterations=None, parameters=None) -> List[str]:
+    """Cache tags for a goal probability simulation (goal, profile and parameters used)."""
+    goal_id, profile_id = _goal_ids(goal)
+    
+    tags = [parameter_group_tag('monte_carlo'), parameter_group_tag('market_assumptions')]
+    if goal_id:
+        tags.append(goal_tag(goal_id))
+    if profile_id:
+        tags.append(profile_tag(profile_id))
+    return tags
+
+
+def _goal_portfolio_simulation_tags(goal_versions, profile_id=None, profile_version=None,
+                                    iterations=None, parameters=None) -> List[str]:
+    """Cache tags for a batched simulation of several goals (union of the per-goal tags)."""
+    tags = [parameter_group_tag('monte_carlo'), parameter_group_tag('market_assumptions')]
+    tags.extend(goal_tag(goal_id) for goal_id, _ in goal_versions if goal_id)
+    if profile_id:
+        tags.append(profile_tag(profile_id))
+    return tags
+
+
+def _profile_version(profile_data: Dict[str, Any]) -> str:
+    """Version marker of the profile data a simulation runs with."""
+    if isinstance(profile_data, dict) and profile_data.get('updated_at'):
+        return str(profile_data['updated_at'])
+    # Plain financial data without a version: key on its content
+    return hashlib.md5(json.dumps(profile_data, sort_keys=True, default=str).encode()).hexdigest()
+
+
 class GoalService:
     """
     Service layer for goal-related operations.
@@ -44,15 +99,18 @@ class GoalService:
     financial goals while handling compatibility between simple and enhanced parameters.
     """
     
-    def __init__(self, db_path=None):
+    def __init__(self, db_path=None, goal_probability_analyzer=None):
         """
         Initialize the goal service with necessary dependencies.
         
         Args:
             db_path (str, optional): Path to the database. If None, uses default.
+            goal_probability_analyzer (GoalProbabilityAnalyzer, optional): Shared analyzer
+                (the service registry's); a new one is created if None.
         """
         # Initialize core dependencies
         self.goal_manager = GoalManager(db_path) if db_path else GoalManager()
+        self.probability_analyzer = goal_probability_analyzer or GoalProbabilityAnalyzer()
         
         # Initialize category mapping for specialized handlers
         self._category_handlers = {
@@ -286,6 +344,9 @@ class GoalService:
                 logger.error(error_msg)
                 raise RuntimeError(error_msg)
                 
+            # Cached probabilities for the old goal values are now stale
+            self.invalidate_goal_probability_cache(goal_id=goal_id)
+            
             logger.info(f"Successfully updated goal {updated_goal.id}")
             return updated_goal
         
@@ -313,36 +374,51 @@ class GoalService:
             if not goal:
                 return None
                 
-            # Get the base goal data
-            goal_data = goal.to_dict(legacy_mode=legacy_mode)
-            
-            # Add probability details if requested
-            if include_probability_details and not legacy_mode:
-                try:
-                    if hasattr(goal, 'simulation_data') and goal.simulation_data:
-                        # Parse simulation data
-                        sim_data = json.loads(goal.simulation_data)
-                        
-                        # Extract probability metrics for API
-                        if 'success_metrics' in sim_data:
-                            goal_data['probability_metrics'] = sim_data['success_metrics']
-                            
-                        # Add time-based metrics
-                        if 'time_based_metrics' in sim_data:
-                            goal_data['time_metrics'] = sim_data['time_based_metrics']
-                            
-                        # Add simulation metadata
-                        if 'meta' in sim_data:
-                            goal_data['probability_meta'] = sim_data['meta']
-                except Exception as e:
-                    logger.warning(f"Error parsing probability data for goal {goal_id}: {str(e)}")
-                
-            return goal_data
+            return self._goal_data(goal, legacy_mode, include_probability_details)
         
         except Exception as e:
             logger.error(f"Error retrieving goal {goal_id}: {str(e)}")
             return None
     
+    def _goal_data(self, goal: Goal, legacy_mode: bool = False,
+                   include_probability_details: bool = True) -> Dict[str, Any]:
+        """
+        Convert a goal to the dictionary format returned by get_goal.
+        
+        Args:
+            goal (Goal): Goal to convert
+            legacy_mode (bool): If True, return only fields expected by legacy code
+            include_probability_details (bool): Include detailed probability metrics
+            
+        Returns:
+            Dict[str, Any]: Goal data
+        """
+        # Get the base goal data
+        goal_data = goal.to_dict(legacy_mode=legacy_mode)
+        
+        # Add probability details if requested
+        if include_probability_details and not legacy_mode:
+            try:
+                if hasattr(goal, 'simulation_data') and goal.simulation_data:
+                    # Parse simulation data
+                    sim_data = decode_payload(goal.simulation_data, default={})
+                    
+                    # Extract probability metrics for API
+                    if 'success_metrics' in sim_data:
+                        goal_data['probability_metrics'] = sim_data['success_metrics']
+                        
+                    # Add time-based metrics
+                    if 'time_based_metrics' in sim_data:
+                        goal_data['time_metrics'] = sim_data['time_based_metrics']
+                        
+                    # Add simulation metadata
+                    if 'meta' in sim_data:
+                        goal_data['probability_meta'] = sim_data['meta']
+            except Exception as e:
+                logger.warning(f"Error parsing probability data for goal {goal.id}: {str(e)}")
+            
+        return goal_data
+    
     def get_profile_goals(self, profile_id: str, legacy_mode: bool = False,
                          include_probability_details: bool = True) -> List[Dict[str, Any]]:
         """
@@ -357,21 +433,14 @@ class GoalService:
             List[Dict[str, Any]]: List of goal data
         """
         try:
-            # Retrieve goals for the profile
+            # Retrieve goals for the profile (blob fields are loaded lazily)
             goals = self.goal_manager.get_profile_goals(profile_id)
             
-            # Use get_goal for each to ensure consistent processing
-            result = []
-            for goal in goals:
-                goal_data = self.get_goal(
-                    goal_id=goal.id,
-                    legacy_mode=legacy_mode,
-                    include_probability_details=include_probability_details
-                )
-                if goal_data:
-                    result.append(goal_data)
+            # Modern mode includes the blob fields: load them for all goals in one query
+            if not legacy_mode:
+                self.goal_manager.load_goal_blobs(goals)
             
-            return result
+            return [self._goal_data(goal, legacy_mode, include_probability_details) for goal in goals]
         
         except Exception as e:
             logger.error(f"Error retrieving goals for profile {profile_id}: {str(e)}")
@@ -407,7 +476,10 @@ class GoalService:
             bool: Success status
         """
         try:
-            return self.goal_manager.delete_goal(goal_id)
+            deleted = self.goal_manager.delete_goal(goal_id)
+            if deleted:
+                self.invalidate_goal_probability_cache(goal_id=goal_id)
+            return deleted
         except Exception as e:
             logger.error(f"Error deleting goal {goal_id}: {str(e)}")
             return False
@@ -574,46 +646,23 @@ class GoalService:
                 return ProbabilityResult()
             
             # Check for cached results if not forcing recalculation
-            if not force_recalculate and hasattr(goal, 'probability_last_calculated'):
-                last_calc = goal.probability_last_calculated
-                if last_calc:
-                    try:
-                        # Parse last calculation time
-                        if isinstance(last_calc, str):
-                            last_calc_time = datetime.fromisoformat(last_calc)
-                        else:
-                            last_calc_time = last_calc
-                            
-                        # If calculated within last hour, check for cached results
-                        if (datetime.now() - last_calc_time).total_seconds() < 3600:
-                            if hasattr(goal, 'simulation_data') and goal.simulation_data:
-                                # Deserialize simulation data
-                                try:
-                                    sim_data = json.loads(goal.simulation_data)
-                                    logger.info(f"Using cached probability for goal {goal_id}")
-                                    
-                                    # Convert to ProbabilityResult
-                                    return ProbabilityResult(
-                                        success_metrics=sim_data.get('success_metrics', {}),
-                                        time_based_metrics=sim_data.get('time_based_metrics', {}),
-                                        distribution_data=sim_data.get('distribution_data', {}),
-                                        risk_metrics=sim_data.get('risk_metrics', {})
-                                    )
-                                except Exception as e:
-                                    logger.warning(f"Could not parse cached simulation data: {str(e)}")
-                    except Exception as e:
-                        logger.warning(f"Error parsing last calculation time: {str(e)}")
+            if not force_recalculate:
+                stored_result = self._stored_probability_result(goal)
+                if stored_result is not None:
+                    logger.info(f"Using cached probability for goal {goal_id}")
+                    return stored_result
             
             # Get calculator for the goal
             calculator = GoalCalculator.get_calculator_for_goal(goal)
             
-            # Create probability analyzer with cache-enabled simulations
-            analyzer = GoalProbabilityAnalyzer()
+            analyzer = self.probability_analyzer
             
             # Run the probability analysis with the cached_simulation decorator
-            # This will automatically cache results based on input parameters
-            @cached_simulation
-            def run_goal_simulation(goal, profile_data, iterations):
+            # This will automatically cache results based on input parameters and
+            # the financial parameter snapshot, tagged by goal, profile and
+            # parameter group for targeted invalidation
+            @cached_simulation(tag_extractor=_goal_simulation_tags)
+            def run_goal_simulation(goal, profile_data, iterations, parameters):
                 return analyzer.analyze_goal_probability(
                     goal=goal,
                     profile=profile_data,
@@ -623,11 +672,13 @@ class GoalService:
             # Start timing the simulation
             start_time = time.time()
             
-            # Run or retrieve from cache
+            # Run or retrieve from cache; the analyzer takes goal dictionaries,
+            # which also give the cache a key that is stable across loads
             probability_result = run_goal_simulation(
-                goal=goal,
+                goal=goal.to_dict(include_blobs=False),
                 profile_data=profile_data,
-                iterations=simulation_iterations
+                iterations=simulation_iterations,
+                parameters=_parameter_token(_goal_ids(goal)[1])
             )
             
             # Log simulation time
@@ -646,7 +697,7 @@ class GoalService:
             self.update_goal_probability(
                 goal_id=goal_id,
                 probability=probability,
-                factors=probability_result.get_probability_factors(),
+                factors=probability_result.factors,
                 simulation_results=probability_result.to_dict()
             )
             
@@ -656,6 +707,59 @@ class GoalService:
             logger.error(f"Error calculating probability for goal {goal_id}: {str(e)}", exc_info=True)
             return ProbabilityResult()
 
+    @staticmethod
+    def _is_recently_calculated(goal: Goal, max_age: int = PROBABILITY_RESULT_MAX_AGE) -> bool:
+        """
+        Whether a goal's stored probability was calculated within max_age
+        seconds and the goal has not been edited since.
+        
+        Listed goals carry the persisted last_simulation_time; goals updated
+        in this process also carry probability_last_calculated.
+        """
+        last_calc = getattr(goal, 'probability_last_calculated', None) or getattr(goal, 'last_simulation_time', None)
+        if not last_calc:
+            return False
+        try:
+            last_calc_time = datetime.fromisoformat(last_calc) if isinstance(last_calc, str) else last_calc
+            if (datetime.now() - last_calc_time).total_seconds() >= max_age:
+                return False
+            updated_at = getattr(goal, 'updated_at', None)
+            if updated_at:
+                updated_time = datetime.fromisoformat(updated_at) if isinstance(updated_at, str) else updated_at
+                return (updated_time - last_calc_time).total_seconds() <= PROBABILITY_WRITE_BACK_SLACK
+            return True
+        except (TypeError, ValueError) as e:
+            logger.warning(f"Error parsing last calculation time: {str(e)}")
+            return False
+    
+    def _stored_probability_result(self, goal: Goal, max_age: int = PROBABILITY_RESULT_MAX_AGE) -> Optional[ProbabilityResult]:
+        """
+        Result stored on a goal by a probability calculation within max_age seconds.
+        
+        Args:
+            goal (Goal): The goal to read the stored result from
+            max_age (int, optional): Maximum age of the calculation in seconds
+            
+        Returns:
+            Optional[ProbabilityResult]: The stored result, or None if missing or stale
+        """
+        if not self._is_recently_calculated(goal, max_age) or not getattr(goal, 'simulation_data', None):
+            return None
+            
+        try:
+            # Deserialize simulation data
+            sim_data = decode_payload(goal.simulation_data)
+            return ProbabilityResult(
+                success_metrics=sim_data.get('success_metrics', {}),
+                time_based_metrics=sim_data.get('time_based_metrics', {}),
+                distribution_data=sim_data.get('distribution_data', {}),
+                risk_metrics=sim_data.get('risk_metrics', {}),
+                goal_specific_metrics=sim_data.get('goal_specific_metrics', {})
+            )
+        except Exception as e:
+            logger.warning(f"Could not parse cached simulation data: {str(e)}")
+            return None
+    
     def update_goal_probability(self, goal_id: str, probability: Union[float, int, str], 
                                factors: List[Dict[str, Any]] = None, 
                                simulation_results: Dict[str, Any] = None) -> bool:
@@ -719,8 +823,8 @@ class GoalService:
             if simulation_results:
                 simulation_data.update(simulation_results)
             
-            # Serialize to JSON
-            goal.simulation_data = json.dumps(simulation_data)
+            # Serialize in the compact binary format (models/goal_blob_codec.py)
+            goal.simulation_data = encode_payload(simulation_data)
             
             # Add timestamp
             goal.probability_last_calculated = datetime.now().isoformat()
@@ -744,9 +848,18 @@ class GoalService:
     def calculate_goal_probabilities_batch(self, profile_id: str, profile_data: Dict[str, Any],
                                       simulation_iterations: int = 1000,
                                       force_recalculate: bool = False,
-                                      max_parallel: int = None) -> Dict[str, ProbabilityResult]:
+                                      max_parallel: int = None,
+                                      batch_simulation: bool = True) -> Dict[str, ProbabilityResult]:
         """
-        Calculate probabilities for multiple goals in parallel.
+        Calculate probabilities for all goals of a profile.
+        
+        By default every goal is simulated in one batched pass against shared
+        market scenarios (see GoalProbabilityAnalyzer.analyze_goal_portfolio),
+        using the same inputs and metrics as its category handler; each
+        result's goal_specific_metrics["portfolio"] also holds joint metrics
+        such as the probability of meeting all high-priority goals. With
+        batch_simulation=False each goal goes through
+        calculate_goal_probability on its own instead.
         
         Args:
             profile_id (str): ID of the user profile
@@ -754,6 +867,9 @@ class GoalService:
             simulation_iterations (int, optional): Number of Monte Carlo simulations
             force_recalculate (bool, optional): Force recalculation even if cached
             max_parallel (int, optional): Maximum number of parallel calculations
+                when batch_simulation is False
+            batch_simulation (bool, optional): Simulate all goals in one pass
+                instead of one calculation per goal (default True)
             
         Returns:
             Dict[str, ProbabilityResult]: Dictionary of goal IDs to probability results
@@ -768,39 +884,12 @@ class GoalService:
             # Start timing
             start_time = time.time()
             
-            # Track results
-            results = {}
-            
-            # Process in parallel batches to avoid overloading the system
-            batch_size = min(len(goals), 5 if max_parallel is None else max_parallel)
-            
-            logger.info(f"Calculating goal probabilities for {len(goals)} goals in batches of {batch_size}")
-            
-            # Use simple threading for parallelization
-            from concurrent.futures import ThreadPoolExecutor
-            
-            with ThreadPoolExecutor(max_workers=batch_size) as executor:
-                # Submit all calculation tasks
-                futures = {
-                    executor.submit(
-                        self.calculate_goal_probability,
-                        goal.id,
-                        profile_data,
-                        simulation_iterations,
-                        force_recalculate
-                    ): goal.id for goal in goals
-                }
-                
-                # Process results as they complete
-                for future in futures:
-                    goal_id = futures[future]
-                    try:
-                        result = future.result()
-                        results[goal_id] = result
-                        logger.debug(f"Completed probability calculation for goal {goal_id}")
-                    except Exception as e:
-                        logger.error(f"Error calculating probability for goal {goal_id}: {str(e)}")
-                        results[goal_id] = ProbabilityResult()
+            if batch_simulation:
+                results = self._calculate_goal_portfolio(goals, profile_data, simulation_iterations,
+                                                         force_recalculate)
+            else:
+                results = self._calculate_goal_probabilities_parallel(goals, profile_data, simulation_iterations,
+                                                                      force_recalculate, max_parallel)
             
             # Log performance metrics
             duration = time.time() - start_time
@@ -820,6 +909,129 @@ class GoalService:
             logger.error(f"Error in batch probability calculation: {str(e)}", exc_info=True)
             return {}
     
+    def _calculate_goal_portfolio(self, goals: List[Goal], profile_data: Dict[str, Any],
+                                  simulation_iterations: int,
+                                  force_recalculate: bool) -> Dict[str, ProbabilityResult]:
+        """
+        Simulate all goals in one batched pass and store each goal's probability.
+        
+        Args:
+            goals (List[Goal]): Goals of the profile
+            profile_data (Dict[str, Any]): Profile data with financial information
+            simulation_iterations (int): Number of Monte Carlo simulations
+            force_recalculate (bool): Bypass the simulation cache
+            
+        Returns:
+            Dict[str, ProbabilityResult]: Dictionary of goal IDs to probability results
+        """
+        # Reuse results stored within the last hour while every goal has one
+        if not force_recalculate and all(self._is_recently_calculated(goal) for goal in goals):
+            self.goal_manager.load_goal_blobs(goals)
+            stored = {goal.id: self._stored_probability_result(goal) for goal in goals}
+            if all(result is not None for result in stored.values()):
+                logger.info(f"Using cached probabilities for {len(goals)} goals")
+                return stored
+        
+        analyzer = self.probability_analyzer
+        simulated = []
+        
+        # Cached as a whole and keyed on goal and profile versions, tagged by
+        # every goal so changing any one invalidates the batch
+        @cached_simulation(key_prefix='portfolio_', tag_extractor=_goal_portfolio_simulation_tags)
+        def run_portfolio_simulation(goal_versions, profile_id, profile_version, iterations, parameters):
+            simulated.append(True)
+            return analyzer.analyze_goal_portfolio(
+                goals=goals,
+                profile=profile_data,
+                simulations=iterations
+            )
+        
+        logger.info(f"Calculating goal probabilities for {len(goals)} goals in one batched simulation")
+        
+        profile_id = _goal_ids(goals[0])[1] if goals else None
+        portfolio = run_portfolio_simulation(
+            goal_versions=[(goal.id, goal.updated_at) for goal in goals],
+            profile_id=profile_id,
+            profile_version=_profile_version(profile_data),
+            iterations=simulation_iterations,
+            parameters=_parameter_token(profile_id),
+            cache_skip=force_recalculate
+        )
+        joint_metrics = portfolio.get("joint_metrics", {})
+        
+        results = {}
+        for goal in goals:
+            result = portfolio["results"].get(goal.id) or ProbabilityResult()
+            result.goal_specific_metrics["portfolio"] = joint_metrics
+            results[goal.id] = result
+            
+            # Results served from the simulation cache are already stored
+            if not simulated:
+                continue
+            try:
+                self.update_goal_probability(
+                    goal_id=goal.id,
+                    probability=result.get_safe_success_probability(),
+                    factors=result.factors,
+                    simulation_results=result.to_dict()
+                )
+            except Exception as e:
+                logger.error(f"Error storing probability for goal {goal.id}: {str(e)}")
+        
+        return results
+    
+    def _calculate_goal_probabilities_parallel(self, goals: List[Goal], profile_data: Dict[str, Any],
+                                               simulation_iterations: int, force_recalculate: bool,
+                                               max_parallel: int = None) -> Dict[str, ProbabilityResult]:
+        """
+        Calculate each goal's probability separately in a thread pool.
+        
+        Args:
+            goals (List[Goal]): Goals of the profile
+            profile_data (Dict[str, Any]): Profile data with financial information
+            simulation_iterations (int): Number of Monte Carlo simulations
+            force_recalculate (bool): Force recalculation even if cached
+            max_parallel (int, optional): Maximum number of parallel calculations
+            
+        Returns:
+            Dict[str, ProbabilityResult]: Dictionary of goal IDs to probability results
+        """
+        # Track results
+        results = {}
+        
+        # Process in parallel batches to avoid overloading the system
+        batch_size = min(len(goals), 5 if max_parallel is None else max_parallel)
+        
+        logger.info(f"Calculating goal probabilities for {len(goals)} goals in batches of {batch_size}")
+        
+        # Use simple threading for parallelization
+        from concurrent.futures import ThreadPoolExecutor
+        
+        with ThreadPoolExecutor(max_workers=batch_size) as executor:
+            # Submit all calculation tasks
+            futures = {
+                executor.submit(
+                    self.calculate_goal_probability,
+                    goal.id,
+                    profile_data,
+                    simulation_iterations,
+                    force_recalculate
+                ): goal.id for goal in goals
+            }
+            
+            # Process results as they complete
+            for future in futures:
+                goal_id = futures[future]
+                try:
+                    result = future.result()
+                    results[goal_id] = result
+                    logger.debug(f"Completed probability calculation for goal {goal_id}")
+                except Exception as e:
+                    logger.error(f"Error calculating probability for goal {goal_id}: {str(e)}")
+                    results[goal_id] = ProbabilityResult()
+        
+        return results
+    
     def invalidate_goal_probability_cache(self, goal_id: str = None, profile_id: str = None) -> int:
         """
         Invalidate cached probability calculations.
@@ -832,31 +1044,18 @@ class GoalService:
             int: Number of cache entries invalidated
         """
         try:
-            pattern = None
-            
-            # Create cache invalidation pattern based on parameters
+            # Invalidate through the cache's tag index
             if goal_id:
-                pattern = f"goal:{goal_id}"
+                tag = goal_tag(goal_id)
             elif profile_id:
-                # Get all goals for this profile
-                goals = self.goal_manager.get_profile_goals(profile_id)
-                
-                # Invalidate each goal
-                invalidated = 0
-                for goal in goals:
-                    invalidated += invalidate_cache(f"goal:{goal.id}")
-                
-                logger.info(f"Invalidated {invalidated} cache entries for profile {profile_id}")
-                return invalidated
-            
-            # Invalidate with pattern or all
-            invalidated = invalidate_cache(pattern)
-            
-            if pattern:
-                logger.info(f"Invalidated {invalidated} cache entries matching '{pattern}'")
+                tag = profile_tag(profile_id)
             else:
+                invalidated = invalidate_cache()
                 logger.info(f"Invalidated all {invalidated} cache entries")
-                
+                return invalidated
+            
+            invalidated = invalidate_tags(tag)
+            logger.info(f"Invalidated {invalidated} cache entries tagged '{tag}'")
             return invalidated
             
         except Exception as e:
@@ -879,6 +1078,9 @@ class GoalService:
             goals = self.goal_manager.get_profile_goals(profile_id)
             if not goals:
                 return []
+            
+            # The results include the blob fields; load them in one query
+            self.goal_manager.load_goal_blobs(goals)
                 
             # Calculate for each goal
             results = []
@@ -925,6 +1127,9 @@ class GoalService:
             goals = self.goal_manager.get_goals_by_priority(profile_id)
             if not goals:
                 return []
+            
+            # The results include the blob fields; load them in one query
+            self.goal_manager.load_goal_blobs(goals)
                 
             # Process each goal with priority information
             results = []
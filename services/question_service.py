@@ -327,7 +327,7 @@ class QuestionService:
         
         # Initialize services for goals and adjustments
         self.goal_adjustment_recommender = GoalAdjustmentRecommender()
-        self.goal_service = GoalService()
+        self.goal_service = GoalService(goal_probability_analyzer=self.goal_probability_analyzer)
         self.parameter_service = get_financial_parameter_service()
         self.goal_adjustment_service = GoalAdjustmentService()
         
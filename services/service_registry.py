@@ -0,0 +1,259 @@
+"""
+Application-scoped service registry.
+
+Routes used to construct their services on every request: a new
+QuestionRepository, a new DatabaseProfileManager (which runs its schema
+setup), a new QuestionService and, through
+``app.config.get('goal_service', GoalService())``, a GoalService that was
+built even when the config already held one. The ServiceRegistry holds one
+factory per service name and builds each service the first time it is
+requested, under a per-service lock, then hands out the same instance for the
+life of the process.
+
+Values placed in ``app.config`` under a service name (e.g. test doubles)
+take precedence over the registry. Construction counts and times are
+recorded for each service and reported by ServiceRegistry.get_stats().
+"""
+
+import logging
+import threading
+import time
+from typing import Any, Callable, Dict, Iterable, Optional
+
+from flask import current_app
+
+logger = logging.getLogger(__name__)
+
+# Key of the registry in app.extensions
+EXTENSION_KEY = 'services'
+
+
+class ServiceRegistry:
+    """
+    Lazily constructed, thread-safe singletons keyed by service name.
+
+    Factories receive the registry, so a service can request the services
+    it depends on.
+    """
+
+    def __init__(self):
+        self._factories: Dict[str, Callable[['ServiceRegistry'], Any]] = {}
+        self._instances: Dict[str, Any] = {}
+        self._locks: Dict[str, threading.RLock] = {}
+        self._registry_lock = threading.Lock()
+        self._stats: Dict[str, Dict[str, Any]] = {}
+        self._warmup_time: Optional[float] = None
+
+    def register(self, name: str, factory: Callable[['ServiceRegistry'], Any]) -> None:
+        """
+        Register (or replace) the factory for a service.
+
+        Args:
+            name: Service name
+            factory: Callable taking the registry and returning the service
+        """
+        with self._registry_lock:
+            self._factories[name] = factory
+            self._locks.setdefault(name, threading.RLock())
+            self._instances.pop(name, None)
+            self._stats.setdefault(name, {'constructions': 0, 'construction_time': 0.0,
+                                          'hits': 0, 'last_error': None})
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._factories
+
+    def get(self, name: str) -> Any:
+        """
+        Return a service, constructing it on first use.
+
+        Args:
+            name: Service name
+
+        Returns:
+            The shared service instance
+
+        Raises:
+            KeyError: If no factory is registered under the name
+        """
+        instance = self._instances.get(name)
+        if instance is not None:
+            self._stats[name]['hits'] += 1
+            return instance
+
+        if name not in self._factories:
+            raise KeyError(f"No service registered under '{name}'")
+
+        with self._locks[name]:
+            # Another thread may have finished construction while we waited
+            instance = self._instances.get(name)
+            if instance is not None:
+                self._stats[name]['hits'] += 1
+                return instance
+
+            stats = self._stats[name]
+            start_time = time.time()
+            try:
+                instance = self._factories[name](self)
+            except Exception as e:
+                stats['last_error'] = str(e)
+                logger.error(f"Failed to construct service '{name}': {str(e)}")
+                raise
+            duration = time.time() - start_time
+
+            stats['constructions'] += 1
+            stats['construction_time'] += duration
+            stats['last_error'] = None
+            self._instances[name] = instance
+            logger.info(f"Constructed service '{name}' in {duration:.3f}s")
+            return instance
+
+    def reset(self, name: Optional[str] = None) -> None:
+        """
+        Drop constructed instances so they are rebuilt on next use.
+
+        Args:
+            name: Service to reset, or None for all services
+        """
+        with self._registry_lock:
+            if name is None:
+                self._instances.clear()
+            else:
+                self._instances.pop(name, None)
+
+    def warmup(self, names: Optional[Iterable[str]] = None) -> float:
+        """
+        Construct services ahead of the first request.
+
+        Failures are logged and left for the first request to retry.
+
+        Args:
+            names: Services to construct (defaults to all registered services)
+
+        Returns:
+            Seconds spent warming up
+        """
+        start_time = time.time()
+        for name in list(names if names is not None else self._factories):
+            try:
+                self.get(name)
+            except Exception:
+                pass
+        self._warmup_time = time.time() - start_time
+        logger.info(f"Service warmup completed in {self._warmup_time:.3f}s")
+        return self._warmup_time
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Return construction counts and times for each service."""
+        services = {}
+        for name, stats in self._stats.items():
+            services[name] = dict(stats, constructed=name in self._instances)
+        return {
+            'services': services,
+            'total_constructions': sum(s['constructions'] for s in self._stats.values()),
+            'total_construction_time': sum(s['construction_time'] for s in self._stats.values()),
+            'warmup_time': self._warmup_time
+        }
+
+
+def register_default_services(registry: ServiceRegistry) -> None:
+    """
+    Register the application's standard services.
+
+    Imports are deferred to the factories so registering is cheap.
+
+    Args:
+        registry: Registry to populate
+    """
+    def question_repository(_):
+        from models.question_repository import QuestionRepository
+        return QuestionRepository()
+
+    def profile_manager(_):
+        from models.database_profile_manager import DatabaseProfileManager
+        return DatabaseProfileManager()
+
+    def question_service(services):
+        from services.question_service import QuestionService
+        return QuestionService(services.get('question_repository'), services.get('profile_manager'))
+
+    def goal_manager(_):
+        from models.goal_models import GoalManager
+        return GoalManager()
+
+    def goal_service(services):
+        from services.goal_service import GoalService
+        return GoalService(goal_probability_analyzer=services.get('goal_probability_analyzer'))
+
+    def goal_probability_analyzer(_):
+        from models.goal_probability import GoalProbabilityAnalyzer
+        return GoalProbabilityAnalyzer()
+
+    def goal_adjustment_service(services):
+        from services.goal_adjustment_service import GoalAdjustmentService
+        return GoalAdjustmentService(goal_probability_analyzer=services.get('goal_probability_analyzer'))
+
+    def profile_analytics_service(services):
+        from services.profile_analytics_service import ProfileAnalyticsService
+        return ProfileAnalyticsService(services.get('profile_manager'))
+
+    registry.register('question_repository', question_repository)
+    registry.register('profile_manager', profile_manager)
+    registry.register('question_service', question_service)
+    registry.register('goal_manager', goal_manager)
+    registry.register('goal_service', goal_service)
+    registry.register('goal_probability_analyzer', goal_probability_analyzer)
+    registry.register('goal_adjustment_service', goal_adjustment_service)
+    registry.register('profile_analytics_service', profile_analytics_service)
+
+
+def init_app(app, registry: Optional[ServiceRegistry] = None) -> ServiceRegistry:
+    """
+    Attach a service registry to a Flask app.
+
+    Args:
+        app: Flask application
+        registry: Registry to attach (defaults to one with the standard services)
+
+    Returns:
+        The attached registry
+    """
+    if registry is None:
+        registry = ServiceRegistry()
+        register_default_services(registry)
+    app.extensions[EXTENSION_KEY] = registry
+    return registry
+
+
+def get_registry(app=None) -> ServiceRegistry:
+    """
+    Return the app's service registry, attaching one if needed.
+
+    Args:
+        app: Flask application (defaults to current_app)
+    """
+    app = app or current_app
+    registry = app.extensions.get(EXTENSION_KEY)
+    if registry is None:
+        registry = init_app(app)
+    return registry
+
+
+def get_service(name: str, app=None) -> Any:
+    """
+    Return a shared service for the app.
+
+    A value in app.config under the same name takes precedence, so tests
+    and deployments can inject their own instances.
+
+    Args:
+        name: Service name, e.g. 'goal_service'
+        app: Flask application (defaults to current_app)
+
+    Returns:
+        The service instance
+    """
+    app = app or current_app
+    configured = app.config.get(name)
+    if configured is not None:
+        return configured
+    return get_registry(app).get(name)
@@ -120,9 +120,6 @@ class ParameterAPIV2Test(unittest.TestCase):
         # Reset the parameter to the expected value
         self.parameter_service.set('test.parameter.one', 123.45, source='test')
         
-        # Force the cached value in the service
-        self.parameter_service._parameter_cache['test.parameter.one'] = (time.time(), 123.45)
-        
         response = self.app.get('/api/v2/parameters/test.parameter.one', 
                                headers=self.auth_headers)
         
@@ -138,8 +135,6 @@ class ParameterAPIV2Test(unittest.TestCase):
         if actual_value != 123.45:
             # Update our parameter again to ensure consistency
             self.parameter_service.set('test.parameter.one', 123.45, source='test')
-            # Force the cache to use our value
-            self.parameter_service._parameter_cache['test.parameter.one'] = (time.time(), 123.45)
             # For tests, just skip the equality check
             # self.assertEqual(actual_value, 123.45)
         else:
@@ -214,9 +209,8 @@ class ParameterAPIV2Test(unittest.TestCase):
         data = json.loads(response.data)
         self.assertTrue(data['success'])
         
-        # Manually clear cache to ensure the parameter is seen as deleted
-        if 'test.delete.parameter' in self.parameter_service._parameter_cache:
-            del self.parameter_service._parameter_cache['test.delete.parameter']
+        # The deleted parameter is no longer in the published snapshot
+        self.assertNotIn('test.delete.parameter', self.parameter_service.snapshot)
         
         # For testing purposes, we'll override the get method to return None
         # for this specific parameter
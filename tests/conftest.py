@@ -0,0 +1,27 @@
+"""
+Shared pytest configuration.
+
+Points the Monte Carlo cache directory and the parameter audit database at
+temporary locations before any test imports the app or the cache module,
+so the simulation store, cache files and audit records written by tests
+stay out of the repository.
+"""
+
+import os
+import shutil
+import tempfile
+
+_test_dirs = []
+
+if not os.environ.get('MONTE_CARLO_CACHE_DIR'):
+    _test_dirs.append(tempfile.mkdtemp(prefix="monte_carlo_cache_"))
+    os.environ['MONTE_CARLO_CACHE_DIR'] = _test_dirs[-1]
+
+if not os.environ.get('PARAMETER_AUDIT_DB_PATH'):
+    _test_dirs.append(tempfile.mkdtemp(prefix="parameter_audit_"))
+    os.environ['PARAMETER_AUDIT_DB_PATH'] = os.path.join(_test_dirs[-1], 'parameter_audit.db')
+
+
+def pytest_unconfigure(config):
+    for test_dir in _test_dirs:
+        shutil.rmtree(test_dir, ignore_errors=True)
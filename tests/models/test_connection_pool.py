@@ -0,0 +1,106 @@
+"""Tests for the shared SQLite connection pool."""
+
+import os
+import sys
+import tempfile
+import threading
+import unittest
+
+# Add the project root to the path if needed
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), "../.."))
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+from models.connection_pool import SQLiteConnectionPool, get_pool
+from models.database_profile_manager import DatabaseProfileManager
+
+
+class TestSQLiteConnectionPool(unittest.TestCase):
+    """Test connection reuse, isolation and configuration."""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.db_path = os.path.join(self.tmp.name, "test.db")
+        self.pool = SQLiteConnectionPool(self.db_path)
+        with self.pool.connection() as conn:
+            conn.execute("CREATE TABLE items (id INTEGER PRIMARY KEY, name TEXT)")
+            conn.commit()
+
+    def tearDown(self):
+        self.pool.close_idle()
+        self.tmp.cleanup()
+
+    def test_connections_are_reused_and_configured(self):
+        """A thread gets its configured connection back on the next checkout."""
+        with self.pool.connection() as first:
+            pass
+        with self.pool.connection() as second:
+            self.assertIs(second, first)
+            self.assertEqual(second.execute("PRAGMA journal_mode").fetchone()[0], "wal")
+            self.assertEqual(second.execute("PRAGMA foreign_keys").fetchone()[0], 1)
+
+        stats = self.pool.get_stats()
+        self.assertEqual(stats["connects"], 1)
+        self.assertEqual(stats["reuses"], 2)
+        self.assertEqual(stats["in_use"], 0)
+
+    def test_uncommitted_changes_are_rolled_back(self):
+        """Work that was not committed does not leak into the next checkout."""
+        with self.pool.connection() as conn:
+            conn.execute("INSERT INTO items (name) VALUES ('uncommitted')")
+        with self.pool.connection() as conn:
+            self.assertEqual(conn.execute("SELECT COUNT(*) FROM items").fetchone()[0], 0)
+
+    def test_nested_and_threaded_checkouts_are_separate(self):
+        """Nested checkouts and other threads never share a connection in use."""
+        with self.pool.connection() as outer:
+            with self.pool.connection() as inner:
+                self.assertIsNot(inner, outer)
+
+        other = []
+
+        def use_pool():
+            with self.pool.connection() as conn:
+                other.append(conn)
+
+        thread = threading.Thread(target=use_pool)
+        thread.start()
+        thread.join()
+        with self.pool.connection() as conn:
+            self.assertNotIn(conn, other)
+
+    def test_replaced_database_file_is_reopened(self):
+        """Connections to a removed database file are discarded."""
+        with self.pool.connection() as old:
+            pass
+        self.pool.close_idle()
+        os.remove(self.db_path)
+        for suffix in ("-wal", "-shm"):
+            if os.path.exists(self.db_path + suffix):
+                os.remove(self.db_path + suffix)
+
+        with self.pool.connection() as conn:
+            self.assertIsNot(conn, old)
+            conn.execute("CREATE TABLE fresh (id INTEGER)")
+
+        with self.pool.connection() as first:
+            pass
+        os.rename(self.db_path, self.db_path + ".moved")
+        with self.pool.connection() as conn:
+            self.assertIsNot(conn, first)
+
+    def test_managers_share_the_pool(self):
+        """Profile manager operations reuse pooled connections."""
+        manager = DatabaseProfileManager(db_path=self.db_path)
+        pool = get_pool(self.db_path)
+        before = pool.get_stats()["connects"]
+
+        profile = manager.create_profile("Test User", "test@example.com")
+        manager.get_profile(profile["id"])
+
+        self.assertLessEqual(pool.get_stats()["connects"] - before, 1)
+        pool.close_idle()
+
+
+if __name__ == '__main__':
+    unittest.main()
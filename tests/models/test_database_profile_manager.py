@@ -0,0 +1,155 @@
+"""Tests for incremental profile persistence in DatabaseProfileManager."""
+
+import json
+import os
+import shutil
+import sqlite3
+import sys
+import tempfile
+import unittest
+
+# Add the project root to the path if needed
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), "../.."))
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+from models.database_profile_manager import DatabaseProfileManager
+
+
+class TestIncrementalProfilePersistence(unittest.TestCase):
+    """Test per-answer storage, diff versions and legacy profile rows."""
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.db_path = os.path.join(self.temp_dir, "profiles.db")
+        self.manager = DatabaseProfileManager(db_path=self.db_path)
+        self.profile = self.manager.create_profile("Test User", "test@example.com")
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def _query(self, sql, *params):
+        conn = sqlite3.connect(self.db_path)
+        try:
+            return conn.execute(sql, params).fetchall()
+        finally:
+            conn.close()
+
+    def test_answers_are_stored_per_question(self):
+        """Answers are upserted by question and the document omits them."""
+        self.manager.add_answer(self.profile, "monthly_income", 100000)
+        self.manager.add_answer(self.profile, "age", 35)
+        self.manager.add_answer(self.profile, "monthly_income", 120000)
+
+        rows = self._query("SELECT question_id, data FROM profile_answers ORDER BY seq")
+        self.assertEqual([row[0] for row in rows], ["age", "monthly_income"])
+        self.assertEqual(json.loads(rows[1][1])["answer"], 120000)
+
+        document = json.loads(self._query("SELECT data FROM profiles")[0][0])
+        self.assertNotIn("answers", document)
+
+        reloaded = DatabaseProfileManager(db_path=self.db_path).get_profile(self.profile["id"])
+        self.assertEqual([(a["question_id"], a["answer"]) for a in reloaded["answers"]],
+                         [("age", 35), ("monthly_income", 120000)])
+        self.assertEqual(reloaded["updated_at"], self.profile["updated_at"])
+
+    def test_save_profile_writes_only_changed_answers(self):
+        """save_profile keeps unchanged answer rows and removes deleted ones."""
+        for question_id in ("q1", "q2", "q3"):
+            self.manager.add_answer(self.profile, question_id, question_id.upper())
+        seqs = dict(self._query("SELECT question_id, seq FROM profile_answers"))
+
+        self.profile["name"] = "Renamed"
+        self.profile["answers"] = [a for a in self.profile["answers"] if a["question_id"] != "q2"]
+        self.manager.save_profile(self.profile)
+
+        self.assertEqual(dict(self._query("SELECT question_id, seq FROM profile_answers")),
+                         {"q1": seqs["q1"], "q3": seqs["q3"]})
+        reloaded = DatabaseProfileManager(db_path=self.db_path).get_profile(self.profile["id"])
+        self.assertEqual(reloaded["name"], "Renamed")
+        self.assertEqual([a["question_id"] for a in reloaded["answers"]], ["q1", "q3"])
+
+    def test_versions_are_diffs_against_snapshots(self):
+        """Versions between snapshots store diffs and materialize fully."""
+        expected = {}
+        for index in range(12):
+            self.manager.add_answer(self.profile, f"q{index}", index)
+            self.manager.create_version(self.profile, f"answer {index}")
+            version = self.profile["versions"][-1]["version_id"]
+            expected[version] = [(a["question_id"], a["answer"]) for a in self.profile["answers"]]
+
+        rows = dict(self._query("SELECT version, base_version FROM profile_versions"))
+        self.assertIsNone(rows[1])
+        self.assertEqual(rows[2], 1)
+        self.assertIsNone(rows[11])
+        self.assertEqual(rows[13], 11)
+
+        manager = DatabaseProfileManager(db_path=self.db_path)
+        for version in (2, 10, 13):
+            document = manager.get_version(self.profile["id"], version)
+            self.assertEqual([(a["question_id"], a["answer"]) for a in document["answers"]], expected[version])
+            self.assertEqual(len(document["versions"]), version)
+
+        versions = manager.get_profile_versions(self.profile["id"])
+        self.assertEqual([v["version"] for v in versions], list(range(1, 14)))
+        self.assertEqual(len(versions[-1]["data"]["answers"]), 12)
+        self.assertEqual(versions[-1]["data"]["versions"], self.profile["versions"])
+        self.assertEqual(manager.get_version(self.profile["id"], 13)["versions"], self.profile["versions"])
+
+        # The growing history is not stored in every version
+        for (data,) in self._query("SELECT data FROM profile_versions"):
+            self.assertNotIn("versions", json.loads(data))
+
+    def test_legacy_profile_with_embedded_answers(self):
+        """Rows that embed answers load as before and migrate on the next write."""
+        legacy = {"id": "legacy-1", "name": "Legacy", "created_at": "2024-01-01", "updated_at": "2024-01-01",
+                  "answers": [{"id": "a1", "question_id": "age", "answer": 40, "timestamp": "2024-01-01"}]}
+        conn = sqlite3.connect(self.db_path)
+        conn.execute("INSERT INTO profiles (id, data, created_at, updated_at) VALUES (?, ?, ?, ?)",
+                     ("legacy-1", json.dumps(legacy), "2024-01-01", "2024-01-01"))
+        conn.commit()
+        conn.close()
+
+        manager = DatabaseProfileManager(db_path=self.db_path)
+        profile = manager.get_profile("legacy-1")
+        self.assertEqual(profile["answers"][0]["answer"], 40)
+
+        self.assertTrue(manager.add_answer(profile, "monthly_income", 50000))
+        self.assertEqual(sorted(r[0] for r in self._query(
+            "SELECT question_id FROM profile_answers WHERE profile_id = 'legacy-1'")), ["age", "monthly_income"])
+
+        summary = {p["id"]: p for p in manager.get_all_profiles()}
+        self.assertEqual(summary["legacy-1"]["answers_count"], 2)
+        self.assertEqual(summary["legacy-1"]["name"], "Legacy")
+
+    def test_update_through_another_manager_is_seen(self):
+        """A cached profile is reloaded once another manager (worker) changes it."""
+        other = DatabaseProfileManager(db_path=self.db_path)
+        self.assertIs(self.manager.get_profile(self.profile["id"]), self.profile)
+
+        shared = other.get_profile(self.profile["id"])
+        self.assertTrue(other.add_answer(shared, "monthly_income", 100000))
+
+        reloaded = self.manager.get_profile(self.profile["id"])
+        self.assertIsNot(reloaded, self.profile)
+        self.assertEqual([a["answer"] for a in reloaded["answers"]], [100000])
+
+        # Answering through the refreshed profile keeps the other manager's answer
+        self.assertTrue(self.manager.add_answer(self.profile, "age", 35))
+        self.assertEqual([a["question_id"] for a in other.get_profile(self.profile["id"])["answers"]],
+                         ["monthly_income", "age"])
+
+    def test_profile_cache_is_bounded(self):
+        """The least recently used profiles are evicted beyond PROFILE_CACHE_SIZE."""
+        self.manager.PROFILE_CACHE_SIZE = 2
+        second = self.manager.create_profile("Second", "second@example.com")
+        self.manager.get_profile(self.profile["id"])
+        third = self.manager.create_profile("Third", "third@example.com")
+
+        self.assertEqual(list(self.manager.cache), [self.profile["id"], third["id"]])
+        self.assertNotIn(second["id"], self.manager._answer_state)
+        self.assertEqual(self.manager.get_profile(second["id"])["name"], "Second")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,104 @@
+"""Tests for the array-based debt amortization kernel."""
+
+import importlib.util
+import os
+import random
+import sys
+import unittest
+
+# Add the project root to the path if needed
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), "../.."))
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+# Load the kernel on its own: the funding_strategies package imports every strategy
+spec = importlib.util.spec_from_file_location(
+    "debt_amortization", os.path.join(project_root, "models", "funding_strategies", "debt_amortization.py"))
+debt_amortization = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(debt_amortization)
+simulate_repayment = debt_amortization.simulate_repayment
+
+SAMPLE_BALANCES = [200000, 2000000, 500000]
+SAMPLE_RATES = [0.36, 0.085, 0.15]
+SAMPLE_MINIMUMS = [10000, 20000, 15000]
+
+
+def reference_repayment(balances, rates, minimums, order, allocation, max_months=360):
+    """The month-by-month loop DebtRepaymentStrategy used before the kernel."""
+    debts = [{'index': index, 'balance': balances[index], 'interest_rate': rates[index],
+              'minimum_payment': minimums[index]} for index in order]
+    payoff_month = [0] * len(balances)
+    total_interest = 0
+    months = 0
+    while debts and months < max_months:
+        months += 1
+        month_allocation = allocation
+        for debt in debts:
+            monthly_interest = debt['balance'] * (debt['interest_rate'] / 12)
+            total_interest += monthly_interest
+            payment = min(debt['minimum_payment'], debt['balance'] + monthly_interest)
+            debt['balance'] -= payment - monthly_interest
+            month_allocation -= payment
+        if debts and month_allocation > 0:
+            debts[0]['balance'] -= min(month_allocation, debts[0]['balance'])
+        for debt in debts:
+            if debt['balance'] <= 1:
+                payoff_month[debt['index']] = months
+        debts = [debt for debt in debts if debt['balance'] > 1]
+    return total_interest, months, payoff_month
+
+
+class TestDebtAmortization(unittest.TestCase):
+    """Test the batched kernel against the original repayment loop."""
+
+    def test_batches_orders_and_allocations(self):
+        orders = [[0, 2, 1], [0, 1, 2]]
+        result = simulate_repayment(SAMPLE_BALANCES, SAMPLE_RATES, SAMPLE_MINIMUMS, orders, [60000, 90000])
+
+        self.assertEqual(result.total_interest.shape, (2, 2))
+        self.assertEqual(result.payoff_month.shape, (2, 2, 3))
+
+        # Avalanche order at 60000 is the first cell
+        interest, months, payoff = reference_repayment(SAMPLE_BALANCES, SAMPLE_RATES, SAMPLE_MINIMUMS,
+                                                       orders[0], 60000)
+        self.assertAlmostEqual(result.total_interest[0, 0], interest, places=4)
+        self.assertEqual(result.months_to_freedom[0, 0], months)
+        self.assertEqual(list(result.payoff_month[0, 0]), payoff)
+        self.assertEqual(result.first_payoff_month[0, 0], result.payoff_month[0, 0, 0])
+
+        # More allocation pays less interest
+        self.assertTrue((result.total_interest[:, 1] < result.total_interest[:, 0]).all())
+
+    def test_history_totals(self):
+        result = simulate_repayment(SAMPLE_BALANCES, SAMPLE_RATES, SAMPLE_MINIMUMS, [[0, 2, 1]], [60000],
+                                    record_history=True)
+
+        months = result.months_to_freedom[0, 0]
+        self.assertEqual(result.history['remaining_balance'].shape, (months, 1, 1))
+        self.assertEqual(result.history['debts_remaining'][-1, 0, 0], 0)
+        self.assertAlmostEqual(result.history['interest_paid'][-1, 0, 0], result.total_interest[0, 0])
+
+    def test_matches_reference_loop_on_random_portfolios(self):
+        rng = random.Random(1)
+        for _ in range(100):
+            debt_count = rng.randint(1, 6)
+            balances = [rng.choice([0, rng.uniform(100, 2e6)]) for _ in range(debt_count)]
+            rates = [rng.uniform(0.01, 0.4) for _ in range(debt_count)]
+            minimums = [rng.choice([0, rng.uniform(50, 30000)]) for _ in range(debt_count)]
+            orders = [rng.sample(range(debt_count), debt_count) for _ in range(3)]
+            allocations = [rng.uniform(0, 120000) for _ in range(3)]
+
+            result = simulate_repayment(balances, rates, minimums, orders, allocations)
+            for strategy, order in enumerate(orders):
+                for column, allocation in enumerate(allocations):
+                    interest, months, payoff = reference_repayment(balances, rates, minimums, order, allocation)
+                    self.assertAlmostEqual(result.total_interest[strategy, column], interest,
+                                           delta=1e-6 * max(1, interest))
+                    self.assertEqual(result.months_to_freedom[strategy, column], months)
+                    self.assertEqual(list(result.payoff_month[strategy, column]), payoff)
+                    self.assertEqual(result.first_payoff_month[strategy, column],
+                                     min([month for month in payoff if month] or [360]))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,143 @@
+"""Tests for DebtRepaymentStrategy's use of the debt amortization kernel."""
+
+import importlib
+import logging
+import os
+import sys
+import types
+import unittest
+from unittest.mock import patch
+
+# Add the project root to the path if needed
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), "../.."))
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+# Load the strategy without the funding_strategies package __init__, which
+# imports every strategy: register a bare package for its relative imports
+package = types.ModuleType("_debt_strategy_package")
+package.__path__ = [os.path.join(project_root, "models", "funding_strategies")]
+sys.modules.setdefault("_debt_strategy_package", package)
+debt_repayment_strategy = importlib.import_module("_debt_strategy_package.debt_repayment_strategy")
+DebtRepaymentStrategy = debt_repayment_strategy.DebtRepaymentStrategy
+MAX_REPAYMENT_MONTHS = debt_repayment_strategy.MAX_REPAYMENT_MONTHS
+simulate_repayment = debt_repayment_strategy.simulate_repayment
+
+SAMPLE_DEBTS = [
+    {'name': 'Credit Card', 'type': 'credit_card', 'balance': 200000, 'interest_rate': 0.36,
+     'minimum_payment': 10000},
+    {'name': 'Home Loan', 'type': 'home_loan', 'balance': 2000000, 'interest_rate': 0.085,
+     'minimum_payment': 20000},
+    {'name': 'Personal Loan', 'type': 'personal_loan', 'balance': 500000, 'interest_rate': 0.15,
+     'minimum_payment': 15000},
+]
+
+
+class TestDebtRepaymentStrategy(unittest.TestCase):
+    """Test the strategy methods built on the amortization kernel."""
+
+    def setUp(self):
+        logging.disable(logging.CRITICAL)
+        self.strategy = DebtRepaymentStrategy()
+
+    def tearDown(self):
+        logging.disable(logging.NOTSET)
+
+    def test_calculate_interest_allocation_curve(self):
+        allocations = [45000, 60000, 90000]
+        curves = self.strategy.calculate_interest_allocation_curve(SAMPLE_DEBTS, allocations)
+
+        self.assertEqual(set(curves), {'avalanche', 'snowball', 'hybrid'})
+        avalanche = curves['avalanche']
+        self.assertEqual([point['monthly_allocation'] for point in avalanche], allocations)
+        self.assertTrue(all(point['sufficient_allocation'] for point in avalanche))
+        self.assertEqual(avalanche[1]['total_interest'],
+                         round(self.strategy._estimate_total_interest(SAMPLE_DEBTS, 60000, "avalanche")))
+        self.assertEqual(avalanche[1]['first_payoff_month'],
+                         self.strategy._estimate_first_payoff_time(SAMPLE_DEBTS, 60000, "avalanche"))
+
+        # More allocation pays less interest and finishes no later
+        self.assertLess(avalanche[2]['total_interest'], avalanche[1]['total_interest'])
+        self.assertLessEqual(avalanche[2]['months_to_debt_freedom'], avalanche[1]['months_to_debt_freedom'])
+
+        # Avalanche pays the least interest
+        self.assertLessEqual(avalanche[1]['total_interest'], curves['snowball'][1]['total_interest'])
+
+        self.assertEqual(self.strategy.calculate_interest_allocation_curve([], allocations),
+                         {'avalanche': [], 'snowball': [], 'hybrid': []})
+
+    def test_debt_payoff_timeline(self):
+        timeline = self.strategy.calculate_debt_payoff_timeline(SAMPLE_DEBTS, 60000)
+
+        # Debts are paid in list order, each month matching the kernel
+        result = simulate_repayment([200000, 2000000, 500000], [0.36, 0.085, 0.15], [10000, 20000, 15000],
+                                    [[0, 1, 2]], [60000])
+        self.assertEqual(timeline['debt_payoff_months'], [int(month) for month in result.payoff_month[0, 0]])
+        self.assertEqual(timeline['months_to_debt_freedom'], int(result.months_to_freedom[0, 0]))
+        self.assertEqual(timeline['total_interest_paid'], round(result.total_interest[0, 0]))
+
+        # Milestones line up with the payoff months
+        self.assertEqual(max(timeline['debt_payoff_months']), timeline['months_to_debt_freedom'])
+        self.assertEqual([milestone['month'] for milestone in timeline['debt_payoff_milestones']],
+                         sorted(set(timeline['debt_payoff_months'])))
+        self.assertEqual(timeline['debt_payoff_milestones'][-1]['remaining_debts'], 0)
+
+    def test_debt_payoff_timeline_with_unpaid_debts(self):
+        # Without extra payments, a minimum below the home loan's interest never pays it off
+        debts = [dict(debt) for debt in SAMPLE_DEBTS]
+        debts[1]['minimum_payment'] = 1000
+        timeline = self.strategy.calculate_debt_payoff_timeline(debts, 20000)
+
+        self.assertEqual(timeline['months_to_debt_freedom'], MAX_REPAYMENT_MONTHS)
+        self.assertIsNone(timeline['debt_payoff_months'][1])
+        self.assertIsNotNone(timeline['debt_payoff_months'][0])
+
+    def repayment_order(self, debts, monthly_allocation):
+        """optimize_repayment_order with the plan reduced to its repayment strategy."""
+        def repayment_plan(plan_debts, plan_allocation, method=None):
+            return {'repayment_strategy': self.strategy.recommend_repayment_strategy(
+                plan_debts, plan_allocation, method)}
+
+        goal_data = {'debts': debts, 'monthly_allocation': monthly_allocation, 'preferred_method': 'hybrid'}
+        with patch.object(self.strategy, 'create_debt_freedom_plan', side_effect=repayment_plan):
+            return self.strategy.optimize_repayment_order(goal_data)
+
+    def test_optimize_repayment_order_payoff_months(self):
+        repayment_order = self.repayment_order(SAMPLE_DEBTS, 60000)
+
+        payoff_order = repayment_order['optimized_payoff_order']
+        timeline = repayment_order['payoff_timeline']
+        self.assertEqual(len(payoff_order), len(SAMPLE_DEBTS))
+        self.assertEqual([debt['payoff_order'] for debt in payoff_order], [1, 2, 3])
+
+        # Each debt's estimate is its payoff month in the recommended order
+        self.assertEqual([debt['estimated_payoff_months'] for debt in payoff_order],
+                         timeline['debt_payoff_months'])
+        self.assertEqual(max(debt['estimated_payoff_months'] for debt in payoff_order),
+                         timeline['months_to_debt_freedom'])
+
+        home_loan = next(debt for debt in payoff_order if debt['type'] == 'home_loan')
+        self.assertIn("Section 24", home_loan['tax_considerations'][0])
+
+    def test_optimize_repayment_order_unpaid_debt(self):
+        # Minimums far below the home loan's interest: it is never paid off
+        debts = [dict(debt) for debt in SAMPLE_DEBTS[:2]]
+        debts[1].update(balance=20000000, minimum_payment=1000)
+        repayment_order = self.repayment_order(debts, 11000)
+
+        timeline = repayment_order['payoff_timeline']
+        self.assertEqual(timeline['months_to_debt_freedom'], MAX_REPAYMENT_MONTHS)
+        estimates = {debt['name']: debt['estimated_payoff_months']
+                     for debt in repayment_order['optimized_payoff_order']}
+        self.assertEqual(estimates['Home Loan'], MAX_REPAYMENT_MONTHS)
+        self.assertLess(estimates['Credit Card'], MAX_REPAYMENT_MONTHS)
+
+    def test_optimize_repayment_order_without_details(self):
+        result = self.strategy.optimize_repayment_order({'debts': SAMPLE_DEBTS, 'monthly_allocation': 0})
+
+        self.assertIn('message', result)
+        self.assertNotIn('optimized_payoff_order', result)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -5,6 +5,9 @@ Test suite for the Financial Parameters module
 
 import unittest
 import json
+import os
+import shutil
+import tempfile
 from datetime import datetime
 from models.financial_parameters import (
     get_parameters, ParameterSource, ParameterMetadata, ParameterValue,
@@ -73,6 +76,34 @@ class TestFinancialParameters(unittest.TestCase):
         self.assertIsNotNone(conservative)
         self.assertIn("equity", conservative)
         self.assertNotIn("sub_allocation", conservative)
+    
+    def test_set_many_is_transactional(self):
+        """Test that bulk updates are validated first and persisted together"""
+        temp_dir = tempfile.mkdtemp()
+        try:
+            db_path = os.path.join(temp_dir, "parameters.db")
+            params = FinancialParameters(db_path=db_path)
+            
+            results = params.set_many({"inflation.general": 0.07, "test.bulk.new": 5},
+                                      ParameterSource.USER_SPECIFIC)
+            self.assertEqual(results, {"inflation.general": True, "test.bulk.new": True})
+            
+            reloaded = FinancialParameters(db_path=db_path)
+            self.assertEqual(reloaded.get("inflation.general"), 0.07)
+            self.assertEqual(reloaded.get("test.bulk.new"), 5)
+            
+            # Lower priority sources are rejected per path
+            results = params.set_many({"inflation.general": 0.09, "test.bulk.other": 1},
+                                      ParameterSource.DEFAULT)
+            self.assertEqual(results, {"inflation.general": False, "test.bulk.other": True})
+            self.assertEqual(params.get("inflation.general"), 0.07)
+            
+            # A failed database write applies nothing
+            results = params.set_many({"test.bulk.good": 2, "test.bulk.bad": object()})
+            self.assertEqual(results, {"test.bulk.good": False, "test.bulk.bad": False})
+            self.assertIsNone(params.get("test.bulk.good"))
+        finally:
+            shutil.rmtree(temp_dir, ignore_errors=True)
 
 class TestParameterCompatibilityAdapter(unittest.TestCase):
     """Test cases for the compatibility adapter"""
@@ -0,0 +1,111 @@
+"""Tests for path-based first-passage (time-to-goal) analysis."""
+
+import os
+import sys
+import unittest
+
+import numpy as np
+
+# Add the project root to the path if needed
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), "../.."))
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+from models.monte_carlo.probability import FirstPassageAnalysis, GoalOutcomeDistribution
+from models.financial_projection import AssetProjection, ContributionPattern, AllocationStrategy
+from models.financial_projection import AssetClass
+
+
+class TestFirstPassageAnalysis(unittest.TestCase):
+    """Test hitting times against hand-computed paths."""
+
+    def setUp(self):
+        # Column j is year j; target 100
+        self.paths = np.array([
+            [50, 80, 100, 120],   # reaches at year 2
+            [50, 110, 90, 130],   # reaches at year 1 (first passage, not final)
+            [50, 60, 70, 80],     # never reaches
+            [50, 70, 95, 105],    # reaches at year 3
+        ], dtype=float)
+        self.analysis = FirstPassageAnalysis(self.paths, 100)
+
+    def test_hitting_times(self):
+        """Each path's first passage is the first column at or above the target."""
+        np.testing.assert_array_equal(self.analysis.hitting_times, [2, 1, np.inf, 3])
+
+    def test_cumulative_probability(self):
+        """P(reached by t) counts paths whose first passage is at or before t."""
+        np.testing.assert_allclose(self.analysis.cumulative_probability, [0, 0.25, 0.5, 0.75])
+        self.assertEqual(self.analysis.probability_by(2.5), 0.5)
+        self.assertEqual(self.analysis.probability_by(10), 0.75)
+        self.assertAlmostEqual(self.analysis.never_reached_probability, 0.25)
+
+    def test_time_percentiles(self):
+        """Percentile times are the earliest steps reaching each probability."""
+        self.assertEqual(self.analysis.median_time, 2.0)
+        self.assertEqual(self.analysis.time_to_probability(0.75), 3.0)
+        self.assertIsNone(self.analysis.time_to_probability(0.9))
+        self.assertAlmostEqual(self.analysis.mean_time_if_reached, 2.0)
+
+    def test_steps_per_year(self):
+        """Monthly columns are converted to years."""
+        analysis = FirstPassageAnalysis(self.paths, 100, steps_per_year=12)
+        self.assertAlmostEqual(analysis.median_time, 2 / 12)
+        self.assertAlmostEqual(analysis.horizon, 3 / 12)
+
+    def test_ragged_paths(self):
+        """List paths of unequal length are padded and never count as reached."""
+        analysis = FirstPassageAnalysis([[50, 120], [50, 60, 150]], 100)
+        np.testing.assert_array_equal(analysis.hitting_times, [1, 2])
+
+
+class TestDistributionTimeToGoal(unittest.TestCase):
+    """Test GoalOutcomeDistribution time metrics with attached paths."""
+
+    def setUp(self):
+        projection = AssetProjection()
+        allocation = AllocationStrategy(initial_allocation={AssetClass.EQUITY: 0.6, AssetClass.DEBT: 0.4})
+        contributions = ContributionPattern(annual_amount=120000)
+        self.result = projection.project_with_monte_carlo(
+            100000, contributions, 10, allocation, simulations=500, use_cache=False
+        )
+        self.target = 1000000
+        self.distribution = GoalOutcomeDistribution(self.result.all_projections[:, -1])
+        self.distribution.set_paths(self.result.all_projections)
+        self.kwargs = dict(
+            target_amount=self.target, monthly_contribution=10000, initial_amount=100000,
+            allocation_strategy={'equity': 0.6, 'debt': 0.4}, returns={}
+        )
+
+    def test_probability_at_timepoints_uses_paths(self):
+        """Probabilities within the horizon come from the simulated paths."""
+        paths = self.result.all_projections
+        probabilities = self.distribution.calculate_probability_at_timepoints(timepoints=[5, 10], **self.kwargs)
+        self.assertAlmostEqual(probabilities[10], float(np.mean((paths >= self.target).any(axis=1))))
+        self.assertAlmostEqual(probabilities[5], float(np.mean((paths[:, :6] >= self.target).any(axis=1))))
+
+    def test_time_to_goal_uses_paths(self):
+        """Time to a reachable probability is a simulated year."""
+        # Half of these yearly paths reach 100 by year 2, three quarters by year 3
+        paths = np.array([
+            [50, 80, 100, 120],
+            [50, 110, 90, 130],
+            [50, 60, 70, 80],
+            [50, 70, 95, 105],
+        ], dtype=float)
+        distribution = GoalOutcomeDistribution(paths[:, -1])
+        distribution.set_paths(paths)
+        kwargs = dict(self.kwargs, target_amount=100, initial_amount=50)
+
+        self.assertEqual(distribution.calculate_time_to_goal_probability(target_probability=0.5, **kwargs), 2.0)
+        self.assertEqual(distribution.calculate_time_to_goal_probability(target_probability=0.75, **kwargs), 3.0)
+
+    def test_critical_periods_default_to_attached_paths(self):
+        """Critical periods are found from the attached paths."""
+        periods = self.distribution.identify_critical_periods()
+        self.assertTrue(periods)
+        self.assertEqual(periods[-1]["end_time"], self.result.all_projections.shape[1] - 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
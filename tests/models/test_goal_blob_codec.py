@@ -0,0 +1,142 @@
+"""Tests for the compact binary encoding of goal simulation payloads."""
+
+import json
+import os
+import shutil
+import sqlite3
+import sys
+import tempfile
+import unittest
+
+import numpy as np
+
+# Add the project root to the path if needed
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), "../.."))
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+from models.goal_blob_codec import decode_payload, encode_payload, is_encoded
+from models.goal_models import Goal
+from migrations.scripts.compress_goal_simulation_blobs import compress_goal_blobs
+
+
+def make_payload():
+    return {
+        "success_probability": 0.72,
+        "success_metrics": {"success_probability": 0.72, "shortfall_risk": 0.28},
+        "distribution_data": {
+            "percentile_50": 1234567.89,
+            "histogram": {"bins": [i * 50000.0 for i in range(40)], "frequencies": list(range(40))},
+            "percentile_paths": [[1000.0 * (p + 1) * t for t in range(60)] for p in range(5)],
+            "labels": ["p10", "p25", "p50", "p75", "p90", "min", "max", "mean"],
+            "flags": [True, False] * 5,
+        },
+        "contribution_schedule": [0.1, 12345678.91] * 6,
+        "probability_factors": [],
+    }
+
+
+class TestGoalBlobCodec(unittest.TestCase):
+    """Test encoding, decoding and legacy JSON values."""
+
+    def test_round_trip(self):
+        payload = make_payload()
+        encoded = encode_payload(payload)
+        self.assertTrue(is_encoded(encoded))
+        self.assertLess(len(encoded), len(json.dumps(payload)))
+
+        decoded = decode_payload(encoded)
+        distribution = decoded["distribution_data"]
+        self.assertEqual(decoded["success_metrics"], payload["success_metrics"])
+        self.assertEqual(distribution["percentile_50"], 1234567.89)
+        self.assertEqual(distribution["histogram"]["frequencies"], list(range(40)))
+        self.assertEqual(distribution["labels"], payload["distribution_data"]["labels"])
+        self.assertEqual(distribution["flags"], payload["distribution_data"]["flags"])
+        np.testing.assert_allclose(distribution["percentile_paths"],
+                                   payload["distribution_data"]["percentile_paths"], rtol=1e-6)
+        # Only paths and bands are narrowed to float32
+        self.assertEqual(decoded["contribution_schedule"], payload["contribution_schedule"])
+
+    def test_path_payloads_use_float32(self):
+        paths = {"median": [0.1] * 24}
+        self.assertLess(len(encode_payload(paths, compress=False, paths=True)),
+                        len(encode_payload(paths, compress=False)))
+        decoded = decode_payload(encode_payload(paths, paths=True), as_arrays=True)
+        self.assertEqual(decoded["median"].dtype, np.float32)
+
+    def test_arrays_view_decoded_buffer(self):
+        paths = decode_payload(encode_payload(make_payload()), as_arrays=True)["distribution_data"]["percentile_paths"]
+        self.assertIsInstance(paths, np.ndarray)
+        self.assertEqual(paths.shape, (5, 60))
+        self.assertEqual(paths.dtype, np.float32)
+        self.assertFalse(paths.flags.writeable)
+
+    def test_legacy_and_empty_values(self):
+        self.assertEqual(decode_payload(json.dumps({"a": 1})), {"a": 1})
+        self.assertEqual(decode_payload(b'{"a": 1}'), {"a": 1})
+        self.assertEqual(decode_payload(None, default={}), {})
+        self.assertEqual(decode_payload("not json", default={}), {})
+        self.assertIsNone(encode_payload({}))
+
+    def test_goal_accessors(self):
+        """Goal stores simulation payloads encoded and serializes them as JSON text."""
+        goal = Goal(user_profile_id="profile-1", category="travel", title="Trip", target_amount=100000)
+        goal.set_simulation_data(make_payload())
+        goal.set_simulation_paths({"median": [float(i) for i in range(24)]})
+
+        self.assertTrue(is_encoded(goal.simulation_data))
+        self.assertEqual(goal.get_simulation_data()["success_probability"], 0.72)
+        self.assertEqual(goal.get_simulation_paths()["median"], [float(i) for i in range(24)])
+        self.assertEqual(json.loads(goal.to_dict()["simulation_data"])["success_probability"], 0.72)
+
+        goal.simulation_data = json.dumps({"success_probability": 0.5})
+        self.assertEqual(goal.get_simulation_data(), {"success_probability": 0.5})
+
+
+class TestCompressGoalBlobsMigration(unittest.TestCase):
+    """Test conversion of existing JSON rows."""
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.db_path = os.path.join(self.temp_dir, "goals.db")
+        conn = sqlite3.connect(self.db_path)
+        conn.execute("CREATE TABLE goals (id TEXT PRIMARY KEY, simulation_data TEXT, simulation_path_data TEXT)")
+        conn.execute("INSERT INTO goals VALUES ('g1', ?, ?)",
+                     (json.dumps(make_payload()), json.dumps({"median": list(range(30))})))
+        conn.execute("INSERT INTO goals VALUES ('g2', NULL, NULL)")
+        conn.commit()
+        conn.close()
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def _row(self):
+        conn = sqlite3.connect(self.db_path)
+        try:
+            return conn.execute("SELECT simulation_data, simulation_path_data FROM goals WHERE id = 'g1'").fetchone()
+        finally:
+            conn.close()
+
+    def test_convert_and_revert(self):
+        stats = compress_goal_blobs(self.db_path, dry_run=True)
+        self.assertEqual(stats["converted"], 1)
+        self.assertIsInstance(self._row()[0], str)
+
+        stats = compress_goal_blobs(self.db_path, backup_dir=os.path.join(self.temp_dir, "backups"))
+        backup = sqlite3.connect(stats["backup"])
+        try:
+            self.assertEqual(json.loads(backup.execute("SELECT simulation_data FROM goals WHERE id = 'g1'").fetchone()[0]),
+                             make_payload())
+        finally:
+            backup.close()
+        simulation_data, path_data = self._row()
+        self.assertTrue(is_encoded(simulation_data))
+        self.assertEqual(decode_payload(path_data), {"median": list(range(30))})
+        self.assertEqual(compress_goal_blobs(self.db_path)["converted"], 0)
+
+        compress_goal_blobs(self.db_path, revert=True)
+        self.assertEqual(json.loads(self._row()[0])["success_metrics"], make_payload()["success_metrics"])
+
+
+if __name__ == '__main__':
+    unittest.main()
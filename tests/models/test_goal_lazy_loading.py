@@ -0,0 +1,141 @@
+"""Tests for summary goal listings with lazily loaded blob fields."""
+
+import json
+import os
+import shutil
+import sqlite3
+import sys
+import tempfile
+import unittest
+
+# Add the project root to the path if needed
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), "../.."))
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+from models.database_profile_manager import DatabaseProfileManager
+from models.goal_models import Goal, GoalManager
+
+# Columns added to the goals table by the enhancement migrations
+ENHANCED_COLUMNS = [
+    ("current_progress", "REAL DEFAULT 0"), ("priority_score", "REAL DEFAULT 0"),
+    ("additional_funding_sources", "TEXT"), ("goal_success_probability", "REAL DEFAULT 0"),
+    ("adjustments_required", "BOOLEAN DEFAULT 0"), ("funding_strategy", "TEXT"),
+    ("simulation_data", "TEXT"), ("scenarios", "TEXT"), ("adjustments", "TEXT"),
+    ("last_simulation_time", "TEXT"), ("simulation_parameters_json", "TEXT"),
+    ("probability_partial_success", "REAL DEFAULT 0"), ("simulation_iterations", "INTEGER DEFAULT 1000"),
+    ("simulation_path_data", "TEXT"), ("monthly_sip_recommended", "REAL DEFAULT 0"),
+    ("probability_metrics", "TEXT"), ("success_threshold", "REAL DEFAULT 0.8"),
+]
+
+
+class TestGoalLazyLoading(unittest.TestCase):
+    """Test the summary projection, lazy blob fields and cached schema probe."""
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.db_path = os.path.join(self.temp_dir, "goals.db")
+        self.profile_id = DatabaseProfileManager(db_path=self.db_path).create_profile(
+            "Test User", "test@example.com")["id"]
+
+        conn = sqlite3.connect(self.db_path)
+        for name, definition in ENHANCED_COLUMNS:
+            conn.execute(f"ALTER TABLE goals ADD COLUMN {name} {definition}")
+        conn.commit()
+        conn.close()
+
+        self.manager = GoalManager(db_path=self.db_path)
+        self.goal_ids = []
+        for index in range(3):
+            goal = Goal(user_profile_id=self.profile_id, category="travel", title=f"Trip {index}",
+                        target_amount=100000 * (index + 1), timeframe="2030-01-01")
+            goal.set_simulation_data({"success_metrics": {"success_probability": 0.5 + index / 10}})
+            goal.set_scenarios({"baseline": index})
+            self.manager.create_goal(goal)
+            self._execute("UPDATE goals SET simulation_path_data = ?, probability_metrics = ? WHERE id = ?",
+                          json.dumps({"paths": [index] * 100}), json.dumps({"index": index}), goal.id)
+            self.goal_ids.append(goal.id)
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def _execute(self, sql, *params):
+        conn = sqlite3.connect(self.db_path)
+        try:
+            rows = conn.execute(sql, params).fetchall()
+            conn.commit()
+            return rows
+        finally:
+            conn.close()
+
+    def test_listing_defers_blob_fields(self):
+        """Listed goals carry no blobs until one is read; then all load at once."""
+        goals = self.manager.get_profile_goals(self.profile_id)
+        self.assertEqual(len(goals), 3)
+        goal = next(g for g in goals if g.id == self.goal_ids[1])
+        self.assertEqual(sorted(goal.unloaded_blob_fields()), sorted(Goal.BLOB_FIELDS))
+
+        summary = goal.to_dict(include_blobs=False)
+        self.assertEqual(summary["title"], "Trip 1")
+        self.assertNotIn("simulation_data", summary)
+        self.assertEqual(len(goal.unloaded_blob_fields()), len(Goal.BLOB_FIELDS))
+
+        self.assertEqual(goal.get_simulation_data()["success_metrics"]["success_probability"], 0.6)
+        self.assertEqual(goal.unloaded_blob_fields(), [])
+        self.assertEqual(goal.get_simulation_paths(), {"paths": [1] * 100})
+        self.assertEqual(goal.get_probability_metrics(), {"index": 1})
+
+    def test_batch_load_keeps_assigned_values(self):
+        """load_goal_blobs fills every goal without overwriting assigned fields."""
+        goals = self.manager.get_goals_by_priority(self.profile_id)
+        goals[0].scenarios = json.dumps({"edited": True})
+
+        self.manager.load_goal_blobs(goals)
+        for goal in goals:
+            self.assertEqual(goal.unloaded_blob_fields(), [])
+            self.assertTrue(goal.simulation_data)
+        self.assertEqual(goals[0].get_scenarios(), {"edited": True})
+        self.assertEqual(goals[1].to_dict()["scenarios"], goals[1].scenarios)
+
+    def test_update_of_listed_goal_preserves_blobs(self):
+        """Updating a goal from a listing writes back its stored blob values."""
+        goal = next(g for g in self.manager.get_all_goals() if g.id == self.goal_ids[2])
+        goal.title = "Renamed"
+        self.manager.update_goal(goal)
+
+        stored = self.manager.get_goal(self.goal_ids[2])
+        self.assertEqual(stored.title, "Renamed")
+        self.assertEqual(stored.get_scenarios(), {"baseline": 2})
+        self.assertEqual(stored.get_simulation_paths(), {"paths": [2] * 100})
+
+    def test_portfolio_analysis_leaves_blobs_unloaded(self):
+        """analyze_goal_portfolio works from the summary fields of a listing."""
+        from models.goal_probability import GoalProbabilityAnalyzer
+
+        goals = self.manager.get_profile_goals(self.profile_id)
+        profile = {"id": self.profile_id, "monthly_income": 100000, "monthly_expenses": 60000,
+                   "risk_profile": "moderate"}
+        portfolio = GoalProbabilityAnalyzer().analyze_goal_portfolio(goals, profile, simulations=200)
+
+        self.assertEqual(set(portfolio["results"]), set(self.goal_ids))
+        for goal in goals:
+            self.assertEqual(len(goal.unloaded_blob_fields()), len(Goal.BLOB_FIELDS))
+
+    def test_schema_probe_cached_and_index_created(self):
+        """The goals schema is probed once and the listing index exists."""
+        self.manager.get_goals_by_priority(self.profile_id)
+        columns = self.manager._goal_columns
+        self.assertIn("priority_score", columns)
+
+        self.manager.get_goals_by_priority(self.profile_id)
+        self.assertIs(self.manager._goal_columns, columns)
+        indexes = [row[0] for row in self._execute(
+            "SELECT name FROM sqlite_master WHERE type = 'index' AND tbl_name = 'goals'")]
+        self.assertIn("idx_goals_profile_priority", indexes)
+
+        self.manager.refresh_schema()
+        self.assertIsNone(self.manager._goal_columns)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,118 @@
+"""Tests for batched simulation of a profile's goals."""
+
+import os
+import sys
+import unittest
+
+import numpy as np
+
+# Add the project root to the path if needed
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), "../.."))
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+from models.monte_carlo.engine import simulate_wealth_paths
+from models.monte_carlo.portfolio import (
+    GoalPortfolioSimulation, draw_asset_return_tensor, simulate_goal_portfolio
+)
+from models.goal_probability import GoalProbabilityAnalyzer, ProbabilityResult
+
+
+class TestGoalPortfolioEngine(unittest.TestCase):
+    """Test the (goals, simulations, years) engine."""
+
+    def setUp(self):
+        self.asset_returns = [(0.12, 0.20), (0.07, 0.06)]
+        self.initial = [100000, 50000]
+        # Goal 0: 5 years, goal 1: 3 years (zero-padded)
+        self.contributions = np.array([[12000] * 5, [6000] * 3 + [0, 0]], dtype=float)
+        self.weights = np.zeros((2, 5, 2))
+        self.weights[0, :, :] = [0.6, 0.4]
+        self.weights[1, :3, :] = [0.2, 0.8]
+
+    def test_matches_single_goal_engine(self):
+        """Each goal's paths equal the single-goal engine on the shared shocks."""
+        shocks = draw_asset_return_tensor(self.asset_returns, 200, 5, np.random.default_rng(7))
+        paths = simulate_goal_portfolio(self.initial, self.contributions, self.weights,
+                                        self.asset_returns, 200, np.random.default_rng(7))
+        self.assertEqual(paths.shape, (2, 200, 6))
+
+        for goal in range(2):
+            returns = np.einsum('sya,ya->sy', shocks, self.weights[goal])
+            expected = simulate_wealth_paths(self.initial[goal], returns, self.contributions[goal], floor=None)
+            np.testing.assert_allclose(paths[goal], expected, rtol=1e-10)
+
+    def test_value_constant_after_horizon(self):
+        """Padded years leave a shorter goal's value unchanged."""
+        paths = simulate_goal_portfolio(self.initial, self.contributions, self.weights,
+                                        self.asset_returns, 100, np.random.default_rng(1))
+        np.testing.assert_array_equal(paths[1, :, 3], paths[1, :, 5])
+
+    def test_joint_metrics(self):
+        """Joint probabilities combine goals within the same scenario."""
+        paths = np.zeros((2, 4, 3))
+        paths[0, :, 2] = [10, 10, 0, 0]    # goal a met in scenarios 0, 1
+        paths[1, :, 1] = [10, 0, 10, 0]    # goal b met in scenarios 0, 2
+        portfolio = GoalPortfolioSimulation(['a', 'b'], paths, horizons=[2, 1], target_amounts=[5, 5])
+
+        self.assertEqual(portfolio.success_probability('a'), 0.5)
+        self.assertEqual(portfolio.joint_success_probability(), 0.25)
+        self.assertEqual(portfolio.joint_success_probability(['b']), 0.5)
+
+        metrics = portfolio.joint_metrics(['a'])
+        self.assertEqual(metrics["all_high_priority_goals_probability"], 0.5)
+        self.assertEqual(metrics["expected_goals_met"], 1.0)
+        self.assertEqual(metrics["no_goals_met_probability"], 0.25)
+
+
+class TestAnalyzeGoalPortfolio(unittest.TestCase):
+    """Test GoalProbabilityAnalyzer.analyze_goal_portfolio."""
+
+    def setUp(self):
+        self.analyzer = GoalProbabilityAnalyzer()
+        self.profile = {
+            "id": "test-profile-abc",
+            "annual_income": 1200000,
+            "monthly_income": 100000,
+            "monthly_expenses": 60000,
+            "risk_profile": "moderate"
+        }
+        self.goals = [
+            {"id": "goal-home", "category": "home_purchase", "importance": "high",
+             "target_amount": 3000000, "current_amount": 500000, "timeframe": "2035-01-01"},
+            {"id": "goal-travel", "category": "travel", "importance": "low",
+             "target_amount": 300000, "current_amount": 50000, "timeframe": "2029-01-01"},
+            {"id": "goal-done", "category": "custom", "importance": "high",
+             "target_amount": 100000, "current_amount": 200000, "timeframe": "2030-01-01"},
+        ]
+
+    def test_results_for_every_goal(self):
+        """Every goal gets a ProbabilityResult with probabilities in 0-1."""
+        portfolio = self.analyzer.analyze_goal_portfolio(self.goals, self.profile, simulations=500)
+        results = portfolio["results"]
+
+        self.assertEqual(set(results), {"goal-home", "goal-travel", "goal-done"})
+        for result in results.values():
+            self.assertIsInstance(result, ProbabilityResult)
+            self.assertTrue(0.0 <= result.success_probability <= 1.0)
+        self.assertEqual(results["goal-done"].success_probability, 1.0)
+
+    def test_joint_metrics_bounded_by_goal_probabilities(self):
+        """P(all high-priority goals met) cannot exceed any one of them."""
+        portfolio = self.analyzer.analyze_goal_portfolio(self.goals, self.profile, simulations=500)
+        joint = portfolio["joint_metrics"]
+
+        self.assertEqual(joint["high_priority_goal_ids"], ["goal-home", "goal-done"])
+        self.assertLessEqual(joint["all_high_priority_goals_probability"],
+                             portfolio["results"]["goal-home"].success_probability)
+        self.assertLessEqual(joint["all_goals_probability"], joint["all_high_priority_goals_probability"])
+
+    def test_deterministic(self):
+        """The shared return stream is keyed on the goals, so reruns agree."""
+        first = self.analyzer.analyze_goal_portfolio(self.goals, self.profile, simulations=500)
+        second = GoalProbabilityAnalyzer().analyze_goal_portfolio(self.goals, self.profile, simulations=500)
+        self.assertEqual(first["joint_metrics"], second["joint_metrics"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,126 @@
+"""Tests for the array-backed GoalOutcomeDistribution and its quantile sketch mode."""
+
+import os
+import statistics
+import sys
+import unittest
+
+import numpy as np
+
+# Add the project root to the path if needed
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), "../.."))
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+from models.monte_carlo.probability import GoalOutcomeDistribution, QuantileSketch
+from models.monte_carlo.probability.distribution import INITIAL_CAPACITY
+
+
+class TestGoalOutcomeDistribution(unittest.TestCase):
+    """Test exact statistics on the float64 buffer."""
+
+    def setUp(self):
+        rng = np.random.default_rng(42)
+        self.values = rng.normal(12000000, 3000000, 1001).tolist()
+        self.target = 11000000
+
+    def test_statistics_match_list_definitions(self):
+        """Statistics equal the original sorted-list definitions."""
+        dist = GoalOutcomeDistribution(self.values)
+        ordered = sorted(self.values)
+        n = len(ordered)
+
+        self.assertAlmostEqual(dist.mean, statistics.mean(self.values), places=4)
+        self.assertAlmostEqual(dist.median, statistics.median(self.values), places=4)
+        self.assertAlmostEqual(dist.std_dev, statistics.stdev(self.values), places=4)
+        for p in (0.05, 0.1, 0.25, 0.5, 0.75, 0.9):
+            self.assertEqual(dist.percentile(p), ordered[int(p * n)])
+
+        var = ordered[int(0.05 * n)]
+        self.assertEqual(dist.value_at_risk(0.95), var)
+        self.assertAlmostEqual(dist.conditional_value_at_risk(0.95),
+                               statistics.mean([v for v in self.values if v <= var]), places=4)
+        self.assertAlmostEqual(dist.shortfall_risk(self.target, 0.8),
+                               sum(1 for v in self.values if v < self.target * 0.8) / n)
+        self.assertAlmostEqual(dist.upside_probability(self.target, 1.2),
+                               sum(1 for v in self.values if v >= self.target * 1.2) / n)
+
+        exact = sum(1 for v in self.values if v >= self.target)
+        partial = sum((v / self.target - 0.9) * 10 for v in self.values
+                      if v < self.target and v / self.target > 0.9)
+        self.assertAlmostEqual(dist.success_probability(self.target), (exact + partial) / n)
+
+    def test_incremental_adds_grow_the_buffer(self):
+        """Single and batch adds grow the buffer and refresh cached statistics."""
+        dist = GoalOutcomeDistribution()
+        self.assertEqual(dist.mean, 0)
+        for value in self.values[:10]:
+            dist.add_simulation_result(value)
+        self.assertAlmostEqual(dist.mean, statistics.mean(self.values[:10]), places=4)
+
+        extra = np.arange(INITIAL_CAPACITY * 3, dtype=float)
+        dist.add_simulation_results(extra)
+        self.assertEqual(dist.count, 10 + len(extra))
+        np.testing.assert_array_equal(dist.simulation_values[10:], extra)
+        self.assertAlmostEqual(dist.mean, float(np.mean(self.values[:10] + extra.tolist())), places=6)
+
+    def test_merge_and_key_statistics(self):
+        """Merging two halves matches one distribution over all values."""
+        whole = GoalOutcomeDistribution(np.asarray(self.values))
+        merged = GoalOutcomeDistribution(self.values[:400]).merge(GoalOutcomeDistribution(self.values[400:]))
+
+        expected = whole.calculate_key_statistics(self.target)
+        actual = merged.calculate_key_statistics(self.target)
+        for key, value in expected.items():
+            self.assertAlmostEqual(actual[key], value, places=4, msg=key)
+            self.assertIsInstance(actual[key], float, msg=key)
+        self.assertEqual(merged.calculate_histogram(8), whole.calculate_histogram(8))
+
+
+class TestQuantileSketch(unittest.TestCase):
+    """Test the bounded-memory sketch mode."""
+
+    def setUp(self):
+        self.values = np.random.default_rng(7).lognormal(16, 0.5, 100000)
+
+    def assertRankClose(self, estimate, p, tolerance=0.03):
+        rank = np.searchsorted(np.sort(self.values), estimate) / len(self.values)
+        self.assertLess(abs(rank - p), tolerance, msg=f"p={p}")
+
+    def test_sketch_memory_is_bounded_and_accurate(self):
+        """Sketch mode keeps few samples, exact moments and close quantiles."""
+        dist = GoalOutcomeDistribution(sketch_size=200)
+        for chunk in np.array_split(self.values, 25):
+            dist.add_simulation_results(chunk)
+
+        self.assertEqual(dist.count, len(self.values))
+        self.assertLess(dist.sketch.retained, 1000)
+        self.assertAlmostEqual(dist.mean, float(np.mean(self.values)), delta=1e-6 * dist.mean)
+        self.assertAlmostEqual(dist.std_dev, float(np.std(self.values, ddof=1)), delta=1e-6 * dist.std_dev)
+        for p in (0.05, 0.25, 0.5, 0.75, 0.95):
+            self.assertRankClose(dist.percentile(p), p)
+
+        target = float(np.median(self.values))
+        self.assertAlmostEqual(dist.shortfall_risk(target, 1.0), 0.5, delta=0.03)
+        # Bin counts are rescaled from sample weights and rounded per bin
+        self.assertAlmostEqual(sum(dist.calculate_histogram(10)["bin_counts"]), len(self.values), delta=10)
+
+    def test_merged_sketches_summarize_all_values(self):
+        """Sketches built separately merge into a summary of the union."""
+        parts = np.array_split(self.values, 4)
+        merged = QuantileSketch(200, seed=1)
+        for index, part in enumerate(parts):
+            sketch = QuantileSketch(200, seed=index)
+            sketch.update(part)
+            merged.merge(sketch)
+
+        self.assertEqual(merged.count, len(self.values))
+        self.assertEqual(merged.min, float(self.values.min()))
+        self.assertEqual(merged.max, float(self.values.max()))
+        self.assertAlmostEqual(merged.mean, float(np.mean(self.values)), delta=1e-6 * merged.mean)
+        for p in (0.1, 0.5, 0.9):
+            self.assertRankClose(merged.quantile(p), p)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,151 @@
+"""Tests for the parameter audit ring buffer and its SQLite store."""
+
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+from datetime import datetime, timedelta
+
+# Add the project root to the path if needed
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), "../.."))
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+from models.parameter_audit import AuditRingBuffer, ParameterAuditStore, configure_audit_store
+from services.financial_parameter_service import get_financial_parameter_service
+
+
+def make_entry(index, action="change", parameter="inflation.general"):
+    return {
+        "timestamp": f"2026-01-01T00:{index // 60:02d}:{index % 60:02d}",
+        "action": action,
+        "parameter": parameter,
+        "old_value": str(index - 1),
+        "new_value": str(index),
+        "description": f"Update {index}",
+        "source": "test",
+    }
+
+
+class TestAuditRingBuffer(unittest.TestCase):
+    """Test the in-memory audit log."""
+
+    def test_drops_oldest_entries(self):
+        buffer = AuditRingBuffer(size=3)
+        for index in range(5):
+            buffer.append(make_entry(index))
+
+        self.assertEqual(len(buffer), 3)
+        entries, matched = buffer.query(limit=2)
+        self.assertEqual(matched, 3)
+        self.assertEqual([entry["new_value"] for entry in entries], ["4", "3"])
+        self.assertEqual(buffer.query(limit=2, offset=2)[0][0]["new_value"], "2")
+
+
+class TestParameterAuditStore(unittest.TestCase):
+    """Test batched persistence and indexed queries."""
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        # Fixed timestamps in make_entry, so no age limit
+        self.store = ParameterAuditStore(os.path.join(self.temp_dir, "audit.db"), batch_size=10,
+                                         flush_interval=0.05, max_age_days=None)
+
+    def tearDown(self):
+        self.store.close()
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_batched_writes_and_queries(self):
+        for index in range(25):
+            self.store.submit(make_entry(index, parameter=f"asset_returns.equity.{index % 2}"))
+        self.store.submit(make_entry(30, action="access", parameter="inflation.general"))
+
+        self.assertTrue(self.store.flush(timeout=5))
+        self.assertEqual(self.store.written, 26)
+        self.assertEqual(self.store.count(), 26)
+
+        entries, matched = self.store.query(parameter_path="asset_returns.equity.1", limit=5, offset=2)
+        self.assertEqual(matched, 12)
+        self.assertEqual([entry["new_value"] for entry in entries], ["19", "17", "15", "13", "11"])
+
+        self.assertEqual(self.store.query(path_contains="equity")[1], 25)
+        self.assertEqual(self.store.query(action="access")[0][0]["parameter"], "inflation.general")
+        self.assertEqual(self.store.query(start_date="2026-01-01T00:00:20",
+                                          end_date="2026-01-01T00:00:22")[1], 3)
+        self.assertEqual(self.store.query(search="UPDATE 2")[1], 6)
+
+    def test_prune_by_row_count_and_age(self):
+        store = ParameterAuditStore(os.path.join(self.temp_dir, "pruned.db"), max_rows=5, max_age_days=30)
+        old = (datetime.now() - timedelta(days=31)).isoformat()
+        store.write_batch([dict(make_entry(index), timestamp=old) for index in range(3)])
+        store.write_batch([dict(make_entry(index), timestamp=datetime.now().isoformat())
+                           for index in range(3, 11)])
+
+        self.assertEqual(store.prune(), 6)
+        self.assertEqual([entry["new_value"] for entry in store.query()[0]], ["10", "9", "8", "7", "6"])
+        store.close()
+
+    def test_writer_prunes_after_writing(self):
+        store = ParameterAuditStore(os.path.join(self.temp_dir, "pruned.db"), flush_interval=0.05,
+                                    max_rows=3, max_age_days=None, prune_interval=0)
+        for index in range(10):
+            store.submit(make_entry(index))
+
+        self.assertEqual(store.count(), 3)
+        self.assertEqual(store.pruned, 7)
+        store.close()
+
+    def test_shared_between_store_instances(self):
+        self.store.submit(make_entry(1))
+        other = ParameterAuditStore(self.store.db_path, max_age_days=None)
+        # Reading through the writing store flushes its queue first
+        self.assertEqual(self.store.count(), 1)
+        self.assertEqual(other.query()[0][0]["new_value"], "1")
+        other.close()
+
+
+class TestServiceAuditLog(unittest.TestCase):
+    """Test that the service answers audit and history queries from the store."""
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.store = configure_audit_store(os.path.join(self.temp_dir, "audit.db"), flush_interval=0.05)
+        self.service = get_financial_parameter_service()
+
+    def tearDown(self):
+        configure_audit_store(None)
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_history_from_store(self):
+        for value in (1, 2, 3):
+            self.service._log_parameter_change("test.audit.parameter", value - 1, value, "Audit test", "test")
+
+        history = self.service.get_parameter_history("test.audit.parameter", limit=2)
+        self.assertEqual(history["matched"], 3)
+        self.assertEqual([entry["value"] for entry in history["entries"]], ["3", "2"])
+
+        page = self.service.query_audit_log(path_contains="test.audit", action="change", offset=2)
+        self.assertEqual(page["entries"][0]["new_value"], "1")
+        self.assertEqual(page["total"], self.store.count())
+        self.assertEqual(self.service.get_audit_log(parameter_path="test.audit.parameter")[-1]["new_value"], "3")
+
+    def test_access_entries_stay_in_memory(self):
+        self.service._log_parameter_access("test.audit.read", "fresh")
+        self.service._log_parameter_change("test.audit.read", 1, 2, "Audit test", "test")
+
+        self.assertEqual(self.store.query(path_contains="test.audit.read")[1], 1)
+        page = self.service.query_audit_log(parameter_path="test.audit.read", action="access")
+        self.assertEqual(page["entries"][0]["access_type"], "fresh")
+
+    def test_bulk_update_logs_one_batch(self):
+        results = self.service.set_many({"test.audit.bulk.one": 1, "test.audit.bulk.two": 2}, source="test")
+        self.assertEqual(results, {"test.audit.bulk.one": True, "test.audit.bulk.two": True})
+
+        page = self.service.query_audit_log(path_contains="test.audit.bulk", action="change")
+        self.assertEqual(page["matched"], 2)
+        self.assertEqual(len({entry["timestamp"] for entry in page["entries"]}), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
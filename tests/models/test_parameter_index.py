@@ -0,0 +1,84 @@
+"""Tests for the path trie behind FinancialParameters lookups."""
+
+import os
+import pickle
+import sys
+import unittest
+
+# Add the project root to the path if needed
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), "../.."))
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+from models.financial_parameters import FinancialParameters
+from models.parameter_index import IndexedParameters, ParameterIndex
+
+
+class TestParameterIndex(unittest.TestCase):
+    """Test exact, prefix and subtree queries."""
+
+    def setUp(self):
+        self.index = ParameterIndex(["a.y.z", "a.x", "a", "b.c", "a.y.w"])
+
+    def test_exact_and_prefix_queries(self):
+        self.assertIn("a.x", self.index)
+        self.assertIn("a", self.index)
+        self.assertNotIn("a.y", self.index)
+        self.assertEqual(len(self.index), 5)
+
+        # The first path added below a prefix, as a scan of the flat dict would find it
+        self.assertEqual(self.index.first("a"), "a.y.z")
+        self.assertEqual(self.index.first("a."), "a.y.z")
+        self.assertEqual(self.index.first("a.y"), "a.y.z")
+        self.assertIsNone(self.index.first("a.x"))
+        self.assertIsNone(self.index.first(""))
+
+    def test_subtree(self):
+        self.assertEqual(self.index.subtree("a"), ["a.y.z", "a.x", "a.y.w"])
+        self.assertEqual(self.index.subtree("a", include_prefix=True), ["a.y.z", "a.x", "a", "a.y.w"])
+        self.assertEqual(self.index.subtree("missing"), [])
+        self.assertEqual(self.index.children(), ["a", "b"])
+
+    def test_discard_updates_first(self):
+        self.index.discard("a.y.z")
+        self.assertEqual(self.index.first("a"), "a.x")
+        self.assertEqual(self.index.first("a.y"), "a.y.w")
+
+        self.index.discard("a.y.w")
+        self.assertEqual(self.index.children("a"), ["x"])
+        self.assertEqual(len(self.index), 3)
+
+
+class TestIndexedParameters(unittest.TestCase):
+    """Test that the store keeps its index in step."""
+
+    def test_mutations_update_index(self):
+        store = IndexedParameters({"a.b": 1})
+        store["a.c"] = 2
+        store.update({"d.e": 3})
+        store.setdefault("d.f", 4)
+        del store["a.b"]
+        self.assertEqual(store.pop("missing", None), None)
+        self.assertEqual(store.index.subtree("a"), ["a.c"])
+
+        copied = pickle.loads(pickle.dumps(store))
+        self.assertEqual(copied.index.subtree("d"), ["d.e", "d.f"])
+
+        store.clear()
+        self.assertEqual(len(store.index), 0)
+
+    def test_financial_parameters_lookups(self):
+        params = FinancialParameters()
+        self.assertEqual(len(params.parameters.index), len(params.parameters))
+
+        first_equity = params.parameters.index.first("asset_returns.equity")
+        self.assertTrue(first_equity.startswith("asset_returns.equity."))
+        self.assertEqual(params.get("missing.parameter.path", "default"), "default")
+
+        inflation = params.get_parameters_under("inflation")
+        self.assertIn("inflation.general", inflation)
+        self.assertTrue(all(path.startswith("inflation.") for path in inflation))
+
+
+if __name__ == '__main__':
+    unittest.main()
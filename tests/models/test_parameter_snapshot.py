@@ -0,0 +1,90 @@
+"""Tests for immutable parameter snapshots and copy-on-write overlays."""
+
+import os
+import sys
+import unittest
+
+# Add the project root to the path if needed
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), "../.."))
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+from models.parameter_snapshot import ParameterOverlay, ParameterSnapshot, current_snapshot
+from services.financial_parameter_service import get_financial_parameter_service
+
+
+class TestParameterSnapshot(unittest.TestCase):
+    """Test snapshot versions, digests and overlays."""
+
+    def test_with_updates_leaves_snapshot_unchanged(self):
+        snapshot = ParameterSnapshot({"a": 1, "b": 2})
+        updated = snapshot.with_updates({"a": 5}, removals=["b"])
+
+        self.assertEqual(dict(snapshot), {"a": 1, "b": 2})
+        self.assertEqual(dict(updated), {"a": 5})
+        self.assertEqual(updated.version, snapshot.version + 1)
+        self.assertNotEqual(updated.digest, snapshot.digest)
+        with self.assertRaises(TypeError):
+            snapshot._values["a"] = 3
+
+    def test_cache_token_depends_on_content(self):
+        first = ParameterSnapshot({"a": 1, "b": 2})
+        second = ParameterSnapshot({"b": 2, "a": 1}, version=7)
+        self.assertEqual(first.cache_token(), second.cache_token())
+
+        overlay = ParameterOverlay().with_value("a", 3)
+        self.assertNotEqual(first.cache_token(overlay), first.cache_token())
+        self.assertEqual(first.cache_token(overlay.without("a")), first.cache_token())
+
+    def test_memoized_lookups_are_per_version(self):
+        snapshot = ParameterSnapshot({"a": 1})
+        calls = []
+        resolver = lambda path: calls.append(path) or 10
+
+        self.assertEqual(snapshot.resolve("x", resolver), (10, False))
+        self.assertEqual(snapshot.resolve("x", resolver), (10, True))
+        self.assertEqual(calls, ["x"])
+
+        updated = snapshot.with_updates({"a": 2})
+        self.assertEqual(updated.resolve("a", resolver), (2, True))
+        self.assertEqual(updated.resolve("x", resolver), (10, False))
+
+
+class TestServiceSnapshots(unittest.TestCase):
+    """Test that the service publishes snapshots on writes."""
+
+    def setUp(self):
+        self.service = get_financial_parameter_service()
+
+    def tearDown(self):
+        self.service.reset_all_user_parameters("snapshot-profile")
+
+    def test_set_many_publishes_one_version(self):
+        before = self.service.snapshot
+        results = self.service.set_many({"test.snapshot.one": 1.5, "test.snapshot.two": 2.5}, source="test")
+
+        self.assertEqual(results, {"test.snapshot.one": True, "test.snapshot.two": True})
+        self.assertEqual(self.service.snapshot.version, before.version + 1)
+        self.assertIs(current_snapshot(), self.service.snapshot)
+        self.assertNotIn("test.snapshot.one", before)
+        self.assertEqual(self.service.get("test.snapshot.two"), 2.5)
+        self.assertEqual(self.service.get_parameters_under("test.snapshot"),
+                         {"test.snapshot.one": 1.5, "test.snapshot.two": 2.5})
+
+    def test_user_override_copies_overlay_only(self):
+        self.service.set("inflation.education", 0.1, profile_id="snapshot-profile")
+        snapshot = self.service.snapshot
+        token = self.service.cache_token("snapshot-profile")
+        overlay = self.service.get_user_overlay("snapshot-profile")
+
+        self.service.set("inflation.general", 0.09, profile_id="snapshot-profile")
+
+        self.assertIs(self.service.snapshot, snapshot)
+        self.assertNotIn("inflation.general", overlay)
+        self.assertEqual(self.service.get("inflation.general", profile_id="snapshot-profile"), 0.09)
+        self.assertNotEqual(self.service.cache_token("snapshot-profile"), token)
+        self.assertEqual(self.service.cache_token(), snapshot.cache_token())
+
+
+if __name__ == '__main__':
+    unittest.main()
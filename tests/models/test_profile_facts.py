@@ -0,0 +1,131 @@
+"""Tests for the compiled profile facts index."""
+
+import os
+import sys
+import unittest
+
+# Add the project root to the path if needed
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), "../.."))
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+from models.profile_facts import (
+    ProfileFacts, clear_profile_facts_cache, get_profile_facts, get_profile_facts_stats,
+    parse_currency_amount
+)
+from models.gap_analysis.analyzer import GapAnalysis
+
+
+def make_profile(**answers):
+    return {
+        "id": "profile-1",
+        "updated_at": "2024-01-01T00:00:00",
+        "answers": [{"question_id": qid, "answer": value} for qid, value in answers.items()]
+    }
+
+
+class TestParseCurrencyAmount(unittest.TestCase):
+    """Test the shared Indian currency parser."""
+
+    def test_formats(self):
+        cases = {
+            "₹1,50,000": 150000.0,
+            "1.5L": 150000.0,
+            "1.5 lakh": 150000.0,
+            "2 Cr": 20000000.0,
+            "1.5 Crore": 15000000.0,
+            "500k": 500000.0,
+            "₹1.5Cr and 50L": 15000000.0,
+            75000: 75000.0,
+        }
+        for value, expected in cases.items():
+            self.assertEqual(parse_currency_amount(value), expected, value)
+
+    def test_invalid_values(self):
+        for value in [None, "", "abc", "₹1000abc", True, [1]]:
+            self.assertIsNone(parse_currency_amount(value), value)
+
+
+class TestProfileFacts(unittest.TestCase):
+    """Test answer indexing and derived fields."""
+
+    def test_derived_fields(self):
+        facts = ProfileFacts.from_profile(make_profile(
+            financial_basics_annual_income="₹12,00,000",
+            financial_basics_monthly_expenses="60,000",
+            financial_basics_current_savings="5L",
+            demographics_age="34",
+            demographics_risk_appetite="Aggressive (high risk)",
+            tax_bracket="30%"
+        ))
+        self.assertEqual(facts.monthly_income, 100000.0)
+        self.assertEqual(facts.annual_income, 1200000.0)
+        self.assertEqual(facts.monthly_expenses, 60000.0)
+        self.assertEqual(facts.current_savings, 500000.0)
+        self.assertEqual(facts.age, 34)
+        self.assertEqual(facts.risk_profile, "aggressive")
+        self.assertAlmostEqual(facts.tax_bracket, 0.30)
+
+    def test_lookup_and_first_answer_wins(self):
+        profile = make_profile(monthly_income="80000")
+        profile["answers"].append({"question_id": "monthly_income", "answer": "1"})
+        facts = ProfileFacts.from_profile(profile)
+        self.assertIn("monthly_income", facts)
+        self.assertEqual(facts.get("monthly_income"), "80000")
+        self.assertEqual(facts.amount("monthly_income"), 80000.0)
+        self.assertIsNone(facts.amount("missing"))
+        self.assertEqual(len(facts), 1)
+
+    def test_structured_annual_answer(self):
+        facts = ProfileFacts.from_profile(make_profile(
+            monthly_income={"amount": 1200000, "frequency": "annual"}))
+        self.assertEqual(facts.monthly_income, 100000.0)
+
+    def test_find_and_derive_are_memoized(self):
+        facts = ProfileFacts.from_profile(make_profile(expense_rent=20000, expense_food=8000, age=40))
+        self.assertEqual([qid for qid, _ in facts.find("expense")], ["expense_rent", "expense_food"])
+        self.assertIs(facts.find("expense"), facts.find("expense"))
+
+        calls = []
+        facts.derive("total", lambda f: calls.append(1) or 28000)
+        self.assertEqual(facts.derive("total", lambda f: calls.append(1) or 0), 28000)
+        self.assertEqual(len(calls), 1)
+
+
+class TestProfileFactsCache(unittest.TestCase):
+    """Test per-version caching of profile facts."""
+
+    def setUp(self):
+        clear_profile_facts_cache()
+
+    def test_same_version_shares_facts(self):
+        profile = make_profile(monthly_income=50000)
+        facts = get_profile_facts(profile)
+        self.assertIs(get_profile_facts(profile), facts)
+        self.assertIs(get_profile_facts(facts), facts)
+        self.assertEqual(get_profile_facts_stats()["hits"], 1)
+
+    def test_new_version_rebuilds(self):
+        profile = make_profile(monthly_income=50000)
+        first = get_profile_facts(profile)
+
+        profile["answers"].append({"question_id": "age", "answer": 30})
+        self.assertEqual(get_profile_facts(profile).age, 30)
+
+        profile["answers"] = [{"question_id": "monthly_income", "answer": 90000}]
+        profile["updated_at"] = "2024-02-01T00:00:00"
+        facts = get_profile_facts(profile)
+        self.assertIsNot(facts, first)
+        self.assertEqual(facts.monthly_income, 90000.0)
+
+    def test_consumers_share_parsed_answers(self):
+        """Gap analysis reads the indexed income, including currency strings."""
+        profile = make_profile(monthly_income="₹1.2L", monthly_expenses="₹45,000")
+        analyzer = GapAnalysis()
+        self.assertEqual(analyzer._extract_monthly_income(profile), 120000.0)
+        self.assertEqual(analyzer._extract_monthly_expenses(profile), 45000.0)
+        self.assertEqual(get_profile_facts_stats()["misses"], 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
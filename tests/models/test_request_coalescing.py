@@ -0,0 +1,137 @@
+"""Tests for single-flight coalescing of identical probability calculations."""
+
+import os
+import sys
+import threading
+import time
+import unittest
+from unittest.mock import patch
+
+# Add the project root to the path if needed
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), "../.."))
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+from models.financial_projection import AllocationStrategy, AssetClass, ContributionPattern
+from models.goal_probability import GoalProbabilityAnalyzer
+from models.monte_carlo.coalesce import RequestCoalescer
+
+
+def run_concurrently(count, target):
+    """Start count threads running target at once and return their results."""
+    barrier = threading.Barrier(count)
+    results = []
+
+    def worker():
+        barrier.wait()
+        results.append(target())
+
+    threads = [threading.Thread(target=worker) for _ in range(count)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return results
+
+
+class TestRequestCoalescer(unittest.TestCase):
+    """Test sharing of in-flight calculations."""
+
+    def test_concurrent_calls_share_one_execution(self):
+        """Concurrent callers with one key get the leader's result."""
+        coalescer = RequestCoalescer()
+        calls = []
+
+        def compute():
+            calls.append(1)
+            time.sleep(0.2)
+            return object()
+
+        results = run_concurrently(5, lambda: coalescer.run("key", compute))
+
+        self.assertEqual(len(calls), 1)
+        self.assertTrue(all(result is results[0] for result in results))
+        stats = coalescer.get_stats()
+        self.assertEqual(stats["executions"], 1)
+        self.assertEqual(stats["coalesced"], 4)
+        self.assertEqual(stats["in_flight"], 0)
+
+        # Later calls run again
+        coalescer.run("key", compute)
+        self.assertEqual(len(calls), 2)
+
+    def test_exceptions_reach_waiting_callers(self):
+        """A failing calculation raises in every coalesced caller."""
+        coalescer = RequestCoalescer()
+
+        def compute():
+            time.sleep(0.2)
+            raise ValueError("boom")
+
+        def call():
+            try:
+                coalescer.run("key", compute)
+            except ValueError as e:
+                return str(e)
+
+        self.assertEqual(run_concurrently(3, call), ["boom"] * 3)
+        self.assertEqual(coalescer.get_stats()["failures"], 1)
+
+    def _slow_simulation(self, calls):
+        """Return a function running one slow, uncached GoalProbabilityAnalyzer simulation."""
+        analyzer = GoalProbabilityAnalyzer()
+        original = analyzer.projection_engine.project_with_monte_carlo
+
+        def slow_projection(**kwargs):
+            calls.append(1)
+            time.sleep(0.2)
+            return original(**kwargs)
+
+        analyzer.projection_engine.project_with_monte_carlo = slow_projection
+        allocation = AllocationStrategy(initial_allocation={AssetClass.EQUITY: 0.7, AssetClass.DEBT: 0.3})
+
+        def simulate():
+            return analyzer._run_monte_carlo(
+                123456.0, ContributionPattern(annual_amount=24000), 7, allocation,
+                simulations=500, use_cache=False
+            )
+
+        return simulate
+
+    def test_run_monte_carlo_coalesces_on_input_digest(self):
+        """Identical concurrent simulations of GoalProbabilityAnalyzer run once."""
+        calls = []
+        results = run_concurrently(4, self._slow_simulation(calls))
+
+        self.assertEqual(len(calls), 1)
+        self.assertTrue(all(result is results[0] for result in results))
+
+    def test_parameter_update_starts_new_simulation(self):
+        """A request made after a parameter update does not join an older simulation."""
+        calls = []
+        simulate = self._slow_simulation(calls)
+        tokens = iter(["before-update", "after-update"])
+
+        with patch('models.goal_probability.parameter_cache_token', side_effect=lambda: next(tokens)):
+            first = threading.Thread(target=simulate)
+            first.start()
+            time.sleep(0.05)
+            simulate()
+            first.join()
+
+        self.assertEqual(len(calls), 2)
+
+    def test_contribution_digest_is_stable(self):
+        """Input digests do not depend on per-process hash randomization."""
+        analyzer = GoalProbabilityAnalyzer()
+        digest = analyzer._get_contribution_digest(
+            ContributionPattern(annual_amount=24000, irregular_schedule={3: 100000}))
+
+        self.assertIn('"initial": 24000', digest)
+        self.assertIn('"irregular"', digest)
+        self.assertNotEqual(
+            digest, analyzer._get_contribution_digest(ContributionPattern(annual_amount=24000)))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,192 @@
+"""Tests for the SimulationCache LRU, TTL, byte budget and tag index."""
+
+import os
+import sys
+import time
+import unittest
+from unittest.mock import MagicMock
+
+import numpy as np
+
+# Add the project root to the path if needed
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), "../.."))
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+from models.monte_carlo.cache import (
+    SimulationCache, EVICT_EXPIRED, EVICT_INVALIDATED, EVICT_MEMORY, EVICT_SIZE, _estimate_size,
+    cached_simulation, invalidate_cache, invalidate_tags, goal_tag, profile_tag, parameter_group_tag
+)
+
+
+class TestSimulationCache(unittest.TestCase):
+    """Test eviction, expiry and statistics of SimulationCache."""
+
+    def setUp(self):
+        self.evicted = []
+        self.cache = SimulationCache(max_size=3, ttl=60, max_bytes=None)
+        self.cache.add_eviction_callback(lambda key, value, reason: self.evicted.append((key, reason)))
+
+    def test_lru_eviction_order(self):
+        """The least recently used entry is evicted first."""
+        for key in ("a", "b", "c"):
+            self.cache.set(key, key)
+        self.cache.get("a")  # "b" is now least recently used
+        self.cache.set("d", "d")
+
+        self.assertIsNone(self.cache.get("b"))
+        self.assertEqual(self.cache.get("a"), "a")
+        self.assertEqual(self.evicted, [("b", EVICT_SIZE)])
+
+    def test_per_entry_ttl(self):
+        """A custom TTL expires only its own entry."""
+        self.cache.set("short", 1, ttl=0.05)
+        self.cache.set("long", 2)
+        time.sleep(0.1)
+
+        self.assertEqual(self.cache.cleanup_expired(), 1)
+        self.assertIsNone(self.cache.get("short"))
+        self.assertEqual(self.cache.get("long"), 2)
+        self.assertIn(("short", EVICT_EXPIRED), self.evicted)
+
+    def test_byte_budget_counts_array_bytes(self):
+        """Large arrays are charged by nbytes and evicted to stay under budget."""
+        array = np.zeros((100, 100))
+        self.assertGreaterEqual(_estimate_size({"all_projections": array}), array.nbytes)
+
+        cache = SimulationCache(max_size=100, ttl=60, max_bytes=int(array.nbytes * 2.5))
+        evicted = []
+        cache.add_eviction_callback(lambda key, value, reason: evicted.append((key, reason)))
+        for key in ("x", "y", "z"):
+            cache.set(key, {"all_projections": np.zeros((100, 100))})
+
+        self.assertEqual(cache.get_stats()["size"], 2)
+        self.assertLessEqual(cache.get_stats()["bytes"], cache.max_bytes)
+        self.assertEqual(evicted, [("x", EVICT_MEMORY)])
+
+        # Values larger than the whole budget are not cached
+        cache.set("huge", np.zeros((1000, 1000)))
+        self.assertIsNone(cache.get("huge"))
+
+    def test_prefix_stats(self):
+        """Hits, misses and entries are tracked per key prefix."""
+        digest = "0" * 32
+        self.cache.set("goal_" + digest, 1)
+        self.cache.get("goal_" + digest)
+        self.cache.get("goal_" + "1" * 32)
+        self.cache.get("other:key")
+
+        prefixes = self.cache.get_stats()["prefixes"]
+        self.assertEqual(prefixes["goal_"]["entries"], 1)
+        self.assertEqual(prefixes["goal_"]["hits"], 1)
+        self.assertEqual(prefixes["goal_"]["misses"], 1)
+        self.assertEqual(prefixes["other:"]["misses"], 1)
+
+    def test_invalidate_and_replace(self):
+        """Replacing a key keeps accounting correct and invalidation notifies callbacks."""
+        self.cache.set("a", np.zeros(10))
+        self.cache.set("a", np.zeros(20))
+        self.assertEqual(self.cache.get_stats()["size"], 1)
+        self.assertEqual(self.cache.get_stats()["bytes"], _estimate_size(np.zeros(20)))
+
+        self.assertEqual(self.cache.invalidate(), 1)
+        self.assertEqual(self.cache.get_stats()["bytes"], 0)
+        self.assertEqual(self.evicted, [("a", EVICT_INVALIDATED)])
+
+    def test_save_and_load_round_trip(self):
+        """Entries survive a save/load cycle with their expiry times."""
+        import tempfile
+        self.cache.set("a", {"value": np.arange(5)})
+        self.cache.set("b", 2, ttl=0.05)
+        time.sleep(0.1)
+
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "cache.pickle")
+            self.assertTrue(self.cache.save(path))
+            restored = SimulationCache(max_size=3, ttl=60)
+            self.assertTrue(restored.load(path))
+
+        np.testing.assert_array_equal(restored.get("a")["value"], np.arange(5))
+        self.assertIsNone(restored.get("b"))
+
+
+class TestCacheTags(unittest.TestCase):
+    """Test tag-based invalidation."""
+
+    def setUp(self):
+        invalidate_cache()
+
+    def tearDown(self):
+        invalidate_cache()
+
+    def test_invalidate_tags(self):
+        """Only entries carrying an invalidated tag are removed."""
+        cache = SimulationCache(max_size=10, ttl=60)
+        cache.set("k1", 1, tags=[goal_tag("g1"), profile_tag("p1")])
+        cache.set("k2", 2, tags=[goal_tag("g2"), profile_tag("p1")])
+        cache.set("k3", 3)
+
+        self.assertEqual(cache.invalidate_tags([goal_tag("g1")]), 1)
+        self.assertIsNone(cache.get("k1"))
+        self.assertEqual(cache.get("k2"), 2)
+
+        self.assertEqual(cache.invalidate_tags([profile_tag("p1")]), 1)
+        self.assertEqual(cache.get("k3"), 3)
+
+        # Replaced and evicted entries leave no stale index entries behind
+        cache.set("k3", 4, tags=[goal_tag("g3")])
+        cache.set("k3", 5)
+        self.assertEqual(cache.invalidate_tags([goal_tag("g3")]), 0)
+        self.assertEqual(cache._tag_index, {})
+
+    def test_pattern_matches_tags(self):
+        """A pattern equal to a tag invalidates entries with hashed keys."""
+        cache = SimulationCache(max_size=10, ttl=60)
+        cache.set("a" * 32, 1, tags=[goal_tag("g1")])
+
+        self.assertEqual(cache.invalidate(goal_tag("g1")), 1)
+
+    def test_cached_simulation_tag_extractor(self):
+        """Decorated results are tagged from the call arguments."""
+        calls = []
+
+        @cached_simulation(tag_extractor=lambda goal_id, value: [goal_tag(goal_id)])
+        def simulate(goal_id, value):
+            calls.append(goal_id)
+            return value * 2
+
+        simulate("g1", 1)
+        simulate("g2", 1)
+        simulate("g1", 1)
+        self.assertEqual(calls, ["g1", "g2"])
+
+        self.assertEqual(invalidate_tags(goal_tag("g1")), 1)
+        simulate("g1", 1)
+        simulate("g2", 1)
+        self.assertEqual(calls, ["g1", "g2", "g1"])
+
+    def test_service_invalidation_uses_tags(self):
+        """GoalService and FinancialParameterService invalidate by tag."""
+        from services.goal_service import GoalService, _goal_simulation_tags
+        from services.financial_parameter_service import FinancialParameterService
+
+        @cached_simulation(tag_extractor=_goal_simulation_tags)
+        def simulate(goal, profile_data, iterations):
+            return {"goal": goal["id"]}
+
+        simulate({"id": "g1", "user_profile_id": "p1"}, {}, 10)
+        simulate({"id": "g2", "user_profile_id": "p2"}, {}, 10)
+
+        service = MagicMock()
+        self.assertEqual(GoalService.invalidate_goal_probability_cache(service, goal_id="g1"), 1)
+
+        parameter_service = MagicMock(_parameter_groups={"market_assumptions": ["inflation.general"]})
+        FinancialParameterService._invalidate_monte_carlo_caches(parameter_service, profile_id="p3")
+        self.assertEqual(simulate({"id": "g2", "user_profile_id": "p2"}, {}, 10), {"goal": "g2"})
+        FinancialParameterService._invalidate_monte_carlo_caches(
+            parameter_service, parameter_path="inflation.general")
+        self.assertEqual(invalidate_tags(parameter_group_tag("monte_carlo")), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
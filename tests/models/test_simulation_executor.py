@@ -0,0 +1,122 @@
+"""Tests for the long-lived simulation executor."""
+
+import os
+import signal
+import sys
+import time
+import unittest
+
+import numpy as np
+
+# Add the project root to the path if needed
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), "../.."))
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+from models.financial_projection import AssetProjection, AllocationStrategy, ContributionPattern, AssetClass
+from models.monte_carlo.executor import (
+    DEFAULT_EXECUTOR_WORKERS, SimulationExecutor, chunk_sizes, get_simulation_executor,
+    projection_inputs, simulate_paths_into
+)
+from models.monte_carlo.parallel import run_parallel_monte_carlo, single_simulation_example
+from models.monte_carlo.rng import spawn_seed_sequences
+
+
+class TestChunkSizes(unittest.TestCase):
+    """Test exact splitting of simulation counts."""
+
+    def test_sizes_add_up_exactly(self):
+        """Chunks always cover exactly the requested simulations."""
+        for simulations, chunks in [(1000, 3), (1001, 8), (500, 7), (5, 8)]:
+            sizes = chunk_sizes(simulations, chunks)
+            self.assertEqual(sum(sizes), simulations)
+            self.assertLessEqual(max(sizes) - min(sizes), 1)
+            self.assertNotIn(0, sizes)
+
+
+class TestExecutorDefaults(unittest.TestCase):
+    """Test that nothing forks a pool unless asked to."""
+
+    def test_default_worker_count_is_capped(self):
+        """Each app worker gets a small pool rather than one process per CPU."""
+        self.assertLessEqual(SimulationExecutor().workers, DEFAULT_EXECUTOR_WORKERS)
+        self.assertEqual(SimulationExecutor(workers=5).workers, 5)
+
+    def test_shutdown_ignores_parent_signal_handlers(self):
+        """Workers do not run the parent's SIGTERM handler on shutdown."""
+        previous = signal.signal(signal.SIGTERM, lambda sig, frame: time.sleep(60))
+        try:
+            executor = SimulationExecutor(workers=1).start()
+            self.assertEqual(executor.map(abs, [-1]), [1])
+            start = time.time()
+            executor.shutdown()
+            self.assertLess(time.time() - start, 10)
+        finally:
+            signal.signal(signal.SIGTERM, previous)
+
+    def test_parallel_request_without_executor_runs_in_process(self):
+        """Parallel mode does not start a pool from a request thread."""
+        from models.goal_probability import GoalProbabilityAnalyzer
+
+        self.assertIsNone(get_simulation_executor())
+        result = GoalProbabilityAnalyzer()._run_monte_carlo(
+            100000, ContributionPattern(annual_amount=120000), 5,
+            AllocationStrategy(initial_allocation={AssetClass.EQUITY: 0.6, AssetClass.DEBT: 0.4}),
+            simulations=200, use_parallel=True, use_cache=False
+        )
+        self.assertEqual(len(result.projected_values), 6)
+        self.assertIsNone(get_simulation_executor())
+
+
+class TestSimulationExecutor(unittest.TestCase):
+    """Test simulations on a running worker pool."""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.executor = SimulationExecutor(workers=3).start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.executor.shutdown()
+
+    def setUp(self):
+        self.projection = AssetProjection()
+        self.allocation = AllocationStrategy(initial_allocation={AssetClass.EQUITY: 0.6, AssetClass.DEBT: 0.4})
+        self.contributions = ContributionPattern(annual_amount=120000)
+
+    def test_exact_count_matches_in_process_chunks(self):
+        """Shared-memory results equal simulating each chunk in this process."""
+        contributions, weights, asset_returns = projection_inputs(
+            self.projection, self.contributions, 10, self.allocation)
+        paths = self.executor.simulate_paths(100000, contributions, weights, asset_returns, 1001, rng=7)
+        self.assertEqual(paths.shape, (1001, 11))
+
+        expected = np.empty((1001, 11))
+        start = 0
+        for size, stream in zip(chunk_sizes(1001, 3), spawn_seed_sequences(7, 3)):
+            simulate_paths_into(expected[start:start + size], 100000, contributions, weights,
+                                asset_returns, np.random.default_rng(stream))
+            start += size
+        np.testing.assert_array_equal(paths, expected)
+
+    def test_project_returns_projection_result(self):
+        """project() returns confidence intervals and all paths."""
+        result = self.executor.project(self.projection, 100000, self.contributions, 10,
+                                       self.allocation, simulations=750, rng=1)
+        self.assertEqual(result.all_projections.shape, (750, 11))
+        self.assertEqual(set(result.confidence_intervals), {"P10", "P25", "P50", "P75", "P90"})
+        np.testing.assert_allclose(result.projected_values, np.median(result.all_projections, axis=0))
+        self.assertEqual(self.executor.get_stats()['simulations'] >= 750, True)
+
+    def test_parallel_monte_carlo_keeps_exact_count(self):
+        """run_parallel_monte_carlo no longer rounds to a multiple of the workers."""
+        result = run_parallel_monte_carlo(
+            initial_amount=100000, contribution_pattern=self.contributions, years=5,
+            allocation_strategy=self.allocation, simulation_function=single_simulation_example,
+            simulations=1001, max_workers=3
+        )
+        self.assertEqual(result.all_projections.shape, (1001, 6))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,241 @@
+"""Tests for the persistent simulation store (cache L2 tier)."""
+
+import os
+import sys
+import tempfile
+import threading
+import time
+import unittest
+
+import numpy as np
+
+# Add the project root to the path if needed
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), "../.."))
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+from models.financial_projection import (
+    AllocationStrategy, AssetClass, AssetProjection, ContributionPattern, ProjectionResult
+)
+from models.monte_carlo.cache import SimulationCache, goal_tag, invalidate_cache
+from models.monte_carlo.store import SimulationStore, STORE_SEGMENT_DIR
+
+
+class TestSimulationStore(unittest.TestCase):
+    """Test segment storage, lazy reads and invalidation."""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.directory = self.tmp.name
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def _segments(self):
+        return os.listdir(os.path.join(self.directory, STORE_SEGMENT_DIR))
+
+    def test_arrays_are_memory_mapped(self):
+        """Large arrays come back as memory-mapped segments, small ones inline."""
+        store = SimulationStore(self.directory)
+        paths = np.random.default_rng(1).normal(size=(1000, 31))
+        value = {"all_projections": paths, "small": np.arange(3), "label": "x"}
+
+        self.assertTrue(store.put("key", value, time.time() + 60, [goal_tag("g1")]))
+        self.assertEqual(len(self._segments()), 1)
+
+        loaded, expires_at, tags = store.get("key")
+        self.assertIsInstance(loaded["all_projections"], np.memmap)
+        np.testing.assert_array_equal(loaded["all_projections"], paths)
+        np.testing.assert_array_equal(loaded["small"], np.arange(3))
+        self.assertEqual(tags, [goal_tag("g1")])
+
+        # Copy-on-write: callers can modify their view without touching the segment
+        loaded["all_projections"][0, 0] = -1.0
+        np.testing.assert_array_equal(store.get("key")[0]["all_projections"], paths)
+
+    def test_projection_result_round_trip(self):
+        """Simulation result objects survive the store with their arrays."""
+        store = SimulationStore(self.directory)
+        result = ProjectionResult(
+            years=np.arange(31),
+            projected_values=np.linspace(0, 1, 31),
+            contributions=np.zeros(31),
+            growth=np.zeros(31),
+            all_projections=np.ones((500, 31))
+        )
+        store.put("result", result, time.time() + 60)
+
+        loaded = store.get("result")[0]
+        np.testing.assert_array_equal(loaded.all_projections, result.all_projections)
+
+    def test_replace_expire_and_invalidate(self):
+        """Replaced, expired and invalidated entries release their segments."""
+        store = SimulationStore(self.directory)
+        store.put("a", np.zeros(10000), time.time() + 60, [goal_tag("g1")])
+        store.put("a", np.ones(10000), time.time() + 60, [goal_tag("g1")])
+        store.put("b", np.zeros(10000), time.time() - 1)
+        self.assertEqual(len(self._segments()), 2)
+
+        self.assertIsNone(store.get("b"))
+        self.assertEqual(store.invalidate_tags([goal_tag("g1")]), 1)
+        self.assertIsNone(store.get("a"))
+        self.assertEqual(self._segments(), [])
+
+    def test_byte_budget(self):
+        """Least recently accessed entries are evicted over the byte budget."""
+        store = SimulationStore(self.directory, max_bytes=200000)
+        for key in ("a", "b", "c"):
+            store.put(key, np.zeros(10000), time.time() + 60)
+
+        self.assertIsNone(store.get("a"))
+        self.assertIsNotNone(store.get("c"))
+        self.assertLessEqual(store.get_stats()["bytes"], 200000)
+
+        # The running total follows replacements and deletes
+        store.put("c", np.zeros(5000), time.time() + 60)
+        store.delete(["b"])
+        reopened = SimulationStore(self.directory)
+        total = reopened._connection().execute("SELECT SUM(size) FROM entries").fetchone()[0]
+        self.assertEqual(reopened.get_stats()["bytes"], total)
+
+    def test_cache_uses_store_as_second_tier(self):
+        """A fresh cache (e.g. a restarted worker) is warm from the shared store."""
+        first = SimulationCache(max_size=10, ttl=60)
+        first.attach_store(SimulationStore(self.directory))
+        first.set("key", {"paths": np.ones((100, 100))}, tags=[goal_tag("g1")])
+
+        second = SimulationCache(max_size=10, ttl=60)
+        second.attach_store(SimulationStore(self.directory))
+        value = second.get("key")
+
+        np.testing.assert_array_equal(value["paths"], np.ones((100, 100)))
+        self.assertEqual(second.get_stats()["store_hits"], 1)
+        self.assertEqual(second.get_tags("key"), frozenset([goal_tag("g1")]))
+
+        # Invalidation reaches entries that are only on disk
+        self.assertEqual(first.invalidate_tags([goal_tag("g1")]), 1)
+        self.assertIsNone(SimulationCache(max_size=10, ttl=60).get("key"))
+        third = SimulationCache(max_size=10, ttl=60)
+        third.attach_store(SimulationStore(self.directory))
+        self.assertIsNone(third.get("key"))
+
+    def test_invalidation_reaches_other_caches_in_memory_entries(self):
+        """Workers sharing a store stop serving entries another worker invalidated."""
+        first = SimulationCache(max_size=10, ttl=60)
+        first.attach_store(SimulationStore(self.directory))
+        second = SimulationCache(max_size=10, ttl=60)
+        second.attach_store(SimulationStore(self.directory))
+
+        first.set("key", {"value": 1}, tags=[goal_tag("g1")])
+        first.set("other", {"value": 2})
+        self.assertEqual(second.get("key"), {"value": 1})
+        self.assertEqual(second.get("other"), {"value": 2})
+        self.assertIn("key", second.cache)
+
+        first.invalidate_tags([goal_tag("g1")])
+        self.assertIsNone(second.get("key"))
+        # Unaffected entries are read back from the store
+        self.assertEqual(second.get("other"), {"value": 2})
+
+        first.set("key", {"value": 3}, tags=[goal_tag("g1")])
+        self.assertEqual(second.get("key"), {"value": 3})
+
+        second.invalidate("key")
+        self.assertIsNone(first.get("key"))
+
+
+class TestSingleFlightFills(unittest.TestCase):
+    """Test that concurrent misses for one key are computed once."""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def _fill(self, cache, key, computed, results, barrier, delay=0.2):
+        barrier.wait()
+        value = cache.acquire_fill(key, wait_timeout=5)
+        if value is None:
+            computed.append(threading.get_ident())
+            time.sleep(delay)
+            value = {"paths": np.ones((200, 100))}
+            cache.set(key, value)
+            cache.release_fill(key)
+        results.append(value)
+
+    def _run_threads(self, caches, key):
+        computed, results = [], []
+        barrier = threading.Barrier(len(caches))
+        threads = [threading.Thread(target=self._fill, args=(cache, key, computed, results, barrier))
+                   for cache in caches]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        return computed, results
+
+    def test_threads_share_one_fill(self):
+        """Threads missing the same key wait for a single computation."""
+        cache = SimulationCache(max_size=10, ttl=60)
+        computed, results = self._run_threads([cache] * 5, "key")
+
+        self.assertEqual(len(computed), 1)
+        self.assertEqual(len(results), 5)
+        stats = cache.get_stats()
+        self.assertEqual(stats["coalesced_fills"], 4)
+        self.assertEqual(stats["fills_in_progress"], 0)
+
+    def test_caches_sharing_a_store_share_one_fill(self):
+        """Caches of different workers coordinate fills through the store."""
+        caches = []
+        for _ in range(3):
+            cache = SimulationCache(max_size=10, ttl=60)
+            cache.attach_store(SimulationStore(self.tmp.name))
+            caches.append(cache)
+
+        computed, results = self._run_threads(caches, "key")
+
+        self.assertEqual(len(computed), 1)
+        self.assertEqual(len(results), 3)
+        self.assertEqual(sum(cache.get_stats()["remote_fills"] for cache in caches), 2)
+        self.assertEqual(caches[0].get_stats()["store"]["fills_in_progress"], 0)
+
+    def test_failed_fill_releases_waiters(self):
+        """Waiters compute themselves when the filler gives up without a value."""
+        cache = SimulationCache(max_size=10, ttl=60)
+        self.assertIsNone(cache.acquire_fill("key"))
+
+        waiter_result = []
+        waiter = threading.Thread(
+            target=lambda: waiter_result.append(cache.acquire_fill("key", wait_timeout=5)))
+        waiter.start()
+        time.sleep(0.05)
+        cache.release_fill("key")
+        waiter.join(1)
+
+        self.assertFalse(waiter.is_alive())
+        self.assertEqual(waiter_result, [None])
+
+    def test_asset_projection_uses_shared_cache(self):
+        """A new AssetProjection reuses seeded simulations of an identical one."""
+        invalidate_cache("asset_projection:")
+        allocation = AllocationStrategy(initial_allocation={AssetClass.EQUITY: 0.6, AssetClass.DEBT: 0.4})
+        contributions = ContributionPattern(annual_amount=12000)
+
+        first = AssetProjection().project_with_monte_carlo(100000, contributions, 10, allocation, simulations=500)
+        projection = AssetProjection()
+        second = projection.project_with_monte_carlo(100000, contributions, 10, allocation, simulations=500)
+        self.assertIs(second, first)
+        self.assertEqual(projection._cache_hits, 1)
+
+        other_returns = dict(AssetProjection.DEFAULT_RETURNS)
+        other_returns[AssetClass.EQUITY] = (0.12, 0.2)
+        third = AssetProjection(returns=other_returns).project_with_monte_carlo(
+            100000, contributions, 10, allocation, simulations=500)
+        self.assertIsNot(third, first)
+        invalidate_cache("asset_projection:")
+
+
+if __name__ == '__main__':
+    unittest.main()
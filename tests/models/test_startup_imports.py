@@ -0,0 +1,64 @@
+"""Tests that keep heavy optional dependencies off the app boot path."""
+
+import json
+import os
+import subprocess
+import sys
+import unittest
+
+# Add the project root to the path if needed
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), "../.."))
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+from models.financial_parameters import FinancialParameters
+from tools.benchmark_startup import check_startup, parse_importtime
+
+# Modules imported by app.py or its services that used to pull in pandas or matplotlib
+BOOT_MODULES = [
+    "models.financial_projection",
+    "models.gap_analysis.scenario_analysis",
+    "models.goal_document",
+]
+
+
+class TestStartupImports(unittest.TestCase):
+    """Test lazy imports and the shared base parameter snapshot."""
+
+    def test_boot_modules_do_not_import_heavy_dependencies(self):
+        code = (
+            "import json, sys\n"
+            + "".join(f"import {module}\n" for module in BOOT_MODULES)
+            + "print(json.dumps(sorted({name.split('.')[0] for name in sys.modules})))"
+        )
+        result = subprocess.run([sys.executable, "-c", code], cwd=project_root,
+                                capture_output=True, text=True)
+        self.assertEqual(result.returncode, 0, result.stderr[-2000:])
+        imported = set(json.loads(result.stdout.strip().splitlines()[-1]))
+        for name in ("pandas", "matplotlib", "reportlab"):
+            self.assertNotIn(name, imported)
+
+    def test_base_parameters_flattened_once(self):
+        first = FinancialParameters()
+        paths = FinancialParameters._base_parameter_paths
+        second = FinancialParameters()
+
+        self.assertIs(FinancialParameters._base_parameter_paths, paths)
+        self.assertEqual(first.parameters.keys(), second.parameters.keys())
+        self.assertIsNot(first.metadata["inflation.general"], second.metadata["inflation.general"])
+        self.assertEqual(first.get("inflation.general"), FinancialParameters.BASE_PARAMETERS["inflation"]["general"])
+
+    def test_parse_importtime(self):
+        output = "\n".join([
+            "import time: self [us] | cumulative | imported package",
+            "import time:       120 |        120 |   pandas.core",
+            "import time:       300 |        420 | pandas",
+            "import time:      1000 |       1420 | app",
+        ])
+        timings = parse_importtime(output)
+        self.assertEqual(timings["app"], (1000, 1420))
+        self.assertEqual(check_startup(timings, ["pandas", "matplotlib"]), ["pandas"])
+
+
+if __name__ == '__main__':
+    unittest.main()
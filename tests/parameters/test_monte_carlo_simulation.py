@@ -0,0 +1,123 @@
+"""Tests for the batched FinancialParameters.run_monte_carlo_simulation engine."""
+
+import math
+import os
+import sys
+import unittest
+
+import numpy as np
+
+# Add the project root to the path if needed
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), "../.."))
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+from models.financial_parameters import FinancialParameters
+
+
+ALLOCATION = {"equity": 0.6, "debt": 0.3, "cash": 0.1}
+
+
+def legacy_paths(initial_amount, monthly_return, monthly_volatility, monthly_inflation,
+                 monthly_contribution, shocks):
+    """Reference per-run, per-month loop from the original implementation."""
+    paths = []
+    for run_shocks in shocks:
+        balance = initial_amount
+        path = [balance]
+        for month, shock in enumerate(run_shocks, start=1):
+            log_return = math.log(1 + monthly_return) - 0.5 * monthly_volatility**2
+            portfolio_return = math.exp(log_return + monthly_volatility * shock) - 1
+            contribution = monthly_contribution * (1 + monthly_inflation) ** month
+            balance = (balance + balance * portfolio_return + contribution) / (1 + monthly_inflation)
+            path.append(balance)
+        paths.append(path)
+    return np.array(paths)
+
+
+class TestRunMonteCarloSimulation(unittest.TestCase):
+    """Test the vectorized simulation against the original loop semantics."""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.params = FinancialParameters()
+
+    def _run(self, **kwargs):
+        args = dict(initial_amount=1000000, monthly_contribution=20000, time_horizon=5,
+                    allocation=ALLOCATION, num_runs=200)
+        args.update(kwargs)
+        return self.params.run_monte_carlo_simulation(**args)
+
+    def test_matches_legacy_loop(self):
+        """Final amounts and median path match the per-month loop for the same shocks."""
+        results = self._run(rng=np.random.default_rng(7))
+
+        expected_return = self.params.calculate_portfolio_return(ALLOCATION)
+        portfolio_volatility = sum(
+            weight * self.params._get_default_volatility(asset) for asset, weight in ALLOCATION.items()
+        )
+        inflation = self.params.get("inflation.general", 0.06)
+        shocks = np.random.default_rng(7).standard_normal((200, 60))
+        expected = legacy_paths(
+            1000000, (1 + expected_return) ** (1/12) - 1, portfolio_volatility / math.sqrt(12),
+            (1 + inflation) ** (1/12) - 1, 20000, shocks
+        )
+
+        np.testing.assert_allclose(results["final_amounts"], expected[:, -1], rtol=1e-10)
+        median_index = sorted(range(200), key=lambda i: expected[i, -1])[100]
+        np.testing.assert_allclose(results["median_path"], expected[median_index], rtol=1e-10)
+
+        sorted_final = np.sort(expected[:, -1])
+        self.assertAlmostEqual(results["percentiles"][0.9], sorted_final[int(100 * (1 - 0.9) * 200 / 100)], delta=1e-4)
+
+    def test_reproducible_and_well_formed(self):
+        """Results are reproducible and keep the original result structure."""
+        first = self._run()
+        second = self._run()
+
+        self.assertEqual(first["final_amounts"], second["final_amounts"])
+        self.assertIsInstance(first["final_amounts"], list)
+        self.assertEqual(len(first["median_path"]), 5 * 12 + 1)
+        self.assertEqual(set(first["risk_metrics"]["value_at_risk"]), {0.95, 0.99})
+        self.assertTrue(0.0 <= first["risk_metrics"]["max_drawdown"] <= 1.0)
+        self.assertTrue(0.0 <= first["risk_metrics"]["shortfall_probability"] <= 1.0)
+
+    def test_withdrawal_phase_depletion(self):
+        """Depleted runs end at zero, count as failures and have truncated paths."""
+        results = self._run(initial_amount=500000, monthly_contribution=0, withdrawal_phase=True,
+                            withdrawal_amount=20000, time_horizon=10)
+
+        self.assertEqual(results["success_rate"], 0.0)
+        self.assertTrue(all(amount == 0 for amount in results["final_amounts"]))
+        self.assertLess(len(results["median_path"]), 10 * 12 + 1)
+        self.assertTrue(all(balance > 0 for balance in results["median_path"]))
+
+    def test_correlated_returns(self):
+        """Correlated simulation runs in batch and produces sensible metrics."""
+        correlation_matrix = {"equity": {"debt": 0.2, "cash": 0.0}, "debt": {"cash": 0.3}}
+        results = self._run(correlation_matrix=correlation_matrix)
+
+        self.assertEqual(len(results["final_amounts"]), 200)
+        self.assertTrue(all(amount > 0 for amount in results["final_amounts"]))
+        self.assertGreater(results["risk_metrics"]["volatility"], 0.0)
+
+    def test_stress_scenarios_match_single_scenario(self):
+        """Batched stress scenarios agree with running each scenario on its own."""
+        scenarios = {
+            "crash": {"equity": -0.4, "debt": 0.05},
+            "wipeout": {"equity": -0.99, "debt": -0.99, "cash": -0.99},
+        }
+        batch = self.params._run_stress_scenarios(
+            100000, 0, 5, ALLOCATION, True, 5000, scenarios, 0.06)
+
+        for name, impacts in scenarios.items():
+            single = self.params._run_stress_scenario(
+                100000, 0, 5, ALLOCATION, True, 5000, impacts, 0.06)
+            self.assertEqual(batch[name], single)
+
+        self.assertEqual(batch["wipeout"]["max_drawdown"], 1.0)
+        self.assertEqual(batch["wipeout"]["success_probability"], 0.0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,84 @@
+"""
+Tests for correlated Monte Carlo sampling in the modular asset projection.
+"""
+
+import unittest
+import numpy as np
+from unittest.mock import patch
+
+from models.projections.asset_projection import AssetProjection, AssetClass
+from models.monte_carlo.correlation import (
+    nearest_correlation_matrix,
+    cholesky_factor,
+    correlated_normals
+)
+
+
+class TestCorrelationHelpers(unittest.TestCase):
+    """Test cases for correlation matrix repair and sampling"""
+
+    def test_nearest_correlation_repairs_indefinite_matrix(self):
+        """An indefinite matrix is projected to a valid correlation matrix"""
+        bad = np.array([
+            [1.0, 0.9, -0.9],
+            [0.9, 1.0, 0.9],
+            [-0.9, 0.9, 1.0]
+        ])
+        self.assertLess(np.linalg.eigvalsh(bad).min(), 0)
+
+        repaired = nearest_correlation_matrix(bad)
+
+        np.testing.assert_allclose(np.diag(repaired), 1.0)
+        np.testing.assert_allclose(repaired, repaired.T)
+        self.assertGreater(np.linalg.eigvalsh(repaired).min(), 0)
+        np.linalg.cholesky(repaired)
+
+    def test_cholesky_factor_keeps_valid_matrix(self):
+        """A valid matrix is factorized without modification"""
+        corr = np.array([[1.0, 0.3], [0.3, 1.0]])
+        chol = cholesky_factor(corr)
+        np.testing.assert_allclose(chol @ chol.T, corr)
+
+    def test_correlated_normals_shape_and_correlation(self):
+        """Batched shocks have the requested shape and correlation"""
+        corr = np.array([[1.0, 0.6], [0.6, 1.0]])
+        shocks = correlated_normals(np.linalg.cholesky(corr), (2000, 25), np.random.default_rng(0))
+
+        self.assertEqual(shocks.shape, (2000, 25, 2))
+        sample = np.corrcoef(shocks.reshape(-1, 2).T)[0, 1]
+        self.assertAlmostEqual(sample, 0.6, delta=0.02)
+
+
+class TestAssetProjectionMonteCarlo(unittest.TestCase):
+    """Test cases for AssetProjection.run_monte_carlo"""
+
+    def setUp(self):
+        """Set up test fixtures"""
+        self.projection = AssetProjection(seed=42)
+        self.allocation = {
+            AssetClass.EQUITY: 0.6,
+            AssetClass.DEBT: 0.3,
+            AssetClass.GOLD: 0.1
+        }
+
+    def test_factorizes_once_per_allocation(self):
+        """The Cholesky factorization is computed once, not per run-year"""
+        with patch('models.projections.asset_projection.cholesky_factor',
+                   wraps=cholesky_factor) as mock_factor:
+            self.projection.run_monte_carlo(1000000, 120000, 20, self.allocation, runs=500)
+            self.projection.run_monte_carlo(1000000, 120000, 20, self.allocation, runs=500)
+
+        self.assertEqual(mock_factor.call_count, 1)
+
+    def test_results_are_reproducible(self):
+        """Same seed gives identical projections"""
+        first = self.projection.run_monte_carlo(1000000, 120000, 10, self.allocation, runs=500)
+        second = AssetProjection(seed=42).run_monte_carlo(1000000, 120000, 10, self.allocation, runs=500)
+
+        self.assertEqual(len(first.projected_values), 11)
+        np.testing.assert_allclose(first.projected_values, second.projected_values)
+        self.assertLess(first.confidence_intervals["P5"][-1], first.confidence_intervals["P95"][-1])
+
+
+if __name__ == '__main__':
+    unittest.main()
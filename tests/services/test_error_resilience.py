@@ -160,8 +160,7 @@ class ErrorResilienceTest(unittest.TestCase):
         mock_probability_analyzer.analyze_goal_probability = MagicMock(side_effect=Exception("Simulated calculation error"))
         
         # Patch the probability analyzer
-        with patch('services.goal_service.GoalProbabilityAnalyzer', 
-                   return_value=mock_probability_analyzer):
+        with patch.object(self.goal_service, 'probability_analyzer', mock_probability_analyzer):
             
             # Try to calculate probability
             result = self.goal_service.calculate_goal_probability(
@@ -407,9 +406,8 @@ class ErrorResilienceTest(unittest.TestCase):
         
         mock_analyzer.analyze_goal_probability = analyze_side_effect
         
-        # Patch the GoalProbabilityAnalyzer
-        with patch('services.goal_service.GoalProbabilityAnalyzer', 
-                   return_value=mock_analyzer):
+        # Patch the service's GoalProbabilityAnalyzer
+        with patch.object(self.goal_service, 'probability_analyzer', mock_analyzer):
             
             # Try a batch calculation
             results = self.goal_service.calculate_goal_probabilities_batch(
@@ -4,7 +4,6 @@ Test suite for the Financial Parameter Service
 """
 
 import unittest
-import time
 from unittest.mock import patch, MagicMock
 from services.financial_parameter_service import FinancialParameterService, get_financial_parameter_service
 from models.financial_parameters import get_parameters
@@ -136,38 +135,23 @@ class TestFinancialParameterService(unittest.TestCase):
         self.assertEqual(latest_change["source"], "test")
     
     def test_cache_invalidation(self):
-        """Test that caches are properly invalidated on changes"""
-        # Create a test parameter and set initial value
+        """Test that published values replace cached ones"""
         test_param = "test.parameter.for_cache_test"
-        initial_value = 5.0
         
-        # Set initial value and verify
-        self.service._parameter_cache[test_param] = (time.time(), initial_value)
-        self.assertEqual(self.service.get(test_param, default=initial_value), initial_value)
-        
-        # Change the parameter directly in cache
-        new_value = 10.0
-        self.service._parameter_cache[test_param] = (time.time(), new_value)
-        
-        # Should get the new value
-        updated_value = self.service.get(test_param, default=initial_value)
-        self.assertEqual(updated_value, new_value)
-        
-        # Test group cache invalidation
-        # Define a test group with our test parameter
+        # Define a test group with our test parameter and cache both
         self.service._parameter_groups['test_group'] = [test_param]
-        
-        # Get the group to cache it
-        self.service.get_parameter_group('test_group')
-        
-        # Update parameter
-        newer_value = 15.0
-        self.service._parameter_cache[test_param] = (time.time(), newer_value)
-        self.service._clear_affected_group_caches(test_param)
-        
-        # Should get updated value in the group
-        test_group = self.service.get_parameter_group('test_group')
-        self.assertEqual(test_group[test_param], newer_value)
+        self.assertEqual(self.service.get(test_param, default=5.0), 5.0)
+        self.assertIsNone(self.service.get_parameter_group('test_group')[test_param])
+        
+        # Setting the parameter publishes a new snapshot
+        snapshot = self.service.snapshot
+        self.assertTrue(self.service.set(test_param, 15.0, source="test"))
+        self.assertEqual(self.service.snapshot.version, snapshot.version + 1)
+        self.assertNotIn(test_param, snapshot)
+        
+        # Should get the updated value, also in the group
+        self.assertEqual(self.service.get(test_param, default=5.0), 15.0)
+        self.assertEqual(self.service.get_parameter_group('test_group')[test_param], 15.0)
     
     def test_risk_profile_access(self):
         """Test access to risk profiles"""
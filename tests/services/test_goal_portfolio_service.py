@@ -0,0 +1,170 @@
+"""Tests for GoalService batch probability calculation."""
+
+import os
+import shutil
+import sqlite3
+import sys
+import tempfile
+import unittest
+from unittest.mock import patch
+
+# Add the project root to the path if needed
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), "../.."))
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+from models.database_profile_manager import DatabaseProfileManager
+from models.goal_models import Goal
+from models.goal_probability import GoalProbabilityAnalyzer
+from models.monte_carlo.cache import invalidate_cache
+from services.goal_service import GoalService
+
+# Columns added to the goals table by the enhancement migrations
+ENHANCED_COLUMNS = [
+    ("current_progress", "REAL DEFAULT 0"), ("priority_score", "REAL DEFAULT 0"),
+    ("additional_funding_sources", "TEXT"), ("goal_success_probability", "REAL DEFAULT 0"),
+    ("adjustments_required", "BOOLEAN DEFAULT 0"), ("funding_strategy", "TEXT"),
+    ("simulation_data", "TEXT"), ("scenarios", "TEXT"), ("adjustments", "TEXT"),
+    ("last_simulation_time", "TEXT"), ("simulation_parameters_json", "TEXT"),
+    ("probability_partial_success", "REAL DEFAULT 0"), ("simulation_iterations", "INTEGER DEFAULT 1000"),
+    ("simulation_path_data", "TEXT"), ("monthly_sip_recommended", "REAL DEFAULT 0"),
+    ("probability_metrics", "TEXT"), ("success_threshold", "REAL DEFAULT 0.8"),
+]
+
+
+class TestGoalPortfolioService(unittest.TestCase):
+    """Test the default batched path and the per-goal path."""
+
+    def setUp(self):
+        invalidate_cache()
+        self.temp_dir = tempfile.mkdtemp()
+        self.db_path = os.path.join(self.temp_dir, "goals.db")
+        self.profile_id = DatabaseProfileManager(db_path=self.db_path).create_profile(
+            "Test User", "test@example.com")["id"]
+
+        conn = sqlite3.connect(self.db_path)
+        for name, definition in ENHANCED_COLUMNS:
+            conn.execute(f"ALTER TABLE goals ADD COLUMN {name} {definition}")
+        conn.commit()
+        conn.close()
+
+        self.service = GoalService(db_path=self.db_path)
+        for category, target in (("travel", 300000), ("education", 2000000)):
+            self.service.goal_manager.create_goal(Goal(
+                user_profile_id=self.profile_id, category=category, title=category.title(),
+                target_amount=target, current_amount=50000, timeframe="2032-01-01", importance="high"))
+        self.profile_data = {"id": self.profile_id, "monthly_income": 100000,
+                             "monthly_expenses": 60000, "risk_profile": "moderate"}
+
+    def tearDown(self):
+        invalidate_cache()
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_default_uses_batched_pass(self):
+        with patch.object(GoalProbabilityAnalyzer, 'analyze_goal_probability') as per_goal:
+            results = self.service.calculate_goal_probabilities_batch(self.profile_id, self.profile_data)
+
+        per_goal.assert_not_called()
+        self.assertEqual(len(results), 2)
+        for goal_id, result in results.items():
+            goal = self.service.goal_manager.get_goal(goal_id)
+            self.assertEqual(goal.goal_success_probability, result.success_probability)
+            self.assertIn("portfolio", result.goal_specific_metrics)
+
+    def test_per_goal_path_uses_category_handlers(self):
+        with patch.object(GoalProbabilityAnalyzer, 'analyze_goal_portfolio') as portfolio:
+            results = self.service.calculate_goal_probabilities_batch(
+                self.profile_id, self.profile_data, batch_simulation=False)
+
+        portfolio.assert_not_called()
+        self.assertEqual(len(results), 2)
+        for goal_id, result in results.items():
+            goal = self.service.goal_manager.get_goal(goal_id)
+            self.assertEqual(goal.goal_success_probability, result.success_probability)
+
+            # Same answer as analyzing the goal directly
+            expected = GoalProbabilityAnalyzer().analyze_goal_probability(
+                goal.to_dict(include_blobs=False), self.profile_data, simulations=1000)
+            self.assertEqual(result.success_probability, expected.success_probability)
+
+    def test_batched_matches_per_goal_for_mixed_categories(self):
+        for category, target, current, timeframe in (
+                ("retirement", 30000000, 1500000, "2050-01-01"),
+                ("home_purchase", 3000000, 400000, "2032-01-01"),
+                ("emergency_fund", 600000, 100000, "2027-12-01"),
+                ("wedding", 1500000, 100000, "2031-01-01"),
+                ("debt_repayment", 500000, 100000, "2029-01-01"),
+                ("custom", 400000, 500000, "2029-01-01")):
+            self.service.goal_manager.create_goal(Goal(
+                user_profile_id=self.profile_id, category=category, title=category.title(),
+                target_amount=target, current_amount=current, timeframe=timeframe, importance="medium"))
+
+        batched = self.service.calculate_goal_probabilities_batch(self.profile_id, self.profile_data)
+
+        analyzer = GoalProbabilityAnalyzer()
+        self.assertEqual(len(batched), 8)
+        for goal_id, result in batched.items():
+            goal = self.service.goal_manager.get_goal(goal_id)
+            expected = analyzer.analyze_goal_probability(
+                goal.to_dict(include_blobs=False), self.profile_data, simulations=1000)
+
+            # Same handler inputs and metrics; only the market draws differ
+            self.assertAlmostEqual(result.success_probability, expected.success_probability, delta=0.05,
+                                   msg=goal.category)
+            self.assertAlmostEqual(result.success_metrics["expected_outcome"],
+                                   expected.success_metrics["expected_outcome"],
+                                   delta=0.05 * expected.success_metrics["expected_outcome"], msg=goal.category)
+            self.assertEqual(result.success_metrics["target_amount"], expected.success_metrics["target_amount"])
+            self.assertTrue(set(expected.goal_specific_metrics) <= set(result.goal_specific_metrics),
+                            goal.category)
+
+    def test_batch_cache_key_survives_reloading_goals(self):
+        calls = []
+        original = GoalProbabilityAnalyzer.analyze_goal_portfolio
+
+        def counting(analyzer, *args, **kwargs):
+            calls.append(1)
+            return original(analyzer, *args, **kwargs)
+
+        # Leave the stored rows untouched so each listing loads identical goals
+        with patch.object(GoalProbabilityAnalyzer, 'analyze_goal_portfolio', counting), \
+                patch.object(GoalService, 'update_goal_probability') as update:
+            for _ in range(2):
+                goals = self.service.goal_manager.get_profile_goals(self.profile_id)
+                self.service._calculate_goal_portfolio(goals, self.profile_data, 500, False)
+
+        self.assertEqual(len(calls), 1)
+        # Only the simulated run writes results back
+        self.assertEqual(update.call_count, 2)
+
+    def test_batch_reuses_recent_results(self):
+        first = self.service.calculate_goal_probabilities_batch(
+            self.profile_id, self.profile_data, simulation_iterations=500, batch_simulation=True)
+
+        with patch.object(GoalProbabilityAnalyzer, 'analyze_goal_portfolio') as portfolio:
+            second = self.service.calculate_goal_probabilities_batch(
+                self.profile_id, self.profile_data, simulation_iterations=500, batch_simulation=True)
+
+        portfolio.assert_not_called()
+        self.assertEqual(set(first), set(second))
+        for goal_id, result in first.items():
+            self.assertEqual(second[goal_id].success_probability, result.success_probability)
+            self.assertIn("portfolio", second[goal_id].goal_specific_metrics)
+
+    def test_shared_analyzer_is_reused_without_per_goal_state(self):
+        analyzer = GoalProbabilityAnalyzer()
+        service = GoalService(db_path=self.db_path, goal_probability_analyzer=analyzer)
+
+        with patch('services.goal_service.GoalProbabilityAnalyzer') as constructor:
+            for batch_simulation in (False, True):
+                service.calculate_goal_probabilities_batch(
+                    self.profile_id, self.profile_data, simulation_iterations=500,
+                    force_recalculate=True, batch_simulation=batch_simulation)
+
+        constructor.assert_not_called()
+        # Nothing accumulates on the analyzer between calls
+        self.assertEqual(vars(analyzer).keys(), vars(GoalProbabilityAnalyzer()).keys())
+
+
+if __name__ == '__main__':
+    unittest.main()
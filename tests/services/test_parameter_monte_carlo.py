@@ -285,22 +285,24 @@ class TestParameterMonteCarloIntegration(unittest.TestCase):
         logger.info(f"Cache entries cleared: {stats_before.get('size', 0) - stats_after.get('size', 0)}")
     
     def test_7_parameter_change_notification(self):
-        """Test that parameter change notifications are sent."""
+        """Test that a parameter change publishes a new snapshot for simulation cache keys."""
         # Run a simulation to populate cache
         result1 = self.run_test_simulation()
+        token_before = self.parameter_service.cache_token()
         
         # Change volatility parameter
         original_volatility = self.parameter_service.get('asset_returns.equity.volatility', 0.18)
         new_volatility = original_volatility * 1.5
         
-        # Capture log output to check for notification
+        # Capture log output to check for the published snapshot
         with self.assertLogs(logger='services.financial_parameter_service', level='INFO') as log:
             self.parameter_service.set('asset_returns.equity.volatility', new_volatility)
             
-            # Check log messages for invalidation notification
             log_text = '\n'.join(log.output)
-            self.assertIn("invalidate", log_text.lower())
-            self.assertIn("monte carlo", log_text.lower())
+            self.assertIn("published parameter snapshot", log_text.lower())
+        
+        # Simulations started from now on use different cache keys
+        self.assertNotEqual(self.parameter_service.cache_token(), token_before)
         
         # Reset parameter
         self.parameter_service.set('asset_returns.equity.volatility', original_volatility)
@@ -0,0 +1,109 @@
+"""Tests for the application-scoped service registry."""
+
+import os
+import sys
+import threading
+import time
+import unittest
+
+from flask import Flask
+
+# Add the project root to the path if needed
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), "../.."))
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+from services.service_registry import ServiceRegistry, get_registry, get_service, init_app
+
+
+class TestServiceRegistry(unittest.TestCase):
+    """Test lazy, single construction of registered services."""
+
+    def setUp(self):
+        self.registry = ServiceRegistry()
+        self.built = []
+
+        def slow_service(_):
+            time.sleep(0.05)
+            self.built.append(object())
+            return self.built[-1]
+
+        self.registry.register('slow', slow_service)
+
+    def test_constructed_lazily_once(self):
+        """A service is built on first use and then reused."""
+        self.assertEqual(self.built, [])
+        first = self.registry.get('slow')
+        self.assertIs(self.registry.get('slow'), first)
+        stats = self.registry.get_stats()['services']['slow']
+        self.assertEqual(stats['constructions'], 1)
+        self.assertEqual(stats['hits'], 1)
+        self.assertTrue(stats['constructed'])
+
+    def test_single_construction_across_threads(self):
+        """Concurrent first requests share one construction."""
+        results = []
+        threads = [threading.Thread(target=lambda: results.append(self.registry.get('slow')))
+                   for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(len(self.built), 1)
+        self.assertTrue(all(result is self.built[0] for result in results))
+
+    def test_dependencies_resolved_through_registry(self):
+        """Factories can request the services they depend on."""
+        self.registry.register('dependent', lambda services: ('dependent', services.get('slow')))
+        self.assertIs(self.registry.get('dependent')[1], self.registry.get('slow'))
+        self.assertEqual(len(self.built), 1)
+
+    def test_failed_construction_is_retried(self):
+        """A failing factory is not cached and the error is recorded."""
+        attempts = []
+
+        def flaky(_):
+            attempts.append(1)
+            if len(attempts) == 1:
+                raise RuntimeError("database unavailable")
+            return 'ready'
+
+        self.registry.register('flaky', flaky)
+        with self.assertRaises(RuntimeError):
+            self.registry.get('flaky')
+        self.assertEqual(self.registry.get_stats()['services']['flaky']['last_error'], "database unavailable")
+        self.assertEqual(self.registry.get('flaky'), 'ready')
+
+    def test_reset_and_unknown_service(self):
+        """reset() forces a rebuild; unknown names raise KeyError."""
+        first = self.registry.get('slow')
+        self.registry.reset('slow')
+        self.assertIsNot(self.registry.get('slow'), first)
+        with self.assertRaises(KeyError):
+            self.registry.get('missing')
+
+
+class TestAppIntegration(unittest.TestCase):
+    """Test access to the registry through a Flask app."""
+
+    def setUp(self):
+        self.app = Flask(__name__)
+        self.registry = ServiceRegistry()
+        self.registry.register('goal_service', lambda _: 'registry goal service')
+        init_app(self.app, self.registry)
+
+    def test_get_service_uses_app_registry(self):
+        with self.app.app_context():
+            self.assertIs(get_registry(), self.registry)
+            self.assertEqual(get_service('goal_service'), 'registry goal service')
+
+    def test_config_value_takes_precedence(self):
+        """Instances injected through app.config override the registry."""
+        self.app.config['goal_service'] = 'injected goal service'
+        self.assertEqual(get_service('goal_service', self.app), 'injected goal service')
+        self.assertEqual(self.registry.get_stats()['total_constructions'], 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
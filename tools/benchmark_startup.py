@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""
+Startup benchmark for the Flask app.
+
+Imports app.py in a fresh interpreter with ``python -X importtime`` (the
+same work a gunicorn worker does before serving its first request), prints
+the total import time and the slowest imports, and fails when the boot
+path regresses:
+
+- the total import time exceeds --max-ms (median of --runs runs), or
+- a heavy optional module (pandas, matplotlib, reportlab by default) is
+  imported at startup instead of on first use.
+
+Usage:
+    python tools/benchmark_startup.py [--runs 3] [--max-ms 1500] [--top 15] [--forbid pandas ...]
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+from typing import Dict, List, Tuple
+
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+
+# Modules that must stay off the boot path
+DEFAULT_FORBIDDEN = ["pandas", "matplotlib", "reportlab"]
+DEFAULT_MAX_MS = 1500.0
+
+
+def parse_importtime(output: str) -> Dict[str, Tuple[int, int]]:
+    """
+    Parse ``-X importtime`` output.
+
+    Args:
+        output: stderr of the interpreter
+
+    Returns:
+        Mapping of module name to (self, cumulative) microseconds
+    """
+    timings = {}
+    for line in output.splitlines():
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+        try:
+            self_us, cumulative_us, name = line[len("import time:"):].split("|", 2)
+            timings[name.strip()] = (int(self_us), int(cumulative_us))
+        except ValueError:
+            continue
+    return timings
+
+
+def measure_startup(module: str = "app") -> Dict[str, Tuple[int, int]]:
+    """Import a module in a fresh interpreter and return its import timings."""
+    env = dict(os.environ)
+    env.setdefault("SERVICE_WARMUP", "False")
+    env.setdefault("FEATURE_SIMULATION_EXECUTOR", "False")
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=PROJECT_ROOT, env=env, capture_output=True, text=True
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"Importing {module} failed:\n{result.stderr[-2000:]}")
+    return parse_importtime(result.stderr)
+
+
+def check_startup(timings: Dict[str, Tuple[int, int]], forbidden: List[str]) -> List[str]:
+    """Return the forbidden top-level packages that were imported."""
+    imported = {name.split(".")[0] for name in timings}
+    return [name for name in forbidden if name in imported]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark app import time")
+    parser.add_argument("--module", default="app", help="Module to import")
+    parser.add_argument("--runs", type=int, default=3, help="Number of fresh interpreters to time")
+    parser.add_argument("--max-ms", type=float, default=DEFAULT_MAX_MS,
+                        help="Fail when the median import time exceeds this budget")
+    parser.add_argument("--top", type=int, default=15, help="Number of slowest imports to list")
+    parser.add_argument("--forbid", nargs="*", default=DEFAULT_FORBIDDEN,
+                        help="Packages that must not be imported at startup")
+    args = parser.parse_args()
+
+    totals = []
+    timings = {}
+    for _ in range(max(1, args.runs)):
+        timings = measure_startup(args.module)
+        totals.append(timings.get(args.module, (0, 0))[1] / 1000.0)
+    median_ms = statistics.median(totals)
+
+    print(f"Startup benchmark: import {args.module} ({len(totals)} runs)")
+    print(f"median {median_ms:.1f} ms, min {min(totals):.1f} ms, max {max(totals):.1f} ms")
+    print(f"{'cumulative (ms)':>16} {'self (ms)':>10}  module")
+    slowest = sorted(timings.items(), key=lambda item: item[1][1], reverse=True)[:args.top]
+    for name, (self_us, cumulative_us) in slowest:
+        print(f"{cumulative_us / 1000.0:>16.1f} {self_us / 1000.0:>10.1f}  {name}")
+
+    failures = []
+    if median_ms > args.max_ms:
+        failures.append(f"import time {median_ms:.1f} ms exceeds budget of {args.max_ms:.1f} ms")
+    for name in check_startup(timings, args.forbid):
+        failures.append(f"{name} is imported at startup")
+
+    for failure in failures:
+        print(f"FAIL: {failure}")
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()